@@ -19,15 +19,13 @@ Knob Assignments:
 # Global variables
 dance_time = 0.0
 animal_types = ['cat', 'dog', 'bird', 'rabbit', 'bear', 'fox', 'elephant', 'giraffe', 'penguin', 'monkey', 'lion', 'pig', 'horse', 'duck', 'tiger', 'zebra', 'panda', 'kangaroo', 'owl', 'turtle', 'snake', 'octopus']
-cached_positions = []  # Cached random positions
-cached_num_animals = 0  # Track when to regenerate positions
+position_cache = {}  # Memoized layouts keyed by (num_animals, xres, yres)
 
 def setup(screen, eyesy):
     """Initialize the mode"""
-    global dance_time, cached_positions, cached_num_animals
+    global dance_time, position_cache
     dance_time = 0.0
-    cached_positions = []
-    cached_num_animals = 0
+    position_cache = {}
 
 def draw_cat(screen, color, x, y, size, bounce, lean, arm_swing, leg_swing):
     """Draw a cat character"""
@@ -1846,6 +1844,105 @@ def get_dance_move_params(move_type, local_time, intensity, size, audio_amplitud
     
     return bounce, lean, arm_swing, leg_swing
 
+def poisson_disk_sample(min_x, min_y, max_x, max_y, radius, rng, k=30):
+    """Bridson Poisson-disk sampling inside a rectangle
+
+    Points are kept at least `radius` apart. A uniform background grid with
+    cell size radius/sqrt(2) holds at most one point per cell, so each
+    candidate only has to be checked against the 5x5 block of cells around it.
+    """
+    width = max_x - min_x
+    height = max_y - min_y
+    cell_size = radius / math.sqrt(2)
+    cols = int(width / cell_size) + 1
+    rows = int(height / cell_size) + 1
+    grid = [None] * (cols * rows)
+    radius_sq = radius * radius
+
+    def fits(px, py):
+        col = int((px - min_x) / cell_size)
+        row = int((py - min_y) / cell_size)
+        for r in range(max(0, row - 2), min(rows, row + 3)):
+            for c in range(max(0, col - 2), min(cols, col + 3)):
+                other = grid[r * cols + c]
+                if other is not None:
+                    dx = other[0] - px
+                    dy = other[1] - py
+                    if dx * dx + dy * dy < radius_sq:
+                        return False
+        return True
+
+    def insert(px, py):
+        point = (px, py)
+        grid[int((py - min_y) / cell_size) * cols + int((px - min_x) / cell_size)] = point
+        samples.append(point)
+        active.append(point)
+
+    samples = []
+    active = []
+    insert(rng.uniform(min_x, max_x), rng.uniform(min_y, max_y))
+
+    while active:
+        index = rng.randrange(len(active))
+        base_x, base_y = active[index]
+        for _ in range(k):
+            angle = rng.uniform(0, 2 * math.pi)
+            dist = rng.uniform(radius, 2 * radius)
+            px = base_x + math.cos(angle) * dist
+            py = base_y + math.sin(angle) * dist
+            if min_x <= px <= max_x and min_y <= py <= max_y and fits(px, py):
+                insert(px, py)
+                break
+        else:
+            # No room left around this point
+            active[index] = active[-1]
+            active.pop()
+
+    return samples
+
+def spread_subset(points, count):
+    """Pick `count` points that are as far apart as possible (farthest-point order)"""
+    if len(points) <= count:
+        return list(points)
+    cx = sum(p[0] for p in points) / len(points)
+    cy = sum(p[1] for p in points) / len(points)
+    # Start from the point furthest from the centroid so the layout reaches the edges
+    first = max(range(len(points)), key=lambda idx: (points[idx][0] - cx) ** 2 + (points[idx][1] - cy) ** 2)
+    chosen = [points[first]]
+    nearest_sq = [(p[0] - points[first][0]) ** 2 + (p[1] - points[first][1]) ** 2 for p in points]
+    while len(chosen) < count:
+        best = max(range(len(points)), key=nearest_sq.__getitem__)
+        bx, by = points[best]
+        chosen.append((bx, by))
+        for idx, (px, py) in enumerate(points):
+            d = (px - bx) ** 2 + (py - by) ** 2
+            if d < nearest_sq[idx]:
+                nearest_sq[idx] = d
+    return chosen
+
+def generate_positions(num_animals, min_x, min_y, max_x, max_y, min_spacing):
+    """Poisson-disk layout for the animals, deterministic per animal count
+
+    `min_spacing` is the preferred distance. When the screen can't fit that many
+    animals at that spacing the radius is shrunk until the sampler produces
+    enough points, and the best-spread subset is returned.
+    """
+    rng = random.Random(num_animals * 42)  # Seed ensures consistency
+    area = (max_x - min_x) * (max_y - min_y)
+    # A maximal Poisson-disk set covers roughly r^2 * 1.5 of area per point,
+    # so there is no point starting above that radius
+    radius = min(min_spacing, math.sqrt(area / (num_animals * 1.5)), max(max_x - min_x, max_y - min_y))
+    radius = max(radius, 1.0)
+    while True:
+        samples = poisson_disk_sample(min_x, min_y, max_x, max_y, radius, rng)
+        if len(samples) >= num_animals or radius <= 1.0:
+            break
+        radius = max(1.0, radius * 0.85)
+    positions = spread_subset(samples, num_animals)
+    while len(positions) < num_animals:
+        positions.append(((min_x + max_x) / 2, (min_y + max_y) / 2))
+    return [(int(px), int(py)) for px, py in positions]
+
 def draw(screen, eyesy):
     """Draw dancing animals in a circle"""
     global dance_time
@@ -1902,14 +1999,12 @@ def draw(screen, eyesy):
     # Update dance time
     dance_time += speed
     
-    # Generate random positions for animals with spacing
-    # Cache positions and only regenerate when number of animals changes
-    global cached_positions, cached_num_animals
+    # Positions come from a Poisson-disk layout, memoized per number of animals
+    global position_cache
     
-    if len(cached_positions) != num_animals or cached_num_animals != num_animals:
-        # Regenerate positions when count changes
-        positions = []
-        
+    cache_key = (num_animals, xr, yr)
+    positions = position_cache.get(cache_key)
+    if positions is None:
         # Minimum spacing between animals (based on animal size)
         # Spacing scales with number of animals - more animals need more space to prevent clustering
         # Account for maximum possible movement: base size + max bounce + max lean + max intensity movement
@@ -1920,6 +2015,7 @@ def draw(screen, eyesy):
         # Total per animal: size * 0.5 + size * 0.29 + size * 0.06 + size * 0.15 = size * 1.0
         # For two animals: need 2 * size * 1.0 = size * 2.0 minimum
         # Using 16.0x base with more aggressive scaling for very large safety margin
+        # (generate_positions shrinks this when the screen can't fit it)
         base_spacing_multiplier = 16.0  # Increased from 13.0 for better separation
         # Scale spacing up when there are more animals (prevents clustering)
         # More aggressive scaling for larger groups
@@ -1946,159 +2042,22 @@ def draw(screen, eyesy):
         min_y = max(0, int(margin_y))
         max_y = max(min_y + 50, int(yr - margin_y))  # Ensure at least 50px height
         
-        # Final safety check - if bounds are still invalid, use screen center
-        if min_x >= max_x:
-            min_x = max(0, xr // 4)
-            max_x = min(xr, xr * 3 // 4)
-        if min_y >= max_y:
-            min_y = max(0, yr // 4)
-            max_y = min(yr, yr * 3 // 4)
-        
         if num_animals == 1:
             # Single animal at center
             positions = [(center_x, center_y)]
         else:
-            # Use deterministic seed based on number of animals for consistent positions
-            random.seed(num_animals * 42)  # Seed ensures consistency
-            
-            # Try grid-based initial distribution for better spacing, then refine
-            # Calculate grid dimensions - use more columns/rows for better distribution
-            # For many animals, use a more spread out grid
-            if num_animals <= 4:
-                grid_cols = int(math.ceil(math.sqrt(num_animals * 1.2)))
-            elif num_animals <= 8:
-                grid_cols = int(math.ceil(math.sqrt(num_animals * 1.5)))
-            else:
-                # For many animals, use wider grid to prevent vertical stacking
-                grid_cols = int(math.ceil(math.sqrt(num_animals * 2.0)))
-            grid_rows = int(math.ceil(num_animals / grid_cols))
-            
-            # Grid cell size should be at least min_spacing with extra margin
-            # Use larger cells to ensure better separation, especially for many animals
-            if num_animals <= 6:
-                cell_margin = 1.6
-            elif num_animals <= 12:
-                cell_margin = 2.0
-            else:
-                cell_margin = 2.4  # Very large margin for many animals
-            cell_width = max(min_spacing * cell_margin, (max_x - min_x) / max(1, grid_cols - 1))
-            cell_height = max(min_spacing * cell_margin, (max_y - min_y) / max(1, grid_rows - 1))
-            
-            # Generate positions using improved algorithm
-            max_attempts = 2000  # Increased attempts for better placement
-            grid_positions = []
-            
-            # First, try placing animals in a loose grid pattern
-            for row in range(grid_rows):
-                for col in range(grid_cols):
-                    if len(grid_positions) >= num_animals:
-                        break
-                    base_x = min_x + col * cell_width
-                    base_y = min_y + row * cell_height
-                    # Add very small random offset within cell to keep animals separated
-                    # Further reduced offset range to prevent clustering, especially with many animals
-                    if num_animals <= 6:
-                        offset_range = 0.06
-                    elif num_animals <= 12:
-                        offset_range = 0.03
-                    else:
-                        offset_range = 0.01  # Minimal offset for many animals
-                    offset_x = random.uniform(-cell_width * offset_range, cell_width * offset_range)
-                    offset_y = random.uniform(-cell_height * offset_range, cell_height * offset_range)
-                    pos_x = int(base_x + offset_x)
-                    pos_y = int(base_y + offset_y)
-                    # Clamp to bounds
-                    pos_x = max(min_x, min(max_x, pos_x))
-                    pos_y = max(min_y, min(max_y, pos_y))
-                    grid_positions.append((pos_x, pos_y))
-                if len(grid_positions) >= num_animals:
-                    break
-            
-            # Now refine positions to ensure proper spacing
-            positions = []
-            for i, (pos_x, pos_y) in enumerate(grid_positions):
-                attempts = 0
-                found_position = False
-                current_x, current_y = pos_x, pos_y
-                
-                while not found_position and attempts < max_attempts:
-                    # Check if current position overlaps - use stricter check
-                    overlaps = False
-                    min_distance_found = float('inf')
-                    for existing_x, existing_y in positions:
-                        distance = math.sqrt((current_x - existing_x)**2 + (current_y - existing_y)**2)
-                        if distance < min_spacing:
-                            overlaps = True
-                            min_distance_found = min(min_distance_found, distance)
-                            break
-                    
-                    if not overlaps:
-                        positions.append((current_x, current_y))
-                        found_position = True
-                    else:
-                        # Try a new random position - push away from closest animal
-                        # Use smaller search radius for many animals to prevent clustering
-                        if num_animals <= 6:
-                            search_radius = 0.15
-                        elif num_animals <= 12:
-                            search_radius = 0.08
-                        else:
-                            search_radius = 0.05  # Very small search radius for many animals
-                        # If we found a too-close animal, try to move away from it
-                        if min_distance_found < float('inf'):
-                            # Move further away from the closest animal
-                            push_away_factor = (min_spacing - min_distance_found) / min_spacing
-                            current_x = pos_x + random.uniform(-cell_width * search_radius, cell_width * search_radius) * (1 + push_away_factor)
-                            current_y = pos_y + random.uniform(-cell_height * search_radius, cell_height * search_radius) * (1 + push_away_factor)
-                        else:
-                            current_x = pos_x + random.uniform(-cell_width * search_radius, cell_width * search_radius)
-                            current_y = pos_y + random.uniform(-cell_height * search_radius, cell_height * search_radius)
-                        current_x = max(min_x, min(max_x, int(current_x)))
-                        current_y = max(min_y, min(max_y, int(current_y)))
-                        attempts += 1
-                
-                # If we couldn't find a position after max attempts, try completely random
-                # Use more attempts and stricter spacing check
-                if not found_position:
-                    # Ensure valid bounds before using random.randint
-                    if min_x < max_x and min_y < max_y:
-                        fallback_attempts = 1000 if num_animals <= 6 else 1500  # More attempts for many animals
-                        for fallback_attempt in range(fallback_attempts):
-                            fallback_x = random.randint(min_x, max_x)
-                            fallback_y = random.randint(min_y, max_y)
-                            overlaps = False
-                            # Check against all existing positions with strict spacing
-                            for existing_x, existing_y in positions:
-                                distance = math.sqrt((fallback_x - existing_x)**2 + (fallback_y - existing_y)**2)
-                                if distance < min_spacing:
-                                    overlaps = True
-                                    break
-                            if not overlaps:
-                                positions.append((fallback_x, fallback_y))
-                                found_position = True
-                                break
-                    else:
-                        # If bounds are invalid, just place at center with offset
-                        offset_x = (i % 3 - 1) * animal_size * 2
-                        offset_y = (i // 3 - 1) * animal_size * 2
-                        positions.append((center_x + offset_x, center_y + offset_y))
-                        found_position = True
-                
-                # Last resort: place it anyway (shouldn't happen with proper spacing)
-                if not found_position:
-                    positions.append((current_x, current_y))
+            positions = generate_positions(num_animals, min_x, min_y, max_x, max_y, min_spacing)
         
-        # Cache the positions
-        cached_positions = positions
-        cached_num_animals = num_animals
-    else:
-        # Use cached positions
-        positions = cached_positions
+        position_cache[cache_key] = positions
     
     # Calculate minimum safe distance for runtime checking
     # Use a slightly smaller value than min_spacing since positions are already spaced
     runtime_min_distance = animal_size * 12.0  # Runtime check distance
     
+    # Already-placed animals are bucketed into a uniform grid with cells of
+    # runtime_min_distance, so only the surrounding 3x3 cells need checking
+    separation_grid = {}
+    
     # Draw each animal at its random position
     final_positions = []  # Track final positions for collision checking
     for i in range(num_animals):
@@ -2125,22 +2084,30 @@ def draw(screen, eyesy):
         
         # Check if movement would bring this animal too close to others
         # Constrain movement to maintain safe distance
-        for j, (other_x, other_y) in enumerate(final_positions):
-            distance = math.sqrt((new_x - other_x)**2 + (new_y - other_y)**2)
-            if distance < runtime_min_distance and distance > 0:
-                # Push away from the other animal
-                dx = new_x - other_x
-                dy = new_y - other_y
-                dist = math.sqrt(dx*dx + dy*dy)
-                if dist > 0.001:  # Avoid division by zero
-                    # Scale back movement to maintain distance
-                    push_factor = (runtime_min_distance - dist) / dist
-                    new_x = other_x + dx * (1 + push_factor * 0.3)
-                    new_y = other_y + dy * (1 + push_factor * 0.3)
+        cell_x = int(new_x // runtime_min_distance)
+        cell_y = int(new_y // runtime_min_distance)
+        neighbours = []
+        for gx in range(cell_x - 1, cell_x + 2):
+            for gy in range(cell_y - 1, cell_y + 2):
+                neighbours.extend(separation_grid.get((gx, gy), ()))
+        neighbours.sort()  # Keep the original placement order
+        for j in neighbours:
+            other_x, other_y = final_positions[j]
+            dx = new_x - other_x
+            dy = new_y - other_y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < runtime_min_distance * runtime_min_distance and dist_sq > 0.000001:
+                # Push away from the other animal, scaling back movement to maintain distance
+                dist = math.sqrt(dist_sq)
+                push_factor = (runtime_min_distance - dist) / dist
+                new_x = other_x + dx * (1 + push_factor * 0.3)
+                new_y = other_y + dy * (1 + push_factor * 0.3)
         
         animal_x = new_x
         animal_y = new_y
         final_positions.append((animal_x, animal_y))
+        grid_key = (int(animal_x // runtime_min_distance), int(animal_y // runtime_min_distance))
+        separation_grid.setdefault(grid_key, []).append(i)
         
         # Select animal type (cycles through types)
         animal_type = animal_types[i % len(animal_types)]
@@ -2,6 +2,7 @@ import os
 import pygame
 import math
 import random
+import numpy as np
 
 """
 Dancing Character Mode
@@ -32,507 +33,251 @@ def setup(screen, eyesy):
     cached_positions = []
     cached_num_characters = 0
 
-def draw_character(screen, color, char_x, char_y, character_size, intensity, 
-                   audio_amplitude, audio_beat, audio_low, audio_mid, audio_high,
-                   dance_time_local, 
-                   phase_offset, speed_multiplier, move_type, 
-                   is_couple=False, mirror_couple=False):
-    """Draw a single dancing character with unique parameters
+# Dance moves, one row each. Every rhythm below is a multiple of 0.1 rad per unit of
+# dance time, so each move's whole pose repeats after POSE_PERIOD and can be tabled.
+# Freeze's hold gate steps every half unit, which doesn't divide POSE_PERIOD, so
+# it stays out of the tables and is applied when sampling (see FREEZE_HOLD).
+#   bounce: (freq, height as a fraction of character size)
+#   lean:   (freq, lean at full intensity)
+#   sway:   (freq, side-to-side amount, phase)  - phase pi/2 turns sin into cos
+#   rhythm: (freq, right side's phase behind the left) - arms/legs alternate on it
+#   arms:   (vertical swing, horizontal swing freq, special) - special 'circles'/'floss'
+#   legs:   (swing, left base angle, left gain, right base angle, right gain)
+#   ground: how far the move drops toward the floor (fraction of character size)
+#   floor:  body tilts toward horizontal
+HALF_PI = math.pi / 2
+DANCE_MOVES = [
+    # 0 Standard - alternating arms/legs
+    dict(bounce=(2.0, 0.08), lean=(0.7, 0.3), sway=(0.5, 0.2, 0), rhythm=(1.5, HALF_PI),
+         arms=(0.6, 1.2, None), legs=(0.5, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=False),
+    # 1 Wave - smooth flowing movements
+    dict(bounce=(1.5, 0.1), lean=(0.5, 0.4), sway=(0.4, 0.25, 0), rhythm=(1.0, math.pi * 0.3),
+         arms=(0.8, 0.8, None), legs=(0.4, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=False),
+    # 2 Jump - bouncy, energetic
+    dict(bounce=(3.0, 0.15), lean=(1.2, 0.2), sway=(0.8, 0.15, 0), rhythm=(2.0, HALF_PI),
+         arms=(0.7, 1.5, None), legs=(0.7, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=False),
+    # 3 Spin - rotating body movements, arms opposite
+    dict(bounce=(2.0, 0.06), lean=(1.5, 0.5), sway=(0.6, 0.3, HALF_PI), rhythm=(1.2, math.pi),
+         arms=(0.9, 1.0, None), legs=(0.3, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=False),
+    # 4 Squat - up and down, legs spread
+    dict(bounce=(1.8, 0.2), lean=(0.4, 0.2), sway=(0.3, 0.1, 0), rhythm=(1.3, HALF_PI),
+         arms=(0.5, 0.9, None), legs=(0.8, HALF_PI + 0.25, 0.5, HALF_PI - 0.25, 0.5), ground=0.0, floor=False),
+    # 5 Kick - leg-focused movements
+    dict(bounce=(2.2, 0.08), lean=(0.9, 0.25), sway=(0.6, 0.18, 0), rhythm=(1.8, HALF_PI),
+         arms=(0.4, 1.1, None), legs=(1.0, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=False),
+    # 6 Arm Circles - circular arm movements
+    dict(bounce=(2.0, 0.08), lean=(0.6, 0.3), sway=(0.5, 0.2, 0), rhythm=(1.0, HALF_PI),
+         arms=(1.0, 0.7, 'circles'), legs=(0.3, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=False),
+    # 7 Side Step - lateral movements
+    dict(bounce=(2.0, 0.08), lean=(0.8, 0.35), sway=(1.0, 0.35, 0), rhythm=(1.4, HALF_PI),
+         arms=(0.6, 1.3, None), legs=(0.6, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=False),
+    # 8 Breakdance - spinning low to ground, legs spread out horizontally
+    dict(bounce=(2.5, 0.05), lean=(2.0, 0.6), sway=(1.5, 0.3, HALF_PI), rhythm=(2.0, HALF_PI),
+         arms=(0.8, 1.8, None), legs=(0.7, math.pi * 0.7, 0.3, math.pi * 0.3, 0.3), ground=0.6, floor=True),
+    # 9 Low Squat - very low to ground, legs very spread out
+    dict(bounce=(1.5, 0.03), lean=(0.6, 0.2), sway=(0.4, 0.15, 0), rhythm=(1.2, HALF_PI),
+         arms=(0.5, 1.0, None), legs=(0.9, HALF_PI + 0.35, 0.4, HALF_PI - 0.35, 0.4), ground=0.5, floor=True),
+    # 10 One Knee - left leg kneeling (more horizontal), right leg up
+    dict(bounce=(2.0, 0.04), lean=(0.7, 0.3), sway=(0.5, 0.2, 0), rhythm=(1.3, HALF_PI),
+         arms=(0.7, 1.2, None), legs=(0.6, math.pi * 0.75, 0.2, HALF_PI - 0.1, 0.5), ground=0.4, floor=True),
+    # 11 Floor Spin - lying down spinning
+    dict(bounce=(1.8, 0.02), lean=(2.5, 0.8), sway=(2.0, 0.25, HALF_PI), rhythm=(1.6, HALF_PI),
+         arms=(0.9, 2.0, None), legs=(0.4, math.pi * 0.65, 0.4, math.pi * 0.35, 0.4), ground=0.7, floor=True),
+    # 12 Moonwalk - sliding backward motion
+    dict(bounce=(2.0, 0.05), lean=(0.6, 0.2), sway=(1.5, -0.3, 0), rhythm=(1.8, HALF_PI),
+         arms=(0.5, 1.0, None), legs=(0.7, HALF_PI + 0.1, 0.5, HALF_PI - 0.1, 0.5), ground=0.0, floor=True),
+    # 13 Robot - stiff, mechanical movements
+    dict(bounce=(1.0, 0.06), lean=(0.4, 0.15), sway=(0.3, 0.1, 0), rhythm=(0.8, math.pi),
+         arms=(0.4, 0.6, None), legs=(0.3, HALF_PI + 0.1, 0.2, HALF_PI - 0.1, 0.2), ground=0.0, floor=True),
+    # 14 Floss - side-to-side arm swinging
+    dict(bounce=(2.5, 0.08), lean=(1.2, 0.25), sway=(1.5, 0.2, 0), rhythm=(2.0, math.pi),
+         arms=(1.0, 2.0, 'floss'), legs=(0.2, HALF_PI + 0.1, 0.2, HALF_PI - 0.1, 0.2), ground=0.0, floor=True),
+    # 15 Running Man - alternating big leg lifts
+    dict(bounce=(2.2, 0.1), lean=(0.8, 0.2), sway=(0.6, 0.15, 0), rhythm=(2.2, HALF_PI),
+         arms=(0.6, 1.4, None), legs=(1.0, HALF_PI + 0.3, 0.7, HALF_PI - 0.3, 0.7), ground=0.0, floor=True),
+    # 16 Windmill - continuous spinning
+    dict(bounce=(2.0, 0.08), lean=(3.0, 0.6), sway=(2.5, 0.3, HALF_PI), rhythm=(2.5, HALF_PI),
+         arms=(0.9, 2.5, None), legs=(0.5, HALF_PI + 0.2, 0.5, HALF_PI - 0.2, 0.5), ground=0.0, floor=True),
+    # 17 Freeze - sharp, popping movements (every other half beat is held)
+    dict(bounce=(3.0, 0.12), lean=(1.5, 0.4), sway=(1.0, 0.2, 0), rhythm=(1.5, HALF_PI),
+         arms=(0.7, 1.5, None), legs=(0.6, HALF_PI + 0.2, 0.5, HALF_PI - 0.2, 0.5), ground=0.0, floor=True),
+    # 18 Shuffle - quick side steps
+    dict(bounce=(2.5, 0.08), lean=(1.0, 0.3), sway=(2.0, 0.4, 0), rhythm=(2.5, HALF_PI),
+         arms=(0.5, 2.0, None), legs=(0.8, HALF_PI + 0.25, 0.6, HALF_PI - 0.25, 0.6), ground=0.0, floor=True),
+    # 19 C-Walk - complex footwork
+    dict(bounce=(2.0, 0.06), lean=(0.9, 0.35), sway=(1.5, 0.25, HALF_PI), rhythm=(1.8, HALF_PI + math.pi * 0.3),
+         arms=(0.4, 1.3, None), legs=(0.9, HALF_PI + 0.2, 0.6, HALF_PI - 0.2, 0.6), ground=0.0, floor=True),
+]
+FREEZE_MOVE = 17
+BREAKDANCE_MOVE = 8
+POSE_PERIOD = 20 * math.pi  # Shortest span every 0.1-multiple rhythm repeats over
+POSE_SAMPLES = 2048  # Keyframes per move (~0.03 dance-time apart)
+# Pose table channels
+BOUNCE, LEAN, SWAY, LEFT, RIGHT, ARM_H, SPECIAL_H, SPECIAL_V = range(8)
+# Freeze damps bounce, lean and the arm/leg rhythm on every other half beat
+FREEZE_HOLD = np.array([0.3, 0.2, 1.0, 0.3, 0.3, 1.0, 1.0, 1.0])
+
+def build_pose_tables():
+    """Sample every move's joint drivers over one POSE_PERIOD
     
-    move_type: Different dance styles:
-    0 = Standard (alternating arms/legs)
-    1 = Wave (smooth flowing movements)
-    2 = Jump (bouncy, energetic)
-    3 = Spin (rotating body movements)
-    4 = Squat (up and down movements)
-    5 = Kick (leg-focused movements)
-    6 = Arm Circles (circular arm movements)
-    7 = Side Step (lateral movements)
-    8 = Breakdance (spinning low to ground)
-    9 = Low Squat (very low to ground)
-    10 = One Knee (one knee down pose)
-    11 = Floor Spin (lying down spinning)
-    12 = Moonwalk (sliding backward motion)
-    13 = Robot (stiff, mechanical movements)
-    14 = Floss (side-to-side arm swinging)
-    15 = Running Man (alternating leg lifts)
-    16 = Windmill (continuous spinning)
-    17 = Freeze (sharp, popping movements)
-    18 = Shuffle (quick side steps)
-    19 = C-Walk (complex footwork)
+    Returns (moves, POSE_SAMPLES + 1, channels) float32 keyframes; the last
+    sample repeats the first so interpolation never wraps. Amplitudes that
+    don't depend on knobs or audio are baked in.
     """
+    t = np.linspace(0.0, POSE_PERIOD, POSE_SAMPLES + 1)
+    tables = np.zeros((len(DANCE_MOVES), POSE_SAMPLES + 1, 8), np.float32)
+    for index, move in enumerate(DANCE_MOVES):
+        table = tables[index]
+        freq, height = move['bounce']
+        table[:, BOUNCE] = np.sin(t * freq) * height
+        freq, amount = move['lean']
+        table[:, LEAN] = np.sin(t * freq) * amount
+        freq, amount, phase = move['sway']
+        table[:, SWAY] = np.sin(t * freq + phase) * amount
+        freq, right_phase = move['rhythm']
+        table[:, LEFT] = np.sin(t * freq)
+        table[:, RIGHT] = np.sin(t * freq + right_phase)
+        table[:, ARM_H] = np.cos(t * move['arms'][1])
+        if move['arms'][2] == 'circles':
+            table[:, SPECIAL_H] = np.cos(t * 1.5) * 0.5  # Circle radius is half the arm
+            table[:, SPECIAL_V] = np.sin(t * 1.5) * 0.8
+        elif move['arms'][2] == 'floss':
+            table[:, SPECIAL_H] = np.sin(t * 2.0) * 1.2  # Big side-to-side
+            table[:, SPECIAL_V] = np.cos(t * 2.0) * 0.3  # Small vertical
+    return tables
+
+def move_params():
+    """Per-move constants as arrays indexed by move type"""
+    moves = DANCE_MOVES
+    return dict(
+        arm_swing=np.array([m['arms'][0] for m in moves]),
+        special=np.array([{None: 0, 'circles': 1, 'floss': 2}[m['arms'][2]] for m in moves]),
+        leg_swing=np.array([m['legs'][0] for m in moves]),
+        left_leg=np.array([m['legs'][1] for m in moves]),
+        left_gain=np.array([m['legs'][2] for m in moves]),
+        right_leg=np.array([m['legs'][3] for m in moves]),
+        right_gain=np.array([m['legs'][4] for m in moves]),
+        ground=np.array([m['ground'] for m in moves]),
+        floor=np.array([m['floor'] for m in moves]),
+    )
+
+POSE_TABLES = build_pose_tables()
+MOVE_PARAMS = move_params()
+
+def sample_poses(move_type, local_time):
+    """Interpolate each character's pose channels from its move's keyframes
     
-    # Each character has different dance parameters
-    # phase_offset: shifts the dance timing (makes them out of sync)
-    # speed_multiplier: makes some dance faster/slower
-    # move_type: determines the dance style
+    Freeze's hold is applied here from the unwrapped local_time, so its hard
+    steps stay in phase and unblurred however long the dance has run.
+    """
+    position = np.mod(local_time, POSE_PERIOD) * (POSE_SAMPLES / POSE_PERIOD)
+    index = np.minimum(position.astype(np.intp), POSE_SAMPLES - 1)
+    frac = (position - index)[:, None]
+    before = POSE_TABLES[move_type, index]
+    after = POSE_TABLES[move_type, index + 1]
+    held = (move_type == FREEZE_MOVE) & (np.floor(local_time * 2.0) % 2 == 1)
+    return (before + (after - before) * frac) * np.where(held[:, None], FREEZE_HOLD, 1.0)
+
+def audio_bands(audio_in):
+    """(amplitude, peak, low, mid, high) of a buffer, each normalized to 0-1
     
+    Lower indices count as lower frequencies - a rough three-way split.
+    """
+    n = len(audio_in)
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    levels = np.abs(np.asarray(audio_in, dtype=np.float64))
+    third = n // 3
+    low_total = levels[:third].sum()
+    mid_total = levels[third:2 * n // 3].sum()
+    high_total = levels[2 * n // 3:].sum()
+    return ((low_total + mid_total + high_total) / n / 32768.0,
+            levels.max() / 32768.0,
+            low_total / max(1, third) / 32768.0,
+            mid_total / max(1, third) / 32768.0,
+            high_total / max(1, n - 2 * third) / 32768.0)
+
+def draw_characters(screen, color, char_x, char_y, phase_offset, speed_multiplier, move_type, mirror,
+                    character_size, intensity, audio, dance_time_local):
+    """Pose and draw all characters at once
+    
+    Per-character arrays: position, phase_offset (shifts the dance timing),
+    speed_multiplier, move_type (row of DANCE_MOVES) and mirror (couples'
+    first partner steps with mirrored legs). audio is audio_bands() output.
+    Poses come from the keyframe tables; the rest is one vectorized pass over
+    the characters before emitting a head and four limbs each.
+    """
+    audio_amplitude, audio_beat, audio_low, audio_mid, audio_high = audio
+    params = MOVE_PARAMS
     # Character proportions
     head_radius = character_size * 0.15
     body_length = character_size * 0.4
     arm_length = character_size * 0.35
     leg_length = character_size * 0.4
-    
-    # Apply phase offset and speed multiplier to local dance time
-    local_dance_time = dance_time_local * speed_multiplier + phase_offset
-    
-    # Different dance move types create different movement patterns
-    # Enhanced audio reactivity: use different frequency bands for different effects
+    pose = sample_poses(move_type, dance_time_local * speed_multiplier + phase_offset)
+    # Audio reactivity: bass drives bounce and legs, mids the arms, highs the head
     audio_boost = 1.0 + audio_amplitude * intensity * 0.5
-    # Bass (low) affects body bounce and leg movements more
     bass_boost = 1.0 + audio_low * intensity * 0.8
-    # Mid affects arm movements
     mid_boost = 1.0 + audio_mid * intensity * 0.6
-    # High affects head and quick movements
-    high_boost = 1.0 + audio_high * intensity * 0.4
-    
-    # Initialize movement variables based on move type
-    # Initialize ground_offset for all moves (will be set for floor moves)
-    ground_offset = 0.0
-    
-    if move_type == 0:  # Standard - alternating arms/legs
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.08
-        body_lean = math.sin(local_dance_time * 0.7) * intensity * 0.3
-        horizontal_sway = math.sin(local_dance_time * 0.5) * intensity * character_size * 0.2
-        rhythm_speed = 1.5
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.6
-        arm_horizontal_freq = 1.2
-        leg_swing_intensity = 0.5
-        
-    elif move_type == 1:  # Wave - smooth flowing movements
-        dance_bounce = math.sin(local_dance_time * 1.5) * character_size * 0.1
-        body_lean = math.sin(local_dance_time * 0.5) * intensity * 0.4  # More lean
-        horizontal_sway = math.sin(local_dance_time * 0.4) * intensity * character_size * 0.25
-        rhythm_speed = 1.0  # Slower, smoother
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.sin(local_dance_time * rhythm_speed + math.pi * 0.3)  # Phase shift
-        arm_swing_intensity = 0.8  # More arm movement
-        arm_horizontal_freq = 0.8
-        leg_swing_intensity = 0.4  # Less leg movement
-        
-    elif move_type == 2:  # Jump - bouncy, energetic
-        dance_bounce = math.sin(local_dance_time * 3.0) * character_size * 0.15  # Bigger bounce
-        body_lean = math.sin(local_dance_time * 1.2) * intensity * 0.2
-        horizontal_sway = math.sin(local_dance_time * 0.8) * intensity * character_size * 0.15
-        rhythm_speed = 2.0  # Faster
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.7
-        arm_horizontal_freq = 1.5
-        leg_swing_intensity = 0.7  # More leg movement
-        
-    elif move_type == 3:  # Spin - rotating body movements
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.06
-        body_lean = math.sin(local_dance_time * 1.5) * intensity * 0.5  # More rotation
-        horizontal_sway = math.cos(local_dance_time * 0.6) * intensity * character_size * 0.3
-        rhythm_speed = 1.2
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = -math.sin(local_dance_time * rhythm_speed)  # Opposite
-        arm_swing_intensity = 0.9  # Big arm movements
-        arm_horizontal_freq = 1.0
-        leg_swing_intensity = 0.3
-        
-    elif move_type == 4:  # Squat - up and down movements
-        dance_bounce = math.sin(local_dance_time * 1.8) * character_size * 0.2  # Big vertical movement
-        body_lean = math.sin(local_dance_time * 0.4) * intensity * 0.2
-        horizontal_sway = math.sin(local_dance_time * 0.3) * intensity * character_size * 0.1
-        rhythm_speed = 1.3
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.5
-        arm_horizontal_freq = 0.9
-        leg_swing_intensity = 0.8  # Big leg movements
-        
-    elif move_type == 5:  # Kick - leg-focused movements
-        dance_bounce = math.sin(local_dance_time * 2.2) * character_size * 0.08
-        body_lean = math.sin(local_dance_time * 0.9) * intensity * 0.25
-        horizontal_sway = math.sin(local_dance_time * 0.6) * intensity * character_size * 0.18
-        rhythm_speed = 1.8
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.4  # Less arm movement
-        arm_horizontal_freq = 1.1
-        leg_swing_intensity = 1.0  # Maximum leg movement
-        
-    elif move_type == 6:  # Arm Circles - circular arm movements
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.08
-        body_lean = math.sin(local_dance_time * 0.6) * intensity * 0.3
-        horizontal_sway = math.sin(local_dance_time * 0.5) * intensity * character_size * 0.2
-        rhythm_speed = 1.0
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 1.0  # Maximum arm movement
-        arm_horizontal_freq = 0.7  # Slower for circles
-        leg_swing_intensity = 0.3  # Minimal leg movement
-        
-    elif move_type == 7:  # Side Step - lateral movements
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.08
-        body_lean = math.sin(local_dance_time * 0.8) * intensity * 0.35
-        horizontal_sway = math.sin(local_dance_time * 1.0) * intensity * character_size * 0.35  # Big side movement
-        rhythm_speed = 1.4
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.6
-        arm_horizontal_freq = 1.3
-        leg_swing_intensity = 0.6
-        
-    elif move_type == 8:  # Breakdance - spinning low to ground
-        # Character gets very low, almost on ground
-        dance_bounce = math.sin(local_dance_time * 2.5) * character_size * 0.05
-        ground_offset = character_size * 0.6  # Push character down toward ground
-        body_lean = math.sin(local_dance_time * 2.0) * intensity * 0.6  # Big rotation
-        horizontal_sway = math.cos(local_dance_time * 1.5) * intensity * character_size * 0.3
-        rhythm_speed = 2.0
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.8
-        arm_horizontal_freq = 1.8
-        leg_swing_intensity = 0.7
-        
-    elif move_type == 9:  # Low Squat - very low to ground
-        # Character squats very low
-        dance_bounce = math.sin(local_dance_time * 1.5) * character_size * 0.03
-        ground_offset = character_size * 0.5  # Push character down
-        body_lean = math.sin(local_dance_time * 0.6) * intensity * 0.2
-        horizontal_sway = math.sin(local_dance_time * 0.4) * intensity * character_size * 0.15
-        rhythm_speed = 1.2
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.5
-        arm_horizontal_freq = 1.0
-        leg_swing_intensity = 0.9  # Big leg movements
-        
-    elif move_type == 10:  # One Knee - one knee down pose
-        # Character kneels on one knee
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.04
-        ground_offset = character_size * 0.4  # Push character down
-        body_lean = math.sin(local_dance_time * 0.7) * intensity * 0.3
-        horizontal_sway = math.sin(local_dance_time * 0.5) * intensity * character_size * 0.2
-        rhythm_speed = 1.3
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.7
-        arm_horizontal_freq = 1.2
-        leg_swing_intensity = 0.6
-        
-    elif move_type == 11:  # Floor Spin - lying down spinning
-        # Character lies down and spins
-        dance_bounce = math.sin(local_dance_time * 1.8) * character_size * 0.02
-        ground_offset = character_size * 0.7  # Push character way down
-        body_lean = math.sin(local_dance_time * 2.5) * intensity * 0.8  # Big rotation
-        horizontal_sway = math.cos(local_dance_time * 2.0) * intensity * character_size * 0.25
-        rhythm_speed = 1.6
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.9
-        arm_horizontal_freq = 2.0
-        leg_swing_intensity = 0.4
-        
-    elif move_type == 12:  # Moonwalk - sliding backward motion
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.05
-        body_lean = math.sin(local_dance_time * 0.6) * intensity * 0.2
-        horizontal_sway = -math.sin(local_dance_time * 1.5) * intensity * character_size * 0.3  # Backward motion
-        rhythm_speed = 1.8
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.5
-        arm_horizontal_freq = 1.0
-        leg_swing_intensity = 0.7  # Focus on leg movement
-        
-    elif move_type == 13:  # Robot - stiff, mechanical movements
-        dance_bounce = math.sin(local_dance_time * 1.0) * character_size * 0.06  # Slower, stiffer
-        body_lean = math.sin(local_dance_time * 0.4) * intensity * 0.15  # Minimal lean
-        horizontal_sway = math.sin(local_dance_time * 0.3) * intensity * character_size * 0.1
-        rhythm_speed = 0.8  # Slower, more mechanical
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = -math.sin(local_dance_time * rhythm_speed)  # Opposite, robotic
-        arm_swing_intensity = 0.4  # Stiff movements
-        arm_horizontal_freq = 0.6
-        leg_swing_intensity = 0.3  # Minimal leg movement
-        
-    elif move_type == 14:  # Floss - side-to-side arm swinging
-        dance_bounce = math.sin(local_dance_time * 2.5) * character_size * 0.08
-        body_lean = math.sin(local_dance_time * 1.2) * intensity * 0.25
-        horizontal_sway = math.sin(local_dance_time * 1.5) * intensity * character_size * 0.2
-        rhythm_speed = 2.0  # Fast
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = -math.sin(local_dance_time * rhythm_speed)  # Opposite arms
-        arm_swing_intensity = 1.0  # Maximum arm movement
-        arm_horizontal_freq = 2.0  # Fast horizontal swings
-        leg_swing_intensity = 0.2  # Minimal leg movement
-        
-    elif move_type == 15:  # Running Man - alternating leg lifts
-        dance_bounce = math.sin(local_dance_time * 2.2) * character_size * 0.1
-        body_lean = math.sin(local_dance_time * 0.8) * intensity * 0.2
-        horizontal_sway = math.sin(local_dance_time * 0.6) * intensity * character_size * 0.15
-        rhythm_speed = 2.2  # Fast alternating
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.6
-        arm_horizontal_freq = 1.4
-        leg_swing_intensity = 1.0  # Maximum leg movement (running motion)
-        
-    elif move_type == 16:  # Windmill - continuous spinning
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.08
-        body_lean = math.sin(local_dance_time * 3.0) * intensity * 0.6  # Continuous rotation
-        horizontal_sway = math.cos(local_dance_time * 2.5) * intensity * character_size * 0.3
-        rhythm_speed = 2.5  # Fast spinning
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.9  # Big arm movements
-        arm_horizontal_freq = 2.5
-        leg_swing_intensity = 0.5
-        
-    elif move_type == 17:  # Freeze - sharp, popping movements
-        # Sharp, staccato movements with pauses
-        freeze_phase = math.floor(local_dance_time * 2.0) % 2  # Alternates between 0 and 1
-        dance_bounce = math.sin(local_dance_time * 3.0) * character_size * 0.12 * (1 if freeze_phase == 0 else 0.3)
-        body_lean = math.sin(local_dance_time * 1.5) * intensity * 0.4 * (1 if freeze_phase == 0 else 0.2)
-        horizontal_sway = math.sin(local_dance_time * 1.0) * intensity * character_size * 0.2
-        rhythm_speed = 1.5
-        left_side_phase = math.sin(local_dance_time * rhythm_speed) * (1 if freeze_phase == 0 else 0.3)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed) * (1 if freeze_phase == 0 else 0.3)
-        arm_swing_intensity = 0.7
-        arm_horizontal_freq = 1.5
-        leg_swing_intensity = 0.6
-        
-    elif move_type == 18:  # Shuffle - quick side steps
-        dance_bounce = math.sin(local_dance_time * 2.5) * character_size * 0.08
-        body_lean = math.sin(local_dance_time * 1.0) * intensity * 0.3
-        horizontal_sway = math.sin(local_dance_time * 2.0) * intensity * character_size * 0.4  # Big side movement
-        rhythm_speed = 2.5  # Very fast
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed)
-        arm_swing_intensity = 0.5
-        arm_horizontal_freq = 2.0
-        leg_swing_intensity = 0.8  # Quick leg movements
-        
-    else:  # move_type == 19: C-Walk - complex footwork
-        dance_bounce = math.sin(local_dance_time * 2.0) * character_size * 0.06
-        body_lean = math.sin(local_dance_time * 0.9) * intensity * 0.35
-        horizontal_sway = math.cos(local_dance_time * 1.5) * intensity * character_size * 0.25
-        rhythm_speed = 1.8
-        left_side_phase = math.sin(local_dance_time * rhythm_speed)
-        right_side_phase = math.cos(local_dance_time * rhythm_speed + math.pi * 0.3)  # Offset phase
-        arm_swing_intensity = 0.4  # Less arm movement
-        arm_horizontal_freq = 1.3
-        leg_swing_intensity = 0.9  # Complex leg movements
-    
-    # Add audio-reactive bounce (bass affects bounce more)
-    audio_bounce = audio_amplitude * intensity * character_size * 0.15
-    bass_bounce = audio_low * intensity * character_size * 0.2  # Extra bounce from bass
-    total_bounce = dance_bounce + audio_bounce + bass_bounce
-    
-    # Add audio-reactive sway (beat affects horizontal movement)
-    audio_sway = (audio_beat - 0.5) * intensity * character_size * 0.15
-    # Add high-frequency jitter for more dynamic movement
-    high_sway = (audio_high - 0.5) * intensity * character_size * 0.1
-    
-    # Calculate character position
-    final_char_x = char_x + horizontal_sway + audio_sway + high_sway
-    final_char_y = char_y - total_bounce + ground_offset  # Add ground offset for floor moves
-    
-    # For couples, mirror movements if needed (swap left/right)
-    if is_couple and mirror_couple:
-        left_side_phase, right_side_phase = right_side_phase, left_side_phase
-    
-    # Calculate arm movements (mid frequencies affect arms more)
-    left_arm_vertical_swing = left_side_phase * intensity * arm_swing_intensity * audio_boost * mid_boost
-    left_arm_horizontal_swing = math.cos(local_dance_time * arm_horizontal_freq) * intensity * 0.5 * mid_boost
-    
-    right_arm_vertical_swing = right_side_phase * intensity * arm_swing_intensity * audio_boost * mid_boost
-    right_arm_horizontal_swing = -math.cos(local_dance_time * arm_horizontal_freq) * intensity * 0.5 * mid_boost
-    
-    # For couples, mirror arm movements
-    if is_couple and mirror_couple:
-        left_arm_vertical_swing, right_arm_vertical_swing = right_arm_vertical_swing, left_arm_vertical_swing
-        left_arm_horizontal_swing, right_arm_horizontal_swing = -right_arm_horizontal_swing, -left_arm_horizontal_swing
-    
-    # Special handling for Arm Circles move type
-    if move_type == 6:
-        # Create circular arm movements
-        circle_radius = arm_length * 0.5
-        left_arm_circle_angle = local_dance_time * 1.5
-        right_arm_circle_angle = local_dance_time * 1.5 + math.pi  # Opposite direction
-        if is_couple and mirror_couple:
-            # Reverse circle direction for mirrored partner
-            left_arm_circle_angle = local_dance_time * 1.5 + math.pi
-            right_arm_circle_angle = local_dance_time * 1.5
-        left_arm_horizontal_swing = math.cos(left_arm_circle_angle) * circle_radius / arm_length
-        left_arm_vertical_swing = math.sin(left_arm_circle_angle) * intensity * 0.8 * audio_boost
-        right_arm_horizontal_swing = math.cos(right_arm_circle_angle) * circle_radius / arm_length
-        right_arm_vertical_swing = math.sin(right_arm_circle_angle) * intensity * 0.8 * audio_boost
-    
-    # Special handling for Floss move type (move_type 14)
-    elif move_type == 14:
-        # Floss: arms swing side to side in opposite directions
-        floss_angle = local_dance_time * 2.0
-        # Left arm swings right, right arm swings left (crossing motion)
-        left_arm_horizontal_swing = math.sin(floss_angle) * 1.2  # Big side-to-side
-        left_arm_vertical_swing = math.cos(floss_angle) * intensity * 0.3 * audio_boost  # Small vertical
-        right_arm_horizontal_swing = -math.sin(floss_angle) * 1.2  # Opposite direction
-        right_arm_vertical_swing = math.cos(floss_angle + math.pi) * intensity * 0.3 * audio_boost
-    
-    # Draw character
-    
-    # For floor moves, adjust body orientation to be more horizontal
-    if move_type >= 8:  # Floor moves (8-11)
-        # Body is more horizontal for floor moves
-        body_tilt = math.pi / 2 - 0.3  # Tilt body toward horizontal
-        body_angle_adjusted = body_lean + body_tilt
-    else:
-        body_angle_adjusted = body_lean
-    
-    # Head (bobs slightly with bounce, reacts to high frequencies)
-    head_y = final_char_y - body_length - head_radius
-    head_x = final_char_x + body_lean * character_size * 0.2
-    # Add high-frequency head bob (high frequencies make head bob more)
+    total_bounce = character_size * (pose[:, BOUNCE] + (audio_amplitude * 0.15 + audio_low * 0.2) * intensity)
+    sway = (pose[:, SWAY] + ((audio_beat - 0.5) * 0.15 + (audio_high - 0.5) * 0.1)) * intensity * character_size
+    final_x = char_x + sway
+    final_y = char_y - total_bounce + params['ground'][move_type] * character_size
+    body_lean = pose[:, LEAN] * intensity
+    # Arms swing on the rhythm; circles and floss replace the swing entirely
+    arm_v = intensity * params['arm_swing'][move_type] * audio_boost * mid_boost
+    left_arm_v = pose[:, LEFT] * arm_v
+    right_arm_v = pose[:, RIGHT] * arm_v
+    left_arm_h = pose[:, ARM_H] * (intensity * 0.5 * mid_boost)
+    right_arm_h = -left_arm_h
+    special = params['special'][move_type]
+    if special.any():
+        # Mirrored partners circle their arms the other way
+        flip = np.where(mirror & (special == 1), -1.0, 1.0)
+        special_h = pose[:, SPECIAL_H] * flip
+        special_v = pose[:, SPECIAL_V] * flip * intensity * audio_boost
+        is_special = special > 0
+        left_arm_h = np.where(is_special, special_h, left_arm_h)
+        right_arm_h = np.where(is_special, -special_h, right_arm_h)
+        left_arm_v = np.where(is_special, special_v, left_arm_v)
+        right_arm_v = np.where(is_special, -special_v, right_arm_v)
+    # Legs step on the rhythm (mirrored partners swap sides)
+    left_side = np.where(mirror, pose[:, RIGHT], pose[:, LEFT])
+    right_side = np.where(mirror, pose[:, LEFT], pose[:, RIGHT])
+    leg_swing = intensity * params['leg_swing'][move_type] * audio_boost * bass_boost
+    left_leg_angle = params['left_leg'][move_type] + left_side * leg_swing * params['left_gain'][move_type]
+    right_leg_angle = params['right_leg'][move_type] - right_side * leg_swing * params['right_gain'][move_type]
+    # Floor moves tilt the body toward horizontal and keep the head low
+    floor = params['floor'][move_type]
+    body_angle = body_lean + np.where(floor, HALF_PI - 0.3, 0.0)
+    head_x = final_x + body_lean * character_size * 0.2
     head_high_bob = audio_high * intensity * character_size * 0.1
-    
-    # For floor moves, head is closer to ground level
-    if move_type >= 8:
-        head_y = final_char_y - body_length * 0.3 - head_radius - head_high_bob
-    else:
-        head_y = head_y - head_high_bob
-    
-    pygame.draw.circle(screen, color, (int(head_x), int(head_y)), int(head_radius))
-    
-    # Body (leans with dance, more horizontal for floor moves)
+    head_y = final_y - np.where(floor, body_length * 0.3, body_length) - head_radius - head_high_bob
     body_start_y = head_y + head_radius
-    body_end_y = final_char_y
-    body_angle = body_angle_adjusted
-    body_end_x = final_char_x + math.sin(body_angle) * body_length * 0.3
-    body_end_y_actual = body_end_y - math.cos(body_angle) * body_length * 0.3
-    pygame.draw.line(screen, color, 
-                    (int(head_x), int(body_start_y)), 
-                    (int(body_end_x), int(body_end_y_actual)), 
-                    max(2, int(character_size * 0.08)))
-    
-    # Shoulder position (where arms attach - top third of body)
-    shoulder_y_pos = body_start_y + (body_end_y_actual - body_start_y) * 0.25  # Top quarter of body
-    shoulder_x = head_x + math.sin(body_angle) * (body_end_y_actual - body_start_y) * 0.25
-    shoulder_y = shoulder_y_pos
-    
-    # Hip position (where legs attach - bottom of body)
-    hip_x = body_end_x
-    hip_y = body_end_y_actual
-    
-    # Arms - extend from shoulders horizontally, then angle up/down
-    # Left arm (dancing motion - swings left and up/down)
-    left_arm_base_x = shoulder_x - arm_length * 0.7  # Base horizontal position (left)
-    left_arm_end_x = left_arm_base_x + left_arm_horizontal_swing * arm_length * 0.3
-    left_arm_end_y = shoulder_y + left_arm_vertical_swing * arm_length * 0.8
-    
-    pygame.draw.line(screen, color,
-                    (int(shoulder_x), int(shoulder_y)),
-                    (int(left_arm_end_x), int(left_arm_end_y)),
-                    max(2, int(character_size * 0.06)))
-    
-    # Right arm (dancing motion - swings right and up/down)
-    right_arm_base_x = shoulder_x + arm_length * 0.7  # Base horizontal position (right)
-    right_arm_end_x = right_arm_base_x + right_arm_horizontal_swing * arm_length * 0.3
-    right_arm_end_y = shoulder_y + right_arm_vertical_swing * arm_length * 0.8
-    
-    pygame.draw.line(screen, color,
-                    (int(shoulder_x), int(shoulder_y)),
-                    (int(right_arm_end_x), int(right_arm_end_y)),
-                    max(2, int(character_size * 0.06)))
-    
-    # Legs - stepping dance motion (alternating)
-    # Different move types affect leg movements
-    # Leg movements react more to bass (low frequencies)
-    left_leg_swing = left_side_phase * intensity * leg_swing_intensity * audio_boost * bass_boost
-    right_leg_swing = right_side_phase * intensity * leg_swing_intensity * audio_boost * bass_boost
-    
-    # Adjust leg angles based on move type
-    if move_type == 5:  # Kick - bigger leg movements
-        left_leg_base_angle = math.pi / 2 + 0.2
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.6
-        right_leg_base_angle = math.pi / 2 - 0.2
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.6
-    elif move_type == 4:  # Squat - legs spread more
-        left_leg_base_angle = math.pi / 2 + 0.25
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.5
-        right_leg_base_angle = math.pi / 2 - 0.25
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.5
-    elif move_type == 8:  # Breakdance - legs spread out horizontally on ground
-        left_leg_base_angle = math.pi * 0.7  # More horizontal, angled left
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.3
-        right_leg_base_angle = math.pi * 0.3  # More horizontal, angled right
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.3
-    elif move_type == 9:  # Low Squat - legs very spread out
-        left_leg_base_angle = math.pi / 2 + 0.35
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.4
-        right_leg_base_angle = math.pi / 2 - 0.35
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.4
-    elif move_type == 10:  # One Knee - one leg down, one leg up
-        # Left leg is the kneeling one (more horizontal)
-        left_leg_base_angle = math.pi * 0.75  # More horizontal
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.2
-        # Right leg is up (more vertical)
-        right_leg_base_angle = math.pi / 2 - 0.1
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.5
-    elif move_type == 11:  # Floor Spin - legs spread out horizontally
-        left_leg_base_angle = math.pi * 0.65  # Horizontal
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.4
-        right_leg_base_angle = math.pi * 0.35  # Horizontal
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.4
-    elif move_type == 12:  # Moonwalk - legs slide backward
-        left_leg_base_angle = math.pi / 2 + 0.1
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.5
-        right_leg_base_angle = math.pi / 2 - 0.1
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.5
-    elif move_type == 13:  # Robot - stiff, minimal leg movement
-        left_leg_base_angle = math.pi / 2 + 0.1
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.2  # Small movements
-        right_leg_base_angle = math.pi / 2 - 0.1
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.2
-    elif move_type == 14:  # Floss - minimal leg movement, focus on arms
-        left_leg_base_angle = math.pi / 2 + 0.1
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.2
-        right_leg_base_angle = math.pi / 2 - 0.1
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.2
-    elif move_type == 15:  # Running Man - big leg lifts
-        left_leg_base_angle = math.pi / 2 + 0.3
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.7  # Big lifts
-        right_leg_base_angle = math.pi / 2 - 0.3
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.7
-    elif move_type == 16:  # Windmill - legs spread for spinning
-        left_leg_base_angle = math.pi / 2 + 0.2
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.5
-        right_leg_base_angle = math.pi / 2 - 0.2
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.5
-    elif move_type == 17:  # Freeze - sharp leg movements
-        left_leg_base_angle = math.pi / 2 + 0.2
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.5
-        right_leg_base_angle = math.pi / 2 - 0.2
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.5
-    elif move_type == 18:  # Shuffle - quick side leg movements
-        left_leg_base_angle = math.pi / 2 + 0.25
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.6
-        right_leg_base_angle = math.pi / 2 - 0.25
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.6
-    else:  # move_type == 19: C-Walk - complex footwork
-        left_leg_base_angle = math.pi / 2 + 0.2
-        left_leg_angle = left_leg_base_angle + left_leg_swing * 0.6
-        right_leg_base_angle = math.pi / 2 - 0.2
-        right_leg_angle = right_leg_base_angle - right_leg_swing * 0.6
-    
-    left_leg_end_x = hip_x + math.cos(left_leg_angle) * leg_length
-    left_leg_end_y = hip_y + math.sin(left_leg_angle) * leg_length
-    pygame.draw.line(screen, color,
-                    (int(hip_x), int(hip_y)),
-                    (int(left_leg_end_x), int(left_leg_end_y)),
-                    max(2, int(character_size * 0.06)))
-    
-    right_leg_end_x = hip_x + math.cos(right_leg_angle) * leg_length
-    right_leg_end_y = hip_y + math.sin(right_leg_angle) * leg_length
-    pygame.draw.line(screen, color,
-                    (int(hip_x), int(hip_y)),
-                    (int(right_leg_end_x), int(right_leg_end_y)),
-                    max(2, int(character_size * 0.06)))
+    body_sin = np.sin(body_angle)
+    hip_x = final_x + body_sin * body_length * 0.3
+    hip_y = final_y - np.cos(body_angle) * body_length * 0.3
+    # Arms attach a quarter of the way down the body
+    shoulder_x = head_x + body_sin * (hip_y - body_start_y) * 0.25
+    shoulder_y = body_start_y + (hip_y - body_start_y) * 0.25
+    joints = np.array([
+        head_x, head_y, body_start_y, hip_x, hip_y, shoulder_x, shoulder_y,
+        shoulder_x - arm_length * 0.7 + left_arm_h * arm_length * 0.3, shoulder_y + left_arm_v * arm_length * 0.8,
+        shoulder_x + arm_length * 0.7 + right_arm_h * arm_length * 0.3, shoulder_y + right_arm_v * arm_length * 0.8,
+        hip_x + np.cos(left_leg_angle) * leg_length, hip_y + np.sin(left_leg_angle) * leg_length,
+        hip_x + np.cos(right_leg_angle) * leg_length, hip_y + np.sin(right_leg_angle) * leg_length,
+    ]).astype(np.intp).T.tolist()
+    head_size = int(head_radius)
+    body_width = max(2, int(character_size * 0.08))
+    limb_width = max(2, int(character_size * 0.06))
+    line = pygame.draw.line
+    for hx, hy, by, px, py, sx, sy, lax, lay, rax, ray, llx, lly, rlx, rly in joints:
+        pygame.draw.circle(screen, color, (hx, hy), head_size)
+        line(screen, color, (hx, by), (px, py), body_width)
+        line(screen, color, (sx, sy), (lax, lay), limb_width)
+        line(screen, color, (sx, sy), (rax, ray), limb_width)
+        line(screen, color, (px, py), (llx, lly), limb_width)
+        line(screen, color, (px, py), (rlx, rly), limb_width)
 
 def draw(screen, eyesy):
     """Draw multiple dancing characters"""
@@ -548,47 +293,9 @@ def draw(screen, eyesy):
     xr = eyesy.xres
     yr = eyesy.yres
     
-    # Calculate audio amplitude for reactivity
-    audio_amplitude = 0.0
-    audio_beat = 0.0
-    audio_low = 0.0  # Low frequency (bass) component
-    audio_mid = 0.0  # Mid frequency component
-    audio_high = 0.0  # High frequency component
-    
-    if len(eyesy.audio_in) > 0:
-        # Calculate average amplitude
-        total = 0.0
-        peak = 0.0
-        low_total = 0.0
-        mid_total = 0.0
-        high_total = 0.0
-        
-        for i in range(len(eyesy.audio_in)):
-            abs_val = abs(eyesy.audio_in[i])
-            total += abs_val
-            if abs_val > peak:
-                peak = abs_val
-            
-            # Simple frequency separation (rough approximation)
-            # Lower indices = lower frequencies (in typical audio processing)
-            if i < len(eyesy.audio_in) // 3:
-                low_total += abs_val
-            elif i < 2 * len(eyesy.audio_in) // 3:
-                mid_total += abs_val
-            else:
-                high_total += abs_val
-        
-        audio_amplitude = (total / len(eyesy.audio_in)) / 32768.0  # Normalize to 0-1
-        audio_beat = peak / 32768.0  # Peak for beat detection
-        
-        # Normalize frequency components
-        low_count = max(1, len(eyesy.audio_in) // 3)
-        mid_count = max(1, len(eyesy.audio_in) // 3)
-        high_count = max(1, len(eyesy.audio_in) - 2 * (len(eyesy.audio_in) // 3))
-        
-        audio_low = (low_total / low_count) / 32768.0
-        audio_mid = (mid_total / mid_count) / 32768.0
-        audio_high = (high_total / high_count) / 32768.0
+    # Audio amplitude, peak and a rough low/mid/high split, in one vectorized pass
+    audio = audio_bands(eyesy.audio_in)
+    audio_amplitude = audio[0]
     
     # Number of characters (Knob3) - 1 to 25 characters (perfect 5x5 grid at max)
     num_characters = int(1 + eyesy.knob3 * 24.99)  # 1-25 characters
@@ -776,7 +483,8 @@ def draw(screen, eyesy):
                 couple_map[i] = i + 1
                 couple_map[i + 1] = i
     
-    # Draw each character with unique dance parameters
+    # Gather each character's dance parameters, then pose and draw them together
+    dancers = []  # (x, y, phase_offset, speed_multiplier, move_type, mirror)
     for i, (pos_x, pos_y) in enumerate(positions):
         # Check if this character is part of a couple
         is_in_couple = i in couple_map
@@ -798,11 +506,7 @@ def draw(screen, eyesy):
         # First partner mirrors, second partner doesn't (creates mirror effect)
         mirror_couple = is_in_couple and is_first_partner
         
-        draw_character(screen, color, pos_x, pos_y, character_size, intensity,
-                     audio_amplitude, audio_beat, audio_low, audio_mid, audio_high,
-                     dance_time,
-                     phase_offset, speed_multiplier, move_type,
-                     is_in_couple, mirror_couple)
+        dancers.append((pos_x, pos_y, phase_offset, speed_multiplier, move_type, mirror_couple))
     
     # Add a dedicated breakdancer character (appears conditionally)
     # Appears when there are 3+ characters, with varying probability
@@ -846,8 +550,10 @@ def draw(screen, eyesy):
         breakdancer_phase = dance_time * 0.3  # Different phase from others
         breakdancer_speed = 1.2  # Slightly faster for more dynamic breakdancing
         
-        draw_character(screen, color, breakdancer_x, breakdancer_y, character_size, intensity,
-                     audio_amplitude, audio_beat, audio_low, audio_mid, audio_high,
-                     dance_time,
-                     breakdancer_phase, breakdancer_speed, 8,  # Always breakdance (move_type 8)
-                     False, False)  # Not part of a couple
+        dancers.append((breakdancer_x, breakdancer_y, breakdancer_phase, breakdancer_speed,
+                        BREAKDANCE_MOVE, False))  # Always breakdance, never part of a couple
+    
+    if dancers:
+        char_x, char_y, phase_offset, speed_multiplier, move_type, mirror = (np.array(v) for v in zip(*dancers))
+        draw_characters(screen, color, char_x, char_y, phase_offset, speed_multiplier, move_type, mirror,
+                        character_size, intensity, audio, dance_time)
@@ -0,0 +1,439 @@
+"""
+Background camera capture shared by the webcam modes (U - Webcam, U - Webcam Grid).
+
+Reading a camera inside draw() stalls the whole frame for as long as the
+driver takes to deliver the next image (and with ffmpeg, for as long as it
+takes to spawn a new process). Here every device gets its own reader thread:
+it converts each frame to RGB at the mode's size and publishes it into a
+preallocated latest-frame slot, and draw() just picks up whatever frame is
+newest without ever waiting on the camera.
+
+Modes import it from examples/lib (or from their own folder when the file is
+copied next to main.py for deployment).
+"""
+
+import functools
+import subprocess
+import threading
+import time
+import numpy as np
+import pygame
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+@functools.lru_cache(maxsize=8)
+def _resize_index(src_height, src_width, height, width, bgr):
+    """Flat source index for every byte of a (height, width, 3) nearest-neighbour resize
+
+    The channel swap for BGR sources is folded into the same index, so the
+    resize is a single np.take straight into the output buffer.
+    """
+    rows = np.arange(height) * src_height // height
+    cols = np.arange(width) * src_width // width
+    channels = np.array([2, 1, 0] if bgr else [0, 1, 2])
+    pixels = rows[:, None] * src_width + cols
+    return (pixels[:, :, None] * 3 + channels).astype(np.intp).ravel()
+
+
+def convert_frame(frame, out, bgr=False):
+    """Resize `frame` to out's size and write it into `out` as RGB
+
+    `out` is a (height, width, 3) uint8 array. Grey frames are expanded and an
+    alpha channel is dropped. Uses OpenCV when it is installed, otherwise a
+    nearest-neighbour NumPy resize.
+    """
+    if frame.ndim == 2:
+        frame = frame[:, :, None].repeat(3, axis=2)
+    elif frame.shape[2] > 3:
+        frame = frame[:, :, :3]
+    height, width = out.shape[:2]
+    if cv2 is not None:
+        if frame.shape[:2] != (height, width):
+            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+        if bgr:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out)
+        else:
+            np.copyto(out, frame)
+        return
+    if frame.shape[:2] == (height, width):
+        if bgr:
+            # One plane at a time is several times faster than copying a reversed view
+            for channel in range(3):
+                np.copyto(out[:, :, channel], frame[:, :, 2 - channel])
+        else:
+            np.copyto(out, frame)
+        return
+    index = _resize_index(frame.shape[0], frame.shape[1], height, width, bgr)
+    # mode='clip' lets take() write straight into `out` instead of through a temporary
+    np.take(np.ascontiguousarray(frame).reshape(-1), index, out=out.reshape(-1), mode='clip')
+
+
+def frame_surface(size):
+    """A Surface to upload frames into, in the display's pixel format when there is a display"""
+    surface = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+def upload_frame(surface, frame):
+    """Copy an RGB (height, width, 3) frame into `surface` (same size) and return it
+
+    A contiguous frame is wrapped with pygame.image.frombuffer - a Surface
+    header over the array, no pixel copy - and blitted, which converts to the
+    surface's format in one pass. Use this with a persistent surface from
+    frame_surface() instead of building a new Surface per frame.
+    """
+    if frame.flags.c_contiguous:
+        surface.blit(pygame.image.frombuffer(frame, (frame.shape[1], frame.shape[0]), 'RGB'), (0, 0))
+    else:
+        pygame.surfarray.blit_array(surface, frame.swapaxes(0, 1))
+    return surface
+
+
+class FrameSource:
+    """Something a CaptureStream can pull frames from
+
+    read() returns a (height, width, 3) uint8 array, or None when no frame is
+    ready yet, and raises EOFError once the source is gone for good. `bgr`
+    says whether the channels come in BGR order. A source whose frames already
+    have the stream's size (`size`, as (width, height)) can override
+    read_into() to write straight into the stream's buffer.
+    """
+
+    bgr = False
+    size = None
+
+    def read(self):
+        raise NotImplementedError
+
+    def read_into(self, out):
+        frame = self.read()
+        if frame is None:
+            return False
+        convert_frame(frame, out, self.bgr)
+        return True
+
+    def close(self):
+        pass
+
+
+class OpenCVSource(FrameSource):
+    """An opened cv2.VideoCapture"""
+
+    bgr = True
+
+    def __init__(self, capture):
+        self.capture = capture
+
+    def read(self):
+        ret, frame = self.capture.read()
+        if not ret or frame is None or frame.size == 0:
+            return None
+        return frame
+
+    def close(self):
+        self.capture.release()
+
+
+class WebcamLibSource(FrameSource):
+    """A started webcam.Webcam (returns RGB frames)"""
+
+    def __init__(self, webcam):
+        self.webcam = webcam
+
+    def read(self):
+        frame = self.webcam.read()
+        if frame is None or frame.size == 0:
+            return None
+        return frame
+
+    def close(self):
+        self.webcam.stop()
+
+
+class ImageioSource(FrameSource):
+    """An imageio reader such as imageio.get_reader('<video0>')"""
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    def read(self):
+        try:
+            frame = self.reader.get_next_data()
+        except IndexError:
+            raise EOFError('imageio reader ran out of frames')
+        if frame is None or frame.size == 0:
+            return None
+        return frame
+
+    def close(self):
+        self.reader.close()
+
+
+class PygameCameraSource(FrameSource):
+    """A started pygame.camera.Camera"""
+
+    def __init__(self, camera):
+        self.camera = camera
+        self.surface = None
+
+    def read(self):
+        # get_image() blocks until the driver has a frame, which is fine on the reader thread
+        self.surface = self.camera.get_image(self.surface)
+        return pygame.surfarray.array3d(self.surface).swapaxes(0, 1)
+
+    def close(self):
+        self.camera.stop()
+
+
+class FFmpegPipeSource(FrameSource):
+    """One long-running ffmpeg process streaming raw RGB frames over a pipe
+
+    ffmpeg does the decode and the scaling to `size`, so every frame is read
+    directly into the stream's buffer. `input_format` defaults to v4l2 for
+    /dev/video* devices; pass None to read a video file instead (played in
+    real time and looped, which makes it a stand-in camera for testing).
+    """
+
+    def __init__(self, device, size, input_format='v4l2', ffmpeg='ffmpeg'):
+        self.device = device
+        self.size = tuple(size)
+        self.frame_bytes = self.size[0] * self.size[1] * 3
+        cmd = [ffmpeg, '-loglevel', 'error', '-nostdin']
+        if input_format:
+            cmd += ['-f', input_format]
+        else:
+            cmd += ['-re', '-stream_loop', '-1']
+        cmd += ['-i', device,
+                '-vf', f'scale={self.size[0]}:{self.size[1]}',
+                '-pix_fmt', 'rgb24', '-f', 'rawvideo', '-']
+        self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                        bufsize=self.frame_bytes)
+
+    def read_into(self, out):
+        view = memoryview(out).cast('B')
+        filled = 0
+        while filled < self.frame_bytes:
+            count = self.process.stdout.readinto(view[filled:])
+            if not count:
+                raise EOFError(f'ffmpeg stopped streaming {self.device}')
+            filled += count
+        return True
+
+    def read(self):
+        frame = np.empty((self.size[1], self.size[0], 3), np.uint8)
+        self.read_into(frame)
+        return frame
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+class VideoFileSource(FrameSource):
+    """Frames from a local video file, looped and paced to its frame rate
+
+    Stands in for a camera when testing or running the webcam modes without
+    one. Uses OpenCV when installed, otherwise imageio.
+    """
+
+    def __init__(self, path, fps=None):
+        self.path = path
+        self.frame_time = 0.0
+        if cv2 is not None:
+            self.capture = cv2.VideoCapture(path)
+            if not self.capture.isOpened():
+                raise IOError(f'could not open {path}')
+            self.bgr = True
+            fps = fps or self.capture.get(cv2.CAP_PROP_FPS)
+        else:
+            import imageio
+            self.reader = imageio.get_reader(path)
+            fps = fps or self.reader.get_meta_data().get('fps')
+        self.interval = 1.0 / fps if fps else 0.0
+
+    def _next_frame(self):
+        if cv2 is not None:
+            ret, frame = self.capture.read()
+            if not ret:
+                self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ret, frame = self.capture.read()
+            return frame if ret else None
+        try:
+            return self.reader.get_next_data()
+        except IndexError:
+            self.reader.set_image_index(0)
+            return self.reader.get_next_data()
+
+    def read(self):
+        # Deliver frames no faster than the file's frame rate, like a live camera
+        wait = self.frame_time + self.interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self.frame_time = time.monotonic()
+        return self._next_frame()
+
+    def close(self):
+        if cv2 is not None:
+            self.capture.release()
+        else:
+            self.reader.close()
+
+
+class SyntheticSource(FrameSource):
+    """Generated test frames: a scrolling gradient at a fixed frame rate
+
+    Every pixel of the top-left 8x8 block holds the frame number (mod 256) in
+    all three channels, so tests can tell which frame they were handed. With
+    `bgr=True` the frames come out in BGR order like an OpenCV camera.
+    `frame_count` ends the source after that many frames.
+    """
+
+    def __init__(self, size, fps=30.0, bgr=False, frame_count=None):
+        self.native_size = tuple(size)
+        self.bgr = bgr
+        self.interval = 1.0 / fps if fps else 0.0
+        self.frame_count = frame_count
+        self.frames_made = 0
+        self.frame_time = 0.0
+        width, height = self.native_size
+        self.ramp_x = np.linspace(0, 255, width).astype(np.uint8)
+        self.ramp_y = np.linspace(0, 255, height).astype(np.uint8)
+        self.closed = False
+
+    def read(self):
+        if self.closed or (self.frame_count is not None and self.frames_made >= self.frame_count):
+            raise EOFError('synthetic source finished')
+        wait = self.frame_time + self.interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self.frame_time = time.monotonic()
+        width, height = self.native_size
+        n = self.frames_made
+        frame = np.empty((height, width, 3), np.uint8)
+        frame[:, :, 0] = np.roll(self.ramp_x, n)[None, :]
+        frame[:, :, 1] = self.ramp_y[:, None]
+        frame[:, :, 2] = 255 - frame[:, :, 0]
+        frame[:8, :8] = n % 256
+        self.frames_made += 1
+        return frame
+
+    def close(self):
+        self.closed = True
+
+
+class CaptureStream:
+    """A reader thread that keeps the newest frame of one source ready for draw()
+
+    Frames live in three preallocated (height, width, 3) RGB buffers: the
+    newest published frame, the one draw() is currently using, and the one the
+    thread is filling. latest() only takes a lock long enough to swap indices,
+    so it never waits for the camera. Frames the thread produces faster than
+    draw() asks for them are simply overwritten.
+    """
+
+    def __init__(self, source, size, name='camera', idle_delay=0.005):
+        self.source = source
+        self.size = tuple(size)
+        self.name = name
+        self.idle_delay = idle_delay  # Back-off when the source has no frame ready
+        width, height = self.size
+        self.buffers = np.zeros((3, height, width, 3), np.uint8)
+        self.frame_id = 0  # Number of frames published so far
+        self.error = None
+        self._front = -1  # Newest published buffer
+        self._reading = -1  # Buffer handed out by latest()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'capture {name}', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def latest(self):
+        """(frame, frame_id) for the newest frame, or (None, 0) before the first one
+
+        The frame stays valid until the next latest() call; compare frame_id
+        with the last one seen to skip re-uploading an unchanged frame.
+        """
+        with self._lock:
+            if self._front < 0:
+                return None, 0
+            self._reading = self._front
+            return self.buffers[self._front], self.frame_id
+
+    def _run(self):
+        source = self.source
+        direct = source.size is not None and tuple(source.size) == self.size
+        while not self._stop.is_set():
+            with self._lock:
+                back = next(i for i in range(3) if i != self._front and i != self._reading)
+            out = self.buffers[back]
+            try:
+                if direct:
+                    ok = source.read_into(out)
+                else:
+                    frame = source.read()
+                    ok = frame is not None
+                    if ok:
+                        convert_frame(frame, out, source.bgr)
+            except EOFError:
+                break
+            except Exception as e:
+                if self.error is None:
+                    print(f"{self.name} read error (will retry): {e}")
+                self.error = e
+                ok = False
+            if ok:
+                with self._lock:
+                    self._front = back
+                    self.frame_id += 1
+            elif not self._stop.is_set():
+                time.sleep(self.idle_delay)
+
+    def stop(self, timeout=1.0):
+        """Stop the thread and release the device"""
+        self._stop.set()
+        self._thread.join(timeout)
+        try:
+            self.source.close()
+        except Exception:
+            pass
+        # A read that was blocked on the device returns once it is closed
+        self._thread.join(timeout)
+
+
+# Running streams by device, so a mode that is reloaded (or another webcam
+# mode) can hand the device back before opening it again
+_streams = {}
+
+
+def open_stream(key, source, size, name=None):
+    """Start a CaptureStream for `source`, stopping any earlier one for the same device"""
+    close_stream(key)
+    stream = CaptureStream(source, size, name or str(key)).start()
+    _streams[key] = stream
+    return stream
+
+
+def close_stream(key):
+    stream = _streams.pop(key, None)
+    if stream is not None:
+        stream.stop()
+
+
+def close_all_streams():
+    for key in list(_streams):
+        close_stream(key)
@@ -0,0 +1,95 @@
+"""
+Batched Bezier curves shared by the curve scope modes (S - Folia Curves,
+S - Bezier H Scope, S - Bezier V Scope).
+
+Control points for many curves live in one NumPy array of shape
+(..., points, 2). Tessellation is a single matrix product with a cached table
+of Bernstein weights, rotation applies one 2x2 matrix per curve (or per grid
+cell) in bulk, and each finished curve goes to the screen as one
+pygame.draw.lines / aalines call instead of a gfxdraw.bezier per curve.
+
+gfx_segments() gives the sampling pygame.gfxdraw.bezier uses for a given
+`steps`, so the modes keep their look.
+
+Modes import it from examples/lib (or from their own folder when the file is
+copied next to main.py for deployment).
+"""
+
+import functools
+import math
+import numpy as np
+import pygame
+
+
+def gfx_segments(num_points, steps):
+    """Line segments pygame.gfxdraw.bezier draws for `num_points` control points"""
+    return num_points * steps
+
+
+@functools.lru_cache(maxsize=32)
+def bezier_basis(num_points, segments):
+    """(segments + 1, num_points) Bernstein weights for one Bezier of degree num_points - 1
+
+    Row i holds the weights at t = i / segments, so basis @ control_points
+    gives the tessellated curve. Cached because the modes reuse a few shapes.
+    """
+    degree = num_points - 1
+    t = np.linspace(0.0, 1.0, segments + 1)[:, None]
+    k = np.arange(num_points)
+    binomial = np.array([math.comb(degree, i) for i in k], dtype=np.float64)
+    basis = binomial * t ** k * (1.0 - t) ** (degree - k)
+    basis.flags.writeable = False
+    return basis
+
+
+def tessellate(control, segments):
+    """Evaluate every curve in `control` (..., points, 2) at segments + 1 points
+
+    Quadratic (3 points), cubic (4 points) or higher-degree curves all use the
+    same call; the result has shape (..., segments + 1, 2).
+    """
+    control = np.asarray(control, dtype=np.float64)
+    return np.matmul(bezier_basis(control.shape[-2], segments), control)
+
+
+def rotation_matrices(degrees):
+    """(..., 2, 2) rotation matrices for an array of angles in degrees"""
+    radians = np.radians(degrees)
+    cos_a = np.cos(radians)
+    sin_a = np.sin(radians)
+    return np.stack((np.stack((cos_a, -sin_a), -1), np.stack((sin_a, cos_a), -1)), -2)
+
+
+def rotate(points, centers, degrees):
+    """Rotate point sets about their own centers
+
+    points is (cells, ..., 2), centers (cells, 2) and degrees (cells,): every
+    point belonging to cell i turns by degrees[i] around centers[i].
+    """
+    points = np.asarray(points, dtype=np.float64)
+    centers = np.asarray(centers, dtype=np.float64)
+    matrices = rotation_matrices(degrees)
+    # Flatten each cell's points so one batched matmul turns them all
+    cells = points.shape[0]
+    flat = points.reshape(cells, -1, 2) - centers[:, None, :]
+    turned = np.matmul(flat, np.swapaxes(matrices, -1, -2)) + centers[:, None, :]
+    return turned.reshape(points.shape)
+
+
+def draw_polylines(surface, color, polylines, closed=False, antialias=False):
+    """Draw each (points, 2) polyline in `polylines` with one pygame call
+
+    Without antialiasing points are truncated to whole pixels, as gfxdraw does.
+    """
+    polylines = np.asarray(polylines)
+    if polylines.size == 0:
+        return
+    polylines = polylines.reshape(-1, polylines.shape[-2], 2)
+    if antialias:
+        draw_lines = pygame.draw.aalines
+        point_lists = polylines.tolist()
+    else:
+        draw_lines = pygame.draw.lines
+        point_lists = polylines.astype(np.intp).tolist()
+    for points in point_lists:
+        draw_lines(surface, color, closed, points)
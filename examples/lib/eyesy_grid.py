@@ -0,0 +1,354 @@
+"""
+Grid engine shared by the S - Grid scope modes (Circles, Triangles, Polygons
+and Slide Square, in their Filled / Unfilled / Outlined and Uniform / Column /
+Patchwork Color variants).
+
+Every one of them draws a shape on each cell of the same 7 x 10 lattice, with
+odd rows shifted right and odd columns shifted down, sized by one audio sample
+per cell. A Grid puts that together from three parts:
+
+- a shape (Circles, Triangles, Polygons, SlideSquares), which sizes all 70
+  cells from the audio in one NumPy expression and draws them
+- a color scheme (UniformColor, ColumnColor, PatchworkColor), which picks the
+  frame's few distinct colors once instead of once per cell
+- a shift (KnobShift, SlideShift, or None for a fixed lattice)
+
+The lattice itself is computed once per resolution. The arithmetic is done
+in the same order as the original per-cell loops, so the modes draw exactly
+what they used to.
+
+Modes import it from examples/lib (or from their own folder when the file is
+copied next to main.py for deployment).
+"""
+
+import functools
+import random
+import numpy as np
+import pygame
+
+ROWS = 7
+COLUMNS = 10
+CELLS = ROWS * COLUMNS
+_ROW = np.repeat(np.arange(ROWS), COLUMNS).reshape(ROWS, COLUMNS)
+_COLUMN = np.tile(np.arange(COLUMNS), ROWS).reshape(ROWS, COLUMNS)
+ODD_ROWS = _ROW % 2 == 1  # Shifted right
+ODD_COLUMNS = _COLUMN % 2 == 1  # Shifted down
+SAMPLE_SUM = (_COLUMN + _ROW).ravel()  # Audio sample per cell, audio_in[j + i]
+SAMPLE_DIFFERENCE = (_COLUMN - _ROW).ravel()  # audio_in[j - i], negative ones wrap
+
+
+@functools.lru_cache(maxsize=8)
+def lattice(xres, yres):
+    """(x, y) arrays of shape (ROWS, COLUMNS): cell centers before any shift
+
+    One spacing (an eighth of the width, a fifth of the height) outside the
+    top-left corner, so shapes run off every edge.
+    """
+    x8 = xres / 8
+    y5 = yres / 5
+    x = _COLUMN * x8 - x8
+    y = _ROW * y5 - y5
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return x, y
+
+
+def audio_samples(eyesy, cells):
+    """The audio sample for each cell, as floats"""
+    return np.asarray(eyesy.audio_in, dtype=np.float64)[cells]
+
+
+class KnobShift:
+    """knob1 shifts odd rows right by up to one spacing, knob2 odd columns down"""
+
+    def setup(self, eyesy):
+        pass
+
+    def offsets(self, eyesy):
+        return int(eyesy.knob1 * (eyesy.xres / 8)), int(eyesy.knob2 * (eyesy.yres / 5))
+
+
+class LFO:
+    """Triangle LFO between start and max, moving step per update()"""
+
+    def __init__(self, start, max, step):
+        self.start = start
+        self.max = max
+        self.step = step
+        self.current = 0
+        self.direction = 1
+
+    def update(self):
+        self.current += self.step * self.direction
+        # when it gets to the top, flip direction
+        if self.current >= self.max:
+            self.direction = -1
+            self.current = self.max  # in case it steps above max
+        # when it gets to the bottom, flip direction
+        if self.current <= self.start:
+            self.direction = 1
+            self.current = self.start  # in case it steps below min
+        return self.current
+
+
+class SlideShift:
+    """Rows slide back and forth on an LFO: knob1 sets its speed, knob2 its range
+
+    The LFO steps twice per row (once for the x shift, once for the y shift),
+    so every row is shifted a little differently.
+    """
+
+    def setup(self, eyesy):
+        self.range = eyesy.xres * 0.09375
+        self.speed = max(1, int(eyesy.xres * 0.00234))
+        self.lfo = LFO(-self.range, self.range, 10)
+
+    def offsets(self, eyesy):
+        lfo = self.lfo
+        lfo.step = eyesy.knob1 * self.speed
+        lfo.max = int(eyesy.knob2 * self.range)
+        lfo.start = int(eyesy.knob2 * -self.range)
+        x = []
+        y = []
+        for _ in range(ROWS):
+            x.append(-lfo.update())
+            y.append(lfo.update() * 0.8)
+        return np.array(x)[:, None], np.array(y)[:, None]
+
+
+class UniformColor:
+    """Every cell in the knob4 LFO color
+
+    per_cell asks color_picker_lfo once per cell, as the circle and polygon
+    modes always have: each call moves the LFO on, so their colors cycle
+    faster and drift across the grid.
+    """
+
+    def __init__(self, per_cell=False):
+        self.per_cell = per_cell
+
+    def setup(self, eyesy):
+        pass
+
+    def colors(self, eyesy):
+        if self.per_cell:
+            return [eyesy.color_picker_lfo(eyesy.knob4) for _ in range(CELLS)]
+        return [eyesy.color_picker_lfo(eyesy.knob4)] * CELLS
+
+
+class ColumnColor:
+    """Hue steps by a tenth per column from knob4"""
+
+    def setup(self, eyesy):
+        pass
+
+    def colors(self, eyesy):
+        return [eyesy.color_picker(((j * .1) + eyesy.knob4) % 1.0) for j in range(COLUMNS)] * ROWS
+
+
+def _patchwork():
+    """Which of the three patchwork colors each cell takes, -1 for the carried one
+
+    Odd rows take the first, odd columns the second and every third diagonal
+    the third, later rules winning. Other cells keep the color of the cell
+    drawn before them; for the first cell that is the last cell of the
+    previous frame.
+    """
+    picks = []
+    for i in range(ROWS):
+        for j in range(COLUMNS):
+            pick = picks[-1] if picks else -1
+            if i % 2 == 1:
+                pick = 0
+            if j % 2 == 1:
+                pick = 1
+            if (j + i) % 3 == 1:
+                pick = 2
+            picks.append(pick)
+    return picks
+
+
+PATCHWORK = _patchwork()
+
+
+class PatchworkColor:
+    """Three colors from knob4 in a patchwork; mirrored takes the second from 1 - knob4"""
+
+    def __init__(self, mirrored=False):
+        self.mirrored = mirrored
+
+    def setup(self, eyesy):
+        self.carried = eyesy.color_picker(eyesy.knob4)
+
+    def colors(self, eyesy):
+        knob = eyesy.knob4
+        second = 1 - knob if self.mirrored else (0.4 + knob) % 1.0
+        palette = [eyesy.color_picker(knob), eyesy.color_picker(second),
+                   eyesy.color_picker((0.8 + knob) % 1.0), self.carried]
+        colors = [palette[pick] for pick in PATCHWORK]
+        self.carried = colors[-1]
+        return colors
+
+
+class Circles:
+    """Circles sized by audio_in[j + i] plus a knob3 rest size
+
+    outlined draws two opposite quarters filled and the other two as outline.
+    """
+
+    samples = SAMPLE_SUM
+
+    def __init__(self, scale, outlined=False):
+        self.scale = scale
+        self.outlined = outlined
+
+    def setup(self, eyesy):
+        self.outline = int(eyesy.xres * 0.00625)
+
+    def prepare(self, eyesy):
+        pass
+
+    def sizes(self, audio, eyesy):
+        rest = int(eyesy.knob3 * (eyesy.xres * 0.023)) + 1
+        return np.abs(audio / 32768 * eyesy.xres * self.scale) + rest
+
+    def draw(self, screen, colors, xs, ys, sizes):
+        circle = pygame.draw.circle
+        if not self.outlined:
+            for color, x, y, size in zip(colors, xs.tolist(), ys.tolist(), sizes.tolist()):
+                circle(screen, color, [x, y], size)
+            return
+        outline = self.outline
+        for color, x, y, size in zip(colors, xs.tolist(), ys.tolist(), sizes.tolist()):
+            circle(screen, color, [x, y], size, 0, draw_top_right=False, draw_top_left=True,
+                   draw_bottom_right=True, draw_bottom_left=False)
+            circle(screen, color, [x, y], size, outline, draw_top_right=True, draw_top_left=False,
+                   draw_bottom_right=False, draw_bottom_left=True)
+
+
+class Triangles:
+    """Upright triangles, knob3 wide, grown by audio_in[j - i]"""
+
+    samples = SAMPLE_DIFFERENCE
+
+    def __init__(self, scale, filled=True):
+        self.scale = scale
+        self.filled = filled
+
+    def setup(self, eyesy):
+        self.line_width = 0 if self.filled else int(eyesy.xres * 0.0026)
+
+    def prepare(self, eyesy):
+        self.width = int(eyesy.knob3 * (eyesy.xres * 0.063)) + 1
+
+    def sizes(self, audio, eyesy):
+        return np.abs(audio * 0.00003058 * (eyesy.xres * self.scale))
+
+    def draw(self, screen, colors, xs, ys, sizes):
+        width = self.width
+        line_width = self.line_width
+        polygon = pygame.draw.polygon
+        for color, x, y, rad in zip(colors, xs.tolist(), ys.tolist(), sizes.tolist()):
+            points = [((x - width) - rad, (y + width) + rad), (x, (y - width) - rad),
+                      ((x + width) + rad, (y + width) + rad)]
+            polygon(screen, color, points, line_width)
+
+
+# Which way each of a polygon's six corners moves as the audio grows
+_MORPH = np.array([(-1, -1), (1, -1), (1, 0), (1, 1), (0, -1), (-1, 1)], dtype=np.float64)
+
+
+class Polygons:
+    """Random hexagons, knob3 scaled, pulled out of shape by audio_in[j + i]
+
+    A trigger deals a new set of random corner offsets.
+    """
+
+    samples = SAMPLE_SUM
+
+    def setup(self, eyesy):
+        self.spread = int(eyesy.xres * 0.016)
+        self.deal()
+        self.line_width = int(eyesy.xres * 0.0027)
+        self.scale = eyesy.xres * 0.078
+        # Cells share corner sets: cell (i, j) uses set int(i * j + xres * 0.004)
+        self.cell_sets = [int((i * j) + eyesy.xres * 0.008 / 2) for i in range(ROWS) for j in range(COLUMNS)]
+
+    def deal(self):
+        low = int(self.spread * -1)
+        self.offsets = np.array([[(random.randrange(low, self.spread), random.randrange(low, self.spread))
+                                  for _ in range(0, 6)] for _ in range(0, CELLS)], dtype=np.float64)
+
+    def prepare(self, eyesy):
+        if eyesy.trig:
+            self.deal()
+        self.stretch = (eyesy.knob3 * 7) + 1
+
+    def sizes(self, audio, eyesy):
+        return (audio * 0.00003052) * self.scale
+
+    def draw(self, screen, colors, xs, ys, sizes):
+        corners = self.offsets[self.cell_sets] * self.stretch
+        corners += np.stack((xs, ys), -1)[:, None, :]
+        corners += sizes[:, None, None] * _MORPH
+        polygon = pygame.draw.polygon
+        line_width = self.line_width
+        for color, points in zip(colors, corners.tolist()):
+            polygon(screen, color, points, line_width)
+
+
+class SlideSquares:
+    """Squares knob3 wide, inflated by audio_in[j - i]"""
+
+    samples = SAMPLE_DIFFERENCE
+
+    def __init__(self, filled=True):
+        self.filled = filled
+
+    def setup(self, eyesy):
+        self.scale = eyesy.xres * 0.07734
+        self.line_width = 0 if self.filled else int(eyesy.xres * 0.0026)
+
+    def prepare(self, eyesy):
+        self.width = int(eyesy.knob3 * self.scale) + 1
+
+    def sizes(self, audio, eyesy):
+        return np.abs(audio / self.scale)
+
+    def draw(self, screen, colors, xs, ys, sizes):
+        width = self.width
+        line_width = self.line_width
+        rect = pygame.draw.rect
+        for color, x, y, rad in zip(colors, xs.tolist(), ys.tolist(), sizes.tolist()):
+            square = pygame.Rect(0, 0, width, width)
+            square.center = (x, y)
+            square.inflate_ip(rad, rad)
+            rect(screen, color, square, line_width)
+
+
+class Grid:
+    """One S - Grid mode: a shape, a color scheme and a shift (None keeps the lattice still)"""
+
+    def __init__(self, shape, color, shift=None):
+        self.shape = shape
+        self.color = color
+        self.shift = shift
+
+    def setup(self, screen, eyesy):
+        self.lattice = lattice(eyesy.xres, eyesy.yres)
+        for part in (self.shape, self.color, self.shift):
+            if part is not None:
+                part.setup(eyesy)
+
+    def draw(self, screen, eyesy):
+        eyesy.color_picker_bg(eyesy.knob5)
+        x, y = self.lattice
+        if self.shift is not None:
+            x_offset, y_offset = self.shift.offsets(eyesy)
+            x = np.where(ODD_ROWS, x + x_offset, x)
+            y = np.where(ODD_COLUMNS, y + y_offset, y)
+        shape = self.shape
+        shape.prepare(eyesy)
+        sizes = shape.sizes(audio_samples(eyesy, shape.samples), eyesy)
+        colors = self.color.colors(eyesy)
+        shape.draw(screen, colors, x.ravel(), y.ravel(), sizes)
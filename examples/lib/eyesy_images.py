@@ -0,0 +1,117 @@
+"""
+Lazily decoded image sequences for image-heavy modes (slideshows, image sets).
+
+Loading every file in Images/ in setup() makes a mode pay the whole decode
+time, and keep every image in memory, before its first frame. An
+ImageSequence indexes like the list of surfaces it replaces, but decodes
+each image the first time it is asked for:
+
+- images are decoded on a background thread, starting with the first few,
+  and each access prefetches the next `prefetch` images (wrapping around,
+  as slideshows do), so stepping through them rarely waits
+- decoded images are kept least-recently-used first, and the oldest are
+  dropped once they take more than `max_bytes`; one asked for again is
+  simply decoded again
+
+All sequences share one decode thread, so a mode that makes a new sequence
+in every setup() (on each reload) never piles up threads. close() cancels a
+sequence's queued decodes and drops its images. Where threads are
+unavailable (Pyodide), images are decoded on access.
+
+Modes import it from examples/lib (or from their own folder when the file is
+copied next to main.py for deployment).
+"""
+
+import glob
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+_executor = None  # The decode thread every sequence shares, started on first use
+
+
+def _decoder():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='eyesy-images')
+    return _executor
+
+
+class ImageSequence:
+    """The images matching a glob pattern (sorted), or a list of paths, decoded on demand
+
+    alpha converts each image with convert_alpha() (when there is a display)
+    once it has been decoded, as modes do after pygame.image.load().
+    """
+
+    def __init__(self, paths, prefetch=2, max_bytes=64 * 1024 * 1024, alpha=False):
+        if isinstance(paths, str):
+            paths = sorted(glob.glob(paths))
+        self.paths = list(paths)
+        self.prefetch = prefetch
+        self.max_bytes = max_bytes
+        self.alpha = alpha
+        self.nbytes = 0
+        self._cache = OrderedDict()  # Index -> surface, least recently used first
+        self._pending = {}  # Index -> Future of a decode
+        self._threads = True
+        for index in range(min(prefetch, len(self.paths))):
+            self._start(index)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        for index in range(len(self.paths)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.paths)))]
+        count = len(self.paths)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('image index out of range')
+        surface = self._cache.get(index)
+        if surface is None:
+            future = self._pending.pop(index, None)
+            surface = future.result() if future is not None else pygame.image.load(self.paths[index])
+            if self.alpha and pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self._store(index, surface)
+        else:
+            self._cache.move_to_end(index)
+        for step in range(1, self.prefetch + 1):
+            self._start((index + step) % count)
+        return surface
+
+    def close(self):
+        """Cancel the decodes still queued and drop the decoded images
+
+        Call it on the sequence a mode is about to replace. The sequence
+        still works afterwards: images are simply decoded again.
+        """
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._cache.clear()
+        self.nbytes = 0
+
+    def _start(self, index):
+        """Decode an image in the background, unless it is already decoded or on its way"""
+        if index in self._cache or index in self._pending or not self._threads:
+            return
+        try:
+            self._pending[index] = _decoder().submit(pygame.image.load, self.paths[index])
+        except RuntimeError:
+            # No threads here: decode on access instead
+            self._threads = False
+
+    def _store(self, index, surface):
+        self._cache[index] = surface
+        self.nbytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        # Never drop the image just asked for
+        while self.nbytes > self.max_bytes and len(self._cache) > 1:
+            _, dropped = self._cache.popitem(last=False)
+            self.nbytes -= dropped.get_width() * dropped.get_height() * dropped.get_bytesize()
@@ -0,0 +1,149 @@
+"""
+Array-backed particle system shared by the particle modes (S - Rain, S - Snow).
+
+Every particle is a row in a set of NumPy arrays, so spawning, wind, flutter,
+respawning and culling run as a handful of vector operations per frame instead
+of one Python object update per particle. Shapes are drawn from a StampCache:
+each style is rasterized once onto a small colorkeyed Surface and the whole
+system is blitted with a single Surface.blits call.
+
+Modes import it from examples/lib (or from their own folder when the file is
+copied next to main.py for deployment).
+"""
+
+import math
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """Falling particles with wind drift, flutter and spin"""
+
+    def __init__(self, screen_width, screen_height, speed_range, spin_range=(0.0, 0.0),
+                 flutter_speed_range=(0.0, 0.0), rng=None):
+        self.width = screen_width
+        self.height = screen_height
+        self.speed_range = speed_range
+        self.spin_range = spin_range
+        self.flutter_speed_range = flutter_speed_range
+        # Seeded from NumPy's global generator, so np.random.seed() makes a run repeatable
+        self.rng = rng if rng is not None else np.random.default_rng(np.random.randint(2 ** 31))
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.prev_y = np.empty(0)
+        self.speed = np.empty(0)
+        self.drift = np.empty(0)  # Accumulated horizontal wind offset
+        self.spin = np.empty(0)
+        self.spin_speed = np.empty(0)
+        self.flutter = np.empty(0)  # Side-to-side flutter phase
+        self.flutter_speed = np.empty(0)
+
+    def __len__(self):
+        return len(self.x)
+
+    def resize(self, count, spawn_top=None):
+        """Grow or shrink to `count` particles
+
+        New particles start anywhere between `spawn_top` (default: one screen
+        height above the top) and the top edge. Shrinking drops the oldest ones.
+        """
+        current = len(self.x)
+        if count > current:
+            n = count - current
+            rng = self.rng
+            top = -self.height if spawn_top is None else spawn_top
+            self.x = np.concatenate((self.x, rng.uniform(0, self.width, n)))
+            y = rng.uniform(top, 0, n)
+            self.y = np.concatenate((self.y, y))
+            self.prev_y = np.concatenate((self.prev_y, y))
+            self.speed = np.concatenate((self.speed, rng.uniform(*self.speed_range, n)))
+            self.drift = np.concatenate((self.drift, np.zeros(n)))
+            self.spin = np.concatenate((self.spin, rng.uniform(0, math.pi * 2, n)))
+            self.spin_speed = np.concatenate((self.spin_speed, rng.uniform(*self.spin_range, n)))
+            self.flutter = np.concatenate((self.flutter, rng.uniform(0, math.pi * 2, n)))
+            self.flutter_speed = np.concatenate((self.flutter_speed, rng.uniform(*self.flutter_speed_range, n)))
+        elif count < current:
+            drop = current - count
+            for name in ('x', 'y', 'prev_y', 'speed', 'drift', 'spin', 'spin_speed', 'flutter', 'flutter_speed'):
+                setattr(self, name, getattr(self, name)[drop:])
+
+    def step(self, wind_strength, wind_jitter, fall_speed, flutter_amount=0.0):
+        """Advance one frame and respawn anything that left the screen"""
+        n = len(self.x)
+        if n == 0:
+            return
+        rng = self.rng
+        self.prev_y[:] = self.y
+        # Wind effect: a random walk whose bias follows the wind strength
+        self.drift += wind_strength * rng.uniform(-wind_jitter, wind_jitter, n)
+        self.x += self.drift
+        self.spin += self.spin_speed
+        if flutter_amount:
+            self.flutter += self.flutter_speed
+            self.x += np.sin(self.flutter) * flutter_amount
+        self.y += self.speed * fall_speed
+        # Reset anything that fell off the bottom or was blown off the sides
+        gone = (self.y > self.height) | (self.x < 0) | (self.x > self.width)
+        count = int(np.count_nonzero(gone))
+        if count:
+            y = rng.uniform(-50, 0, count)
+            self.y[gone] = y
+            self.prev_y[gone] = y
+            self.x[gone] = rng.uniform(0, self.width, count)
+            self.drift[gone] = 0.0
+            self.spin[gone] = rng.uniform(0, math.pi * 2, count)
+            self.flutter[gone] = rng.uniform(0, math.pi * 2, count)
+
+    def visible(self, margin):
+        """Indices of particles within `margin` pixels of the screen"""
+        return np.flatnonzero((self.y > -margin) & (self.y < self.height + margin))
+
+
+class StampCache:
+    """Pre-rasterized shapes keyed by style, each with its blit offset
+
+    `render(key)` must return (surface, (offset_x, offset_y)); the offset is
+    added to a particle's position to get the blit position. When the cache
+    grows past `max_size` it is cleared (styles change with the knobs, so old
+    entries are rarely reused).
+    """
+
+    def __init__(self, render, max_size=256):
+        self.render = render
+        self.max_size = max_size
+        self.stamps = {}
+
+    def get(self, key):
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            if len(self.stamps) >= self.max_size:
+                self.stamps.clear()
+            stamp = self.render(key)
+            self.stamps[key] = stamp
+        return stamp
+
+    def clear(self):
+        self.stamps.clear()
+
+
+def new_stamp(width, height, colors):
+    """Blank colorkeyed Surface whose key differs from every color in `colors`"""
+    key = (0, 0, 0)
+    while key in colors:
+        key = (key[0], key[1], key[2] + 1)
+    surface = pygame.Surface((max(1, width), max(1, height)))
+    surface.fill(key)
+    surface.set_colorkey(key, pygame.RLEACCEL)
+    return surface
+
+
+def blit_stamps(screen, stamps, xs, ys):
+    """Blit stamps[i] at particle i's position with a single blits call
+
+    `stamps` is a list of (surface, (offset_x, offset_y)) the same length as
+    xs/ys.
+    """
+    screen.blits([
+        (surface, (x + offset[0], y + offset[1]))
+        for (surface, offset), x, y in zip(stamps, xs.astype(np.intp).tolist(), ys.astype(np.intp).tolist())
+    ], False)
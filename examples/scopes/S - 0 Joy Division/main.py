@@ -1,51 +1,55 @@
 import pygame
-import math
-# Global waveform buffer
-line_buffer = []
+import numpy as np
+# Knob1 - line spacing (16 px apart down to 3 px, filling the screen with history)
+# Knob5 - waveform height
+NUM_POINTS = 100  # Number of horizontal segments across width
+LINE_WIDTH_RATIO = 0.6  # or 0.4 for narrower lines
+MAX_LINE_SPACING = 16
+MIN_LINE_SPACING = 3
+MAX_WAVE = 110  # Tallest waveform offset (knob5 at 1)
+# Waveform history: a ring buffer of rows, newest at `head`
+history = None
+head = 0
+filled = 0
+xs = None  # Screen x of every point
+taper = None  # Center pull (like the original artwork): 1 in the middle, 0 at the edges
 def setup(screen, eyesy):
-    global line_buffer
-    line_buffer = []
+    global history, head, filled, xs, taper
+    w, h = int(eyesy.xres), int(eyesy.yres)
+    x_start = (1 - LINE_WIDTH_RATIO) * w / 2
+    spacing = (w - 2 * x_start) / NUM_POINTS
+    j = np.arange(NUM_POINTS)
+    xs = (x_start + j * spacing).astype(np.intp)
+    taper = 1 - np.abs(j - NUM_POINTS / 2) / (NUM_POINTS / 2)
+    # Deep enough to reach the top of the screen at the tightest spacing
+    depth = (h + MAX_WAVE) // MIN_LINE_SPACING + 1
+    history = np.zeros((depth, NUM_POINTS))
+    head = 0
+    filled = 0
 def draw(screen, eyesy):
-    global line_buffer
+    global head, filled
     # Set black background
     screen.fill((0, 0, 0))
     # Get screen dimensions
     w, h = int(eyesy.xres), int(eyesy.yres)
-    # Number of horizontal segments across width
-    num_points = 100
-    #spacing = w / num_points
-    line_width_ratio = 0.6  # or 0.4 for narrower lines
-    x_start = (1 - line_width_ratio) * w / 2
-    x_end = w - x_start
-    usable_width = x_end - x_start
-    spacing = usable_width / num_points
-    # Normalize audio into waveform
-    audio = eyesy.audio_in
-    waveform = []
-    for i in range(num_points):
-        idx = int(i * len(audio) / num_points)
-        sample = audio[idx] / 32768  # normalize to -1 to 1
-        #y_offset = sample * 75  # scale height of waveform
-        y_offset = sample * (10 + eyesy.knob5 * 100)
-        waveform.append(y_offset)
-    # Add new line to buffer
-    line_buffer.insert(0, waveform)
-    # Keep only enough lines to fill screen
-    max_lines = int(h / 6)
-    #max_lines = 24         # only show 24 lines
-    line_spacing = 16
-    line_buffer = line_buffer[:max_lines]
+    # Normalize audio into waveform and write it over the oldest line
+    audio = np.asarray(eyesy.audio_in, dtype=np.float64)
+    idx = (np.arange(NUM_POINTS) * len(audio)) // NUM_POINTS
+    depth = len(history)
+    head = (head - 1) % depth
+    history[head] = audio[idx] / 32768 * (10 + eyesy.knob5 * 100)  # normalize to -1 to 1 and scale
+    filled = min(filled + 1, depth)
+    # Only the lines that can still reach the screen are drawn
+    line_spacing = int(round(MAX_LINE_SPACING - eyesy.knob1 * (MAX_LINE_SPACING - MIN_LINE_SPACING)))
+    count = min(filled, (h + MAX_WAVE) // line_spacing + 1)
+    if count == 0:
+        return
+    lines = history[(head + np.arange(count)) % depth]
+    # Screen coordinates of every point of every line in one step
+    ys = (h - np.arange(count) * line_spacing)[:, None] + lines * taper
+    points = np.empty((count, NUM_POINTS, 2), np.intp)
+    points[:, :, 0] = xs
+    points[:, :, 1] = ys
     # Draw each horizontal line
-    for i, line in enumerate(line_buffer):
-        y = h - i * line_spacing  # spacing between lines
-        points = []
-        for j, offset in enumerate(line):
-            #x = int(j * spacing)
-            x = int(x_start + j * spacing)
-            wave = offset
-            # Apply center pull (like the original artwork)
-            dist_from_center = abs(j - num_points / 2)
-            wave *= 1 - (dist_from_center / (num_points / 2))
-            points.append((x, int(y + wave)))
-        if len(points) > 1:
-            pygame.draw.lines(screen, (255, 255, 255), False, points, 1)
+    for line in points.tolist():
+        pygame.draw.lines(screen, (255, 255, 255), False, line, 1)
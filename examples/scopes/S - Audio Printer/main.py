@@ -11,37 +11,35 @@ import math
 # Constants
 xc = 100  # horizontal count (matching the length of eyesy.audio_in)
 yc = 72   # vertical count
-# Initialize a global list to store the history of audio input and colors
-audio_history = []
+# The printed history lives on a persistent transparent surface, one strip per row
+# (oldest at the top). Each frame it scrolls up one row and only the new row is drawn;
+# the shear is applied when the strips are blitted to the screen
+paper = None
 def setup(screen, eyesy):
-    global xr, yr, audio_history
+    global xr, yr, square_size, v_square_size, row_h, cell_x, paper
     xr = eyesy.xres
     yr = eyesy.yres
-    # Initialize the history with default values for rows
-    audio_history = [[(0, (0, 0, 0))] * xc for _ in range(yc)]
-def draw(screen, eyesy):
-    global xr, yr, audio_history, square_size, v_square_size
-    bg_color = eyesy.color_picker_bg(eyesy.knob5)
-    color = eyesy.color_picker_lfo(eyesy.knob4)
     # Calculate the size of each square based on the x resolution with a border
     square_size = xr / xc
     v_square_size = yr / yc
-    # Square Parameters
-    thickness = 1  # line thickness
-    corner_radius = 0 # 0 = no radius
-    # Shift the history down one row
-    audio_history.pop(0)
+    row_h = int(v_square_size)
+    cell_x = [int(i * square_size) for i in range(xc)]
+    paper = pygame.Surface((xr, yc * row_h), pygame.SRCALPHA)
+    paper.fill((0, 0, 0, 0))
+def draw(screen, eyesy):
+    global paper
+    bg_color = eyesy.color_picker_bg(eyesy.knob5)
+    color = eyesy.color_picker_lfo(eyesy.knob4)
+    # Shift the history up one row (one self-blit) and clear the new bottom row
+    paper.scroll(0, -row_h)
+    new_row = pygame.Rect(0, (yc - 1) * row_h, xr, row_h)
+    paper.fill((0, 0, 0, 0), new_row)
     # set the threshold for capturing the audio input
     volume = 10000 - (eyesy.knob3 * 10000)
-    # Create a new row based on audio input threshold
-    new_row = []
+    # Print the new row: a square for every sample over the threshold
     for i in range(xc):
-        value = int(abs(eyesy.audio_in[i]))
-        if value > volume:
-            new_row.append((1, color))
-        else:
-            new_row.append((0, (0, 0, 0)))
-    audio_history.append(new_row)
+        if int(abs(eyesy.audio_in[i])) > volume:
+            paper.fill(color, (cell_x[i], new_row.y, int(square_size), row_h))
     # Calculate the horizontal shift based on knob2
     max_shift = 3.8 * square_size
     if eyesy.knob2 < 0.40: # shift left
@@ -52,22 +50,16 @@ def draw(screen, eyesy):
         shift = 0
     # Select the style of drawing the boxes (scan up, down, up/down)
     set = int(eyesy.knob1 * 2)
+    # One blit per row strip, offset by its shear (twice per row for up/down)
+    strips = []
     for j in range(yc):
-        for i in range(xc):
-            x = i * square_size
-            y = j * v_square_size
-            # Determine the position based on the 'set'
-            if set == 0:  # 2x bottom
-                rect = pygame.Rect(x + ((yc - j) * shift), y, square_size, v_square_size)
-            elif set == 1:  # 2x top
-                rect = pygame.Rect(x + ((yc - j) * shift), yr - y - v_square_size, square_size, v_square_size)
-            else:# set == 2:  # 1x top, 1x bottom
-                rect = pygame.Rect(x + ((yc - j) * shift), y, square_size, v_square_size)
-                rect2 = pygame.Rect(x + ((yc - j) * shift * -1), yr - y - v_square_size, square_size, v_square_size)
-            audio_input, note_color = audio_history[j][i]
-            if audio_input == 1:
-                if set <= 1:
-                    pygame.draw.rect(screen, note_color, rect, 0, corner_radius)
-                else:
-                    pygame.draw.rect(screen, note_color, rect, 0, corner_radius)
-                    pygame.draw.rect(screen, note_color, rect2, 0, corner_radius)
+        area = (0, j * row_h, xr, row_h)
+        y = j * v_square_size
+        if set == 0:  # 2x bottom
+            strips.append((paper, (int((yc - j) * shift), int(y)), area))
+        elif set == 1:  # 2x top
+            strips.append((paper, (int((yc - j) * shift), int(yr - y - v_square_size)), area))
+        else:# set == 2:  # 1x top, 1x bottom
+            strips.append((paper, (int((yc - j) * shift), int(y)), area))
+            strips.append((paper, (int((yc - j) * shift * -1), int(yr - y - v_square_size)), area))
+    screen.blits(strips, False)
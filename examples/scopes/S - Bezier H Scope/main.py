@@ -1,16 +1,21 @@
 import os
+import sys
 import pygame
-import random
-import pygame.gfxdraw
+import numpy as np
 #Knob1 - y offset for lines
 #Knob2 - x offset for lines
 #Knob3 - trails
 #Knob4 - foreground color
 #Knob5 - background color
+# Curve engine lives in examples/lib, which the runners put on sys.path
+try:
+    from eyesy_curves import gfx_segments, tessellate, draw_polylines
+except ImportError:  # Deployed on its own, with the library copied next to main.py
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from eyesy_curves import gfx_segments, tessellate, draw_polylines
+SCOPES = 12  # Stacked copies of the scope
 def setup(screen, eyesy):
-    global xr, yr, pointNumber, yhalf, margin, xoff
-    global pointList1, pointList2, pointList3, pointList4, pointList5, pointList6
-    global pointList7, pointList8, pointList9, pointList10, pointList11, pointList12
+    global xr, yr, pointNumber, yhalf, margin, xoff, spots, copies
     # set up the horizontal location of scope points...#
     #...so two points are in the l & r margins (outside of the screen width) for better visuals  #
     pointNumber = 24  #total scope points
@@ -21,23 +26,11 @@ def setup(screen, eyesy):
     yr = eyesy.yres
     yhalf = int(yr/2)
     xoff = 0
-    # create arrays for scopes
-    pointList1 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList2 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList3 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList4 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList5 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList6 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList7 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList8 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList9 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList10 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList11 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
-    pointList12 = [(int((xr/pointNumber)*i), int(yhalf)) for i in range(0, pointNumber)]
+    # x of each scope point, moved two 'points' left of the screen for better visuals
+    spots = np.arange(pointNumber) * int(xr/pointNumber) - margin
+    copies = np.arange(SCOPES)[:, None]
 def draw(screen, eyesy):
-    global xr, yr, yhalf, margin, pointNumber, xoff
-    global pointList1, pointList2, pointList3, pointList4, pointList5, pointList6
-    global pointList7, pointList8, pointList9, pointList10, pointList11, pointList12
+    global xr, yr, yhalf, margin, pointNumber, xoff, spots, copies
     # set colors
     eyesy.color_picker_bg(eyesy.knob5)
     color = eyesy.color_picker_lfo(eyesy.knob4, 0.1)
@@ -49,34 +42,14 @@ def draw(screen, eyesy):
         xoff = (0.48 - eyesy.knob2) * (eyesy.xres * -0.078) #100  ##to the left
     elif eyesy.knob2 > 0.52 :
         xoff = (eyesy.knob2 - 0.52) * (eyesy.xres * 0.078)  #100  ##to the right
-    for i in range (0, pointNumber):
-        height = int((eyesy.audio_in[i*2] * eyesy.yres) / 32768)
-        spot = (int(xr/pointNumber)*i)-margin #move left side start two 'points' to the left for better visuals
-        pointList1[i] = (spot,          (height+(yhalf-centering)) )
-        pointList2[i] = (spot+(xoff),   (height+(yhalf-centering)+(voffset*1)) )
-        pointList3[i] = (spot+(xoff*2), (height+(yhalf-centering)+(voffset*2)) )
-        pointList4[i] = (spot+(xoff*3), (height+(yhalf-centering)+(voffset*3)) )
-        pointList5[i] = (spot+(xoff*4), (height+(yhalf-centering)+(voffset*4)) )
-        pointList6[i] = (spot+(xoff*5), (height+(yhalf-centering)+(voffset*5)) )
-        pointList7[i] = (spot+(xoff*6), (height+(yhalf-centering)+(voffset*6)) )
-        pointList8[i] = (spot+(xoff*7), (height+(yhalf-centering)+(voffset*7)) )
-        pointList9[i] = (spot+(xoff*8), (height+(yhalf-centering)+(voffset*8)) )
-        pointList10[i]= (spot+(xoff*9), (height+(yhalf-centering)+(voffset*9)) )
-        pointList11[i]= (spot+(xoff*10), (height+(yhalf-centering)+(voffset*10)) )
-        pointList12[i]= (spot+(xoff*11), (height+(yhalf-centering)+(voffset*11)) )
+    audio = np.asarray(eyesy.audio_in[:pointNumber * 2:2], dtype=np.float64)
+    height = np.trunc(audio * eyesy.yres / 32768)
+    # control points of all 12 scopes, each shifted right by xoff and down by voffset from the last
+    points = np.empty((SCOPES, pointNumber, 2))
+    points[:, :, 0] = spots + xoff * copies
+    points[:, :, 1] = height + (yhalf - centering) + voffset * copies
     # Draw the scopes
-    pygame.gfxdraw.bezier(screen, pointList1, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList2, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList3, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList4, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList5, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList6, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList7, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList8, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList9, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList10, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList11, smooth, color)
-    pygame.gfxdraw.bezier(screen, pointList12, smooth, color)
+    draw_polylines(screen, color, tessellate(points, gfx_segments(pointNumber, smooth)))
    #Trails
     veil = pygame.Surface((eyesy.xres,eyesy.yres))
     veil.set_alpha(int(eyesy.knob3 * 20))
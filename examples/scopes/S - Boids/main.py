@@ -1,7 +1,7 @@
 import os
 import pygame
 import math
-import random
+import numpy as np
 #Knob1 - Boid size
 #Knob2 - Bar width
 #Knob3 - Bar style (filled/unfilled, curved/90-degree corners)
@@ -10,73 +10,144 @@ import random
 # Initialize a global dictionary to store audio history for each index
 audio_history = {}
 # Boid settings
-NUM_BOIDS = 250
+NUM_BOIDS = 250  # Flock size - the engine handles thousands at frame rate
 BOID_SPEED = 20
-class Boid:
-    def __init__(self, x, y):
-        self.position = pygame.Vector2(x, y)
-        self.velocity = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize() * BOID_SPEED
-        self.size = 1  # Default size, will be updated in draw function
-        self.color_value = random.random()  # Random value for consistent color picking
-    def update(self, screen_width, screen_height, obstacles, size):
-        self.size = size  # Update size dynamically
-        # Update position
-        self.position += self.velocity
+# Flocking settings (set the weights to 0 for free-flying boids)
+NEIGHBOR_RADIUS = 60  # Grid cell size used for the neighbour search
+SEPARATION_WEIGHT = 0.05
+ALIGNMENT_WEIGHT = 0.05
+COHESION_WEIGHT = 0.01
+# Boid colors are quantized into this many hue buckets, one stamp each
+COLOR_BUCKETS = 64
+class BoidFlock:
+    """Structure-of-arrays flock: every boid is a row in the position/velocity arrays"""
+    def __init__(self, count, screen_width, screen_height):
+        self.count = count
+        self.width = screen_width
+        self.height = screen_height
+        self.position = np.column_stack((
+            np.random.uniform(0, screen_width, count),
+            np.random.uniform(0, screen_height, count),
+        ))
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        self.velocity = np.column_stack((np.cos(angle), np.sin(angle))) * BOID_SPEED
+        # Random value per boid for consistent color picking
+        self.color_bucket = np.random.randint(0, COLOR_BUCKETS, count)
+        self.grid_cols = max(1, int(screen_width // NEIGHBOR_RADIUS))
+        self.grid_rows = max(1, int(screen_height // NEIGHBOR_RADIUS))
+    def _neighborhood_sums(self, cells, values):
+        # Per-cell totals, then summed over the wrapping 3x3 block of cells around each cell
+        grid = np.bincount(cells, weights=values, minlength=self.grid_cols * self.grid_rows)
+        grid = grid.reshape(self.grid_rows, self.grid_cols)
+        total = np.zeros_like(grid)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                total += np.roll(grid, (dy, dx), axis=(0, 1))
+        return total.ravel()[cells], grid.ravel()[cells]
+    def flock(self):
+        """Separation, alignment and cohesion from grid-binned neighbours"""
+        pos = self.position
+        vel = self.velocity
+        col = np.clip((pos[:, 0] * (self.grid_cols / self.width)).astype(np.intp), 0, self.grid_cols - 1)
+        row = np.clip((pos[:, 1] * (self.grid_rows / self.height)).astype(np.intp), 0, self.grid_rows - 1)
+        cells = row * self.grid_cols + col
+        ones = np.ones(self.count)
+        near_count, cell_count = self._neighborhood_sums(cells, ones)
+        near_x, cell_x = self._neighborhood_sums(cells, pos[:, 0])
+        near_y, cell_y = self._neighborhood_sums(cells, pos[:, 1])
+        near_vx, _ = self._neighborhood_sums(cells, vel[:, 0])
+        near_vy, _ = self._neighborhood_sums(cells, vel[:, 1])
+        # Exclude the boid itself from its own neighbourhood
+        others = np.maximum(near_count - 1, 1)
+        has_neighbors = (near_count > 1)[:, None]
+        center = np.column_stack((near_x - pos[:, 0], near_y - pos[:, 1])) / others[:, None]
+        heading = np.column_stack((near_vx - vel[:, 0], near_vy - vel[:, 1])) / others[:, None]
+        # Separation pushes away from boids sharing the same cell
+        crowd = (cell_count - 1)[:, None]
+        separation = crowd * pos - (np.column_stack((cell_x, cell_y)) - pos)
+        steer = (SEPARATION_WEIGHT * separation
+                 + ALIGNMENT_WEIGHT * (heading - vel)
+                 + COHESION_WEIGHT * (center - pos))
+        vel += np.where(has_neighbors, steer, 0.0)
+        # Keep a constant cruising speed
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        vel *= (BOID_SPEED / np.maximum(speed, 1e-6))[:, None]
+    def update(self, bars, size):
+        """Integrate, wrap around the screen edges and bounce off the VU bars"""
+        pos = self.position
+        vel = self.velocity
+        pos += vel
         # Wrap around screen edges
-        if self.position.x > screen_width:
-            self.position.x = 0
-        elif self.position.x < 0:
-            self.position.x = screen_width
-        if self.position.y > screen_height:
-            self.position.y = 0
-        elif self.position.y < 0:
-            self.position.y = screen_height
-        # Check for collisions with obstacles and bounce
-        for obstacle in obstacles:
-            boid_rect = pygame.Rect(self.position.x - self.size, self.position.y - self.size, self.size * 2, self.size * 2)
-            if boid_rect.colliderect(obstacle):
-                self.bounce(obstacle)
-    def bounce(self, obstacle):
-        # Calculate the overlap on x and y axes
-        overlap_x = min(self.position.x + self.size, obstacle.right) - max(self.position.x - self.size, obstacle.left)
-        overlap_y = min(self.position.y + self.size, obstacle.bottom) - max(self.position.y - self.size, obstacle.top)
-        # Determine the direction of the bounce
-        if overlap_x < overlap_y:
-            # Bounce horizontally
-            if self.position.x < obstacle.centerx:
-                self.velocity.x = -abs(self.velocity.x)  # Bounce left
-            else:
-                self.velocity.x = abs(self.velocity.x)  # Bounce right
-        else:
-            # Bounce vertically
-            if self.position.y < obstacle.centery:
-                self.velocity.y = -abs(self.velocity.y)  # Bounce up
-            else:
-                self.velocity.y = abs(self.velocity.y)  # Bounce down
-    def draw(self, screen, eyesy):
-        # Use the consistent random value to pick the color
-        self.color = eyesy.color_picker(self.color_value)
-        pygame.draw.circle(screen, self.color, (int(self.position.x), int(self.position.y)), self.size)
+        x = pos[:, 0]
+        y = pos[:, 1]
+        x[:] = np.where(x > self.width, 0, np.where(x < 0, self.width, x))
+        y[:] = np.where(y > self.height, 0, np.where(y < 0, self.height, y))
+        left, top, right, bottom, spacing = bars
+        # A boid can only touch the bar under it or the ones either side
+        base = (x // spacing).astype(np.intp)
+        for offset in (-1, 0, 1):
+            idx = np.clip(base + offset, 0, len(left) - 1)
+            l = left[idx]
+            t = top[idx]
+            r = right[idx]
+            b = bottom[idx]
+            hit = (x + size > l) & (x - size < r) & (y + size > t) & (y - size < b)
+            if offset != 0:
+                hit &= (base + offset >= 0) & (base + offset < len(left))
+            if not hit.any():
+                continue
+            # Calculate the overlap on x and y axes to pick the bounce direction
+            overlap_x = np.minimum(x + size, r) - np.maximum(x - size, l)
+            overlap_y = np.minimum(y + size, b) - np.maximum(y - size, t)
+            horizontal = hit & (overlap_x < overlap_y)
+            vertical = hit & ~(overlap_x < overlap_y)
+            vx = np.abs(vel[:, 0])
+            vy = np.abs(vel[:, 1])
+            vel[:, 0] = np.where(horizontal, np.where(x < (l + r) / 2, -vx, vx), vel[:, 0])
+            vel[:, 1] = np.where(vertical, np.where(y < (t + b) / 2, -vy, vy), vel[:, 1])
+    def draw(self, screen, stamps, size):
+        xy = (self.position - size).astype(np.intp).tolist()
+        screen.blits([(stamps[bucket], pos) for bucket, pos in zip(self.color_bucket.tolist(), xy)], False)
+def make_stamps(eyesy, size):
+    """One pre-rendered circle per color bucket for the current boid size"""
+    stamps = []
+    for bucket in range(COLOR_BUCKETS):
+        color = eyesy.color_picker(bucket / float(COLOR_BUCKETS))
+        stamp = pygame.Surface((size * 2 + 1, size * 2 + 1))
+        key = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+        stamp.fill(key)
+        stamp.set_colorkey(key)
+        pygame.draw.circle(stamp, color, (size, size), size)
+        stamps.append(stamp)
+    return stamps
 def setup(screen, eyesy):
-    global min_height, yhalf, corner, fill, boids
+    global min_height, yhalf, corner, fill, flock, stamps, stamp_size
     min_height = 5
     yhalf = (eyesy.yres / 2)
     corner = 0
     fill = 0
-    boids = [Boid(random.uniform(0, eyesy.xres), random.uniform(0, eyesy.yres)) for _ in range(NUM_BOIDS)]
+    flock = BoidFlock(NUM_BOIDS, eyesy.xres, eyesy.yres)
+    stamps = None
+    stamp_size = None
 def draw(screen, eyesy):
-    global min_height, yhalf, corner, fill, audio_history, boids
+    global min_height, yhalf, corner, fill, audio_history, flock, stamps, stamp_size
     eyesy.color_picker_bg(eyesy.knob5)
     color = eyesy.color_picker_lfo(eyesy.knob4)
     # Calculate boid size based on knob1
     boid_size = int(eyesy.knob1 * 24) + 1  # Map knob1 value to range 1-25
+    if boid_size != stamp_size:
+        stamps = make_stamps(eyesy, boid_size)
+        stamp_size = boid_size
     # Number of vu boxes
     count = 32  # Fixed count for demonstration
     spacing = eyesy.xres / count
     box_width = int(eyesy.knob2 * (spacing)) + 2
     box_width_half = int(box_width / 2)
     box_offset = int((spacing - box_width) / 2)
-    obstacles = []
+    bar_left = np.empty(count)
+    bar_top = np.empty(count)
+    bar_right = np.empty(count)
+    bar_bottom = np.empty(count)
     # Draw vu_boxes!
     for i in range(count):
         current_value = abs(eyesy.audio_in[i] * eyesy.yres / 32768)
@@ -110,9 +181,12 @@ def draw(screen, eyesy):
             box_width,
             height
         )
-        obstacles.append(vu_box)
+        bar_left[i] = vu_box.left
+        bar_top[i] = vu_box.top
+        bar_right[i] = vu_box.right
+        bar_bottom[i] = vu_box.bottom
         pygame.draw.rect(screen, color, vu_box, fill, corner)
     # Update and draw boids with dynamic size and consistent color
-    for boid in boids:
-        boid.update(eyesy.xres, eyesy.yres, obstacles, boid_size)
-        boid.draw(screen, eyesy)
+    flock.flock()
+    flock.update((bar_left, bar_top, bar_right, bar_bottom, spacing), boid_size)
+    flock.draw(screen, stamps, boid_size)
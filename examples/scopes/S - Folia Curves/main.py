@@ -1,177 +1,103 @@
 import os
+import sys
 import pygame
-import time
-import math
-import pygame.gfxdraw
+import numpy as np
 # Knob1 - Drawing option selection
 # Knob2 - Max. rotation speed. If knob is turned all the way right, the rotation speed is stopped and the angle is set to 0.
 # Knob3 - 'Trails' amount. Need to turn on 'Persist' button to see the effect.
 # Knob4 - foreground color
 # Knob5 - background color
+# Curve engine lives in examples/lib, which the runners put on sys.path
+try:
+    from eyesy_curves import gfx_segments, tessellate, rotate, draw_polylines
+except ImportError:  # Deployed on its own, with the library copied next to main.py
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from eyesy_curves import gfx_segments, tessellate, rotate, draw_polylines
+GRID_WIDTH = 9
+GRID_HEIGHT = 7
+CELLS = GRID_WIDTH * GRID_HEIGHT
+HISTORY = 7  # Audio frames averaged per cell
+CURVE_SEGMENTS = gfx_segments(3, 4)  # Same sampling as gfxdraw.bezier(points, 4)
+# Curves are quadratic Beziers in box units (box corner at 0,0, far corner at 1,1);
+# each control point is base + a1 * bend, a1 being the cell's averaged audio in pixels
+CURVE_BASE = {
+    'top': [(1, 0), (0.5, 0), (0, 0)],
+    'bottom': [(1, 1), (0.5, 1), (0, 1)],
+    'left': [(0, 1), (0, 0.5), (0, 0)],
+    'right': [(1, 1), (1, 0.5), (1, 0)],
+    'beak': [(1, 0), (0.5, 0), (0, 0)],
+}
+CURVE_BEND = {
+    'top': [(0, 0), (0, 1), (0, 0)],
+    'bottom': [(0, 0), (0, -1), (0, 0)],
+    'left': [(0, 0), (1, 0), (0, 0)],
+    'right': [(0, 0), (-1, 0), (0, 0)],
+    'beak': [(0, 0), (0, -1), (0, 0)],
+}
+# Drawing options picked by knob1: (curves, box edges as vertex index runs)
+DRAWING_OPTIONS = [
+    (['top'], []),  # 1 - single
+    (['top', 'bottom'], []),  # 2 - broken lozenge
+    (['top', 'left'], []),  # 3 - angle
+    (['top', 'beak'], []),  # 4 - bird beak
+    (['top'], [[0, 1, 2, 3]]),  # 5 - house
+    (['top', 'bottom'], [[0, 1], [2, 3]]),  # 6 - lozenge
+    (['top', 'bottom', 'left', 'right'], []),  # 7 - star
+]
+BOX_VERTICES = np.array([(0, 0), (0, 1), (1, 1), (1, 0)], dtype=np.float64)
 def setup(screen, eyesy):
     global xr, yr, l100, audio_history, rotation_angles
     xr = eyesy.xres
     yr = eyesy.yres
     l100 = xr * 0.037  # xr * 0.078
     # Initialize the audio history for each slot
-    audio_history = [[0] * 7 for _ in range(63)]
+    audio_history = np.zeros((CELLS, HISTORY))
     # Initialize the rotation angles for each box
-    rotation_angles = [0] * 63
-def rotate_point(cx, cy, x, y, angle):
-    # Rotate a point around a center
-    radians = math.radians(angle)
-    cos_angle = math.cos(radians)
-    sin_angle = math.sin(radians)
-    translated_x = x - cx
-    translated_y = y - cy
-    rotated_x = translated_x * cos_angle - translated_y * sin_angle
-    rotated_y = translated_x * sin_angle + translated_y * cos_angle
-    return rotated_x + cx, rotated_y + cy
+    rotation_angles = np.zeros(CELLS)
+def drawing_option(knob):
+    """Index into DRAWING_OPTIONS for knob1"""
+    for option, limit in enumerate((0.15, 0.3, 0.45, 0.6, 0.75, 0.9)):
+        if knob < limit:
+            return option
+    return 6
 def draw(screen, eyesy):
     global xr, yr, l100, audio_history, rotation_angles
     # Color settings
     eyesy.color_picker_bg(eyesy.knob5)
     color = eyesy.color_picker_lfo(eyesy.knob4, 0.05)
     # Calculate the spacing between the boxes
-    grid_width = 9
-    grid_height = 7
     box_width = l100
     box_height = l100
-    horizontal_spacing = (xr - grid_width * box_width) / (grid_width + 1)
-    vertical_spacing = (yr - grid_height * box_height) / (grid_height + 1)
-    # Draw the grid of boxes
-    for row in range(grid_height):
-        for col in range(grid_width):
-            # Calculate the position of the box
-            x = horizontal_spacing * (col + 1) + col * box_width
-            y = vertical_spacing * (row + 1) + row * box_height
-            # Get the y-position offset from the audio input
-            index = row * grid_width + col
-            current_value = (eyesy.audio_in[index] * yr) / 32768
-            # Update the history and calculate the average
-            audio_history[index].pop(0)
-            audio_history[index].append(current_value)
-            a1 = sum(audio_history[index]) / len(audio_history[index])
-            # Update the rotation angle based on a1
-            max_rotation_speed = eyesy.knob2 * 200  # Maximum rotation speed in degrees per frame
-            rotation_speed = (a1 / yr) * max_rotation_speed * 2  # Scale a1 to the range [-max_rotation_speed, max_rotation_speed]
-            rotation_angles[index] += rotation_speed
-            # Limit the rotation angle to [-180, 180]
-            rotation_angles[index] = max(min(rotation_angles[index], 180), -180)
-            if eyesy.knob2 == 1:
-                rotation_angles = [0] * 63
-            # Calculate the rotated vertices of the box
-            center_x = x + box_width / 2
-            center_y = y + box_height / 2
-            vertices = [
-                (x, y),
-                (x, y + box_height),
-                (x + box_width, y + box_height),
-                (x + box_width, y)
-            ]
-            rotated_vertices = [rotate_point(center_x, center_y, vx, vy, rotation_angles[index]) for vx, vy in vertices]
-            # Determine the drawing option based on eyesy.knob1
-            if eyesy.knob1 < 0.15:
-                # 1 - single
-                additional_line = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                pygame.gfxdraw.bezier(screen, additional_line, 4, color)
-            elif 0.15 <= eyesy.knob1 < 0.3:
-                # 2 - broken lozenge
-                additional_line = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                additional_line2 = [
-                    rotate_point(center_x, center_y, x + box_width, y + box_width, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + box_width - a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y + box_width, rotation_angles[index])
-                ]
-                pygame.gfxdraw.bezier(screen, additional_line, 4, color)
-                pygame.gfxdraw.bezier(screen, additional_line2, 4, color)
-            elif 0.3 <= eyesy.knob1 < 0.45:
-                # 3 - angle
-                additional_line = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                additional_line3 = [
-                    rotate_point(center_x, center_y, x, y + box_width, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + a1, y + box_width / 2, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                pygame.gfxdraw.bezier(screen, additional_line, 4, color)
-                pygame.gfxdraw.bezier(screen, additional_line3, 4, color)
-            elif 0.45 <= eyesy.knob1 < 0.6:
-                # 4 - bird beak
-                additional_line = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                additional_line2 = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y - a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                pygame.gfxdraw.bezier(screen, additional_line, 4, color)
-                pygame.gfxdraw.bezier(screen, additional_line2, 4, color)
-            elif 0.6 <= eyesy.knob1 < 0.75:
-                # 5 - house
-                pygame.draw.aalines(screen, color, False, rotated_vertices)
-                additional_line = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                pygame.gfxdraw.bezier(screen, additional_line, 4, color)
-            elif 0.75 <= eyesy.knob1 < 0.9:
-                # 6 - lozenge
-                pygame.draw.aalines(screen, color, False, [rotated_vertices[0], rotated_vertices[1]])
-                pygame.draw.aalines(screen, color, False, [rotated_vertices[2], rotated_vertices[3]])
-                additional_line = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                additional_line2 = [
-                    rotate_point(center_x, center_y, x + box_width, y + box_width, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + box_width - a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y + box_width, rotation_angles[index])
-                ]
-                pygame.gfxdraw.bezier(screen, additional_line, 4, color)
-                pygame.gfxdraw.bezier(screen, additional_line2, 4, color)
-            else:
-                # 7 - star
-                additional_line = [
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                additional_line2 = [
-                    rotate_point(center_x, center_y, x + box_width, y + box_width, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width / 2, y + box_width - a1, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y + box_width, rotation_angles[index])
-                ]
-                additional_line3 = [
-                    rotate_point(center_x, center_y, x, y + box_width, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + a1, y + box_width / 2, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x, y, rotation_angles[index])
-                ]
-                additional_line4 = [
-                    rotate_point(center_x, center_y, x + box_width, y + box_width, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x - a1 + box_width, y + box_width / 2, rotation_angles[index]),
-                    rotate_point(center_x, center_y, x + box_width, y, rotation_angles[index])
-                ]
-                pygame.gfxdraw.bezier(screen, additional_line, 4, color)
-                pygame.gfxdraw.bezier(screen, additional_line2, 4, color)
-                pygame.gfxdraw.bezier(screen, additional_line3, 4, color)
-                pygame.gfxdraw.bezier(screen, additional_line4, 4, color)
+    horizontal_spacing = (xr - GRID_WIDTH * box_width) / (GRID_WIDTH + 1)
+    vertical_spacing = (yr - GRID_HEIGHT * box_height) / (GRID_HEIGHT + 1)
+    # Position of every box, row by row
+    row, col = np.divmod(np.arange(CELLS), GRID_WIDTH)
+    corners = np.stack((horizontal_spacing * (col + 1) + col * box_width,
+                        vertical_spacing * (row + 1) + row * box_height), -1)
+    centers = corners + (box_width / 2, box_height / 2)
+    # Get the y-position offset from the audio input and average it over the history
+    current_value = np.asarray(eyesy.audio_in[:CELLS], dtype=np.float64) * yr / 32768
+    audio_history[:, :-1] = audio_history[:, 1:]
+    audio_history[:, -1] = current_value
+    a1 = audio_history.mean(axis=1)
+    # Update the rotation angle based on a1
+    max_rotation_speed = eyesy.knob2 * 200  # Maximum rotation speed in degrees per frame
+    rotation_speed = (a1 / yr) * max_rotation_speed * 2  # Scale a1 to the range [-max_rotation_speed, max_rotation_speed]
+    # Limit the rotation angle to [-180, 180]
+    np.clip(rotation_angles + rotation_speed, -180, 180, out=rotation_angles)
+    if eyesy.knob2 == 1:
+        rotation_angles[:] = 0
+    # Build every cell's curves at once, rotate them with their box and tessellate
+    names, edges = DRAWING_OPTIONS[drawing_option(eyesy.knob1)]
+    base = np.array([CURVE_BASE[name] for name in names], dtype=np.float64) * box_width
+    bend = np.array([CURVE_BEND[name] for name in names], dtype=np.float64)
+    control = corners[:, None, None, :] + base + a1[:, None, None, None] * bend
+    control = rotate(control, centers, rotation_angles)
+    draw_polylines(screen, color, tessellate(control, CURVE_SEGMENTS))
+    if edges:
+        vertices = rotate(corners[:, None, :] + BOX_VERTICES * (box_width, box_height), centers, rotation_angles)
+        for run in edges:
+            draw_polylines(screen, color, vertices[:, run], antialias=True)
     # Trails
     veil = pygame.Surface((eyesy.xres, eyesy.yres))
     veil.set_alpha(int(eyesy.knob3 * 45))
@@ -2,12 +2,17 @@ import pygame
 import random
 import time
 import math
+import numpy as np
 import pygame.gfxdraw
 #Knob1 - cloud x position
 #Knob2 - cloud y position
 #Knob3 - pattern shape and swell range
 #Knob4 - foreground color
 #Knob5 - background color
+# Circles per pixel row of the cloud (all five knobs are taken, so density is set here).
+# 1 is the original 360 circles at 720p; denser clouds keep the same shape and colors,
+# with the extra circles taking the color of their row
+DENSITY = 1.0
 color_rate = 0
 def setup(screen, eyesy):
     pass
@@ -22,11 +27,24 @@ def draw(screen, eyesy):
     y480 = yr * 0.667 #((480*yr)/eyesy.yres)
     xpos1 = int(eyesy.knob1*4*x240)-2*x240
     cool = int(yhalf)
-    for i in range(cool):
-        xpos = int(x240 + int(xhalf*math.sin(.5 + time.time())*eyesy.knob3))
-        ypos = int((eyesy.knob2*y480) + eyesy.audio_in[i%99]/100 + int(30* math.cos(1 * 1 + time.time())))
+    count = int(cool * DENSITY)
+    if count == 0:
+        return
+    now = time.time()  # One clock read per frame
+    # The whole cloud in one pass: i runs down the cloud, fractional when denser than one circle a row
+    i = np.arange(count) / DENSITY
+    rows = i.astype(np.intp)
+    audio = np.asarray(eyesy.audio_in, dtype=np.float64)[rows % 99]
+    xpos = int(x240 + int(xhalf*math.sin(.5 + now)*eyesy.knob3))
+    ypos = np.trunc((eyesy.knob2*y480) + audio/100 + int(30* math.cos(1 * 1 + now)))
+    radius = np.trunc(np.trunc((30 + 20 * np.sin(i*eyesy.knob3 * 3 + now))*yr)/yr)
+    xs = np.trunc(np.trunc(xr / 2 + xpos * np.sin(i * 1 + now)) + xpos1)
+    ys = np.trunc(i + ypos)
+    # Colors step along the gradient one row at a time
+    palette = []
+    for row in range(rows[-1] + 1):
         color_rate += (eyesy.knob4*0.02)
-        color = eyesy.color_picker(color_rate)
-        radius = int((30 + 20 * math.sin(i*eyesy.knob3 * 3 + time.time()))*yr)/yr
-        xpos = int(xr / 2 + xpos * math.sin(i * 1 + time.time()))
-        pygame.gfxdraw.filled_circle(screen, int(xpos+xpos1), int(i+ypos), int(radius), color)
+        palette.append(eyesy.color_picker(color_rate))
+    for x, y, r, c in zip(xs.astype(np.intp).tolist(), ys.astype(np.intp).tolist(),
+                          radius.astype(np.intp).tolist(), rows.tolist()):
+        pygame.gfxdraw.filled_circle(screen, x, y, r, palette[c])
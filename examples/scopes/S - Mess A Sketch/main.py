@@ -1,40 +1,60 @@
 import pygame
-import random
+import numpy as np
+from collections import deque
+from itertools import islice
+# Strokes are rasterized once, onto a persistent layer, as they're sketched. "Mess" mode
+# re-jitters them every frame, so it redraws the most recent HISTORY segments; older
+# segments are settled onto their own layer and stay still
+HISTORY = 1000
 def setup(screen, eyesy):
-    global drawing, current_pos, mess
+    global drawing, current_pos, mess, layer, settled
     current_pos = (
         (int(eyesy.knob1 * eyesy.xres), int((1 - eyesy.knob2) * eyesy.yres)),
         eyesy.color_picker(eyesy.knob4),
         int(eyesy.knob3 * 0)
         )
-    drawing = [current_pos]
+    drawing = deque([current_pos])
+    layer = pygame.Surface((eyesy.xres, eyesy.yres), pygame.SRCALPHA)
+    layer.fill((0, 0, 0, 0))
+    settled = layer.copy()
     mess = False
+def add_point(pos):
+    # A straight run in one color and width is kept as a single segment
+    if len(drawing) > 1 and pos[1:] == drawing[-1][1:]:
+        (x0, y0), (x1, y1), (x2, y2) = drawing[-2][0], drawing[-1][0], pos[0]
+        if (x1 - x0) * (y2 - y1) == (y1 - y0) * (x2 - x1) and (x1 - x0) * (x2 - x1) + (y1 - y0) * (y2 - y1) > 0:
+            drawing[-1] = pos
+            return
+    drawing.append(pos)
+    if len(drawing) > HISTORY + 1:
+        start = drawing.popleft()[0]
+        pygame.draw.line(settled, drawing[0][1], start, drawing[0][0], drawing[0][2])
 def draw(screen, eyesy):
     global drawing, current_pos, mess
-    pygame.time.Clock().tick(60)
     screen.fill(eyesy.color_picker_bg(eyesy.knob5))
-    if drawing[-1][0] == current_pos[0]:
-        drawing[-1] == current_pos
-    elif drawing[-1] != current_pos and int(eyesy.knob3 * 30) > 0:
-        drawing.append(current_pos)
+    if drawing[-1][0] != current_pos[0] and int(eyesy.knob3 * 30) > 0:
+        # Only the new segment is drawn
+        pygame.draw.line(layer, current_pos[1], drawing[-1][0], current_pos[0], current_pos[2])
+        add_point(current_pos)
     if mess:
+        screen.blit(settled, (0, 0))
         audio_level = abs(eyesy.audio_in[0]) / 32767.0
         random_offset = int(audio_level * 50)
-        for i in range(1, len(drawing)):
-            pygame.draw.line(screen, drawing[i][1],
-                            (drawing[i-1][0][0] + random.randint(-random_offset, random_offset),
-                                        drawing[i-1][0][1] + random.randint(-random_offset, random_offset)),
-                            (drawing[i][0][0] + random.randint(-random_offset, random_offset),
-                                    drawing[i][0][1] + random.randint(-random_offset, random_offset)),
-                            drawing[i][2])
+        # Jitter both ends of every segment in one batch
+        points = np.array([pos[0] for pos in drawing])
+        ends = np.stack((points[:-1], points[1:]), 1)
+        ends += np.random.randint(-random_offset, random_offset + 1, ends.shape)
+        for (start, end), (pos, color, width) in zip(ends.tolist(), islice(drawing, 1, None)):
+            pygame.draw.line(screen, color, start, end, width)
     else:
-        for i in range(1, len(drawing)):
-            pygame.draw.line(screen, drawing[i][1], drawing[i-1][0], drawing[i][0], drawing[i][2])
+        screen.blit(layer, (0, 0))
     if eyesy.trig:
         mess = not mess
     # clear the drawing
     if eyesy.trig and all((eyesy.knob1 == 1, eyesy.knob2 == 1, eyesy.knob3 == 0, eyesy.knob4 == 1, eyesy.knob5 == 1)):
-        drawing = [current_pos]
+        drawing = deque([current_pos])
+        layer.fill((0, 0, 0, 0))
+        settled.fill((0, 0, 0, 0))
     current_pos = (
         (int(eyesy.knob1 * eyesy.xres), int((1 -eyesy.knob2) * eyesy.yres)),
         eyesy.color_picker(eyesy.knob4),
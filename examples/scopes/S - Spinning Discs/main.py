@@ -1,6 +1,6 @@
 import os
+import sys
 import pygame
-import glob
 #this mode and images are originally from the Technobear:
 #https://patchstorage.com/spinning-discs-640/
 #Knob1 - rotation rate
@@ -8,9 +8,15 @@ import glob
 #Knob3 - index color
 #Knob4 - foreground color
 #Knob5 - background color
+# Image sequence lives in examples/lib, which the runners put on sys.path
+try:
+    from eyesy_images import ImageSequence
+except ImportError:  # Deployed on its own, with the library copied next to main.py
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from eyesy_images import ImageSequence
 image_index = 0
 image_offset = 0
-images = []
+images = ImageSequence([])
 angle = 0
 def debug(screen, eyesy, dbg_str):
     color = eyesy.color_picker()
@@ -20,16 +26,9 @@ def debug(screen, eyesy, dbg_str):
     screen.blit(text, textpos)
 def setup(screen, eyesy) :
     global images, image_index
-    for filepath in sorted(glob.glob(eyesy.mode_root + '/Images/*.png')):
-        filename = os.path.basename(filepath)
-        img = pygame.image.load(filepath)
-        images.append(img)
-        try:
-            pal = len(img.get_palette())
-            print(filepath ,  " - " , len(img.get_palette()))
-        except:
-            print(filename ,  " no palette")
-    print("loaded")
+    # 22 discs, decoded as knob2 and the trigger reach them
+    images.close()
+    images = ImageSequence(eyesy.mode_root + '/Images/*.png')
 def draw(screen, eyesy) :
     global images, image_index, image_offset
     global angle
@@ -3,6 +3,7 @@ import pygame
 import math
 import time
 import random
+import numpy as np
 #Knob1 - Wave speed
 #Knob2 - Wave size/scale
 #Knob3 - 2D/3D mode switch (0-0.5: 2D waves, 0.5-1: 3D waves) + Wave direction/frequency
@@ -24,6 +25,18 @@ import random
 # Note: These shift+knob features work in the test runner. On actual EYESY hardware,
 # they require the shift button state to be exposed via eyesy.shift in the API.
 # Currently, the official EYESY OS v3 API doesn't expose shift state to modes.
+# 2D waves are sampled every COLUMN_STEP pixels; the polygon edges interpolate linearly
+# between samples (1 = every pixel, larger = cheaper)
+COLUMN_STEP = 4
+# 3D mesh density (depth rows x horizontal points) at a density of 1.0. The density adapts
+# between MESH_DENSITY_RANGE to keep the 3D mesh near MESH_BUDGET_MS per frame (None = fixed).
+# It stays fixed under eyesy.fixed_timestep too, so headless renders don't depend on the machine
+MESH_ROWS = 25
+MESH_COLS = 60
+MESH_BUDGET_MS = 8.0
+MESH_DENSITY_RANGE = (0.5, 2.0)
+mesh_density = 1.0
+mesh_layouts = {}  # (rows, cols, xres) -> static mesh layout, see mesh_layout()
 def setup(screen, eyesy):
     global trigger_waves, last_trigger_state
     trigger_waves = []  # List of active trigger wave effects
@@ -69,20 +82,16 @@ def draw(screen, eyesy):
     # Get audio amplitude for reactivity - enhanced for better responsiveness
     audio_amplitude = 0.0
     audio_peak = 0.0
-    audio_samples_used = []
-    if len(eyesy.audio_in) > 0:
+    audio_samples_used = np.empty(0)
+    audio = np.asarray(eyesy.audio_in, dtype=float)
+    if len(audio) > 0:
         # Calculate average amplitude
-        total = 0.0
-        for i in range(len(eyesy.audio_in)):
-            abs_val = abs(eyesy.audio_in[i])
-            total += abs_val
-            if abs_val > audio_peak:
-                audio_peak = abs_val
-        audio_amplitude = (total / len(eyesy.audio_in)) / 32768.0
+        magnitude = np.abs(audio)
+        audio_amplitude = magnitude.mean() / 32768.0
         # Also get peak for more dynamic response
-        audio_peak = audio_peak / 32768.0
+        audio_peak = magnitude.max() / 32768.0
         # Store normalized samples for direct wave shaping
-        audio_samples_used = [(eyesy.audio_in[i] / 32768.0) for i in range(min(len(eyesy.audio_in), 200))]
+        audio_samples_used = audio[:200] / 32768.0
     # Wave parameters
     wave_speed = eyesy.knob1 * 0.02 + 0.003
     wave_scale = eyesy.knob2 * 2.5 + 0.5  # Increased range for bigger wave height
@@ -169,158 +178,144 @@ def draw_gradient_background(screen, eyesy, base_color, gradient_amount):
 def draw_2d_waves(screen, eyesy, wave_color, wave_speed, wave_scale,
                   wave_direction, breaking_intensity, wave_frequency,
                   audio_amplitude, current_time, num_layers, turbulence=0.0, audio_samples_used=None):
-    """Draw 2D waves with enhanced audio reactivity"""
+    """Draw 2D waves with enhanced audio reactivity
+
+    The height field for every layer is computed at once as a (layers, columns)
+    array, sampled every COLUMN_STEP pixels.
+    """
     if audio_samples_used is None:
-        audio_samples_used = []
-    """Draw 2D waves (original implementation)"""
+        audio_samples_used = np.empty(0)
+    # Per-layer wave properties (back to front) vary by depth
+    layer_progress = np.arange(num_layers) / max(num_layers - 1, 1)
+    layer_speed = wave_speed * (0.4 + layer_progress * 0.6)
+    layer_scale = wave_scale * (0.5 + layer_progress * 0.5)
+    # Wave frequency affects wavelength - more frequency = shorter waves = more waves on screen
+    base_wavelength = 200 + layer_progress * 150
+    layer_wavelength = base_wavelength / wave_frequency  # Shorter wavelength = more waves
+    wave_offset = current_time * layer_speed * 150 * wave_direction
+    # Adjust base position - waves should take up more vertical space
+    # Start waves higher and make them taller
+    base_y_offset = (wave_scale - 0.5) * 0.4  # More aggressive offset
+    # Waves start at 30% of screen height and extend down
+    base_y = eyesy.yres * (0.30 - base_y_offset + layer_progress * (0.55 + base_y_offset * 0.6))
+    # Sample columns across the full width, always including both edges
+    xs = np.arange(0, eyesy.xres, COLUMN_STEP)
+    if xs[-1] != eyesy.xres - 1:
+        xs = np.append(xs, eyesy.xres - 1)
+    # Everything below is (layers, columns): one row per layer
+    wavenumber = (2 * math.pi / layer_wavelength)[:, None]
+    offset = wave_offset[:, None]
+    scale = layer_scale[:, None]
+    # Primary wave - smooth rolling motion from a combination of sine and cosine
+    phase1 = xs * wavenumber + offset
+    primary_wave = np.sin(phase1) * 0.7 + np.cos(phase1) * 0.3
+    # Front face slightly steeper, back face a gentle smooth slope
+    wave_value = np.where(primary_wave > 0, primary_wave * (1.0 + breaking_intensity * 0.2), primary_wave * 0.85)
+    # Gentle secondary waves for texture (much smaller amplitude)
+    wave_value += np.sin(xs * (wavenumber / 1.3) + offset * 0.95) * 0.15
+    wave_value += np.cos(xs * (wavenumber / 0.8) + offset * 1.05) * 0.1
+    # Very subtle variation for organic feel
+    wave_value += np.sin(phase1 * 3.5) * 0.015
+    # Shift+Knob1: Add turbulence/chaos (COMMENTED OUT)
+    # if turbulence > 0.0:
+    #     # Add noise based on position and time for turbulence
+    #     noise_phase = (xs / 50.0) * 2 * math.pi + current_time * 2.0
+    #     wave_value += (np.sin(noise_phase) * 0.3 + np.sin(noise_phase * 2.3) * 0.2 +
+    #                    np.sin(noise_phase * 3.7) * 0.1) * turbulence
+    # Apply smooth wave height scaling
+    base_height = wave_value * scale * 100
+    if len(audio_samples_used) > 0:
+        # Direct audio-to-wave mapping: each column uses the audio sample under it
+        audio_index = np.minimum(xs * len(audio_samples_used) // eyesy.xres, len(audio_samples_used) - 1)
+        audio_mod = audio_samples_used[audio_index] * scale * 150
+        # Also add amplitude-based scaling
+        amplitude_mod = audio_amplitude * scale * 80
+        wave_height = base_height + audio_mod + amplitude_mod
+    else:
+        # Fallback if no audio
+        audio_mod = audio_amplitude * 20 * np.sin(phase1 * 1.5)
+        wave_height = base_height * (1.0 + audio_amplitude * 0.25) + audio_mod
+    ys = np.clip((base_y[:, None] + wave_height).astype(np.intp), 0, eyesy.yres - 1)
+    # Polygon outline: bottom-left corner, the wave line, bottom-right corner
+    outline = np.empty((len(xs) + 2, 2), np.intp)
+    outline[0] = (0, eyesy.yres - 1)
+    outline[-1] = (eyesy.xres - 1, eyesy.yres - 1)
+    outline[1:-1, 0] = xs
+    crest = outline[1:-1]
     # Draw wave layers from back to front
     for layer in range(num_layers):
-        layer_progress = layer / max(num_layers - 1, 1)
-        # Wave properties vary by depth
-        layer_speed = wave_speed * (0.4 + layer_progress * 0.6)
-        layer_scale = wave_scale * (0.5 + layer_progress * 0.5)
-        # Wave frequency affects wavelength - more frequency = shorter waves = more waves on screen
-        base_wavelength = 200 + layer_progress * 150
-        layer_wavelength = base_wavelength / wave_frequency  # Shorter wavelength = more waves
         # Color gets lighter as waves get closer
-        depth_factor = 0.4 + layer_progress * 0.6
+        depth_factor = 0.4 + layer_progress[layer] * 0.6
         layer_color = (
             int(wave_color[0] * depth_factor),
             int(wave_color[1] * depth_factor),
             int(wave_color[2] * depth_factor)
         )
-        wave_offset = current_time * layer_speed * 150 * wave_direction
-        # Adjust base position - waves should take up more vertical space
-        # Start waves higher and make them taller
-        base_y_offset = (wave_scale - 0.5) * 0.4  # More aggressive offset
-        # Waves start at 30% of screen height and extend down
-        base_y = eyesy.yres * (0.30 - base_y_offset + layer_progress * (0.55 + base_y_offset * 0.6))
-        # Build wave points with realistic ocean wave physics
-        points = []
-        # Generate points across full width, including edges
-        for x in range(0, eyesy.xres, 1):  # Full width coverage, high resolution
-            # Simplified, more realistic ocean wave physics
-            # Primary wave - smooth rolling motion
-            phase1 = (x / layer_wavelength) * 2 * math.pi + wave_offset
-            # Use a smoother wave function - combination of sine and cosine
-            # This creates more natural rolling waves
-            primary_wave = math.sin(phase1) * 0.7 + math.cos(phase1) * 0.3
-            # Add gentle secondary waves for texture (much smaller amplitude)
-            phase2 = (x / (layer_wavelength * 1.3)) * 2 * math.pi + wave_offset * 0.95
-            phase3 = (x / (layer_wavelength * 0.8)) * 2 * math.pi + wave_offset * 1.05
-            secondary1 = math.sin(phase2) * 0.15
-            secondary2 = math.cos(phase3) * 0.1
-            # Create smooth, rolling wave shape
-            # Ocean waves are smoother and more flowing
-            if primary_wave > 0:
-                # Front face - slightly steeper but still smooth
-                wave_value = primary_wave * (1.0 + breaking_intensity * 0.2)
-            else:
-                # Back face - gentle, smooth slope
-                wave_value = primary_wave * 0.85
-            # Combine waves smoothly
-            wave_value = wave_value + secondary1 + secondary2
-            # Very subtle variation for organic feel (much smaller)
-            subtle_variation = math.sin(phase1 * 3.5) * 0.015
-            wave_value += subtle_variation
-            # Shift+Knob1: Add turbulence/chaos (COMMENTED OUT)
-            # if turbulence > 0.0:
-            #     # Add noise based on position and time for turbulence
-            #     noise_phase = (x / 50.0) * 2 * math.pi + current_time * 2.0
-            #     turbulence_noise = (
-            #         math.sin(noise_phase) * 0.3 +
-            #         math.sin(noise_phase * 2.3) * 0.2 +
-            #         math.sin(noise_phase * 3.7) * 0.1
-            #     ) * turbulence
-            #     wave_value += turbulence_noise
-            # Apply smooth wave height scaling
-            base_height = wave_value * layer_scale * 100
-            # Enhanced audio reactivity - direct mapping of audio to wave shape
-            # Map x position to audio sample index for direct audio-to-wave mapping
-            audio_index = int((x / eyesy.xres) * len(audio_samples_used)) if len(audio_samples_used) > 0 else 0
-            audio_index = min(audio_index, len(audio_samples_used) - 1) if len(audio_samples_used) > 0 else 0
-            # Direct audio influence on wave height
-            if len(audio_samples_used) > 0:
-                # Use actual audio sample value for direct reactivity
-                audio_sample = audio_samples_used[audio_index]
-                # Stronger audio influence - audio directly affects wave height
-                audio_mod = audio_sample * layer_scale * 150  # Direct audio-to-wave mapping
-                # Also add amplitude-based scaling
-                amplitude_mod = audio_amplitude * layer_scale * 80
-                wave_height = base_height + audio_mod + amplitude_mod
-            else:
-                # Fallback if no audio
-                audio_mod = audio_amplitude * 20 * math.sin(phase1 * 1.5)
-                wave_height = base_height * (1.0 + audio_amplitude * 0.25) + audio_mod
-            # Simple 2D wave rendering - no 3D transformation
-            x_screen = x
-            y_screen = int(base_y + wave_height)
-            # Clamp to screen bounds, but ensure we can reach full width
-            x_screen = max(0, min(x_screen, eyesy.xres - 1))
-            y_screen = max(0, min(y_screen, eyesy.yres - 1))
-            points.append((x_screen, y_screen))
-        # Ensure we have points at both edges for full width coverage
-        if len(points) > 0:
-            # Ensure first point is at x=0
-            if points[0][0] > 0:
-                first_y = points[0][1]
-                points.insert(0, (0, first_y))
-            # Ensure last point is at x=eyesy.xres-1
-            if points[-1][0] < eyesy.xres - 1:
-                last_y = points[-1][1]
-                points.append((eyesy.xres - 1, last_y))
-        # Draw wave as filled polygon with smooth rendering
-        if len(points) > 1:
-            # Ensure polygon extends full width and closes properly
-            polygon_points = [(0, eyesy.yres)]
-            polygon_points.extend(points)
-            polygon_points.append((eyesy.xres - 1, eyesy.yres))
-            # Ensure all y values are within screen bounds
-            safe_points = [(px, min(eyesy.yres - 1, max(0, py))) for px, py in polygon_points]
-            # Draw main wave polygon - this creates smooth filled waves
-            pygame.draw.polygon(screen, layer_color, safe_points)
-        # Draw wave details on top layer - subtle highlights only
-        if layer == num_layers - 1:
-            # Draw subtle wave crest highlight for realism
-            if len(points) > 1:
-                # Very subtle lighter color for the wave crest
-                crest_color = (
-                    min(255, layer_color[0] + 20),
-                    min(255, layer_color[1] + 20),
-                    min(255, layer_color[2] + 20)
-                )
-                # Draw smooth crest line
-                pygame.draw.lines(screen, crest_color, False, points, 1)
-            # Draw subtle highlights on wave peaks (sun reflection)
-            highlight_color = (
-                min(255, layer_color[0] + 40),
-                min(255, layer_color[1] + 40),
-                min(255, layer_color[2] + 40)
-            )
-            # Only draw highlights on actual peaks for subtle effect
-            for i in range(1, len(points) - 1, 2):
-                if i < len(points):
-                    x, y = points[i]
-                    # Check if this is actually a peak
-                    if i > 0 and i < len(points) - 1:
-                        prev_y = points[i-1][1]
-                        next_y = points[i+1][1]
-                        if y < prev_y and y < next_y:  # Local minimum (peak)
-                            phase = (x / layer_wavelength) * 2 * math.pi + wave_offset
-                            wave_val = math.cos(phase)
-                            if wave_val > 0.7:
-                                highlight_size = int(1 + (wave_val - 0.7) * 4)
-                                pygame.draw.circle(screen, highlight_color, (x, y - 1), highlight_size)
+        outline[1:-1, 1] = ys[layer]
+        # Draw main wave polygon - this creates smooth filled waves
+        pygame.draw.polygon(screen, layer_color, outline.tolist())
+    # Draw wave details on top layer - subtle highlights only
+    # Very subtle lighter color for the wave crest
+    crest_color = (
+        min(255, layer_color[0] + 20),
+        min(255, layer_color[1] + 20),
+        min(255, layer_color[2] + 20)
+    )
+    pygame.draw.lines(screen, crest_color, False, crest.tolist(), 1)
+    # Draw subtle highlights on wave peaks (sun reflection)
+    highlight_color = (
+        min(255, layer_color[0] + 40),
+        min(255, layer_color[1] + 40),
+        min(255, layer_color[2] + 40)
+    )
+    # Only draw highlights on actual peaks (local minima in screen y) for subtle effect
+    top = ys[-1]
+    peaks = np.flatnonzero((top[1:-1] < top[:-2]) & (top[1:-1] < top[2:])) + 1
+    wave_val = np.cos(phase1[-1, peaks])
+    for x, y, val in zip(xs[peaks].tolist(), top[peaks].tolist(), wave_val.tolist()):
+        if val > 0.7:
+            highlight_size = int(1 + (val - 0.7) * 4)
+            pygame.draw.circle(screen, highlight_color, (x, y - 1), highlight_size)
+def mesh_layout(num_rows, num_cols, xres, depth_range):
+    """Static part of the 3D mesh for one density: vertex x and z, and the strip draw order
+
+    Strips (the band between two rows) are drawn back to front so nearer waves
+    cover farther ones. Computed once per density and cached.
+    """
+    key = (num_rows, num_cols, xres)
+    layout = mesh_layouts.get(key)
+    if layout is None:
+        x_3d = np.arange(num_cols) / (num_cols - 1) * xres * 1.2 - (xres * 1.2) / 2  # X centered, wider
+        z_3d = np.arange(num_rows) * (depth_range / num_rows)  # Z position (depth)
+        strip_order = np.argsort(-z_3d[:-1], kind='stable')  # Farthest strip first
+        layout = (x_3d, z_3d, strip_order)
+        mesh_layouts[key] = layout
+    return layout
+def adapt_mesh_density(eyesy, elapsed_ms):
+    """Nudge the mesh density toward the frame budget (not with a fixed timestep)"""
+    global mesh_density
+    if MESH_BUDGET_MS is None or getattr(eyesy, 'fixed_timestep', False):
+        return
+    if elapsed_ms > MESH_BUDGET_MS * 1.1:
+        mesh_density *= 0.9
+    elif elapsed_ms < MESH_BUDGET_MS * 0.6:
+        mesh_density *= 1.05
+    mesh_density = max(MESH_DENSITY_RANGE[0], min(MESH_DENSITY_RANGE[1], mesh_density))
 def draw_3d_waves(screen, eyesy, wave_color, bg_color, wave_speed, wave_scale,
                   wave_frequency, audio_amplitude, current_time, mode_blend,
                   wave_direction, camera_angle=0.0, audio_samples_used=None):
-    """Draw 3D waves with enhanced audio reactivity"""
+    """Draw 3D waves with perspective projection and enhanced audio reactivity
+
+    Vertex displacement and projection run on the whole mesh as NumPy arrays,
+    and each row of quads (all one color) is filled as a single strip polygon.
+    """
+    start_time = time.perf_counter()
     if audio_samples_used is None:
-        audio_samples_used = []
-    """Draw 3D waves with perspective projection - optimized for performance"""
-    # 3D parameters - optimized for performance (reduced from 40x100 to 25x60)
-    num_rows = 25  # Number of depth rows (reduced for better performance)
-    num_cols = 60  # Number of horizontal points (reduced for better performance)
+        audio_samples_used = np.empty(0)
+    # Mesh density follows the frame budget in steps of 1/4 so the mesh doesn't shimmer
+    density = round(mesh_density * 4) / 4.0
+    num_rows = max(2, int(MESH_ROWS * density))  # Number of depth rows
+    num_cols = max(2, int(MESH_COLS * density))  # Number of horizontal points
     depth_range = 600.0  # How far back waves extend in 3D space
     # Camera/view parameters - adjusted for better coverage
     camera_z = -150.0  # Camera position in Z (moved closer for larger view)
@@ -328,131 +323,94 @@ def draw_3d_waves(screen, eyesy, wave_color, bg_color, wave_speed, wave_scale,
     # Wave parameters - direction controls X movement, Z always moves forward
     wave_offset_x = current_time * wave_speed * 150 * wave_direction
     wave_offset_z = current_time * wave_speed * 100  # Z always moves forward for depth effect
-    # Generate 3D wave mesh
-    mesh_points = []  # List of (x, y, z) for each point
-    screen_points = []  # List of (screen_x, screen_y) for each point
-    for row in range(num_rows):
-        z_3d = row * (depth_range / num_rows)  # Z position (depth)
-        depth_factor = 1.0 - (z_3d / depth_range)  # 1.0 at front, 0.0 at back
-        # Color gets darker with depth
-        color_factor = 0.3 + depth_factor * 0.7
-        row_color = (
-            int(wave_color[0] * color_factor),
-            int(wave_color[1] * color_factor),
-            int(wave_color[2] * color_factor)
-        )
-        row_points = []
-        row_screen_points = []
-        for col in range(num_cols):
-            x_3d = (col / (num_cols - 1)) * eyesy.xres * 1.2 - (eyesy.xres * 1.2) / 2  # X position centered, wider
-            # Calculate wave height at this 3D position
-            # Use both X and Z for wave pattern
-            phase_x = (x_3d / (200.0 / wave_frequency)) * 2 * math.pi + wave_offset_x
-            phase_z = (z_3d / (150.0 / wave_frequency)) * 2 * math.pi + wave_offset_z
-            # Combine waves in X and Z directions for 3D effect
-            wave_x = math.sin(phase_x) * 0.7 + math.cos(phase_x) * 0.3
-            wave_z = math.sin(phase_z) * 0.5 + math.cos(phase_z * 0.7) * 0.3
-            # Combine for 3D wave surface - increased height multiplier
-            wave_height_3d = (wave_x + wave_z * 0.5) * wave_scale * 150  # Increased from 80 to 150
-            # Enhanced audio reactivity for 3D mode - direct audio mapping
-            # Map x position to audio sample index
-            audio_index = int((col / num_cols) * len(audio_samples_used)) if len(audio_samples_used) > 0 else 0
-            audio_index = min(audio_index, len(audio_samples_used) - 1) if len(audio_samples_used) > 0 else 0
-            if len(audio_samples_used) > 0:
-                # Direct audio sample influence
-                audio_sample = audio_samples_used[audio_index]
-                # Strong audio influence on 3D waves
-                audio_mod = audio_sample * wave_scale * 200
-                # Amplitude-based scaling
-                amplitude_mod = audio_amplitude * wave_scale * 100
-                wave_height_3d = wave_height_3d + audio_mod + amplitude_mod
-            else:
-                # Fallback
-                audio_mod = audio_amplitude * 25 * math.sin(phase_x * 1.5)
-                wave_height_3d = wave_height_3d * (1.0 + audio_amplitude * 0.4) + audio_mod
-            # Y position in 3D space (wave height)
-            y_3d = wave_height_3d
-            # Base Y position - waves start at 20% of screen and extend upward to fill more space
-            # Front waves (depth_factor = 1.0) start at 20%, back waves start lower
-            base_y_3d = eyesy.yres * (0.20 + (1.0 - depth_factor) * 0.5)  # Start at 20%, extend to 70%
-            y_3d += base_y_3d
-            # Store 3D point
-            mesh_points.append((x_3d, y_3d, z_3d))
-            # Shift+Knob3: Apply camera rotation (COMMENTED OUT)
-            # if abs(camera_angle) > 0.1:
-            #     angle_rad = math.radians(camera_angle)
-            #     # Rotate X coordinate based on camera angle
-            #     x_rotated = x_3d * math.cos(angle_rad) - z_3d * math.sin(angle_rad)
-            #     z_rotated = x_3d * math.sin(angle_rad) + z_3d * math.cos(angle_rad)
-            # else:
-            x_rotated = x_3d
-            z_rotated = z_3d
-            # Project 3D to 2D screen coordinates with perspective
-            # Perspective projection: screen_x = (x_3d * focal_length) / (z_3d - camera_z)
-            z_distance = z_rotated - camera_z
-            if z_distance > 0:
-                screen_x = (x_rotated * focal_length) / z_distance + eyesy.xres / 2
-                screen_y = (y_3d * focal_length) / z_distance + eyesy.yres * 0.1  # Offset upward to fill more space
-                # Allow points to extend beyond screen for full coverage, but clamp for drawing
-                row_screen_points.append((int(screen_x), int(screen_y)))
-            else:
-                row_screen_points.append(None)
-        screen_points.append(row_screen_points)
-    # Draw 3D wave mesh as filled polygons - optimized for performance
-    for row in range(num_rows - 1):
-        z_3d = row * (depth_range / num_rows)
-        depth_factor = 1.0 - (z_3d / depth_range)
+    x_3d, z_3d, strip_order = mesh_layout(num_rows, num_cols, eyesy.xres, depth_range)
+    depth_factor = 1.0 - (z_3d / depth_range)  # 1.0 at front, 0.0 at back
+    # Wave height uses both X and Z: the X wave varies per column, the Z wave per row
+    phase_x = (x_3d / (200.0 / wave_frequency)) * 2 * math.pi + wave_offset_x
+    phase_z = (z_3d / (150.0 / wave_frequency)) * 2 * math.pi + wave_offset_z
+    wave_x = np.sin(phase_x) * 0.7 + np.cos(phase_x) * 0.3
+    wave_z = np.sin(phase_z) * 0.5 + np.cos(phase_z * 0.7) * 0.3
+    # (rows, cols) wave surface
+    wave_height_3d = (wave_x + wave_z[:, None] * 0.5) * wave_scale * 150
+    if len(audio_samples_used) > 0:
+        # Direct audio mapping: each column uses the audio sample under it
+        audio_index = np.minimum(np.arange(num_cols) * len(audio_samples_used) // num_cols,
+                                 len(audio_samples_used) - 1)
+        audio_mod = audio_samples_used[audio_index] * wave_scale * 200
+        amplitude_mod = audio_amplitude * wave_scale * 100
+        wave_height_3d += audio_mod + amplitude_mod
+    else:
+        # Fallback
+        audio_mod = audio_amplitude * 25 * np.sin(phase_x * 1.5)
+        wave_height_3d = wave_height_3d * (1.0 + audio_amplitude * 0.4) + audio_mod
+    # Base Y position - front waves start at 20% of the screen, back waves lower (up to 70%)
+    y_3d = wave_height_3d + (eyesy.yres * (0.20 + (1.0 - depth_factor) * 0.5))[:, None]
+    # Shift+Knob3: Apply camera rotation (COMMENTED OUT)
+    # if abs(camera_angle) > 0.1:
+    #     angle_rad = math.radians(camera_angle)
+    #     x_rotated = x_3d * math.cos(angle_rad) - z_3d[:, None] * math.sin(angle_rad)
+    #     z_rotated = x_3d * math.sin(angle_rad) + z_3d[:, None] * math.cos(angle_rad)
+    # Perspective projection: screen_x = (x_3d * focal_length) / (z_3d - camera_z)
+    # (the camera sits in front of the mesh, so every vertex has a positive distance)
+    perspective = (focal_length / (z_3d - camera_z))[:, None]
+    screen_x = (x_3d * perspective + eyesy.xres / 2).astype(np.intp)
+    screen_y = (y_3d * perspective + eyesy.yres * 0.1).astype(np.intp)  # Offset upward to fill more space
+    # Quick visibility check per quad - skip the parts of a strip that are completely off-screen
+    quad_min_x = np.minimum(screen_x[:-1], screen_x[1:])
+    quad_min_x = np.minimum(quad_min_x[:, :-1], quad_min_x[:, 1:])
+    quad_max_x = np.maximum(screen_x[:-1], screen_x[1:])
+    quad_max_x = np.maximum(quad_max_x[:, :-1], quad_max_x[:, 1:])
+    quad_min_y = np.minimum(screen_y[:-1], screen_y[1:])
+    quad_min_y = np.minimum(quad_min_y[:, :-1], quad_min_y[:, 1:])
+    quad_max_y = np.maximum(screen_y[:-1], screen_y[1:])
+    quad_max_y = np.maximum(quad_max_y[:, :-1], quad_max_y[:, 1:])
+    visible = (quad_max_x >= 0) & (quad_min_x < eyesy.xres) & (quad_max_y >= 0) & (quad_min_y < eyesy.yres)
+    # Clamp points to screen bounds for drawing
+    points = np.stack((np.clip(screen_x, 0, eyesy.xres - 1), np.clip(screen_y, 0, eyesy.yres - 1)), axis=-1)
+    # Draw the mesh back to front, one strip polygon per row (every quad in a row shares its color)
+    outline_rows = num_rows // 3  # Only front third of rows get outlines
+    for row in strip_order.tolist():
+        columns = np.flatnonzero(visible[row])
+        if len(columns) == 0:
+            continue
+        first = columns[0]
+        last = columns[-1] + 1
         # Color gets darker with depth
-        color_factor = 0.3 + depth_factor * 0.7
+        color_factor = 0.3 + depth_factor[row] * 0.7
         row_color = (
             int(wave_color[0] * color_factor),
             int(wave_color[1] * color_factor),
             int(wave_color[2] * color_factor)
         )
-        # Draw quads between this row and next row
-        for col in range(num_cols - 1):
-            p1 = screen_points[row][col]
-            p2 = screen_points[row][col + 1]
-            p3 = screen_points[row + 1][col + 1]
-            p4 = screen_points[row + 1][col]
-            # Only draw if all points are valid
-            if p1 and p2 and p3 and p4:
-                # Quick visibility check - skip quads completely off-screen
-                min_x = min(p1[0], p2[0], p3[0], p4[0])
-                max_x = max(p1[0], p2[0], p3[0], p4[0])
-                min_y = min(p1[1], p2[1], p3[1], p4[1])
-                max_y = max(p1[1], p2[1], p3[1], p4[1])
-                # Skip if completely off-screen
-                if max_x < 0 or min_x >= eyesy.xres or max_y < 0 or min_y >= eyesy.yres:
-                    continue
-                # Clamp points to screen bounds for drawing
-                safe_quad_points = [
-                    (max(0, min(p1[0], eyesy.xres - 1)), max(0, min(p1[1], eyesy.yres - 1))),
-                    (max(0, min(p2[0], eyesy.xres - 1)), max(0, min(p2[1], eyesy.yres - 1))),
-                    (max(0, min(p3[0], eyesy.xres - 1)), max(0, min(p3[1], eyesy.yres - 1))),
-                    (max(0, min(p4[0], eyesy.xres - 1)), max(0, min(p4[1], eyesy.yres - 1)))
-                ]
-                # Draw filled quad
-                pygame.draw.polygon(screen, row_color, safe_quad_points)
-                # Only draw outline for front rows (reduces drawing overhead)
-                if row < num_rows // 3:  # Only front third of rows get outlines
-                    outline_color = (
-                        max(0, row_color[0] - 20),
-                        max(0, row_color[1] - 20),
-                        max(0, row_color[2] - 20)
-                    )
-                    pygame.draw.lines(screen, outline_color, True, safe_quad_points, 1)
-    # Draw wave crest highlights on front row
-    if len(screen_points) > 0:
-        front_row = screen_points[0]
-        crest_points = [p for p in front_row if p is not None]
-        if len(crest_points) > 1:
-            crest_color = (
-                min(255, wave_color[0] + 30),
-                min(255, wave_color[1] + 30),
-                min(255, wave_color[2] + 30)
+        near_edge = points[row, first:last + 1]
+        far_edge = points[row + 1, first:last + 1]
+        # Near edge left to right, then far edge back right to left
+        strip = np.concatenate((near_edge, far_edge[::-1])).tolist()
+        pygame.draw.polygon(screen, row_color, strip)
+        if row < outline_rows:
+            outline_color = (
+                max(0, row_color[0] - 20),
+                max(0, row_color[1] - 20),
+                max(0, row_color[2] - 20)
             )
-            pygame.draw.lines(screen, crest_color, False, crest_points, 2)
+            # Quad outlines: the two row edges plus a zig-zag through the cross edges
+            zigzag = np.empty((len(near_edge) * 2, 2), np.intp)
+            zigzag[0::4] = near_edge[0::2]
+            zigzag[1::4] = far_edge[0::2]
+            zigzag[2::4] = far_edge[1::2]
+            zigzag[3::4] = near_edge[1::2]
+            pygame.draw.lines(screen, outline_color, False, near_edge.tolist(), 1)
+            pygame.draw.lines(screen, outline_color, False, far_edge.tolist(), 1)
+            pygame.draw.lines(screen, outline_color, False, zigzag.tolist(), 1)
+    # Draw wave crest highlights on front row
+    crest_color = (
+        min(255, wave_color[0] + 30),
+        min(255, wave_color[1] + 30),
+        min(255, wave_color[2] + 30)
+    )
+    crest_points = np.stack((screen_x[0], screen_y[0]), axis=-1)
+    pygame.draw.lines(screen, crest_color, False, crest_points.tolist(), 2)
+    adapt_mesh_density(eyesy, (time.perf_counter() - start_time) * 1000.0)
 def draw_trigger_waves(screen, eyesy, wave_color, current_time):
     """Draw trigger wave ripple effects - creates expanding wave ripples"""
     global trigger_waves
@@ -1,8 +1,14 @@
 import os
+import sys
 import pygame
-import glob
 # IMPORTANT -- SCALE ALL IMAGES TO SCREEN WIDTH X SCREEN HEIGHT
-images = []
+# Image sequence lives in examples/lib, which the runners put on sys.path
+try:
+    from eyesy_images import ImageSequence
+except ImportError:  # Deployed on its own, with the library copied next to main.py
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from eyesy_images import ImageSequence
+images = ImageSequence([])
 image_index = 0
 trigger = False
 bgi = pygame.Surface((1280, 720))
@@ -11,12 +17,9 @@ last_screen = pygame.Surface((1280,720))
 def setup(screen, eyesy) :
     global images, fall, bg, image_index, xr, yr
     image_index = 0
-    for filepath in sorted(glob.glob(eyesy.mode_root + '/Images/*.png')):
-        filename = os.path.basename(filepath)
-        print('loading image file: ' + filename)
-        img = pygame.image.load(filepath)
-        img = img.convert_alpha()
-        images.append(img)
+    # Decoded as the slideshow reaches them, the next ones in the background
+    images.close()
+    images = ImageSequence(eyesy.mode_root + '/Images/*.png', alpha=True)
     xr = eyesy.xres
     yr = eyesy.yres
 def draw(screen, eyesy) :
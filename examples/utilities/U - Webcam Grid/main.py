@@ -12,6 +12,7 @@ Camera Detection:
 - Automatically detects multiple cameras and adds them to the grid
 - Uses multiple backends: OpenCV, webcam library, imageio, ffmpeg, or pygame.camera
 - If multiple video sources are detected, each grid cell shows a different camera
+- Each camera is read on its own background thread, so drawing never waits on a camera
 - If camera can not be found or not be opened, it will use a static png instead
 Tested: EYESY OS 2.1 on Organelle M
 # Copyright notice:
@@ -24,6 +25,16 @@ import subprocess
 import sys
 import os
 import math
+# Background capture threads live in examples/lib, which the runners put on sys.path
+try:
+    from eyesy_capture import (OpenCVSource, WebcamLibSource, ImageioSource, FFmpegPipeSource,
+                               PygameCameraSource, open_stream, close_all_streams,
+                               frame_surface, upload_frame)
+except ImportError:  # Deployed on its own, with the library copied next to main.py
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from eyesy_capture import (OpenCVSource, WebcamLibSource, ImageioSource, FFmpegPipeSource,
+                               PygameCameraSource, open_stream, close_all_streams,
+                               frame_surface, upload_frame)
 # Try to detect available camera backends
 # Try multiple libraries in order of preference
 USE_OPENCV = False
@@ -115,6 +126,8 @@ def setup(screen, etc):
     # CRITICAL: Ensure setup() completes successfully to prevent mode switch
     # The EYESY OS may switch to Solo mode if setup() fails or raises exceptions
     try:
+        # Hand back any camera still held by an earlier run of this (or another webcam) mode
+        close_all_streams()
         etc.capture = Capture(etc)
         print("✓ Setup completed successfully - Grid mode initialized")
     except Exception as e:
@@ -128,6 +141,8 @@ def setup(screen, etc):
                 self.cameras = []
                 self.camera_snapshots = []
                 self.camera_masked = []
+            def get_and_flip(self, screen, etc):
+                pass
         etc.capture = MinimalCapture()
     # Initialize grid cell rotations and scales with slight variations for visual distinction
     etc.grid_rotations = [[random.uniform(-15, 15) for _ in range(4)] for _ in range(4)]
@@ -135,78 +150,23 @@ def setup(screen, etc):
     etc._mode_type = "GRID"  # Unique identifier - MUST be "GRID"
     etc._mode_file = "U - Webcam Grid/main.py"  # File path identifier
     etc._mode_text = "GRID MODE"  # Text to display - MUST be "GRID MODE", never "STANDALONE"
+    # Labels drawn over the grid every frame
+    global grid_label, grid_outline, file_label
+    label_font = pygame.font.Font(None, 80)
+    grid_label = label_font.render("GRID MODE", True, (0, 255, 255))
+    grid_outline = label_font.render("GRID MODE", True, (0, 0, 0))
+    file_label = pygame.font.Font(None, 32).render("U - Webcam Grid/main.py", True, (255, 255, 255))
 def draw(screen, etc):
     # GRID MODE: 4x4 grid layout
-    # CRITICAL: This is GRID mode - should have MAGENTA border, NOT green!
     etc.color_picker_bg(etc.knob5)
-    # Draw a thin border around the entire screen to show this is GRID mode
-    # MAGENTA border (255, 0, 255) = GRID MODE
-    # GREEN border (0, 255, 0) = STANDALONE MODE (WRONG FILE!)
-    pygame.draw.rect(screen, (255, 0, 255), (0, 0, etc.xres, etc.yres), 5)  # Magenta border for GRID
-    # ============================================================
-    # DIRECT GRID TEST: Draw 16 rectangles directly in draw() function
-    # This bypasses get_and_flip() entirely to test if grid works
-    # ============================================================
-    grid_cols = 4
-    grid_rows = 4
-    cell_width = etc.xres // grid_cols
-    cell_height = etc.yres // grid_rows
-    print(f"*** DRAW() FUNCTION: Drawing {grid_rows}x{grid_cols} grid directly ***")
-    print(f"*** Screen: {etc.xres}x{etc.yres}, Cells: {cell_width}x{cell_height} ***")
-    # Draw 16 colored rectangles directly - NO get_and_flip() call
-    for row in range(grid_rows):
-        for col in range(grid_cols):
-            cell_num = row * grid_cols + col + 1
-            cell_x = col * cell_width
-            cell_y = row * cell_height
-            # Calculate distinct color for each cell
-            r = (cell_num * 16) % 255
-            g = ((cell_num * 23) % 255)
-            b = ((cell_num * 31) % 255)
-            # Draw a HUGE colored rectangle covering most of the cell
-            pygame.draw.rect(screen, (r, g, b),
-                           (cell_x + 5, cell_y + 5, cell_width - 10, cell_height - 10), 0)
-            # Draw cell number in HUGE font
-            try:
-                font = pygame.font.Font(None, 100)
-                text = font.render(str(cell_num), True, (255, 255, 255))
-                text_x = cell_x + (cell_width - text.get_width()) // 2
-                text_y = cell_y + (cell_height - text.get_height()) // 2
-                screen.blit(text, (text_x, text_y))
-            except:
-                pass
-            if cell_num <= 4:
-                print(f"*** DREW CELL {cell_num} at ({cell_x}, {cell_y}) color=({r}, {g}, {b}) ***")
-    print(f"*** DRAW() FUNCTION: Finished drawing 16 cells ***")
-    # DON'T call get_and_flip() - we're testing direct drawing
-    # etc.capture.get_and_flip(screen, etc)
-    # DRAW "GRID MODE" TEXT LAST - AFTER EVERYTHING ELSE - CANNOT BE OVERRIDDEN
-    # This ensures the text is ALWAYS drawn on top, even if get_and_flip() draws text
-    # Draw multiple times to ensure visibility
-    for y_offset in [10, 80]:
-        try:
-            font = pygame.font.Font(None, 80)  # Very large font
-            # HARDCODE "GRID MODE" - never use variable, never show "STANDALONE"
-            grid_text = "GRID MODE"  # This string is NEVER "STANDALONE"
-            # Force check - if somehow it's "STANDALONE", change it
-            if grid_text == "STANDALONE":
-                grid_text = "GRID MODE"
-            text_surface = font.render(grid_text, True, (0, 255, 255))  # Cyan
-            # Draw with a black outline for visibility
-            outline_surface = font.render(grid_text, True, (0, 0, 0))  # Black outline
-            for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                screen.blit(outline_surface, (10 + dx, y_offset + dy))
-            screen.blit(text_surface, (10, y_offset))
-        except:
-            # If font fails, draw a big cyan rectangle
-            pygame.draw.rect(screen, (0, 255, 255), (10, y_offset, 400, 60))
-    # Also draw file path at the bottom
-    try:
-        small_font = pygame.font.Font(None, 32)
-        file_text = small_font.render("U - Webcam Grid/main.py", True, (255, 255, 255))
-        screen.blit(file_text, (10, etc.yres - 40))
-    except:
-        pass
+    etc.capture.get_and_flip(screen, etc)
+    # MAGENTA border (255, 0, 255) = GRID MODE, GREEN border = STANDALONE MODE (WRONG FILE!)
+    pygame.draw.rect(screen, (255, 0, 255), (0, 0, etc.xres, etc.yres), 5)
+    # "GRID MODE" (cyan, black outline) and the file path, rendered in setup()
+    for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
+        screen.blit(grid_outline, (10 + dx, 10 + dy))
+    screen.blit(grid_label, (10, 10))
+    screen.blit(file_label, (10, etc.yres - 40))
 class Capture(object):
     def _detect_all_cameras(self):
         """Detect all available cameras and return a list of camera info dicts"""
@@ -294,7 +254,7 @@ class Capture(object):
             else:
                 # Even if we found /dev/video* devices, also try indices as they might be different cameras
                 for idx in range(min(5, len(video_devices))):  # Try a few indices
-                cameras.append({'type': 'opencv', 'index': idx})
+                    cameras.append({'type': 'opencv', 'index': idx})
         elif self.use_ffmpeg:
             # Try /dev/video* devices, limit to first 10
             video_devices = sorted(glob.glob('/dev/video*'))[:10]
@@ -344,9 +304,9 @@ class Capture(object):
                     start_time = time.time()
                     timeout = 2.0  # 2 second total timeout
                     while time.time() - start_time < timeout:
-                    ret, test_frame = cap.read()
+                        ret, test_frame = cap.read()
                         if ret and test_frame is not None and test_frame.size > 0:
-                        return cap
+                            return cap
                         time.sleep(0.1)
                     # If we got here, timeout occurred
                     cap.release()
@@ -414,6 +374,8 @@ class Capture(object):
         self.webcam_lib = None
         self.imageio_reader = None
         self.ffmpeg_process = None
+        self.stream = None  # Reader thread for the single-camera fallback
+        self.frame_id = 0  # Last frame picked up from self.stream
         self.static = None
         self.snapshot = pygame.surface.Surface(self.size, 0)
         self.masked = pygame.surface.Surface(self.size, 0)
@@ -435,6 +397,11 @@ class Capture(object):
             self.cell_height = max(1, etc.yres // 4)
         print(f"Grid initialized: {self.grid_rows}x{self.grid_cols}, cells={self.cell_width}x{self.cell_height}, screen={etc.xres}x{etc.yres}")
         self.out = pygame.surface.Surface((self.cell_width, self.cell_height), 0)
+        # Cell numbers (white, black outline) and the placeholder font, made once
+        cell_font = pygame.font.Font(None, 20)
+        self.cell_labels = [(cell_font.render(str(n), True, (255, 255, 255)), cell_font.render(str(n), True, (0, 0, 0)))
+                            for n in range(1, self.grid_rows * self.grid_cols + 1)]
+        self.placeholder_font = pygame.font.Font(None, 48)
         # Don't set colorkey - it can cause transparency issues with grid cells
         # self.out.set_colorkey(BLACK)  # Disabled to ensure cells are always visible
         # Count triggers
@@ -466,7 +433,7 @@ class Capture(object):
                 import time
                 init_start_time = time.time()
                 max_init_time = 10.0  # Don't spend more than 10 seconds total on initialization
-            for i, cam_info in enumerate(available_cameras[:max_cameras]):
+                for i, cam_info in enumerate(available_cameras[:max_cameras]):
                     # Check if we've exceeded total initialization time
                     if time.time() - init_start_time > max_init_time:
                         print(f"Initialization timeout reached. Stopped after {len(self.cameras)} cameras.")
@@ -482,36 +449,37 @@ class Capture(object):
                         cam_obj = None
                         try:
                             print(f"Attempting to initialize camera {i+1}/{max_cameras}: {device_key}")
-                    cam_obj = self._initialize_camera(cam_info)
+                            cam_obj = self._initialize_camera(cam_info)
                         except Exception as e:
                             print(f"Camera {i+1} initialization exception: {e}")
                             pass
                         if cam_obj and (time.time() - cam_start_time < 3.0):  # Only accept if initialized quickly
-                        self.cameras.append({
-                            'type': cam_info['type'],
-                            'obj': cam_obj,
-                            'device': cam_info.get('device', None),
-                            'index': cam_info.get('index', i)
-                        })
+                            self.cameras.append({
+                                'type': cam_info['type'],
+                                'obj': cam_obj,
+                                'device': cam_info.get('device', None),
+                                'index': cam_info.get('index', i)
+                            })
+                            self._open_camera_stream(self.cameras[-1])
                             initialized_devices.add(device_key)
-                        # Create surfaces for this camera
-                        self.camera_snapshots.append(pygame.surface.Surface(self.size, 0))
-                        self.camera_masked.append(pygame.surface.Surface(self.size, 0))
-                        # Format camera info for logging (avoid nested f-strings with backslashes)
-                        device_str = cam_info.get('device', None)
-                        if device_str:
-                            print(f"✓ Camera {len(self.cameras)} initialized: {device_str}")
-                        else:
-                            idx = cam_info.get('index', i)
-                            print(f"✓ Camera {len(self.cameras)} initialized: index {idx}")
+                            # Create surfaces for this camera
+                            self.camera_snapshots.append(pygame.surface.Surface(self.size, 0))
+                            self.camera_masked.append(pygame.surface.Surface(self.size, 0))
+                            # Format camera info for logging (avoid nested f-strings with backslashes)
+                            device_str = cam_info.get('device', None)
+                            if device_str:
+                                print(f"✓ Camera {len(self.cameras)} initialized: {device_str}")
+                            else:
+                                idx = cam_info.get('index', i)
+                                print(f"✓ Camera {len(self.cameras)} initialized: index {idx}")
                         else:
                             if cam_obj:
                                 print(f"Camera {i+1} initialized but took too long, skipping")
                             else:
                                 print(f"Camera {i+1} failed to initialize")
-                except Exception as e:
+                    except Exception as e:
                         print(f"Error initializing camera {i+1}: {e}")
-                    continue
+                        continue
             if len(self.cameras) > 0:
                 # Successfully initialized at least one camera
                 self.static = None
@@ -522,7 +490,7 @@ class Capture(object):
                     device = cam.get('device', None)
                     if device:
                         camera_list.append(device)
-            else:
+                    else:
                         idx = cam.get('index', '?')
                         camera_list.append(f'index_{idx}')
                 print(f"  Camera list: {camera_list}")
@@ -694,28 +662,28 @@ class Capture(object):
                             print("Skipping ffmpeg initialization - no video device")
                             self.ffmpeg_device = None
                         else:
-                        print(f"Initializing ffmpeg camera: {video_device}")
-                        # Create temp file for frame capture
-                        self.ffmpeg_temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-                        self.ffmpeg_temp_file.close()
-                        temp_path = self.ffmpeg_temp_file.name
-                        # Test ffmpeg capture
-                        cmd = ['ffmpeg', '-f', 'v4l2', '-i', video_device,
-                              '-vframes', '1', '-vf', 'scale=320:240',
-                              '-y', temp_path]
-                        result = subprocess.run(cmd, capture_output=True, timeout=5)
-                        if result.returncode == 0 and os.path.exists(temp_path):
-                            # Successfully captured a frame
-                            test_img = pygame.image.load(temp_path)
-                            self.size = test_img.get_size()
-                            self.snapshot = pygame.surface.Surface(self.size, 0)
-                            self.masked = pygame.surface.Surface(self.size, 0)
-                            self.static = None
-                            self.ffmpeg_device = video_device
-                            print(f"✓ ffmpeg camera initialized: {video_device} at {self.size[0]}x{self.size[1]}")
-                            os.unlink(temp_path)  # Clean up test file
-                        else:
-                            os.unlink(temp_path) if os.path.exists(temp_path) else None
+                            print(f"Initializing ffmpeg camera: {video_device}")
+                            # Create temp file for frame capture
+                            self.ffmpeg_temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
+                            self.ffmpeg_temp_file.close()
+                            temp_path = self.ffmpeg_temp_file.name
+                            # Test ffmpeg capture
+                            cmd = ['ffmpeg', '-f', 'v4l2', '-i', video_device,
+                                  '-vframes', '1', '-vf', 'scale=320:240',
+                                  '-y', temp_path]
+                            result = subprocess.run(cmd, capture_output=True, timeout=5)
+                            if result.returncode == 0 and os.path.exists(temp_path):
+                                # Successfully captured a frame
+                                test_img = pygame.image.load(temp_path)
+                                self.size = test_img.get_size()
+                                self.snapshot = pygame.surface.Surface(self.size, 0)
+                                self.masked = pygame.surface.Surface(self.size, 0)
+                                self.static = None
+                                self.ffmpeg_device = video_device
+                                print(f"✓ ffmpeg camera initialized: {video_device} at {self.size[0]}x{self.size[1]}")
+                                os.unlink(temp_path)  # Clean up test file
+                            else:
+                                os.unlink(temp_path) if os.path.exists(temp_path) else None
                                 print(f"ffmpeg could not capture from {video_device} - will use static image fallback")
                                 self.ffmpeg_device = None
                     except Exception as e:
@@ -726,61 +694,61 @@ class Capture(object):
                     if CAM and isinstance(CAM, tuple) and CAM[0]:  # Only try if we have a camera device
                         camera_device = CAM[0]
                         camera_initialized = False
-                    # Try all available video devices - sometimes /dev/video1 works when /dev/video0 doesn't
-                    import glob
-                    all_video_devices = sorted(glob.glob('/dev/video*'))
-                    if not all_video_devices:
-                        all_video_devices = [camera_device]
-                    for video_dev in all_video_devices:
-                        if camera_initialized:
-                            break
-                        print(f"Trying video device: {video_dev}")
-                        # Try to set format with v4l2-ctl first
-                        try:
-                            import subprocess
-                            # Try to query what formats are available
-                            result = subprocess.run(['v4l2-ctl', '--device', video_dev, '--list-formats'],
-                                                  capture_output=True, text=True, timeout=2)
-                            if result.returncode == 0:
-                                print(f"Available formats for {video_dev}:")
-                                print(result.stdout[:300])  # First 300 chars
-                            # Try setting YUYV format (most common)
-                            subprocess.run(['v4l2-ctl', '--device', video_dev,
-                                          '--set-fmt-video=width=640,height=480,pixelformat=YUYV'],
-                                         capture_output=True, text=True, timeout=2)
-                        except:
-                            pass  # v4l2-ctl might not be available
-                        # Try opening without resolution (let camera use what v4l2-ctl set)
-                        try:
-                            print(f"  Opening {video_dev} without resolution specification...")
-                            test_cam = pygame.camera.Camera(video_dev)
-                            test_cam.start()
-                            import time
-                            time.sleep(1.5)  # Longer delay
-                            # Try many times to get a frame
-                            for attempt in range(20):
-                                if test_cam.query_image():
-                                    test_img = test_cam.get_image()
-                                    if test_img and test_img.get_size()[0] > 0:
-                                        actual_size = test_img.get_size()
-                                        self.cam = test_cam
-                                        self.size = actual_size
-                                        self.snapshot = pygame.surface.Surface(self.size, 0)
-                                        self.masked = pygame.surface.Surface(self.size, 0)
-                                        self.static = None
-                                        print(f"✓ SUCCESS! Camera initialized: {video_dev} at {actual_size[0]}x{actual_size[1]}")
-                                        camera_initialized = True
-                                        break
-                                time.sleep(0.15)
-                            if not camera_initialized:
-                                test_cam.stop()
-                        except Exception as e:
-                            print(f"  {video_dev} failed: {e}")
+                        # Try all available video devices - sometimes /dev/video1 works when /dev/video0 doesn't
+                        import glob
+                        all_video_devices = sorted(glob.glob('/dev/video*'))
+                        if not all_video_devices:
+                            all_video_devices = [camera_device]
+                        for video_dev in all_video_devices:
+                            if camera_initialized:
+                                break
+                            print(f"Trying video device: {video_dev}")
+                            # Try to set format with v4l2-ctl first
                             try:
-                                test_cam.stop()
+                                import subprocess
+                                # Try to query what formats are available
+                                result = subprocess.run(['v4l2-ctl', '--device', video_dev, '--list-formats'],
+                                                      capture_output=True, text=True, timeout=2)
+                                if result.returncode == 0:
+                                    print(f"Available formats for {video_dev}:")
+                                    print(result.stdout[:300])  # First 300 chars
+                                # Try setting YUYV format (most common)
+                                subprocess.run(['v4l2-ctl', '--device', video_dev,
+                                              '--set-fmt-video=width=640,height=480,pixelformat=YUYV'],
+                                             capture_output=True, text=True, timeout=2)
                             except:
-                                pass
-                            continue
+                                pass  # v4l2-ctl might not be available
+                            # Try opening without resolution (let camera use what v4l2-ctl set)
+                            try:
+                                print(f"  Opening {video_dev} without resolution specification...")
+                                test_cam = pygame.camera.Camera(video_dev)
+                                test_cam.start()
+                                import time
+                                time.sleep(1.5)  # Longer delay
+                                # Try many times to get a frame
+                                for attempt in range(20):
+                                    if test_cam.query_image():
+                                        test_img = test_cam.get_image()
+                                        if test_img and test_img.get_size()[0] > 0:
+                                            actual_size = test_img.get_size()
+                                            self.cam = test_cam
+                                            self.size = actual_size
+                                            self.snapshot = pygame.surface.Surface(self.size, 0)
+                                            self.masked = pygame.surface.Surface(self.size, 0)
+                                            self.static = None
+                                            print(f"✓ SUCCESS! Camera initialized: {video_dev} at {actual_size[0]}x{actual_size[1]}")
+                                            camera_initialized = True
+                                            break
+                                    time.sleep(0.15)
+                                if not camera_initialized:
+                                    test_cam.stop()
+                            except Exception as e:
+                                print(f"  {video_dev} failed: {e}")
+                                try:
+                                    test_cam.stop()
+                                except:
+                                    pass
+                                continue
                         if not camera_initialized:
                             print(f"Could not initialize any camera device. Tried: {', '.join(all_video_devices[:5])}. Will use static image fallback.")
                     else:
@@ -797,44 +765,92 @@ class Capture(object):
                     needs_static_fallback = True
             # Set up static image fallback if needed
             if needs_static_fallback or (len(self.cameras) == 0 and self.cv2_cap is None and self.cam is None):
-            if self.cv2_cap:
-                self.cv2_cap.release()
-                self.cv2_cap = None
-            if self.webcam_lib:
-                try:
-                    self.webcam_lib.stop()
-                except:
-                    pass
-                self.webcam_lib = None
-            if self.imageio_reader:
-                try:
-                    self.imageio_reader.close()
-                except:
-                    pass
-                self.imageio_reader = None
-            if hasattr(self, 'ffmpeg_temp_file'):
-                try:
-                    import os
-                    if os.path.exists(self.ffmpeg_temp_file.name):
-                        os.unlink(self.ffmpeg_temp_file.name)
-                except:
-                    pass
-            if self.cam:
+                if self.cv2_cap:
+                    self.cv2_cap.release()
+                    self.cv2_cap = None
+                if self.webcam_lib:
+                    try:
+                        self.webcam_lib.stop()
+                    except:
+                        pass
+                    self.webcam_lib = None
+                if self.imageio_reader:
+                    try:
+                        self.imageio_reader.close()
+                    except:
+                        pass
+                    self.imageio_reader = None
+                if hasattr(self, 'ffmpeg_temp_file'):
+                    try:
+                        import os
+                        if os.path.exists(self.ffmpeg_temp_file.name):
+                            os.unlink(self.ffmpeg_temp_file.name)
+                    except:
+                        pass
+                if self.cam:
+                    try:
+                        self.cam.stop()
+                    except:
+                        pass
+                    self.cam = None
                 try:
-                    self.cam.stop()
+                    self.static = pygame.image.load(etc.mode_root + '/no_camera.png')
+                    self.static.convert()
+                    print("Using no_camera.png as fallback")
                 except:
-                    pass
-                self.cam = None
-            try:
-                self.static = pygame.image.load(etc.mode_root + '/no_camera.png')
-                self.static.convert()
-                print("Using no_camera.png as fallback")
-            except:
-                # If no_camera.png doesn't exist, create a simple colored surface
-                self.static = pygame.surface.Surface(self.size, 0)
-                self.static.fill((100, 100, 100))  # Gray placeholder
-                print("Using gray placeholder as fallback")
-            self.triggers += 1
+                    # If no_camera.png doesn't exist, create a simple colored surface
+                    self.static = pygame.surface.Surface(self.size, 0)
+                    self.static.fill((100, 100, 100))  # Gray placeholder
+                    print("Using gray placeholder as fallback")
+                self.triggers += 1
+        # From here on the single fallback camera (if any) is read on a background thread
+        self._start_stream()
+    def _camera_source(self, cam_type, cam_obj):
+        """Wrap an initialized camera object so a reader thread can pull frames from it"""
+        if cam_type == 'opencv':
+            return OpenCVSource(cam_obj)
+        elif cam_type == 'ffmpeg':
+            return FFmpegPipeSource(cam_obj['device'], self.size)
+        elif cam_type == 'pygame_camera':
+            return PygameCameraSource(cam_obj)
+        elif cam_type == 'webcam_lib':
+            return WebcamLibSource(cam_obj)
+        elif cam_type == 'imageio':
+            return ImageioSource(cam_obj)
+        return None
+    def _open_camera_stream(self, cam):
+        """Start the background reader thread for one entry of self.cameras"""
+        cam['stream'] = None
+        cam['frame_id'] = 0
+        try:
+            source = self._camera_source(cam['type'], cam['obj'])
+            if source is not None:
+                key = cam.get('device') or f"{cam['type']}_{cam.get('index', 0)}"
+                cam['stream'] = open_stream(key, source, self.size)
+                cam['surface'] = frame_surface(self.size)  # Frames are uploaded into this one Surface
+        except Exception as e:
+            print(f"Could not start camera thread for {cam.get('device', 'camera')}: {e}")
+    def _start_stream(self):
+        """Hand the single fallback camera (if any) to a background reader thread"""
+        if self.cv2_cap is not None:
+            cam_type, cam_obj = 'opencv', self.cv2_cap
+        elif self.webcam_lib is not None:
+            cam_type, cam_obj = 'webcam_lib', self.webcam_lib
+        elif self.imageio_reader is not None:
+            cam_type, cam_obj = 'imageio', self.imageio_reader
+        elif getattr(self, 'ffmpeg_device', None):
+            cam_type, cam_obj = 'ffmpeg', {'device': self.ffmpeg_device}
+        elif self.cam is not None:
+            cam_type, cam_obj = 'pygame_camera', self.cam
+        else:
+            return
+        try:
+            key = getattr(self, 'ffmpeg_device', None) or cam_type
+            self.stream = open_stream(key, self._camera_source(cam_type, cam_obj), self.size)
+            self.frame_surface = frame_surface(self.size)  # Frames are uploaded into this one Surface
+        except Exception as e:
+            print(f"Could not start camera thread (will use static image): {e}")
+            self.stream = None
     def get_and_flip(self, screen, etc):
         # ============================================================
         # CRITICAL: Check if cameras are still connected
@@ -845,7 +861,11 @@ class Capture(object):
         if len(self.cameras) > 0:
             for i, cam in enumerate(self.cameras):
                 try:
-                    if cam['type'] == 'opencv':
+                    if cam.get('stream') is not None and not cam['stream'].running:
+                        print(f"⚠️  Camera {i+1} stopped streaming - was {cam.get('device', 'unknown')}")
+                        cameras_disconnected = True
+                        cam['obj'] = None
+                    elif cam['type'] == 'opencv':
                         if cam['obj'] is None or not cam['obj'].isOpened():
                             print(f"⚠️  Camera {i+1} (OpenCV) disconnected - was {cam.get('device', 'unknown')}")
                             cameras_disconnected = True
@@ -862,7 +882,10 @@ class Capture(object):
         # If cameras disconnected, try to re-initialize them
         if cameras_disconnected:
             print("⚠️  Cameras disconnected! Attempting to re-initialize...")
-            # Clear disconnected cameras
+            # Clear disconnected cameras (stopping their reader threads)
+            for cam in self.cameras:
+                if cam.get('obj') is None and cam.get('stream') is not None:
+                    cam['stream'].stop()
             self.cameras = [cam for cam in self.cameras if cam.get('obj') is not None]
             # Try to re-initialize if we have fewer cameras than before
             if len(self.cameras) == 0:
@@ -881,198 +904,35 @@ class Capture(object):
                                 'device': cam_info.get('device', None),
                                 'index': cam_info.get('index', 0)
                             })
+                            self._open_camera_stream(self.cameras[-1])
                             self.camera_snapshots.append(pygame.surface.Surface(self.size, 0))
                             self.camera_masked.append(pygame.surface.Surface(self.size, 0))
                             print(f"✓ Re-initialized camera: {cam_info.get('device', 'index_0')}")
                 except Exception as e:
                     print(f"Re-initialization failed: {e}")
         # ============================================================
-        # MINIMAL TEST: Draw 16 simple colored rectangles in 4x4 grid
-        # This bypasses ALL camera code to test if grid drawing works at all
-        # ============================================================
-        # Force grid dimensions
-        grid_cols = 4
-        grid_rows = 4
-        cell_width = etc.xres // grid_cols
-        cell_height = etc.yres // grid_rows
-        # Draw 16 simple colored rectangles - NO camera code, NO transforms, just rectangles
-        cell_num = 0
-        for row in range(grid_rows):
-            for col in range(grid_cols):
-                cell_num += 1
-                cell_x = col * cell_width
-                cell_y = row * cell_height
-                # Calculate distinct color for each cell
-                r = (cell_num * 16) % 255
-                g = ((cell_num * 23) % 255)
-                b = ((cell_num * 31) % 255)
-                # Draw a large colored rectangle covering most of the cell
-                pygame.draw.rect(screen, (r, g, b),
-                               (cell_x + 5, cell_y + 5, cell_width - 10, cell_height - 10), 0)
-                # Draw cell number in center
-                try:
-                    font = pygame.font.Font(None, 80)
-                    text = font.render(str(cell_num), True, (255, 255, 255))
-                    text_x = cell_x + (cell_width - text.get_width()) // 2
-                    text_y = cell_y + (cell_height - text.get_height()) // 2
-                    screen.blit(text, (text_x, text_y))
-                except:
-                    pass
-        # Log camera status every 60 frames (once per second at 60fps)
-        if not hasattr(self, '_frame_count'):
-            self._frame_count = 0
-        self._frame_count += 1
-        if self._frame_count % 60 == 0:
-            print(f"*** Camera status: {len(self.cameras)} cameras active ***")
-        return  # EARLY RETURN - skip all camera code for now
-        # ============================================================
-        # ORIGINAL CODE BELOW (currently disabled for testing)
-        # ============================================================
         # GRID MODE: Always draw a 4x4 grid, regardless of camera status
-        # If we have multiple cameras, read from all of them
+        # ============================================================
+        # If we have multiple cameras, pick up the newest frame of each from its capture thread
+        # This never waits for a camera - a cell keeps its previous snapshot until a new frame arrives
         if len(self.cameras) > 0:
             for i, cam in enumerate(self.cameras):
-                try:
-                    if cam['type'] == 'opencv':
-                        ret, frame = cam['obj'].read()
-                        if ret and frame is not None and frame.size > 0:
-                            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                            if frame_rgb.shape[:2] != self.size[::-1]:
-                                frame_rgb = cv2.resize(frame_rgb, self.size)
-                            if i < len(self.camera_snapshots):
-                                self.camera_snapshots[i] = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-                    elif cam['type'] == 'pygame_camera':
-                        if cam['obj'].query_image():
-                            if i < len(self.camera_snapshots):
-                                self.camera_snapshots[i] = cam['obj'].get_image(self.camera_snapshots[i])
-                    elif cam['type'] == 'ffmpeg' and 'device' in cam['obj']:
-                        import subprocess
-                        import os
-                        import tempfile
-                        import io
-                        cmd = ['ffmpeg', '-f', 'v4l2', '-i', cam['obj']['device'],
-                              '-vframes', '1', '-vf', f'scale={self.size[0]}:{self.size[1]}',
-                              '-f', 'image2pipe', '-vcodec', 'mjpeg', '-q:v', '2', '-']
-                        result = subprocess.run(cmd, capture_output=True, timeout=1)
-                        if result.returncode == 0 and len(result.stdout) > 0:
-                            frame_img = pygame.image.load(io.BytesIO(result.stdout))
-                            if i < len(self.camera_snapshots):
-                                self.camera_snapshots[i] = pygame.transform.scale(frame_img, self.size)
-                except Exception as e:
-                    # Keep previous snapshot on error
-                    pass
+                stream = cam.get('stream')
+                if stream is None or i >= len(self.camera_snapshots):
+                    continue
+                frame, frame_id = stream.latest()
+                if frame is not None and frame_id != cam['frame_id']:
+                    self.camera_snapshots[i] = upload_frame(cam['surface'], frame)
+                    cam['frame_id'] = frame_id
             # Use first camera's snapshot for backward compatibility
             if len(self.camera_snapshots) > 0 and self.camera_snapshots[0]:
                 self.snapshot = self.camera_snapshots[0]
         # Fallback to single camera code
-        elif self.use_opencv and self.cv2_cap is not None:
-            try:
-                ret, frame = self.cv2_cap.read()
-                if ret and frame is not None and frame.size > 0:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    # Resize if needed
-                    if frame_rgb.shape[:2] != self.size[::-1]:  # OpenCV uses (height, width)
-                        frame_rgb = cv2.resize(frame_rgb, self.size)
-                    # Convert numpy array to pygame surface
-                    # pygame.surfarray.make_surface expects (width, height, 3) format
-                    # frame_rgb is (height, width, 3), so we swap axes
-                    self.snapshot = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-                # If frame read fails, keep previous snapshot (don't show static)
-            except Exception as e:
-                # Camera error - log once but keep trying
-                if not hasattr(self, '_error_logged'):
-                    print(f"OpenCV camera read error (will retry): {e}")
-                    self._error_logged = True
-                # Keep previous snapshot, don't fall back to static
-        elif self.use_webcam_lib and self.webcam_lib is not None:
-            try:
-                frame = self.webcam_lib.read()
-                if frame is not None and frame.size > 0:
-                    # webcam library returns RGB numpy array
-                    if len(frame.shape) == 3:
-                        # Resize if needed
-                        if frame.shape[:2] != self.size[::-1]:
-                            import numpy as np
-                            frame = np.array(pygame.surfarray.array3d(
-                                pygame.transform.scale(
-                                    pygame.surfarray.make_surface(frame.swapaxes(0, 1)),
-                                    self.size
-                                )
-                            )).swapaxes(0, 1)
-                        # Convert to pygame surface
-                        self.snapshot = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            except Exception as e:
-                if not hasattr(self, '_webcam_error_logged'):
-                    print(f"webcam library read error (will retry): {e}")
-                    self._webcam_error_logged = True
-        elif self.use_imageio and self.imageio_reader is not None:
-            try:
-                frame = self.imageio_reader.get_next_data()
-                if frame is not None and frame.size > 0:
-                    # imageio returns RGB numpy array
-                    if len(frame.shape) == 3:
-                        # Resize if needed
-                        if frame.shape[:2] != self.size[::-1]:
-                            import numpy as np
-                            frame = np.array(pygame.surfarray.array3d(
-                                pygame.transform.scale(
-                                    pygame.surfarray.make_surface(frame.swapaxes(0, 1)),
-                                    self.size
-                                )
-                            )).swapaxes(0, 1)
-                        # Convert to pygame surface
-                        self.snapshot = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            except Exception as e:
-                if not hasattr(self, '_imageio_error_logged'):
-                    print(f"imageio read error (will retry): {e}")
-                    self._imageio_error_logged = True
-        elif self.use_ffmpeg and hasattr(self, 'ffmpeg_device'):
-            try:
-                import subprocess
-                import os
-                import tempfile
-                # Use a more efficient approach: capture to memory via stdout
-                # This avoids file I/O overhead
-                cmd = ['ffmpeg', '-f', 'v4l2', '-i', self.ffmpeg_device,
-                      '-vframes', '1', '-vf', f'scale={self.size[0]}:{self.size[1]}',
-                      '-f', 'image2pipe', '-vcodec', 'mjpeg', '-q:v', '2', '-']
-                result = subprocess.run(cmd, capture_output=True, timeout=1)
-                if result.returncode == 0 and len(result.stdout) > 0:
-                    # Load image from memory
-                    import io
-                    frame_img = pygame.image.load(io.BytesIO(result.stdout))
-                    self.snapshot = pygame.transform.scale(frame_img, self.size)
-            except Exception as e:
-                # Fallback to file-based method if pipe doesn't work
-                try:
-                    temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-                    temp_file.close()
-                    temp_path = temp_file.name
-                    cmd = ['ffmpeg', '-f', 'v4l2', '-i', self.ffmpeg_device,
-                          '-vframes', '1', '-vf', f'scale={self.size[0]}:{self.size[1]}',
-                          '-y', temp_path]
-                    result = subprocess.run(cmd, capture_output=True, timeout=1)
-                    if result.returncode == 0 and os.path.exists(temp_path):
-                        frame_img = pygame.image.load(temp_path)
-                        self.snapshot = pygame.transform.scale(frame_img, self.size)
-                        os.unlink(temp_path)
-                except:
-                    if not hasattr(self, '_ffmpeg_error_logged'):
-                        print(f"ffmpeg read error (will retry): {e}")
-                        self._ffmpeg_error_logged = True
-        elif self.cam is not None:
-            try:
-                if self.cam.query_image():
-                    self.snapshot = self.cam.get_image(self.snapshot)
-                # If query_image() returns False, keep previous snapshot (don't show static)
-                # This handles occasional frame drops without falling back to static image
-            except Exception as e:
-                # Camera error - log once but keep trying
-                if not hasattr(self, '_pygame_error_logged'):
-                    print(f"pygame.camera read error (will retry): {e}")
-                    self._pygame_error_logged = True
-                # Keep previous snapshot, don't fall back to static
+        elif self.stream is not None:
+            frame, frame_id = self.stream.latest()
+            if frame is not None and frame_id != self.frame_id:
+                self.snapshot = upload_frame(self.frame_surface, frame)
+                self.frame_id = frame_id
         elif self.static is not None:
             self.snapshot = self.static.copy()
         # Ensure snapshot is valid and correct size for threshold operation
@@ -1154,114 +1014,24 @@ class Capture(object):
         reactive_scale = base_scale * (1.0 + audio_reactivity * 0.5)
         reactive_scale = min(reactive_scale, 1.0)  # Never scale larger than 1.0 (cell size)
         reactive_rotation = audio_reactivity * 360 * reactivity
-        # DEBUG: Log scale values to diagnose if cells are too large
-        if not hasattr(self, '_scale_logged'):
-            print(f"*** SCALE DEBUG: base_size_scale={base_size_scale:.3f}, scale_base={self.scale_base:.3f}, base_scale={base_scale:.3f}, reactive_scale={reactive_scale:.3f} ***")
-            print(f"*** SCALE DEBUG: cell_size={self.cell_width}x{self.cell_height}, image_size={self.size} ***")
-            self._scale_logged = True
-        # ============================================================
-        # GRID MODE: ALWAYS DRAW 4x4 GRID (16 CELLS) - NO EXCEPTIONS
-        # ============================================================
-        # This MUST draw 16 cells even if no cameras are initialized
-        # ============================================================
-        # CRITICAL: Force grid to 4x4 BEFORE anything else
-        # Check if grid was somehow set to 1x1
-        if not hasattr(self, 'grid_rows') or self.grid_rows != 4:
-            print(f"*** FORCING grid_rows from {getattr(self, 'grid_rows', 'MISSING')} to 4 ***")
-            self.grid_rows = 4
-        if not hasattr(self, 'grid_cols') or self.grid_cols != 4:
-            print(f"*** FORCING grid_cols from {getattr(self, 'grid_cols', 'MISSING')} to 4 ***")
-            self.grid_cols = 4
-        if not hasattr(self, 'cell_width') or self.cell_width <= 0:
-            self.cell_width = etc.xres // 4
-            print(f"*** RECALCULATING cell_width to {self.cell_width} ***")
-        if not hasattr(self, 'cell_height') or self.cell_height <= 0:
-            self.cell_height = etc.yres // 4
-            print(f"*** RECALCULATING cell_height to {self.cell_height} ***")
-        cells_drawn = 0
-        # CRITICAL DEBUG: Print every frame to prove grid code is running
-        print(f"*** GRID DRAW START: {self.grid_rows}x{self.grid_cols}={self.grid_rows * self.grid_cols} cells ***")
-        print(f"*** Cell size: {self.cell_width}x{self.cell_height}, Screen: {etc.xres}x{etc.yres} ***")
-        print(f"*** Cameras: {len(self.cameras)}, Static: {self.static is not None} ***")
-        print(f"*** VERIFY: grid_rows={self.grid_rows}, grid_cols={self.grid_cols}, loop will run {self.grid_rows * self.grid_cols} times ***")
-        # CRITICAL: Always draw grid, even if no cameras
-        # Force grid to be 4x4 - never allow it to be 1x1
-        if self.grid_rows != 4 or self.grid_cols != 4:
-            print(f"WARNING: Grid was {self.grid_rows}x{self.grid_cols}, forcing to 4x4")
-            self.grid_rows = 4
-            self.grid_cols = 4
-            self.cell_width = etc.xres // 4
-            self.cell_height = etc.yres // 4
-        # SIMPLE TEST: Draw 16 colored rectangles directly to screen FIRST
-        # This proves the grid positions are correct - you MUST see 16 different colored rectangles
-        print("*** DRAWING TEST RECTANGLES TO VERIFY GRID POSITIONS ***")
-        print(f"*** TEST: cell_width={self.cell_width}, cell_height={self.cell_height} ***")
-        test_rects_drawn = 0
-        for test_row in range(4):
-            for test_col in range(4):
-                test_rects_drawn += 1
-                test_cell_x = test_col * self.cell_width
-                test_cell_y = test_row * self.cell_height
-                test_num = test_row * 4 + test_col + 1
-                # Use VERY distinct colors
-                test_r = (test_num * 16) % 255
-                test_g = ((test_num * 23) % 255)
-                test_b = ((test_num * 31) % 255)
-                # Draw a HUGE rectangle covering most of each cell - impossible to miss
-                rect_x = test_cell_x + 5
-                rect_y = test_cell_y + 5
-                rect_w = self.cell_width - 10
-                rect_h = self.cell_height - 10
-                print(f"*** TEST RECT {test_num}: pos=({rect_x}, {rect_y}), size=({rect_w}, {rect_h}), color=({test_r}, {test_g}, {test_b}) ***")
-                pygame.draw.rect(screen, (test_r, test_g, test_b),
-                               (rect_x, rect_y, rect_w, rect_h), 0)
-                # Draw cell number in HUGE font
-                try:
-                    test_font = pygame.font.Font(None, 100)  # HUGE font
-                    test_text = test_font.render(str(test_num), True, (255, 255, 255))
-                    text_x = test_cell_x + self.cell_width // 2 - test_text.get_width() // 2
-                    text_y = test_cell_y + self.cell_height // 2 - test_text.get_height() // 2
-                    screen.blit(test_text, (text_x, text_y))
-                except Exception as e:
-                    print(f"*** ERROR drawing test text: {e} ***")
-        print(f"*** DREW {test_rects_drawn} TEST RECTANGLES - YOU MUST SEE 16 DIFFERENT COLORS ***")
-        # CRITICAL: Verify loop will run 16 times
-        expected_iterations = self.grid_rows * self.grid_cols
-        print(f"*** LOOP VERIFICATION: Will iterate {expected_iterations} times (rows={self.grid_rows}, cols={self.grid_cols}) ***")
-        if expected_iterations != 16:
-            print(f"*** ERROR: Expected 16 iterations but will only do {expected_iterations}! FORCING TO 16 ***")
-            self.grid_rows = 4
-            self.grid_cols = 4
-            expected_iterations = 16
+        # Cell backgrounds are offsets from the background color
+        bg_color = etc.color_picker(etc.knob5)
         for row in range(self.grid_rows):
             for col in range(self.grid_cols):
-                cells_drawn += 1
-                # Calculate cell position - CRITICAL: Each cell must be at different position
+                cell_num = row * self.grid_cols + col
                 cell_x = col * self.cell_width
                 cell_y = row * self.cell_height
-                # Debug: Print position for EVERY cell to verify they're different
-                if cells_drawn <= 4 or cells_drawn == 8 or cells_drawn == 12 or cells_drawn == 16:
-                    print(f"*** CELL {cells_drawn}: row={row}, col={col}, pos=({cell_x}, {cell_y}) ***")
-                # Safety check: ensure position is valid
-                if cell_x < 0 or cell_y < 0 or cell_x >= etc.xres or cell_y >= etc.yres:
-                    print(f"ERROR: Invalid cell position: ({cell_x}, {cell_y}) for cell {cells_drawn}")
-                    continue  # Skip invalid cells
-                # Debug: Log ALL cell positions for first frame
-                if not hasattr(self, '_positions_logged'):
-                    print(f"[GRID DEBUG] Cell {cells_drawn} (r={row}, c={col}): pos=({cell_x}, {cell_y})")
-                    if cells_drawn == 16:
-                        self._positions_logged = True
                 # Select which camera to use for this cell (cycle through available cameras)
-                camera_idx = (row * self.grid_cols + col) % max(1, len(self.cameras)) if len(self.cameras) > 0 else 0
+                camera_idx = cell_num % len(self.cameras) if len(self.cameras) > 0 else 0
                 # Get the source image for this cell
                 source_image = None
                 if len(self.cameras) > 0 and camera_idx < len(self.camera_masked):
                     if self.camera_masked[camera_idx] is not None and self.camera_masked[camera_idx].get_size()[0] > 0:
-                    source_image = self.camera_masked[camera_idx]
+                        source_image = self.camera_masked[camera_idx]
                 # Fallback to main masked image if camera-specific one isn't available
                 if source_image is None:
                     if self.masked is not None and self.masked.get_size()[0] > 0:
-                    source_image = self.masked
+                        source_image = self.masked
                 # Fallback to static image if no masked image
                 if source_image is None:
                     if self.static is not None:
@@ -1270,20 +1040,14 @@ class Capture(object):
                 if source_image is None:
                     source_image = pygame.surface.Surface(self.size, 0)
                     # Use VERY different colors for different cells to make grid visible
-                    cell_num = row * self.grid_cols + col
                     # Create distinct colors for each cell (0-15)
                     r = 50 + ((cell_num % 4) * 50)  # 0-3 -> 50, 100, 150, 200
                     g = 50 + (((cell_num // 4) % 4) * 50)  # 0-3 -> 50, 100, 150, 200
                     b = 50 + (((cell_num // 16) % 4) * 50)  # Mostly 50, some 100
                     source_image.fill((r, g, b))
                     # Also draw cell number on the placeholder
-                    try:
-                        font = pygame.font.Font(None, 48)
-                        text = font.render(str(cell_num + 1), True, (255, 255, 255))
-                        text_rect = text.get_rect(center=(self.size[0]//2, self.size[1]//2))
-                        source_image.blit(text, text_rect)
-                    except:
-                        pass
+                    text = self.placeholder_font.render(str(cell_num + 1), True, (255, 255, 255))
+                    source_image.blit(text, text.get_rect(center=(self.size[0]//2, self.size[1]//2)))
                 # Apply distortion if knob 3 is turned up
                 distorted = source_image
                 if distortion_amount > 0.05:
@@ -1307,14 +1071,7 @@ class Capture(object):
                 # Get rotation and scale for this cell (with audio reactivity)
                 cell_rotation = reactive_rotation + etc.grid_rotations[row][col]
                 cell_scale = reactive_scale * etc.grid_scales[row][col]
-                # Audio-reactive position offset
-                offset_x = int(audio_reactivity * self.cell_width * 0.1 * math.sin(time.time() * 2 + row))
-                offset_y = int(audio_reactivity * self.cell_height * 0.1 * math.cos(time.time() * 2 + col))
-                # Clear output surface - use a DISTINCT color per cell so grid is ALWAYS visible
-                bg_color = etc.color_picker(etc.knob5)
-                # Make each cell VERY different so we can definitely see the grid
-                cell_num = row * self.grid_cols + col
-                # Create a distinct background color for each cell (0-15)
+                # A distinct background per cell (0-15), so the grid stays visible
                 r_offset = ((cell_num % 4) * 40)  # 0, 40, 80, 120
                 g_offset = (((cell_num // 4) % 4) * 40)  # 0, 40, 80, 120
                 b_offset = (((cell_num // 16) % 4) * 40)  # Mostly 0
@@ -1324,18 +1081,13 @@ class Capture(object):
                     min(255, max(50, bg_color[2] + b_offset))
                 )
                 self.out.fill(cell_bg)
-                # Draw a large colored rectangle in each cell to prove grid is working
-                # This makes it impossible to miss the grid
-                test_color = ((cell_num * 15) % 255, ((cell_num * 23) % 255), ((cell_num * 31) % 255))
-                pygame.draw.rect(self.out, test_color, (10, 10, self.cell_width - 20, self.cell_height - 20), 0)
                 # Transform and blit the distorted webcam feed
-                # CRITICAL: Ensure transformed image fits in cell
                 transformed = pygame.transform.rotozoom(
                     distorted,
                     cell_rotation,
                     cell_scale
                 )
-                # Ensure transformed image doesn't exceed cell size (safety check)
+                # Ensure transformed image doesn't exceed cell size
                 if transformed.get_width() > self.cell_width or transformed.get_height() > self.cell_height:
                     # Scale down to fit
                     scale_w = self.cell_width / transformed.get_width()
@@ -1348,64 +1100,13 @@ class Capture(object):
                 tx = (self.cell_width - transformed.get_width()) // 2
                 ty = (self.cell_height - transformed.get_height()) // 2
                 self.out.blit(transformed, (tx, ty))
-                # Draw a VERY visible border to make grid cells distinct (GRID MODE - always show grid)
-                # Use bright white border so cells are always visible
-                border_color = (255, 255, 255)  # Bright white border - always visible
-                # Make border thick and visible
-                pygame.draw.rect(self.out, border_color, (0, 0, self.cell_width, self.cell_height), 5)
-                # Also draw inner border in cell number color
-                cell_num = row * self.grid_cols + col
+                # White outer border, inner border in the cell's own color
+                pygame.draw.rect(self.out, (255, 255, 255), (0, 0, self.cell_width, self.cell_height), 5)
                 inner_color = ((cell_num * 17) % 255, (cell_num * 23) % 255, (cell_num * 31) % 255)
                 pygame.draw.rect(self.out, inner_color, (2, 2, self.cell_width - 4, self.cell_height - 4), 2)
-                # Draw cell number and position indicator in each cell for debugging
-                try:
-                    font = pygame.font.Font(None, 20)
-                    # Show cell number (1-16) and position
-                    cell_num = row * self.grid_cols + col + 1
-                    cell_text = f"{cell_num}"  # Just show cell number
-                    text_surface = font.render(cell_text, True, (255, 255, 255))  # White text
-                    # Draw with black outline for visibility
-                    outline = font.render(cell_text, True, (0, 0, 0))
-                    for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                        self.out.blit(outline, (5 + dx, 5 + dy))
-                    self.out.blit(text_surface, (5, 5))
-                except:
-                    pass
-                # CRITICAL: Blit the cell to the screen at its UNIQUE grid position
-                # Each cell MUST be at a different (cell_x, cell_y) position
-                blit_x = int(cell_x)
-                blit_y = int(cell_y)
-                # Debug: Print position for first few cells EVERY FRAME to verify they're different
-                if cells_drawn <= 4:
-                    print(f"*** BLITTING cell {cells_drawn} at ({blit_x}, {blit_y}) ***")
-                # Blit the cell surface to screen
-                screen.blit(self.out, (blit_x, blit_y))
-                # ALSO draw a simple colored rectangle directly to screen as a backup test
-                # This proves the grid positions are correct - you should see 16 small colored squares
-                test_rect_color = ((cells_drawn * 20) % 255, ((cells_drawn * 30) % 255), ((cells_drawn * 40) % 255))
-                pygame.draw.rect(screen, test_rect_color, (blit_x + 5, blit_y + 5, 30, 30), 0)
-        # CRITICAL DEBUG: Log how many cells were drawn EVERY FRAME
-        expected_cells = self.grid_rows * self.grid_cols
-        print(f"*** GRID DRAW END: Drawn {cells_drawn} cells (expected {expected_cells}) ***")
-        if cells_drawn != expected_cells:
-            print(f"*** GRID ERROR: Expected {expected_cells} cells but only drew {cells_drawn}! ***")
-            print(f"*** This means the loop only ran {cells_drawn} times instead of {expected_cells} ***")
-        else:
-            print(f"*** GRID SUCCESS: All {expected_cells} cells drawn correctly ***")
-        # DRAW TEST RECTANGLES AGAIN AT THE END to verify they appear
-        # If you see these but not the ones at the start, something is overwriting them
-        print("*** DRAWING TEST RECTANGLES AGAIN AT END (should appear on top) ***")
-        for test_row in range(4):
-            for test_col in range(4):
-                test_cell_x = test_col * self.cell_width
-                test_cell_y = test_row * self.cell_height
-                test_num = test_row * 4 + test_col + 1
-                # Draw a small bright rectangle in corner of each cell
-                test_color = ((test_num * 20) % 255, ((test_num * 30) % 255), ((test_num * 40) % 255))
-                pygame.draw.rect(screen, test_color,
-                               (test_cell_x + self.cell_width - 40, test_cell_y + self.cell_height - 40,
-                                35, 35), 0)
-        # NOTE: Text rendering moved to draw() function (drawn AFTER get_and_flip)
-        # This ensures "GRID MODE" text is always drawn last and cannot be overwritten
-        # Do NOT draw any text here that could conflict with draw() function
-        pass
+                # Cell number (1-16), white on a black outline, rendered in __init__
+                text_surface, outline = self.cell_labels[cell_num]
+                for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+                    self.out.blit(outline, (5 + dx, 5 + dy))
+                self.out.blit(text_surface, (5, 5))
+                screen.blit(self.out, (cell_x, cell_y))
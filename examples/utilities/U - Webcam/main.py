@@ -13,6 +13,7 @@ Camera Detection:
 - Optimized for EYESY hardware (Linux/Organelle M)
 - Uses pygame.camera (preferred) or OpenCV (fallback)
 - Uses ONLY the first camera (/dev/video0 or camera index 0)
+- Frames are read on a background thread, so drawing never waits on the camera
 - For multiple cameras, use "U - Webcam Grid" mode instead
 - If camera fails, check: ls -l /dev/video* to see available devices
 Tested: EYESY OS 2.1 on Organelle M
@@ -26,6 +27,16 @@ import subprocess
 import sys
 import os
 import math
+# Background capture threads live in examples/lib, which the runners put on sys.path
+try:
+    from eyesy_capture import (OpenCVSource, WebcamLibSource, ImageioSource, FFmpegPipeSource,
+                               PygameCameraSource, open_stream, close_all_streams,
+                               frame_surface, upload_frame)
+except ImportError:  # Deployed on its own, with the library copied next to main.py
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from eyesy_capture import (OpenCVSource, WebcamLibSource, ImageioSource, FFmpegPipeSource,
+                               PygameCameraSource, open_stream, close_all_streams,
+                               frame_surface, upload_frame)
 # Try to detect available camera backends
 # Try multiple libraries in order of preference
 USE_OPENCV = False
@@ -116,6 +127,8 @@ def setup(screen, etc):
     print("MODE TYPE: STANDALONE (NOT GRID)")
     print("MODE IDENTIFIER: STANDALONE_MODE_V2")
     print("=" * 60)
+    # Hand back any camera still held by an earlier run of this (or another webcam) mode
+    close_all_streams()
     etc.capture = Capture(etc)
     etc._mode_type = "STANDALONE"  # Unique identifier
     etc._mode_file = "U - Webcam/main.py"  # File path identifier
@@ -141,6 +154,9 @@ class Capture(object):
         self.webcam_lib = None
         self.imageio_reader = None
         self.ffmpeg_process = None
+        self.device = None
+        self.stream = None  # Background reader thread, started once a camera is open
+        self.frame_id = 0  # Last frame picked up from the stream
         self.static = None
         self.snapshot = pygame.surface.Surface(self.size, 0)
         self.masked = pygame.surface.Surface(self.size, 0)
@@ -210,6 +226,7 @@ class Capture(object):
                                     self.masked = pygame.surface.Surface(self.size, 0)
                                     self.static = None
                                     print(f"✓ OpenCV camera initialized (STANDALONE): {video_dev} at {actual_width}x{actual_height}")
+                                    self.device = video_dev
                                     camera_initialized = True
                                     break
                                 time.sleep(0.1)
@@ -250,6 +267,7 @@ class Capture(object):
                                         self.masked = pygame.surface.Surface(self.size, 0)
                                         self.static = None
                                         print(f"✓ OpenCV camera initialized (STANDALONE) at index {cam_idx} at {actual_width}x{actual_height}")
+                                        self.device = cam_idx
                                         camera_initialized = True
                                         break
                                     time.sleep(0.1)
@@ -328,6 +346,22 @@ class Capture(object):
                 except Exception as e:
                     print(f"imageio initialization failed: {e} - will use static image fallback")
                     self.imageio_reader = None
+            elif self.use_ffmpeg:
+                # Use ffmpeg via subprocess (no Python packages needed)
+                # One long-running ffmpeg process streams raw frames, started in _start_stream()
+                import glob
+                video_devices = sorted(glob.glob('/dev/video*'))[:10]
+                if video_devices:
+                    self.ffmpeg_device = video_devices[0]
+                    self.device = self.ffmpeg_device
+                    self.size = (320, 240)
+                    self.snapshot = pygame.surface.Surface(self.size, 0)
+                    self.masked = pygame.surface.Surface(self.size, 0)
+                    self.static = None
+                    print(f"✓ ffmpeg camera selected (STANDALONE): {self.ffmpeg_device} at {self.size[0]}x{self.size[1]}")
+                    camera_initialized = True
+                else:
+                    print("No video device found for ffmpeg. Will use static image fallback.")
             elif self.use_pygame_camera:
                 # Use pygame.camera (Linux/EYESY) - workaround for format issues
                 # STANDALONE MODE: Try all video devices but use only the FIRST working one
@@ -388,6 +422,7 @@ class Capture(object):
                                     self.masked = pygame.surface.Surface(self.size, 0)
                                     self.static = None
                                     print(f"✓ SUCCESS! Camera initialized (STANDALONE): {video_dev} at {actual_size[0]}x{actual_size[1]}")
+                                    self.device = video_dev
                                     camera_initialized = True
                                     break
                             time.sleep(0.15)
@@ -456,116 +491,37 @@ class Capture(object):
                 self.static.fill((100, 100, 100))  # Gray placeholder
                 print("Using gray placeholder as fallback")
             self.triggers += 1
+        # From here on the camera is read on a background thread
+        self._start_stream()
+    def _start_stream(self):
+        """Hand the opened camera to a reader thread that keeps its newest frame ready"""
+        try:
+            if self.cv2_cap is not None:
+                source = OpenCVSource(self.cv2_cap)
+            elif self.webcam_lib is not None:
+                source = WebcamLibSource(self.webcam_lib)
+            elif self.imageio_reader is not None:
+                source = ImageioSource(self.imageio_reader)
+            elif getattr(self, 'ffmpeg_device', None):
+                source = FFmpegPipeSource(self.ffmpeg_device, self.size)
+            elif self.cam is not None:
+                source = PygameCameraSource(self.cam)
+            else:
+                return
+            self.stream = open_stream(self.device or type(source).__name__, source, self.size)
+            self.frame_surface = frame_surface(self.size)  # Frames are uploaded into this one Surface
+        except Exception as e:
+            print(f"Could not start camera thread (will use static image): {e}")
+            self.stream = None
     def get_and_flip(self, screen, etc):
         # STANDALONE MODE: Draw single centered image (NOT a grid)
-        if self.use_opencv and self.cv2_cap is not None:
-            try:
-                ret, frame = self.cv2_cap.read()
-                if ret and frame is not None and frame.size > 0:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    # Resize if needed
-                    if frame_rgb.shape[:2] != self.size[::-1]:  # OpenCV uses (height, width)
-                        frame_rgb = cv2.resize(frame_rgb, self.size)
-                    # Convert numpy array to pygame surface
-                    # pygame.surfarray.make_surface expects (width, height, 3) format
-                    # frame_rgb is (height, width, 3), so we swap axes
-                    self.snapshot = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-                # If frame read fails, keep previous snapshot (don't show static)
-            except Exception as e:
-                # Camera error - log once but keep trying
-                if not hasattr(self, '_error_logged'):
-                    print(f"OpenCV camera read error (will retry): {e}")
-                    self._error_logged = True
-                # Keep previous snapshot, don't fall back to static
-        elif self.use_webcam_lib and self.webcam_lib is not None:
-            try:
-                frame = self.webcam_lib.read()
-                if frame is not None and frame.size > 0:
-                    # webcam library returns RGB numpy array
-                    if len(frame.shape) == 3:
-                        # Resize if needed
-                        if frame.shape[:2] != self.size[::-1]:
-                            import numpy as np
-                            frame = np.array(pygame.surfarray.array3d(
-                                pygame.transform.scale(
-                                    pygame.surfarray.make_surface(frame.swapaxes(0, 1)),
-                                    self.size
-                                )
-                            )).swapaxes(0, 1)
-                        # Convert to pygame surface
-                        self.snapshot = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            except Exception as e:
-                if not hasattr(self, '_webcam_error_logged'):
-                    print(f"webcam library read error (will retry): {e}")
-                    self._webcam_error_logged = True
-        elif self.use_imageio and self.imageio_reader is not None:
-            try:
-                frame = self.imageio_reader.get_next_data()
-                if frame is not None and frame.size > 0:
-                    # imageio returns RGB numpy array
-                    if len(frame.shape) == 3:
-                        # Resize if needed
-                        if frame.shape[:2] != self.size[::-1]:
-                            import numpy as np
-                            frame = np.array(pygame.surfarray.array3d(
-                                pygame.transform.scale(
-                                    pygame.surfarray.make_surface(frame.swapaxes(0, 1)),
-                                    self.size
-                                )
-                            )).swapaxes(0, 1)
-                        # Convert to pygame surface
-                        self.snapshot = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            except Exception as e:
-                if not hasattr(self, '_imageio_error_logged'):
-                    print(f"imageio read error (will retry): {e}")
-                    self._imageio_error_logged = True
-        elif self.use_ffmpeg and hasattr(self, 'ffmpeg_device'):
-            try:
-                import subprocess
-                import os
-                import tempfile
-                # Use a more efficient approach: capture to memory via stdout
-                # This avoids file I/O overhead
-                cmd = ['ffmpeg', '-f', 'v4l2', '-i', self.ffmpeg_device,
-                      '-vframes', '1', '-vf', f'scale={self.size[0]}:{self.size[1]}',
-                      '-f', 'image2pipe', '-vcodec', 'mjpeg', '-q:v', '2', '-']
-                result = subprocess.run(cmd, capture_output=True, timeout=1)
-                if result.returncode == 0 and len(result.stdout) > 0:
-                    # Load image from memory
-                    import io
-                    frame_img = pygame.image.load(io.BytesIO(result.stdout))
-                    self.snapshot = pygame.transform.scale(frame_img, self.size)
-            except Exception as e:
-                # Fallback to file-based method if pipe doesn't work
-                try:
-                    temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-                    temp_file.close()
-                    temp_path = temp_file.name
-                    cmd = ['ffmpeg', '-f', 'v4l2', '-i', self.ffmpeg_device,
-                          '-vframes', '1', '-vf', f'scale={self.size[0]}:{self.size[1]}',
-                          '-y', temp_path]
-                    result = subprocess.run(cmd, capture_output=True, timeout=1)
-                    if result.returncode == 0 and os.path.exists(temp_path):
-                        frame_img = pygame.image.load(temp_path)
-                        self.snapshot = pygame.transform.scale(frame_img, self.size)
-                        os.unlink(temp_path)
-                except:
-                    if not hasattr(self, '_ffmpeg_error_logged'):
-                        print(f"ffmpeg read error (will retry): {e}")
-                        self._ffmpeg_error_logged = True
-        elif self.cam is not None:
-            try:
-                if self.cam.query_image():
-                    self.snapshot = self.cam.get_image(self.snapshot)
-                # If query_image() returns False, keep previous snapshot (don't show static)
-                # This handles occasional frame drops without falling back to static image
-            except Exception as e:
-                # Camera error - log once but keep trying
-                if not hasattr(self, '_pygame_error_logged'):
-                    print(f"pygame.camera read error (will retry): {e}")
-                    self._pygame_error_logged = True
-                # Keep previous snapshot, don't fall back to static
+        if self.stream is not None:
+            # Pick up the newest frame from the capture thread - this never waits for the camera
+            # Until the first frame arrives (or while reads fail) the previous snapshot is kept
+            frame, frame_id = self.stream.latest()
+            if frame is not None and frame_id != self.frame_id:
+                self.snapshot = upload_frame(self.frame_surface, frame)
+                self.frame_id = frame_id
         elif self.static is not None:
             self.snapshot = self.static.copy()
         # Ensure snapshot is initialized and correct size
@@ -639,8 +595,9 @@ class Capture(object):
         center_x = etc.xres // 2
         center_y = etc.yres // 2
         # Audio affects position (bounce effect)
-        offset_x = int(audio_reactivity * etc.xres * 0.1 * math.sin(time.time() * 2))
-        offset_y = int(audio_reactivity * etc.yres * 0.1 * math.cos(time.time() * 2))
+        now = time.time()
+        offset_x = int(audio_reactivity * etc.xres * 0.1 * math.sin(now * 2))
+        offset_y = int(audio_reactivity * etc.yres * 0.1 * math.cos(now * 2))
         # Knob 3: Distortion effects
         distortion_amount = etc.knob3
         self.distortion_time += 0.05
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Allocation and garbage-collection profiler for modes' draw().
+
+Wraps a mode's draw function so every frame is measured with tracemalloc and
+every garbage collection is timed through gc.callbacks:
+
+- memory allocated per frame (the tracemalloc peak above where the frame
+  started, so temporaries freed before draw() returns still count) and memory
+  still held after it
+- on every few frames, the source lines whose blocks are alive when draw()
+  returns, its local variables included (the lists and arrays a frame builds;
+  Surface pixels are SDL memory, which tracemalloc can't see)
+- GC collections by generation and their pause times, for collections that
+  interrupt draw() (the frame's allocations are what set those off; the ones
+  in between frames belong to whatever runs the modes)
+
+report() ranks modes by their worst GC pause, which is what shows up on
+screen as a hitch. Used by `eyesy_runner.py --profile-alloc` and
+`test_modes.py --profile-alloc`.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+# tracemalloc's own bookkeeping and ours are left out of the line report
+_IGNORED = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+
+
+def _snapshot():
+    """tracemalloc snapshot that can't set off a collection (it would be timed against the mode)"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return tracemalloc.take_snapshot()
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class ModeProfile:
+    """Running totals for one mode"""
+
+    def __init__(self, name):
+        self.name = name
+        self.frames = 0
+        self.allocated = 0  # Bytes, summed over frames
+        self.retained = 0
+        self.sampled = 0  # Frames with a line snapshot
+        self.blocks = 0  # Blocks alive at the end of sampled frames
+        self.lines = {}  # (filename, lineno) -> [bytes, blocks] over sampled frames
+        self.collections = [0, 0, 0]  # Per generation
+        self.gc_time = 0.0  # Seconds
+        self.gc_max = 0.0
+
+    def top_lines(self, count):
+        """[(filename, lineno, bytes per frame, blocks per frame)] for the heaviest lines"""
+        frames = max(1, self.sampled)
+        ranked = sorted(self.lines.items(), key=lambda item: item[1][0], reverse=True)[:count]
+        return [(filename, lineno, size / frames, blocks / frames)
+                for (filename, lineno), (size, blocks) in ranked]
+
+    def row(self):
+        frames = max(1, self.frames)
+        return {"mode": self.name, "frames": self.frames,
+                "kb_per_frame": self.allocated / frames / 1024,
+                "blocks_per_frame": self.blocks / max(1, self.sampled),
+                "retained_per_frame": self.retained / frames,
+                "collections": list(self.collections),
+                "gc_ms_per_frame": self.gc_time * 1000 / frames,
+                "gc_max_ms": self.gc_max * 1000}
+
+
+class AllocationProfiler:
+    """Profile allocations and GC pauses of the draw() functions it wraps"""
+
+    def __init__(self, snapshot_every=10, top_lines=5):
+        self.snapshot_every = snapshot_every
+        self.top_line_count = top_lines
+        self.profiles = {}
+        self.current = None  # The mode whose draw() is running
+        self._gc_start = None
+        self._started_tracemalloc = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        gc.callbacks.append(self._gc_callback)
+        return self
+
+    def stop(self):
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _gc_callback(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause = time.perf_counter() - self._gc_start
+            self._gc_start = None
+            if self.current is not None:
+                self.current.collections[info["generation"]] += 1
+                self.current.gc_time += pause
+                self.current.gc_max = max(self.current.gc_max, pause)
+
+    def wrap(self, draw, name):
+        """`draw` with every call profiled under `name`"""
+        profile = self.profiles.setdefault(name, ModeProfile(name))
+        code = draw.__code__
+
+        def profiled_draw(screen, eyesy):
+            self.current = profile
+            sample = profile.frames % self.snapshot_every == 0
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            at_return = []
+            if sample:
+                before = _snapshot()
+                previous = sys.getprofile()
+
+                def on_return(frame, event, arg):
+                    # Snapshot as draw() returns, while its locals are still alive
+                    if event == "return" and frame.f_code is code and not at_return:
+                        at_return.append(_snapshot())
+
+                sys.setprofile(on_return)
+            try:
+                return draw(screen, eyesy)
+            finally:
+                current, peak = tracemalloc.get_traced_memory()
+                profile.frames += 1
+                profile.allocated += peak - start
+                profile.retained += current - start
+                self.current = None
+                if sample:
+                    sys.setprofile(previous)
+                    if at_return:
+                        self._count_lines(profile, before, at_return[0])
+
+        profiled_draw.__wrapped__ = draw
+        return profiled_draw
+
+    def _count_lines(self, profile, before, after):
+        profile.sampled += 1
+        stats = after.filter_traces(_IGNORED).compare_to(before.filter_traces(_IGNORED), "lineno")
+        for stat in stats:
+            if stat.size_diff > 0:
+                frame = stat.traceback[0]
+                totals = profile.lines.setdefault((frame.filename, frame.lineno), [0, 0])
+                totals[0] += stat.size_diff
+                totals[1] += max(0, stat.count_diff)
+                profile.blocks += max(0, stat.count_diff)
+
+    def report(self):
+        """Rows for every profiled mode, worst GC pause first"""
+        rows = [profile.row() for profile in self.profiles.values() if profile.frames]
+        return sorted(rows, key=lambda row: (row["gc_max_ms"], row["gc_ms_per_frame"]), reverse=True)
+
+    def format_report(self, limit=None, lines_for=5):
+        """The ranked table, then the top allocating lines of the first `lines_for` modes"""
+        rows = self.report()[:limit]
+        out = ["ALLOCATION PROFILE (worst GC pause first)",
+               f"{'#':>3} {'mode':<34} {'frames':>6} {'KB/frame':>9} {'blocks':>7} {'kept B':>7}"
+               f" {'gen0/1/2':>11} {'GC ms/fr':>8} {'max GC ms':>9}"]
+        for rank, row in enumerate(rows, 1):
+            gens = "/".join(str(n) for n in row["collections"])
+            out.append(f"{rank:>3} {row['mode'][:34]:<34} {row['frames']:>6} {row['kb_per_frame']:>9.1f}"
+                       f" {row['blocks_per_frame']:>7.0f} {row['retained_per_frame']:>7.0f}"
+                       f" {gens:>11} {row['gc_ms_per_frame']:>8.3f} {row['gc_max_ms']:>9.2f}")
+        out.append("KB/frame: allocated per frame (peak); blocks: alive when draw() returns; "
+                   "kept B: still held after it")
+        for row in rows[:lines_for]:
+            lines = self.profiles[row["mode"]].top_lines(self.top_line_count)
+            if lines:
+                out.append(f"\n{row['mode']} - top allocating lines (per frame)")
+                for filename, lineno, size, blocks in lines:
+                    out.append(f"  {size / 1024:8.1f} KB {blocks:7.0f} blocks  {filename}:{lineno}")
+        return "\n".join(out)
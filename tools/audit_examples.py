@@ -7,6 +7,7 @@ Scans for:
 - Unused variables
 - Formatting issues
 - Long lines
+- Performance anti-patterns in draw() (tools/perf_inspector.py)
 """
 
 import os
@@ -16,6 +17,10 @@ import sys
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.perf_inspector import format_findings, inspect_tree
+
 examples_dir = project_root / "examples"
 
 issues_found = {
@@ -24,7 +29,8 @@ issues_found = {
     'unused_variables': [],
     'long_lines': [],
     'trailing_whitespace': [],
-    'missing_docstrings': []
+    'missing_docstrings': [],
+    'performance': []
 }
 
 def check_file(filepath):
@@ -69,6 +75,10 @@ def check_file(filepath):
     try:
         tree = ast.parse(content, filename=str(filepath))
         
+        # Performance anti-patterns, from the same tree
+        for finding in inspect_tree(tree):
+            issues_found['performance'].append((rel_path, finding))
+        
         # Get all imports
         imports = set()
         for node in ast.walk(tree):
@@ -161,6 +171,17 @@ def main():
             print(f"   ... and {len(issues_found['unused_imports']) - 10} more")
         print()
     
+    if issues_found['performance']:
+        print(f"🐢 Performance Anti-Patterns: {len(issues_found['performance'])}")
+        # Worst first, across all modes
+        worst = sorted(issues_found['performance'], key=lambda issue: -issue[1].score)
+        for filepath, finding in worst[:10]:
+            print(f"   {filepath}")
+            print(format_findings([finding], indent='      '))
+        if len(worst) > 10:
+            print(f"   ... and {len(worst) - 10} more")
+        print()
+    
     print("=" * 60)
     print("Audit complete!")
     print("=" * 60)
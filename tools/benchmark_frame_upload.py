@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for getting camera frames onto a Surface in the webcam modes.
+
+Compares the old per-frame path (BGR->RGB copy, a new Surface from
+surfarray.make_surface, and a make_surface -> transform.scale -> array3d round
+trip when the camera size differs from the mode's) with the eyesy_capture path
+(convert_frame into a preallocated buffer, then upload_frame into one
+persistent display-format Surface).
+
+Usage:
+    python tools/benchmark_frame_upload.py [frames]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'examples' / 'lib'))
+
+from eyesy_capture import convert_frame, frame_surface, upload_frame
+
+CAMERA_SIZES = [(320, 240), (640, 480)]
+
+
+def old_upload(frame, size):
+    """What the webcam modes used to do with every frame"""
+    frame_rgb = np.ascontiguousarray(frame[:, :, ::-1])
+    if frame_rgb.shape[:2] != size[::-1]:
+        frame_rgb = np.array(pygame.surfarray.array3d(
+            pygame.transform.scale(pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1)), size)
+        )).swapaxes(0, 1)
+    return pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
+
+
+def new_upload(frame, size, buffer, surface):
+    """Capture-thread conversion plus upload into a persistent Surface"""
+    convert_frame(frame, buffer, bgr=True)
+    return upload_frame(surface, buffer)
+
+
+def measure(func, frames):
+    """(milliseconds per frame, peak bytes traced per frame)"""
+    func()
+    start = time.perf_counter()
+    for _ in range(frames):
+        func()
+    elapsed = (time.perf_counter() - start) / frames * 1000.0
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pygame.init()
+    pygame.display.set_mode((1280, 720), pygame.HIDDEN)
+    print(f"{'camera':>9} {'mode size':>9} {'old ms':>8} {'new ms':>8} {'old alloc':>10} {'new alloc':>10}")
+    for camera_size in CAMERA_SIZES:
+        frame = np.random.randint(0, 256, (camera_size[1], camera_size[0], 3), np.uint8)
+        for size in (camera_size, (160, 120)):
+            buffer = np.empty((size[1], size[0], 3), np.uint8)
+            surface = frame_surface(size)
+            old_ms, old_bytes = measure(lambda: old_upload(frame, size), frames)
+            new_ms, new_bytes = measure(lambda: new_upload(frame, size, buffer, surface), frames)
+            print(f"{'%dx%d' % camera_size:>9} {'%dx%d' % size:>9} {old_ms:8.3f} {new_ms:8.3f} "
+                  f"{old_bytes / 1024:9.0f}K {new_bytes / 1024:9.0f}K")
+    print("alloc = peak Python/NumPy memory traced for one frame (Surface pixels from make_surface come on top)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
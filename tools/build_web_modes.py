@@ -9,6 +9,13 @@ import sys
 import json
 import shutil
 import ast
+import hashlib
+import importlib.util
+import io
+import marshal
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -16,12 +23,22 @@ from typing import List, Dict, Optional
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from tools.optimize_assets import optimize_images
+from tools.perf_inspector import Finding, format_findings, inspect_tree
+
 # Directories
 EXAMPLES_DIR = project_root / "examples"
 CUSTOM_DIR = project_root / "custom"
 WEB_MODES_DIR = project_root / "web" / "modes"
 WEB_ASSETS_DIR = project_root / "web" / "assets"
 WEB_MANIFEST = project_root / "web" / "modes" / "manifest.json"
+LIB_DIR = EXAMPLES_DIR / "lib"
+
+# The web app runs Pyodide 0.24.1 (web/js/pyodide-loader.js), i.e. CPython 3.11.
+# Code objects only load on the Python version that compiled them.
+TARGET_PYTHON = (3, 11)
+# Magic number, flags, source hash: the .pyc header before the marshalled code
+PYC_HEADER_SIZE = 16
 
 
 class ModeValidator:
@@ -33,10 +50,19 @@ class ModeValidator:
         Validate a mode has required functions.
         Returns (is_valid, error_message)
         """
+        return ModeValidator.check_mode(mode_path)[:2]
+    
+    @staticmethod
+    def check_mode(mode_path: Path) -> tuple[bool, Optional[str], List[Finding]]:
+        """
+        Validate a mode and inspect it for performance anti-patterns
+        (tools/perf_inspector.py), from a single parse.
+        Returns (is_valid, error_message, findings), findings worst first
+        """
         main_py = mode_path / "main.py"
         
         if not main_py.exists():
-            return False, "main.py not found"
+            return False, "main.py not found", []
         
         try:
             with open(main_py, 'r', encoding='utf-8') as f:
@@ -48,17 +74,17 @@ class ModeValidator:
             functions = {node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)}
             
             if 'setup' not in functions:
-                return False, "Missing setup() function"
+                return False, "Missing setup() function", []
             
             if 'draw' not in functions:
-                return False, "Missing draw() function"
+                return False, "Missing draw() function", []
             
-            return True, None
+            return True, None, inspect_tree(tree)
             
         except SyntaxError as e:
-            return False, f"Syntax error: {e}"
+            return False, f"Syntax error: {e}", []
         except Exception as e:
-            return False, f"Error validating mode: {e}"
+            return False, f"Error validating mode: {e}", []
 
 
 class ModeBuilder:
@@ -67,6 +93,18 @@ class ModeBuilder:
     def __init__(self):
         self.modes = []
         self.validator = ModeValidator()
+        # The last build's manifest: modes whose content hash is unchanged are not rebuilt
+        self.previous = self.load_manifest()
+        self.previous_modes = {mode["id"]: mode for mode in self.previous.get("modes", [])}
+    
+    @staticmethod
+    def load_manifest() -> Dict:
+        """The manifest currently in web/modes/, or {} if there is none (or it can't be read)"""
+        try:
+            with open(WEB_MANIFEST, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
     
     def scan_modes(self) -> List[Dict]:
         """Scan for all available modes"""
@@ -100,11 +138,22 @@ class ModeBuilder:
         if not main_py.exists():
             return None
         
+        # Unchanged since the last build: reuse its entry, already validated
+        mode_id = self.sanitize_id(mode_folder.name)
+        content_hash = self.mode_hash(mode_folder)
+        previous = self.previous_modes.get(mode_id)
+        if previous and previous.get("hash") == content_hash and previous.get("category") == category:
+            mode_info = dict(previous)
+            mode_info.pop("bundle", None)
+            return mode_info
+        
         # Validate mode
-        is_valid, error = self.validator.validate_mode(mode_folder)
+        is_valid, error, findings = self.validator.check_mode(mode_folder)
         if not is_valid:
             print(f"⚠️  Skipping {mode_folder.name}: {error}")
             return None
+        if findings:
+            print(f"🐢 {mode_folder.name}:\n{format_findings(findings, limit=3)}")
         
         # Extract mode name
         mode_name = mode_folder.name
@@ -121,11 +170,59 @@ class ModeBuilder:
             "source": source,
             "path": f"modes/{self.sanitize_id(mode_name)}.py",
             "has_assets": has_images,
-            "assets_path": f"assets/{self.sanitize_id(mode_name)}" if has_images else None
+            "assets_path": f"assets/{self.sanitize_id(mode_name)}" if has_images else None,
+            "hash": content_hash
         }
         
         return mode_info
     
+    @staticmethod
+    def mode_hash(mode_folder: Path) -> str:
+        """Content hash of a mode: its main.py and everything in its Images/ folder"""
+        files = [mode_folder / "main.py"]
+        images_dir = mode_folder / "Images"
+        if images_dir.is_dir():
+            files += sorted(path for path in images_dir.iterdir() if path.is_file())
+        digest = hashlib.sha256()
+        for path in files:
+            digest.update(path.relative_to(mode_folder).as_posix().encode('utf-8') + b"\0")
+            with open(path, 'rb') as f:
+                digest.update(hashlib.file_digest(f, 'sha256').digest())
+        return digest.hexdigest()[:16]
+    
+    @staticmethod
+    def source_dir(mode: Dict) -> Path:
+        """The folder a mode is built from"""
+        if mode["source"] == "examples":
+            return EXAMPLES_DIR / mode["category"] / mode["name"]
+        return CUSTOM_DIR / mode["name"]
+    
+    def is_current(self, mode: Dict) -> bool:
+        """Whether the last build already produced this mode, from the same content"""
+        previous = self.previous_modes.get(mode["id"])
+        if not previous or previous.get("hash") != mode["hash"]:
+            return False
+        if not (WEB_MODES_DIR / f"{mode['id']}.py").exists():
+            return False
+        return not mode["has_assets"] or (WEB_ASSETS_DIR / mode["id"]).is_dir()
+    
+    def build_mode(self, mode: Dict) -> bool:
+        """Copy one mode's file and assets into web/"""
+        source_dir = self.source_dir(mode)
+        if not self.copy_mode_file(source_dir / "main.py", mode["id"]):
+            return False
+        if mode["has_assets"]:
+            return self.copy_assets(source_dir, mode)
+        return True
+    
+    def remove_stale(self, modes: List[Dict]):
+        """Remove the output of modes the last build had but this one doesn't"""
+        current = {mode["id"] for mode in modes}
+        for mode_id in self.previous_modes.keys() - current:
+            print(f"🗑️  Removing {mode_id}")
+            (WEB_MODES_DIR / f"{mode_id}.py").unlink(missing_ok=True)
+            shutil.rmtree(WEB_ASSETS_DIR / mode_id, ignore_errors=True)
+    
     def sanitize_id(self, name: str) -> str:
         """Convert mode name to safe ID"""
         # Replace spaces and special chars with underscores
@@ -153,25 +250,33 @@ class ModeBuilder:
             print(f"❌ Error copying {source}: {e}")
             return False
     
-    def copy_assets(self, source_dir: Path, mode_id: str) -> bool:
-        """Copy mode assets (images) to web/assets/"""
+    def copy_assets(self, source_dir: Path, mode: Dict) -> bool:
+        """
+        Copy mode assets (images) to web/assets/, optimized for download
+        (tools/optimize_assets.py). Small sprites may be packed into an atlas,
+        which is then recorded in the mode's "atlas" entry.
+        """
         images_dir = source_dir / "Images"
+        mode_id = mode["id"]
         
         if not images_dir.exists():
             return True  # No assets to copy
         
         try:
             dest_dir = WEB_ASSETS_DIR / mode_id
-            dest_dir.mkdir(parents=True, exist_ok=True)
+            # Start clean, so images since removed or packed into the atlas don't linger
+            shutil.rmtree(dest_dir, ignore_errors=True)
             
-            # Copy all image files
-            for img_file in images_dir.glob("*.png"):
-                shutil.copy2(img_file, dest_dir / img_file.name)
-            
-            # Copy other assets (fonts, etc.)
-            for asset_file in images_dir.glob("*"):
-                if asset_file.suffix in ['.ttf', '.jpg', '.jpeg']:
-                    shutil.copy2(asset_file, dest_dir / asset_file.name)
+            report = optimize_images(images_dir, dest_dir, (source_dir / "main.py").read_text(encoding='utf-8'))
+            mode.pop("atlas", None)
+            if report["atlas"]:
+                mode["atlas"] = {
+                    "path": f"assets/{mode_id}/{report['atlas']['file']}",
+                    "sprites": report["atlas"]["sprites"]
+                }
+            # One write, as modes build in parallel
+            print(f"   🗜️  {mode['name']}: assets {report['bytes_in'] // 1024} KB -> {report['bytes_out'] // 1024} KB\n",
+                  end="")
             
             return True
         except Exception as e:
@@ -193,44 +298,35 @@ class ModeBuilder:
         WEB_MODES_DIR.mkdir(parents=True, exist_ok=True)
         WEB_ASSETS_DIR.mkdir(parents=True, exist_ok=True)
         
-        # Process each mode
-        successful = 0
-        failed = 0
+        # Process the modes that changed since the last build, copying in parallel
+        changed = [mode for mode in modes if not self.is_current(mode)]
+        unchanged = len(modes) - len(changed)
+        print(f"📦 Building {len(changed)} changed modes...")
+        with ThreadPoolExecutor() as pool:
+            results = list(pool.map(self.build_mode, changed))
         
-        for mode in modes:
-            mode_id = mode["id"]
-            mode_name = mode["name"]
-            
-            # Find source directory
-            if mode["source"] == "examples":
-                source_dir = EXAMPLES_DIR / mode["category"] / mode_name
+        failed_ids = set()
+        for mode, ok in zip(changed, results):
+            if ok:
+                print(f"   ✅ {mode['name']}")
             else:
-                source_dir = CUSTOM_DIR / mode_name
-            
-            source_file = source_dir / "main.py"
-            
-            if not source_file.exists():
-                print(f"⚠️  Skipping {mode_name}: main.py not found")
-                failed += 1
-                continue
-            
-            print(f"📦 Building {mode_name}...")
-            
-            # Copy mode file
-            if self.copy_mode_file(source_file, mode_id):
-                # Copy assets if present
-                if mode["has_assets"]:
-                    self.copy_assets(source_dir, mode_id)
-                
-                successful += 1
-                print(f"   ✅ {mode_name}")
-            else:
-                failed += 1
-                print(f"   ❌ {mode_name}")
+                failed_ids.add(mode["id"])
+                print(f"   ❌ {mode['name']}")
+        if unchanged:
+            print(f"   ⏭️  {unchanged} unchanged")
+        successful = len(modes) - len(failed_ids)
+        failed = len(failed_ids)
+        self.remove_stale(modes)
+        built = [(mode, self.source_dir(mode) / "main.py") for mode in modes if mode["id"] not in failed_ids]
+        
+        # Bundle the compiled modes; the shared modules also go out as source, for when it can't be used
+        print("\n📦 Bundling compiled modes...")
+        bundle = self.write_bundle(built)
+        libs = self.copy_libs()
         
         # Generate manifest
         print("\n📝 Generating manifest...")
-        self.generate_manifest(modes)
+        self.generate_manifest(modes, bundle, libs)
         
         print(f"\n✅ Build complete!")
         print(f"   Successful: {successful}")
@@ -239,7 +335,135 @@ class ModeBuilder:
         
         return failed == 0
     
-    def generate_manifest(self, modes: List[Dict]):
+    @staticmethod
+    def compile_pyc(source: str, filename: str) -> bytes:
+        """Compile source to .pyc bytes (unchecked hash-based, so the same source always gives the same bytes)"""
+        data = source.encode('utf-8')
+        code = compile(data, filename, 'exec', dont_inherit=True)
+        flags = (1).to_bytes(4, 'little')
+        return importlib.util.MAGIC_NUMBER + flags + importlib.util.source_hash(data) + marshal.dumps(code)
+    
+    def previous_bundle(self) -> Dict[str, bytes]:
+        """Members of the last build's bundle, by name ({} if there is none)"""
+        path = self.previous.get("bundle", {}).get("path")
+        if not path or not (WEB_MODES_DIR / Path(path).name).exists():
+            return {}
+        try:
+            with zipfile.ZipFile(WEB_MODES_DIR / Path(path).name) as bundle:
+                return {name: bundle.read(name) for name in bundle.namelist()}
+        except (OSError, zipfile.BadZipFile):
+            return {}
+    
+    def bundle_pyc(self, previous: Dict[str, bytes], name: str, source: str, filename: str) -> tuple[bytes, bool]:
+        """
+        A bundle member's .pyc, and whether it was compiled. The last bundle's
+        copy is reused when it was compiled by this Python from the same source
+        (the .pyc header carries the source hash).
+        """
+        pyc = previous.get(name)
+        if (pyc and pyc[:4] == importlib.util.MAGIC_NUMBER
+                and pyc[8:16] == importlib.util.source_hash(source.encode('utf-8'))):
+            return pyc, False
+        return self.compile_pyc(source, filename), True
+    
+    def write_bundle(self, built: List[tuple]) -> Optional[Dict]:
+        """
+        Write every built mode, plus the shared modules in examples/lib,
+        precompiled into one versioned zip: web/modes/modes-<hash>.zip.
+        
+        The zip is stored uncompressed. Library modules sit at its root, so the
+        zip works as a sys.path entry for zipimport. Modes sit under modes/, and
+        each mode gets a "bundle" entry with the offset, length and sha256 of
+        its .pyc bytes. The web app fetches the zip once and runs each mode
+        from its own slice.
+        
+        Returns the manifest's "bundle" record, or None when this Python
+        can't compile for the web app (the web app then loads the .py copies,
+        and the shared modules from web/modes/lib/, see copy_libs()).
+        """
+        if sys.version_info[:2] != TARGET_PYTHON:
+            target = ".".join(map(str, TARGET_PYTHON))
+            print(f"⚠️  Not bundling: the web app runs Python {target}, this is {sys.version.split()[0]}")
+            return None
+        
+        previous = self.previous_bundle()
+        sources = []
+        if LIB_DIR.exists():
+            for lib_file in sorted(LIB_DIR.glob("*.py")):
+                sources.append((f"{lib_file.stem}.pyc", lib_file, f"{lib_file.stem}.py", None))
+        for mode, source_file in built:
+            sources.append((f"modes/{mode['id']}.pyc", source_file, mode["path"], mode))
+        entries = []
+        compiled = 0
+        for name, source_file, filename, mode in sources:
+            pyc, fresh = self.bundle_pyc(previous, name, source_file.read_text(encoding='utf-8'), filename)
+            compiled += fresh
+            entries.append((name, pyc, mode))
+        
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as bundle:
+            for name, pyc, mode in entries:
+                # Fixed timestamps keep the zip, and so its name, the same for the same sources
+                bundle.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), pyc)
+        data = buffer.getvalue()
+        
+        with zipfile.ZipFile(io.BytesIO(data)) as bundle:
+            for (name, pyc, mode), info in zip(entries, bundle.infolist()):
+                if mode is None:
+                    continue
+                # Data follows the 30-byte local header, the name and the extra field
+                header = info.header_offset
+                offset = (header + 30 + int.from_bytes(data[header + 26:header + 28], 'little')
+                          + int.from_bytes(data[header + 28:header + 30], 'little'))
+                mode["bundle"] = {
+                    "offset": offset,
+                    "length": len(pyc),
+                    "sha256": hashlib.sha256(pyc).hexdigest()
+                }
+        
+        digest = hashlib.sha256(data).hexdigest()
+        bundle_name = f"modes-{digest[:12]}.zip"
+        WEB_MODES_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in WEB_MODES_DIR.glob("modes-*.zip"):
+            if stale.name != bundle_name:
+                stale.unlink()
+        if not (WEB_MODES_DIR / bundle_name).exists():
+            (WEB_MODES_DIR / bundle_name).write_bytes(data)
+        
+        print(f"   ✅ {bundle_name}: {len(built)} modes, {len(entries) - len(built)} library modules, "
+              f"{len(data) // 1024} KB ({compiled} compiled)")
+        return {
+            "path": f"modes/{bundle_name}",
+            "size": len(data),
+            "sha256": digest,
+            "python": ".".join(map(str, TARGET_PYTHON)),
+            "magic": importlib.util.MAGIC_NUMBER.hex(),
+            "header_size": PYC_HEADER_SIZE
+        }
+    
+    def copy_libs(self) -> List[Dict]:
+        """
+        Copy the shared modules in examples/lib to web/modes/lib/. Modes
+        loaded from source, when the web app can't use the bundle, import them
+        from there. Returns the manifest's "lib" entries (path and content hash).
+        """
+        dest_dir = WEB_MODES_DIR / "lib"
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        libs = []
+        for lib_file in sorted(LIB_DIR.glob("*.py")):
+            data = lib_file.read_bytes()
+            dest = dest_dir / lib_file.name
+            if not dest.exists() or dest.read_bytes() != data:
+                dest.write_bytes(data)
+            libs.append({"path": f"modes/lib/{lib_file.name}", "hash": hashlib.sha256(data).hexdigest()[:16]})
+        current = {lib_file.name for lib_file in LIB_DIR.glob("*.py")}
+        for stale in dest_dir.glob("*.py"):
+            if stale.name not in current:
+                stale.unlink()
+        print(f"   ✅ {len(libs)} library modules copied for loading from source")
+        return libs
+    
+    def generate_manifest(self, modes: List[Dict], bundle: Optional[Dict] = None, libs: Optional[List[Dict]] = None):
         """Generate mode manifest JSON"""
         manifest = {
             "modes": modes,
@@ -251,8 +475,18 @@ class ModeBuilder:
                 "custom": "Custom user modes"
             },
             "version": "1.0.0",
-            "build_date": str(Path(__file__).stat().st_mtime)
+            "build_date": datetime.now(timezone.utc).isoformat(timespec='seconds')
         }
+        if bundle:
+            manifest["bundle"] = bundle
+        if libs:
+            manifest["lib"] = libs
+        
+        # Nothing changed: keep the manifest, and its build date, as it is
+        previous = dict(self.previous, build_date=manifest["build_date"])
+        if previous == manifest:
+            print(f"   ⏭️  Manifest unchanged")
+            return
         
         with open(WEB_MANIFEST, 'w', encoding='utf-8') as f:
             json.dump(manifest, f, indent=2, ensure_ascii=False)
@@ -4,9 +4,11 @@ EYESY Script Runner
 A custom application to run and test EYESY mode scripts locally.
 
 Usage:
-    python tools/eyesy_runner.py [mode_path]
+    python tools/eyesy_runner.py [--profile-alloc] [mode_path]
     
     If mode_path is not provided, a file browser will open to select a mode.
+    --profile-alloc profiles allocations and GC pauses of every mode's draw()
+    and prints a ranked table on exit.
 """
 
 import sys
@@ -46,9 +48,12 @@ except ImportError:
     HAS_MIDI = False
     print("Warning: pygame.midi not available. MIDI input will be disabled.")
 
-# Add project root to path
+# Add project root to path, and examples/lib for the modes' shared modules
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.append(str(project_root / 'examples' / 'lib'))
+
+from tools.perf_inspector import format_findings, inspect_mode
 
 
 class EYESYSimulator:
@@ -125,6 +130,34 @@ class EYESYSimulator:
         self._audio_trig = False
         self.audio_trig = False  # Initialize as public attribute
         
+        # Frame clock (seconds): advanced once per frame by advance_frame()
+        # Modes can read eyesy.time / eyesy.dt instead of the wall clock
+        self.fps = 60
+        self.frame_count = 0
+        self.time = 0.0
+        self.dt = 1.0 / self.fps
+        # When True every frame is exactly 1/fps long (headless renders and tests)
+        self.fixed_timestep = False
+        self._last_frame_time = None
+        
+    def advance_frame(self, dt=None):
+        """Move the frame clock on by one frame
+        
+        dt defaults to 1/fps with fixed_timestep, otherwise to the wall-clock
+        time since the previous call.
+        """
+        if dt is None:
+            if self.fixed_timestep:
+                dt = 1.0 / self.fps
+            else:
+                now = time.perf_counter()
+                dt = 0.0 if self._last_frame_time is None else now - self._last_frame_time
+                self._last_frame_time = now
+        self.dt = dt
+        self.time += dt
+        self.frame_count += 1
+        return self.time
+    
     def set_mode_root(self, path):
         """Set the root path for the current mode"""
         self.mode_root = str(path)
@@ -364,10 +397,60 @@ class EYESYSimulator:
         return color
 
 
+class FrameClock:
+    """Stands in for the time module inside a mode so it runs on eyesy.time
+    
+    time(), monotonic() and sleep() use the simulator's frame clock (sleep just
+    moves the clock on, it never blocks). perf_counter() is real time in the
+    interactive runner, but the frame clock too with fixed_timestep: a mode that
+    times its own work (S - Surf Waves' mesh budget) must not make a headless
+    render depend on how fast the machine is. Everything else is the real time
+    module.
+    """
+    
+    def __init__(self, eyesy):
+        self._eyesy = eyesy
+    
+    def __getattr__(self, name):
+        return getattr(time, name)
+    
+    def time(self):
+        return self._eyesy.time
+    
+    def monotonic(self):
+        return self._eyesy.time
+    
+    def sleep(self, seconds):
+        self._eyesy.time += max(0.0, seconds)
+    
+    def perf_counter(self):
+        if self._eyesy.fixed_timestep:
+            return self._eyesy.time
+        return time.perf_counter()
+    
+    def perf_counter_ns(self):
+        if self._eyesy.fixed_timestep:
+            return int(self._eyesy.time * 1e9)
+        return time.perf_counter_ns()
+
+
+def use_frame_clock(module, eyesy):
+    """Route a loaded mode's module-level `time` to eyesy's frame clock
+    
+    Only the mode's own global is replaced (modes import time before their
+    setup()/draw() run); the real time module is left alone for everyone else.
+    Returns True if the mode uses the time module at all.
+    """
+    if getattr(module, 'time', None) is not time:
+        return False
+    module.time = FrameClock(eyesy)
+    return True
+
+
 class EYESYRunner:
     """Main application to run EYESY modes"""
     
-    def __init__(self, mode_path: Optional[str] = None):
+    def __init__(self, mode_path: Optional[str] = None, profiler=None):
         pygame.init()
         
         self.screen_width = 1280
@@ -383,6 +466,8 @@ class EYESYRunner:
         self.setup_func = None
         self.draw_func = None
         self.mode_path = mode_path
+        # Optional AllocationProfiler wrapped around each mode's draw()
+        self.profiler = profiler
         
         self.show_controls = True
         self.font = pygame.font.Font(None, 24)
@@ -652,6 +737,8 @@ class EYESYRunner:
             
             self.setup_func = module.setup
             self.draw_func = module.draw
+            if self.profiler:
+                self.draw_func = self.profiler.wrap(module.draw, mode_path.name)
             self.mode_path = str(mode_path)
             
             # Set mode name for eyesy.mode API
@@ -666,6 +753,11 @@ class EYESYRunner:
             self.setup_func(self.screen, self.eyesy)
             
             print(f"Loaded mode: {mode_path.name}")
+            # Static hints only: the mode's source is read, not timed
+            findings = inspect_mode(mode_path)
+            if findings:
+                print(f"Performance hints for {mode_path.name}:")
+                print(format_findings(findings, limit=5))
             return True
             
         except Exception as e:
@@ -957,6 +1049,7 @@ class EYESYRunner:
             running = self.handle_events()
             
             if not self.paused:
+                self.eyesy.advance_frame(self.clock.get_time() / 1000.0)
                 self.eyesy.update_audio()
                 
                 # Reset MIDI note new flag at start of each frame
@@ -1061,12 +1154,22 @@ class EYESYRunner:
                 pass
         
         pygame.quit()
+        
+        if self.profiler:
+            self.profiler.stop()
+            print(self.profiler.format_report())
 
 
 def main():
     """Entry point"""
-    mode_path = sys.argv[1] if len(sys.argv) > 1 else None
-    runner = EYESYRunner(mode_path)
+    args = sys.argv[1:]
+    profiler = None
+    if "--profile-alloc" in args:
+        args.remove("--profile-alloc")
+        from tools.alloc_profiler import AllocationProfiler
+        profiler = AllocationProfiler().start()
+    mode_path = args[0] if args else None
+    runner = EYESYRunner(mode_path, profiler)
     runner.run()
 
 
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Golden-frame visual regression for EYESY modes.
+
+Renders a few selected frames of each mode under a fixed input script (frame
+clock, random seeds, simulated audio, knob changes and triggers are all
+deterministic), and either stores them as the mode's goldens or compares
+them with the stored ones using a perceptual difference, so reworking a
+mode's drawing (vectorizing, caching, rendering at another scale) can be
+checked for looking the same.
+
+Goldens are content-addressed: every frame is saved once as a PNG named after
+the hash of its pixels under tools/golden/objects/, and tools/golden/index.json
+maps each mode to the hashes of its frames. Identical frames (blank first
+frames, say) are stored once however many modes produce them. Per-mode
+tolerances live in tools/golden/tolerances.json, for modes whose look may
+drift a little (or, with "skip", not be comparable at all, like a live camera).
+
+A golden is only worth anything if the mode draws the same frames on any
+machine. update (and the timing action, for goldens already stored) renders
+each mode twice, with the real clocks running 20 times fast and then 20 times
+slow, as on a much slower and a much faster CPU, and refuses a mode whose
+frames differ: something in it depends on how long its work takes.
+
+Modes are rendered and compared in worker processes, one fresh process per mode.
+
+Usage:
+    python tools/golden_frames.py update [mode names or paths...]
+    python tools/golden_frames.py check [--jobs N] [--diff-dir DIR] [mode names or paths...]
+    python tools/golden_frames.py timing [mode names or paths...]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import time
+import traceback
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import numpy as np
+import pygame
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.eyesy_runner import EYESYSimulator
+from tools.soak_modes import find_modes, load_mode
+
+GOLDEN_DIR = project_root / "tools" / "golden"
+
+# Render settings (stored in the index; a check always renders the way the goldens were made).
+# Modes render at the device's resolution, where they behave as on the hardware, and frames
+# are kept averaged over SCALE x SCALE blocks: compact, and forgiving of sub-block shifts
+SIZE = (1280, 720)
+SCALE = 4
+SEED = 0
+CAPTURE_FRAMES = (10, 60, 120)
+# The input script: default knobs, then the test suite's "mixed" setting, with a trigger every 20 frames
+KNOB_SCRIPT = ((1, (0.5, 0.5, 0.5, 0.5, 0.5)), (61, (0.25, 0.75, 0.1, 0.9, 0.5)))
+TRIGGER_EVERY = 20
+# The timing check's simulated CPUs: real clocks read this many times the time that really
+# passed, so a mode timing its own work sees a machine 20x slower, then 20x faster
+CPU_SLOWDOWNS = (20.0, 0.05)
+CLOCKS = ("time", "time_ns", "perf_counter", "perf_counter_ns", "monotonic", "monotonic_ns",
+          "process_time", "process_time_ns")
+
+# How different a frame may look before the check fails (per-mode overrides in tolerances.json)
+DEFAULT_TOLERANCE = {
+    "pixel_threshold": 24.0,  # Perceptual distance (0-255 scale) at which a pixel counts as changed
+    "shift": 1,  # Pixels may match anywhere this many (stored) pixels away
+    "max_changed": 0.002,  # Share of pixels allowed over the threshold
+    "max_mean": 1.0,  # Mean perceptual distance allowed over the whole frame
+}
+
+
+def shrink(pixels, scale):
+    """Average (h, w, 3) pixels over scale x scale blocks"""
+    h, w = pixels.shape[0] // scale, pixels.shape[1] // scale
+    blocks = pixels[:h * scale, :w * scale].reshape(h, scale, w, scale, 3)
+    return np.round(blocks.mean(axis=(1, 3))).astype(np.uint8)
+
+
+@contextlib.contextmanager
+def simulated_cpu(slowdown):
+    """Make the real clocks (time's and pygame.time.get_ticks) run `slowdown` times as fast"""
+    originals = {name: getattr(time, name) for name in CLOCKS}
+    originals["get_ticks"] = pygame.time.get_ticks
+
+    def scaled(real, integer):
+        start = real()
+        if integer:
+            return lambda: start + int((real() - start) * slowdown)
+        return lambda: start + (real() - start) * slowdown
+
+    for name in CLOCKS:
+        setattr(time, name, scaled(originals[name], name.endswith("_ns")))
+    pygame.time.get_ticks = scaled(originals["get_ticks"], True)
+    try:
+        yield
+    finally:
+        pygame.time.get_ticks = originals.pop("get_ticks")
+        for name, clock in originals.items():
+            setattr(time, name, clock)
+
+
+def render_frames(mode_path, size=SIZE, seed=SEED, frames=CAPTURE_FRAMES, scale=SCALE, slowdown=None):
+    """Run a mode through the input script and return {frame number: (h, w, 3) uint8 pixels}
+
+    Frames come back shrunk by `scale`. With `slowdown` the mode runs on a
+    simulated CPU (see simulated_cpu()).
+    """
+    if slowdown is not None:
+        with simulated_cpu(slowdown):
+            return render_frames(mode_path, size, seed, frames, scale)
+    random.seed(seed)
+    np.random.seed(seed)
+    pygame.init()
+    pygame.display.set_mode(size, pygame.HIDDEN)
+    screen = pygame.Surface(size)
+    eyesy = EYESYSimulator(*size)
+    eyesy.fixed_timestep = True
+    module = load_mode(mode_path, eyesy)
+    eyesy.update_audio()
+    module.setup(screen, eyesy)
+    knobs = dict(KNOB_SCRIPT)
+    captured = {}
+    for frame in range(1, max(frames) + 1):
+        if frame in knobs:
+            for i, value in enumerate(knobs[frame], 1):
+                setattr(eyesy, f"knob{i}", value)
+        eyesy.advance_frame()
+        eyesy.update_audio()
+        eyesy.trig = frame % TRIGGER_EVERY == 0
+        eyesy.midi_note_new = eyesy.trig
+        if eyesy.auto_clear:
+            screen.fill(tuple(eyesy.bg_color))
+        module.draw(screen, eyesy)
+        if frame in frames:
+            captured[frame] = shrink(pygame.surfarray.array3d(screen).swapaxes(0, 1), scale)
+    return captured
+
+
+def frame_hash(pixels):
+    """Content address of a frame: its shape and pixels, not the PNG bytes"""
+    digest = hashlib.sha256(str(pixels.shape).encode())
+    digest.update(np.ascontiguousarray(pixels).tobytes())
+    return digest.hexdigest()[:24]
+
+
+def object_path(digest, golden_dir=GOLDEN_DIR):
+    return Path(golden_dir) / "objects" / digest[:2] / f"{digest}.png"
+
+
+def save_object(pixels, golden_dir=GOLDEN_DIR):
+    """Store a frame under its hash (once) and return the hash"""
+    digest = frame_hash(pixels)
+    path = object_path(digest, golden_dir)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(pygame.surfarray.make_surface(pixels.swapaxes(0, 1)), str(path))
+    return digest
+
+
+def load_object(digest, golden_dir=GOLDEN_DIR):
+    surface = pygame.image.load(str(object_path(digest, golden_dir)))
+    return pygame.surfarray.array3d(surface).swapaxes(0, 1)
+
+
+def load_json(path, default):
+    path = Path(path)
+    if not path.exists():
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def tolerance_for(mode_name, golden_dir=GOLDEN_DIR):
+    tolerance = dict(DEFAULT_TOLERANCE)
+    tolerance.update(load_json(Path(golden_dir) / "tolerances.json", {}).get(mode_name, {}))
+    return tolerance
+
+
+def to_ycbcr(pixels):
+    """Luma and two chroma channels (BT.601), where distance tracks what the eye sees better than RGB"""
+    rgb = pixels.astype(np.float32)
+    y = rgb @ np.array([0.299, 0.587, 0.114], np.float32)
+    cb = (rgb[..., 2] - y) * 0.564
+    cr = (rgb[..., 0] - y) * 0.713
+    return np.stack((y, cb, cr), axis=-1)
+
+
+def distance_to_nearby(image, other, shift):
+    """Perceptual distance from each pixel of `image` to its best match in `other` within `shift` pixels"""
+    h, w = image.shape[:2]
+    padded = np.pad(other, ((shift, shift), (shift, shift), (0, 0)), mode='edge')
+    best = None
+    for dy in range(2 * shift + 1):
+        for dx in range(2 * shift + 1):
+            delta = image - padded[dy:dy + h, dx:dx + w]
+            distance = delta[..., 0] ** 2 + 0.5 * (delta[..., 1] ** 2 + delta[..., 2] ** 2)
+            best = distance if best is None else np.minimum(best, distance)
+    return np.sqrt(best)
+
+
+def perceptual_diff(expected, actual, shift=0):
+    """Per-pixel perceptual distance (0-255 scale) between two frames
+
+    Frames are compared in YCbCr with chroma weighted at half of luma, as the
+    eye is less sensitive to it. They were already averaged over SCALE x SCALE
+    blocks, and with `shift` a pixel only counts as changed when nothing near
+    it in the other frame matches, both ways round, so one-pixel drift from
+    rounding, antialiasing or a different render scale is forgiven while
+    anything that appears, vanishes or moves further is not.
+    """
+    if expected.shape != actual.shape:
+        raise ValueError(f"frame size changed: {expected.shape} -> {actual.shape}")
+    expected, actual = to_ycbcr(expected), to_ycbcr(actual)
+    return np.maximum(distance_to_nearby(expected, actual, shift), distance_to_nearby(actual, expected, shift))
+
+
+def compare(expected, actual, tolerance=DEFAULT_TOLERANCE):
+    """(passed, stats, distance map) for one frame against its golden"""
+    distance = perceptual_diff(expected, actual, tolerance["shift"])
+    stats = {"changed": float((distance > tolerance["pixel_threshold"]).mean()),
+             "mean": float(distance.mean()),
+             "max": float(distance.max())}
+    passed = stats["changed"] <= tolerance["max_changed"] and stats["mean"] <= tolerance["max_mean"]
+    return passed, stats, distance
+
+
+def diff_image(expected, actual, distance):
+    """Golden, new frame and a heat map of the differences side by side"""
+    heat = np.zeros_like(expected)
+    heat[..., 0] = np.clip(distance * 4, 0, 255).astype(np.uint8)
+    heat[..., 1] = expected.mean(axis=-1).astype(np.uint8) // 4  # Faint golden for orientation
+    return np.concatenate((expected, actual, heat), axis=1)
+
+
+def timing_changes(first, second):
+    """{frame number: share of pixels changed} for the frames two renders disagree on"""
+    return {n: compare(first[n], pixels)[1]["changed"] for n, pixels in second.items()
+            if frame_hash(pixels) != frame_hash(first[n])}
+
+
+def _run_job(job):
+    """Worker: render one mode, then store its frames, compare them with the goldens or
+    check that they don't depend on timing"""
+    action, mode_path, settings, golden_dir, diff_dir = job
+    name = Path(mode_path).name
+    result = {"mode": name, "frames": {}, "passed": True, "error": None, "skipped": None, "timing": {}}
+    tolerance = tolerance_for(name, golden_dir)
+    if tolerance.get("skip"):
+        result["skipped"] = tolerance["skip"]
+        return result
+    try:
+        # Modes' own print()s would bury the report
+        render = (mode_path, tuple(settings["size"]), settings["seed"], tuple(settings["frames"]), settings["scale"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            if action == "check":
+                frames = render_frames(*render)
+            else:
+                # On a slow and a fast simulated CPU: the frames must be the same
+                frames = render_frames(*render, slowdown=CPU_SLOWDOWNS[0])
+                result["timing"] = timing_changes(frames, render_frames(*render, slowdown=CPU_SLOWDOWNS[1]))
+        if action != "check" and result["timing"]:
+            worst = max(result["timing"].items(), key=lambda item: item[1])
+            result["error"] = f"output depends on timing (frame {worst[0]}: {worst[1]:.2%} of pixels changed)"
+            result["passed"] = False
+            return result
+        if action == "timing":
+            return result
+        if action == "update":
+            result["frames"] = {str(n): save_object(pixels, golden_dir) for n, pixels in frames.items()}
+            return result
+        goldens = load_json(Path(golden_dir) / "index.json", {}).get("modes", {}).get(name)
+        if goldens is None:
+            result["error"] = "no goldens (run update first)"
+            result["passed"] = False
+            return result
+        for n, pixels in frames.items():
+            digest = goldens.get(str(n))
+            if digest == frame_hash(pixels):
+                # Same pixels: nothing to diff
+                result["frames"][str(n)] = {"changed": 0.0, "mean": 0.0, "max": 0.0}
+                continue
+            expected = load_object(digest, golden_dir)
+            passed, stats, distance = compare(expected, pixels, tolerance)
+            result["frames"][str(n)] = stats
+            if not passed:
+                result["passed"] = False
+                if diff_dir:
+                    path = Path(diff_dir) / f"{name} - frame {n}.png"
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    image = diff_image(expected, pixels, distance)
+                    pygame.image.save(pygame.surfarray.make_surface(image.swapaxes(0, 1)), str(path))
+    except Exception as e:
+        result["error"] = f"{e}\n{traceback.format_exc()}"
+        result["passed"] = False
+    return result
+
+
+def run_jobs(action, modes, settings, golden_dir=GOLDEN_DIR, diff_dir=None, jobs=1):
+    """Shard the modes across `jobs` worker processes, yielding results as they finish"""
+    work = [(action, str(mode), settings, str(golden_dir), diff_dir) for mode in modes]
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(jobs, maxtasksperchild=1) as pool:
+        yield from pool.imap_unordered(_run_job, work)
+
+
+def update(modes, golden_dir=GOLDEN_DIR, jobs=1):
+    """Render `modes` and record their frames as the goldens; returns the failures"""
+    index_path = Path(golden_dir) / "index.json"
+    index = load_json(index_path, {})
+    settings = {"size": list(SIZE), "scale": SCALE, "seed": SEED, "frames": list(CAPTURE_FRAMES)}
+    if index.get("settings", settings) != settings:
+        # The old goldens were made another way and can't be mixed with new ones
+        index = {}
+    index["settings"] = settings
+    index.setdefault("modes", {})
+    failures = []
+    for result in run_jobs("update", modes, settings, golden_dir, jobs=jobs):
+        if result["error"]:
+            failures.append(result)
+            print(f"{result['mode']:<36} ERROR {result['error'].splitlines()[0]}")
+        elif result["skipped"]:
+            print(f"{result['mode']:<36} skipped ({result['skipped']})")
+        else:
+            index["modes"][result["mode"]] = result["frames"]
+            print(f"{result['mode']:<36} stored")
+    index["modes"] = dict(sorted(index["modes"].items()))
+    Path(golden_dir).mkdir(parents=True, exist_ok=True)
+    with open(index_path, "w") as f:
+        json.dump(index, f, indent=1)
+        f.write("\n")
+    prune(index, golden_dir)
+    return failures
+
+
+def prune(index, golden_dir=GOLDEN_DIR):
+    """Delete stored frames no mode refers to any more"""
+    used = {digest for frames in index["modes"].values() for digest in frames.values()}
+    for path in (Path(golden_dir) / "objects").glob("*/*.png"):
+        if path.stem not in used:
+            path.unlink()
+
+
+def check(modes, golden_dir=GOLDEN_DIR, diff_dir=None, jobs=1):
+    """Render `modes` and compare them with their goldens; returns the failures"""
+    settings = load_json(Path(golden_dir) / "index.json", {}).get("settings")
+    if settings is None:
+        raise SystemExit(f"No goldens in {golden_dir} (run update first)")
+    failures = []
+    for result in run_jobs("check", modes, settings, golden_dir, diff_dir, jobs):
+        worst = max((stats["changed"] for stats in result["frames"].values()), default=0.0)
+        if result["error"]:
+            status = f"ERROR {result['error'].splitlines()[0]}"
+        elif result["skipped"]:
+            status = f"skipped ({result['skipped']})"
+        elif result["passed"]:
+            status = "same" if worst == 0.0 else f"ok ({worst:.2%} of pixels changed)"
+        else:
+            status = f"DIFFERS ({worst:.2%} of pixels changed)"
+        print(f"{result['mode']:<36} {status}")
+        if not result["passed"]:
+            failures.append(result)
+    return failures
+
+
+def timing(modes, golden_dir=GOLDEN_DIR, jobs=1):
+    """Render `modes` on a slow and a fast simulated CPU; returns the modes whose frames differ"""
+    settings = load_json(Path(golden_dir) / "index.json", {}).get(
+        "settings", {"size": list(SIZE), "scale": SCALE, "seed": SEED, "frames": list(CAPTURE_FRAMES)})
+    failures = []
+    for result in run_jobs("timing", modes, settings, golden_dir, jobs=jobs):
+        if result["skipped"]:
+            status = f"skipped ({result['skipped']})"
+        elif result["error"]:
+            status = f"ERROR {result['error'].splitlines()[0]}"
+        else:
+            status = "steady"
+        print(f"{result['mode']:<36} {status}")
+        if not result["passed"]:
+            failures.append(result)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store or check golden frames of EYESY modes")
+    parser.add_argument("action", choices=["update", "check", "timing"])
+    parser.add_argument("modes", nargs="*", help="mode names (substring match) or mode directories; default all")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes (default: one per CPU)")
+    parser.add_argument("--golden-dir", default=str(GOLDEN_DIR), help=f"golden store (default {GOLDEN_DIR})")
+    parser.add_argument("--diff-dir", help="write golden | new | difference images of failing frames here")
+    args = parser.parse_intermixed_args()
+
+    modes = find_modes(args.modes)
+    if not modes:
+        print("No modes found")
+        sys.exit(1)
+    # Leave through the Pool's cleanup when killed so no workers are left running
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    if args.action == "update":
+        failures = update(modes, args.golden_dir, args.jobs)
+    elif args.action == "timing":
+        failures = timing(modes, args.golden_dir, args.jobs)
+    else:
+        failures = check(modes, args.golden_dir, args.diff_dir, args.jobs)
+
+    print("\n" + "=" * 70)
+    print(f"Modes: {len(modes)}")
+    passed = {"update": "Stored", "check": "Matching", "timing": "Steady"}[args.action]
+    print(f"{passed} or skipped: {len(modes) - len(failures)}")
+    print(f"Failed: {len(failures)}")
+    print("=" * 70)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Image optimization for the web build's mode assets (used by build_web_modes.py).
+
+A mode's Images/ folder is written to web/assets/{mode-id}/ with every PNG
+made as small as it can be without changing what the browser shows:
+
+- losslessly recompressed: the pixel data at zlib level 9, and metadata
+  chunks (text, timestamps, physical size) dropped; color chunks are kept
+- quantized when palette-friendly: a truecolor image with 256 colors or
+  fewer becomes an indexed PNG of exactly those colors
+- downsampled to the web canvas, for modes that only ever draw their images
+  scaled to the full screen (pygame.transform.scale(image, (xres, yres)))
+- small sprites (up to SPRITE_MAX pixels a side) packed into one atlas.png,
+  with each sprite's rectangle in the returned report for the manifest
+
+Whichever encoding is smallest wins, and an image is never made larger.
+Modes that recolor their images through the palette (set_palette_at) keep
+every image as it is, palette and all, and are only recompressed losslessly.
+JPEGs and fonts are copied unchanged.
+
+Quantizing, downsampling and atlases need pygame and NumPy; without them
+images are only recompressed.
+
+Usage:
+    python tools/optimize_assets.py <mode folder> <output folder>
+"""
+
+import ast
+import io
+import math
+import os
+import shutil
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+try:
+    import numpy as np
+    import pygame
+    HAS_PYGAME = True
+except ImportError:
+    HAS_PYGAME = False
+
+# The <canvas> in web/index.html
+WEB_CANVAS = (1280, 720)
+# Images no larger than this on either side go into the mode's atlas
+SPRITE_MAX = 128
+# Gap between sprites, so smoothing while scaling one doesn't pick up its neighbour
+ATLAS_PADDING = 1
+ATLAS_NAME = "atlas.png"
+COPIED_SUFFIXES = ('.ttf', '.jpg', '.jpeg')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Ancillary chunks that change how the browser shows the pixels
+COLOR_CHUNKS = (b'tRNS', b'gAMA', b'cHRM', b'sRGB', b'iCCP', b'sBIT')
+
+
+def read_chunks(data: bytes) -> List[Tuple[bytes, bytes]]:
+    """(type, body) of each chunk in a PNG file"""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("not a PNG file")
+    chunks = []
+    pos = len(PNG_SIGNATURE)
+    while pos < len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        chunks.append((kind, data[pos + 8:pos + 8 + length]))
+        pos += 12 + length
+        if kind == b'IEND':
+            break
+    return chunks
+
+
+def write_chunks(chunks: List[Tuple[bytes, bytes]]) -> bytes:
+    out = [PNG_SIGNATURE]
+    for kind, body in chunks:
+        out.append(struct.pack('>I4s', len(body), kind) + body + struct.pack('>I', zlib.crc32(kind + body)))
+    return b''.join(out)
+
+
+def deflate(data: bytes) -> bytes:
+    """zlib at level 9, with whichever strategy compresses data best"""
+    results = []
+    for strategy in (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+        results.append(compressor.compress(data) + compressor.flush())
+    return min(results, key=len)
+
+
+def recompress(data: bytes) -> bytes:
+    """The same PNG with its pixel data deflated again at level 9 and no metadata chunks"""
+    chunks = read_chunks(data)
+    pixels = zlib.decompress(b''.join(body for kind, body in chunks if kind == b'IDAT'))
+    kept = []
+    for kind, body in chunks:
+        if kind == b'IDAT':
+            if not any(k == b'IDAT' for k, _ in kept):
+                kept.append((b'IDAT', deflate(pixels)))
+        elif kind in (b'IHDR', b'PLTE', b'IEND') or kind in COLOR_CHUNKS:
+            kept.append((kind, body))
+    return write_chunks(kept)
+
+
+def is_indexed(data: bytes) -> bool:
+    """Whether a PNG stores palette indices (color type 3)"""
+    return read_chunks(data)[0][1][9] == 3
+
+
+def encode_png(surface) -> bytes:
+    """A truecolor surface as PNG, through pygame's encoder, then recompressed"""
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, "image.png")
+    return recompress(buffer.getvalue())
+
+
+def rgba_pixels(surface):
+    """(height, width, 4) uint8 array of a surface's pixels; opaque surfaces get alpha 255"""
+    width, height = surface.get_size()
+    return np.frombuffer(pygame.image.tostring(surface, 'RGBA'), dtype=np.uint8).reshape(height, width, 4)
+
+
+def quantize(pixels, color_chunks=()) -> Optional[bytes]:
+    """
+    Pixels as an 8-bit indexed PNG, if they have 256 colors or fewer.
+    Exact: the palette is the image's own colors, nothing is approximated.
+    """
+    height, width = pixels.shape[:2]
+    packed = pixels.reshape(-1, 4).copy().view(np.uint32).ravel()
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        return None
+    palette = colors.view(np.uint8).reshape(-1, 4)
+    rows = np.zeros((height, width + 1), dtype=np.uint8)  # Filter type 0 ahead of each row
+    rows[:, 1:] = indices.reshape(height, width)
+    chunks = [(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0))]
+    chunks += [(kind, body) for kind, body in color_chunks if kind not in (b'tRNS', b'sBIT')]
+    chunks.append((b'PLTE', palette[:, :3].tobytes()))
+    alpha = palette[:, 3]
+    if (alpha != 255).any():
+        # Trailing opaque entries can be left out
+        last = int(np.flatnonzero(alpha != 255)[-1]) + 1
+        chunks.append((b'tRNS', alpha[:last].tobytes()))
+    chunks.append((b'IDAT', deflate(rows.tobytes())))
+    chunks.append((b'IEND', b''))
+    return write_chunks(chunks)
+
+
+def _screen_names(tree) -> Tuple[set, set]:
+    """Names the mode binds to eyesy.xres and eyesy.yres"""
+    xres, yres = {'xres'}, {'yres'}
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Attribute)
+                and node.value.attr in ('xres', 'yres')):
+            names = xres if node.value.attr == 'xres' else yres
+            names.update(target.id for target in node.targets if isinstance(target, ast.Name))
+    return xres, yres
+
+
+def _name(node) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def mode_usage(source: str) -> Dict[str, bool]:
+    """
+    How a mode uses its images, from its source:
+    recolors - it changes palette entries (set_palette_at / set_palette)
+    fits_screen - it scales images to the full screen, and never sizes
+    anything from an image's own size (get_width, get_height, get_size, get_rect)
+    """
+    usage = {"recolors": False, "fits_screen": False}
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        usage["recolors"] = True  # Unknown: leave the images alone
+        return usage
+    xres, yres = _screen_names(tree)
+    sized_by_image = False
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        function = _name(node.func)
+        if function in ('set_palette_at', 'set_palette'):
+            usage["recolors"] = True
+        elif function in ('get_width', 'get_height', 'get_size', 'get_rect'):
+            sized_by_image = True
+        elif function == 'scale' and len(node.args) == 2 and isinstance(node.args[1], (ast.Tuple, ast.List)):
+            size = node.args[1].elts
+            if len(size) == 2 and _name(size[0]) in xres and _name(size[1]) in yres:
+                usage["fits_screen"] = True
+    usage["fits_screen"] = usage["fits_screen"] and not sized_by_image
+    return usage
+
+
+def optimize_png(data: bytes, recolors: bool = False, fits_screen: bool = False) -> bytes:
+    """The smallest encoding of one PNG that the browser shows the same (or downsampled, with fits_screen)"""
+    try:
+        candidates = [data, recompress(data)]
+    except (ValueError, zlib.error, struct.error, IndexError):
+        return data  # Not a PNG we can read: leave it as it is
+    if HAS_PYGAME and not recolors and not is_indexed(data):
+        surface = pygame.image.load(io.BytesIO(data), "image.png")
+        color_chunks = [(kind, body) for kind, body in read_chunks(data) if kind in COLOR_CHUNKS]
+        width, height = surface.get_size()
+        if fits_screen and (width > WEB_CANVAS[0] or height > WEB_CANVAS[1]):
+            # Drawn at the canvas size anyway: nothing larger can show
+            surface = pygame.transform.smoothscale(surface, WEB_CANVAS)
+            candidates = [encode_png(surface)]
+        quantized = quantize(rgba_pixels(surface), color_chunks)
+        if quantized:
+            candidates.append(quantized)
+    return min(candidates, key=len)
+
+
+def pack(sizes: Dict[str, Tuple[int, int]]) -> Tuple[Tuple[int, int], Dict[str, List[int]]]:
+    """Shelf-pack rectangles, tallest first: the atlas size and each name's [x, y, width, height]"""
+    padded_area = sum((w + ATLAS_PADDING) * (h + ATLAS_PADDING) for w, h in sizes.values())
+    atlas_width = max(max(w for w, h in sizes.values()), math.ceil(math.sqrt(padded_area)))
+    rects = {}
+    x = y = shelf = 0
+    for name in sorted(sizes, key=lambda name: (-sizes[name][1], name)):
+        w, h = sizes[name]
+        if x + w > atlas_width:
+            x, y, shelf = 0, y + shelf + ATLAS_PADDING, 0
+        rects[name] = [x, y, w, h]
+        x += w + ATLAS_PADDING
+        shelf = max(shelf, h)
+    return (atlas_width, y + shelf), rects
+
+
+def build_atlas(sprites: Dict[str, bytes]) -> Tuple[bytes, Dict[str, List[int]]]:
+    """One PNG holding every sprite, and each sprite's rectangle in it"""
+    surfaces = {name: pygame.image.load(io.BytesIO(data), name) for name, data in sprites.items()}
+    size, rects = pack({name: surface.get_size() for name, surface in surfaces.items()})
+    atlas = np.zeros((size[1], size[0], 4), dtype=np.uint8)
+    for name, (x, y, w, h) in rects.items():
+        atlas[y:y + h, x:x + w] = rgba_pixels(surfaces[name])
+    surface = pygame.image.frombuffer(atlas.tobytes(), size, 'RGBA')
+    candidates = [encode_png(surface)]
+    quantized = quantize(atlas)
+    if quantized:
+        candidates.append(quantized)
+    return min(candidates, key=len), rects
+
+
+def optimize_images(images_dir: Path, dest_dir: Path, source: str = "") -> Dict:
+    """
+    Write a mode's Images/ folder, optimized, to dest_dir.
+    source is the mode's main.py, to see how it uses its images.
+    Returns {"bytes_in", "bytes_out", "atlas"}; "atlas" is None, or
+    {"file": atlas file name, "sprites": {image name: [x, y, width, height]}}.
+    """
+    usage = mode_usage(source)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    report = {"bytes_in": 0, "bytes_out": 0, "atlas": None}
+    images = {}
+    for path in sorted(images_dir.iterdir()):
+        suffix = path.suffix.lower()
+        if suffix == '.png':
+            images[path.name] = path.read_bytes()
+            report["bytes_in"] += len(images[path.name])
+        elif suffix in COPIED_SUFFIXES:
+            shutil.copy2(path, dest_dir / path.name)
+            report["bytes_in"] += path.stat().st_size
+            report["bytes_out"] += path.stat().st_size
+
+    sprites = {}
+    if HAS_PYGAME and not usage["recolors"]:
+        for name, data in images.items():
+            surface = pygame.image.load(io.BytesIO(data), name)
+            if max(surface.get_size()) <= SPRITE_MAX:
+                sprites[name] = data
+    if len(sprites) >= 2:
+        atlas, rects = build_atlas(sprites)
+        # One request instead of several, as long as it isn't a bigger download
+        separate = sum(len(optimize_png(data, fits_screen=usage["fits_screen"])) for data in sprites.values())
+        if len(atlas) <= separate:
+            (dest_dir / ATLAS_NAME).write_bytes(atlas)
+            report["bytes_out"] += len(atlas)
+            report["atlas"] = {"file": ATLAS_NAME, "sprites": rects}
+        else:
+            sprites = {}
+    else:
+        sprites = {}
+
+    for name, data in images.items():
+        if name in sprites:
+            continue
+        optimized = optimize_png(data, usage["recolors"], usage["fits_screen"])
+        (dest_dir / name).write_bytes(optimized)
+        report["bytes_out"] += len(optimized)
+    return report
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    mode_dir = Path(sys.argv[1])
+    main_py = mode_dir / "main.py"
+    source = main_py.read_text(encoding='utf-8') if main_py.exists() else ""
+    report = optimize_images(mode_dir / "Images", Path(sys.argv[2]), source)
+    print(f"{report['bytes_in'] // 1024} KB -> {report['bytes_out'] // 1024} KB")
+    if report["atlas"]:
+        print(f"{len(report['atlas']['sprites'])} sprites packed into {report['atlas']['file']}")
+
+
+if __name__ == "__main__":
+    main()
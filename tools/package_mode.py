@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Package EYESY modes for uploading to the hardware.
+
+Modes that use a shared engine import it from examples/lib/, which the
+runner and the web app put on sys.path but the EYESY doesn't have. This
+copies each mode folder to the output folder and vendors the examples/lib
+modules it imports (found by parsing its Python, and the libraries' own
+imports in turn) next to its main.py, where the mode falls back to them.
+The packaged folder is what goes into the EYESY's Modes directory.
+
+Usage:
+    python tools/package_mode.py [--out DIR] <mode folders...>
+
+    python tools/package_mode.py "examples/scopes/S - Rain" "examples/utilities/U - Webcam"
+"""
+
+import argparse
+import ast
+import shutil
+import sys
+from pathlib import Path
+from typing import List, Set
+
+project_root = Path(__file__).parent.parent
+LIB_DIR = project_root / "examples" / "lib"
+OUT_DIR = project_root / "deploy"
+
+
+def imported_modules(source: str) -> Set[str]:
+    """Top-level names of the modules a piece of Python source imports"""
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split('.')[0])
+    return names
+
+
+def needed_libs(mode_path: Path, lib_dir: Path = LIB_DIR) -> List[Path]:
+    """The shared modules a mode imports, directly or through another shared module"""
+    available = {lib.stem: lib for lib in lib_dir.glob("*.py")}
+    needed = {}
+    pending = [path for path in Path(mode_path).glob("*.py") if path.stem not in available]
+    while pending:
+        source = pending.pop().read_text(encoding='utf-8')
+        for name in imported_modules(source) & available.keys() - needed.keys():
+            needed[name] = available[name]
+            pending.append(available[name])
+    return [needed[name] for name in sorted(needed)]
+
+
+def package_mode(mode_path: Path, out_dir: Path = OUT_DIR, lib_dir: Path = LIB_DIR) -> List[Path]:
+    """
+    Copy a mode folder into out_dir with its shared modules next to main.py,
+    replacing an earlier package of the same mode. Returns the vendored modules.
+    """
+    mode_path = Path(mode_path)
+    if not (mode_path / "main.py").exists():
+        raise FileNotFoundError(f"main.py not found in {mode_path}")
+    dest = Path(out_dir) / mode_path.name
+    if dest.resolve() == mode_path.resolve():
+        raise ValueError(f"{mode_path} would be packaged over itself")
+    libs = needed_libs(mode_path, lib_dir)
+    if dest.exists():
+        shutil.rmtree(dest)
+    shutil.copytree(mode_path, dest, ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+    for lib in libs:
+        shutil.copy2(lib, dest / lib.name)
+    return libs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Package EYESY modes, with their shared modules, for the hardware")
+    parser.add_argument("modes", nargs="+", help="mode directories")
+    parser.add_argument("--out", default=str(OUT_DIR), help=f"where the packaged folders go (default {OUT_DIR})")
+    args = parser.parse_args()
+
+    failures = 0
+    for mode in args.modes:
+        try:
+            libs = package_mode(Path(mode), Path(args.out))
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"❌ {mode}: {e}")
+            failures += 1
+            continue
+        vendored = ", ".join(lib.name for lib in libs) or "no shared modules"
+        print(f"✅ {Path(args.out) / Path(mode).name} ({vendored})")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Static performance inspector for EYESY modes.
+
+Reads a mode's source (no running it) and points out the anti-patterns that
+keep turning up in this repo's modes, on their hot path: draw() and every
+module-level function draw() calls, directly or not.
+
+- pygame.image.load() per frame: decodes the file again every frame
+- a font created per frame (pygame.font.Font / SysFont, pygame.freetype)
+- pygame.time.Clock() / tick() per frame: sleeps inside draw(), on top of
+  the host's own frame pacing
+- a copy of the whole screen per frame (screen.copy()), and scaling or
+  rotating surfaces per frame (the feedback modes do both)
+- a new pygame.Surface per frame
+- time.time() (or perf_counter, monotonic) called inside a loop
+- print() per frame
+- pygame.image.load() without .convert() / .convert_alpha(), anywhere:
+  every blit from an unconverted image converts its pixels again
+
+Each finding is scored by how costly the pattern is, multiplied for every
+loop it sits in, and findings of the same kind in the same function are
+reported together, with their line numbers. inspect_*() return them worst
+first.
+
+Used when EYESYRunner.load_mode() loads a mode, by build_web_modes.py for
+every mode it builds, and by audit_examples.py.
+
+Usage:
+    python tools/perf_inspector.py [mode folders...]   (default: all of examples/)
+"""
+
+import ast
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+project_root = Path(__file__).parent.parent
+
+# Rule -> (weight, what it costs). Hot-path rules count only in draw() and what it calls
+RULES = {
+    'image_load_per_frame': (100, "pygame.image.load() decodes the file every frame; load it once in setup()"),
+    'font_per_frame': (90, "creates a font every frame; create it once in setup()"),
+    'clock_per_frame': (80, "Clock().tick() sleeps inside draw(); the host already paces frames"),
+    'screen_copy_per_frame': (60, "copies the whole screen every frame"),
+    'transform_per_frame': (30, "scales or rotates a surface every frame"),
+    'surface_per_frame': (40, "allocates a new Surface every frame; keep one from setup()"),
+    'time_in_loop': (50, "reads the clock on every loop iteration; read it once per frame"),
+    'print_per_frame': (45, "prints every frame"),
+    'load_without_convert': (20, "image not converted (.convert() / .convert_alpha()); every blit converts it again"),
+}
+# A finding inside a loop counts this many times more, per loop
+LOOP_FACTOR = 4
+
+FONT_CALLS = {'Font', 'SysFont'}
+CLOCK_CALLS = {'Clock', 'tick', 'tick_busy_loop'}
+TRANSFORM_CALLS = {'scale', 'smoothscale', 'rotate', 'rotozoom', 'scale2x', 'scale_by', 'smoothscale_by'}
+TIME_CALLS = {'time', 'perf_counter', 'monotonic', 'process_time'}
+LOOPS = (ast.For, ast.AsyncFor, ast.While, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+
+class Finding(NamedTuple):
+    score: int
+    rule: str
+    function: str
+    lines: List[int]
+    message: str
+
+
+def _dotted(node) -> str:
+    """'pygame.image.load' for the expression a call is made on (names and attributes only)"""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+    return '.'.join(reversed(parts))
+
+
+def _hot_functions(tree) -> Dict[str, ast.FunctionDef]:
+    """draw() and the module-level functions it calls, directly or through each other"""
+    functions = {node.name: node for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+    hot = {}
+    pending = ['draw'] if 'draw' in functions else []
+    while pending:
+        name = pending.pop()
+        if name in hot:
+            continue
+        hot[name] = functions[name]
+        for call, _ in _calls(functions[name]):
+            if isinstance(call.func, ast.Name) and call.func.id in functions:
+                pending.append(call.func.id)
+    return hot
+
+
+def _calls(function):
+    """
+    (call, loop depth) for every call in a function, not counting nested
+    function bodies, nor cached results: a global assigned under an if (as in
+    `if size != stamp_size: stamps = make_stamps(...)`) is only rebuilt when
+    something changed, not every frame
+    """
+    cached = {name for node in ast.walk(function) if isinstance(node, ast.Global) for name in node.names}
+    stack = [(child, 0, False) for child in ast.iter_child_nodes(function)]
+    while stack:
+        node, depth, guarded = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        if guarded and isinstance(node, ast.Assign) and all(
+                isinstance(target, ast.Name) and target.id in cached for target in node.targets):
+            continue
+        if isinstance(node, ast.Call):
+            yield node, depth
+        inner = depth + 1 if isinstance(node, LOOPS) else depth
+        for child in ast.iter_child_nodes(node):
+            stack.append((child, inner, guarded or isinstance(node, ast.If)))
+
+
+def _hot_rule(call, depth, screen) -> Optional[str]:
+    name = _dotted(call.func)
+    last = name.rsplit('.', 1)[-1]
+    if name.endswith('image.load'):
+        return 'image_load_per_frame'
+    if last in FONT_CALLS and ('font' in name or 'freetype' in name):
+        return 'font_per_frame'
+    if last == 'Clock' or (last in CLOCK_CALLS and 'clock' in name.lower()):
+        return 'clock_per_frame'
+    if screen and name == f'{screen}.copy':
+        return 'screen_copy_per_frame'
+    if last in TRANSFORM_CALLS and 'transform' in name:
+        return 'transform_per_frame'
+    if name in ('pygame.Surface', 'Surface'):
+        return 'surface_per_frame'
+    if depth and last in TIME_CALLS and name.startswith('time.'):
+        return 'time_in_loop'
+    if name == 'print':
+        return 'print_per_frame'
+    return None
+
+
+def inspect_tree(tree: ast.Module) -> List[Finding]:
+    """Findings for a parsed mode, worst first"""
+    groups = {}  # (rule, function) -> [score, lines]
+
+    def add(rule, function, line, depth):
+        group = groups.setdefault((rule, function), [0, []])
+        group[0] += RULES[rule][0] * LOOP_FACTOR ** depth
+        group[1].append(line)
+
+    for name, function in _hot_functions(tree).items():
+        args = function.args.args
+        screen = args[0].arg if name == 'draw' and args else None
+        for call, depth in _calls(function):
+            rule = _hot_rule(call, depth, screen)
+            if rule:
+                add(rule, name, call.lineno, depth)
+
+    # Unconverted images, wherever they are loaded
+    converted = {id(node.func.value) for node in ast.walk(tree)
+                 if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                 and node.func.attr in ('convert', 'convert_alpha')}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and _dotted(node.func).endswith('image.load') and id(node) not in converted:
+            add('load_without_convert', '', node.lineno, 0)
+
+    findings = [Finding(score, rule, function, sorted(lines), RULES[rule][1])
+                for (rule, function), (score, lines) in groups.items()]
+    return sorted(findings, key=lambda finding: (-finding.score, finding.lines[0]))
+
+
+def inspect_source(source: str, filename: str = '<mode>') -> List[Finding]:
+    """Findings for a mode's source, worst first ([] if it doesn't parse)"""
+    try:
+        return inspect_tree(ast.parse(source, filename=filename))
+    except SyntaxError:
+        return []
+
+
+def inspect_mode(mode_path) -> List[Finding]:
+    """Findings for a mode folder's main.py, worst first"""
+    main_py = Path(mode_path) / 'main.py'
+    return inspect_source(main_py.read_text(encoding='utf-8'), str(main_py))
+
+
+def format_findings(findings: List[Finding], limit: Optional[int] = None, indent: str = '   ') -> str:
+    """One line per finding: score, where, what; limit keeps the worst few"""
+    shown = findings if limit is None else findings[:limit]
+    lines = []
+    for finding in shown:
+        where = ', '.join(map(str, finding.lines[:6])) + (', ...' if len(finding.lines) > 6 else '')
+        scope = f" in {finding.function}()" if finding.function else ""
+        count = f" ({len(finding.lines)}x)" if len(finding.lines) > 1 else ""
+        lines.append(f"{indent}{finding.score:6d}  line {where}{scope}{count}: {finding.message}")
+    if len(findings) > len(shown):
+        lines.append(f"{indent}        ... and {len(findings) - len(shown)} more")
+    return '\n'.join(lines)
+
+
+def main():
+    paths = [Path(arg) for arg in sys.argv[1:]] or sorted(
+        path.parent for path in (project_root / 'examples').glob('*/*/main.py'))
+    results = [(path, inspect_mode(path)) for path in paths if (path / 'main.py').exists()]
+    results = [(path, findings) for path, findings in results if findings]
+    # Modes with the most to gain first
+    results.sort(key=lambda result: -sum(finding.score for finding in result[1]))
+    for path, findings in results:
+        print(f"{path.name}  (score {sum(finding.score for finding in findings)})")
+        print(format_findings(findings))
+    print(f"\n{len(results)} of {len(paths)} modes have findings")
+
+
+if __name__ == "__main__":
+    main()
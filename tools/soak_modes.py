@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Long-run soak test for EYESY modes.
+
+Drives each mode headlessly for many frames on the simulator's frame clock,
+with knobs, triggers and MIDI notes changing at random, and samples
+tracemalloc (Python and NumPy memory), process RSS (pygame Surfaces and other
+C allocations) and draw() time along the way. A mode is reported when any of
+them keeps climbing: the kind of slow leak that only shows up after days on an
+installation. tracemalloc runs over the last part of the run only, so it does
+not skew the draw times.
+
+Each mode soaks in its own process so RSS belongs to that mode alone.
+
+Usage:
+    python tools/soak_modes.py [options] [mode names or paths...]
+
+    python tools/soak_modes.py --frames 50000 "S - Boids" "U - Timer"
+    python tools/soak_modes.py --jobs 4 --json soak.json
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import multiprocessing
+import os
+import random
+import signal
+import statistics
+import sys
+import time
+import tracemalloc
+import traceback
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Once, not once per worker
+
+import numpy as np
+import pygame
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.eyesy_runner import EYESYSimulator, use_frame_clock
+
+MODE_DIRS = ["scopes", "triggers", "utilities", "mixed"]
+
+# Chance per frame of a knob move, a trigger, and a knob landing on 0 or 1
+KNOB_MOVE_CHANCE = 1 / 30
+TRIGGER_CHANCE = 0.03
+KNOB_EXTREME_CHANCE = 0.1
+
+# What counts as growth between the first and last quarter of a measurement
+TRACED_GROWTH = 100 * 1024  # bytes
+RSS_GROWTH = 4 * 1024 * 1024  # bytes
+FRAME_TIME_RATIO = 1.25
+FRAME_TIME_GROWTH = 0.25  # ms
+
+# Share of the run (at the end) traced with tracemalloc
+TRACED_SHARE = 0.3
+
+# Seconds of simulated audio generated up front and looped; generating it every
+# frame costs as much as many modes' draw(), and far more under tracemalloc
+AUDIO_LOOP_SECONDS = 10
+
+
+def find_modes(names=()):
+    """Mode directories under examples/, narrowed to `names` (substrings or paths)"""
+    modes = []
+    for subdir in MODE_DIRS:
+        subdir_path = project_root / "examples" / subdir
+        if subdir_path.exists():
+            modes.extend(d for d in subdir_path.iterdir() if (d / "main.py").exists())
+    modes.sort()
+    if not names:
+        return modes
+    selected = []
+    for name in names:
+        path = Path(name)
+        if (path / "main.py").exists():
+            selected.append(path)
+        else:
+            selected.extend(m for m in modes if name.lower() in m.name.lower())
+    return selected
+
+
+def current_rss():
+    """Resident set size of this process in bytes (None where it can't be read)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Peak rather than current, but it still rises with a leak (KiB on Linux, bytes on macOS)
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+def rising(values, min_increase=0.0, min_ratio=1.0):
+    """True if `values` climb from each quarter of the run to the next
+
+    Quarter medians ride out the noise of garbage collection and allocator
+    pools; a leak pushes every one of them up, while a cache that fills and
+    then stays put levels off.
+    """
+    values = [v for v in values if v is not None]
+    if len(values) < 8:
+        return False
+    size = len(values) // 4
+    medians = [statistics.median(values[i * size:(i + 1) * size]) for i in range(4)]
+    if any(later <= earlier for earlier, later in zip(medians, medians[1:])):
+        return False
+    return medians[-1] - medians[0] >= min_increase and medians[-1] >= medians[0] * min_ratio
+
+
+def load_mode(mode_path, eyesy):
+    main_py = Path(mode_path) / "main.py"
+    spec = importlib.util.spec_from_file_location("main", str(main_py))
+    module = importlib.util.module_from_spec(spec)
+    eyesy.set_mode_root(str(mode_path))
+    eyesy.mode = Path(mode_path).name
+    spec.loader.exec_module(module)
+    use_frame_clock(module, eyesy)
+    return module
+
+
+def shake_controls(eyesy, rng):
+    """One frame of a restless performer: knob moves, triggers and MIDI notes"""
+    if rng.random() < KNOB_MOVE_CHANCE:
+        value = rng.choice((0.0, 1.0)) if rng.random() < KNOB_EXTREME_CHANCE else rng.random()
+        setattr(eyesy, f"knob{rng.randint(1, 5)}", value)
+    eyesy.trig = rng.random() < TRIGGER_CHANCE
+    eyesy.midi_note_new = eyesy.trig
+    if eyesy.trig:
+        note = rng.randrange(128)
+        eyesy.midi_notes[note] = not eyesy.midi_notes[note]
+
+
+def audio_loop(eyesy, frames):
+    """`frames` frames of the simulator's audio as (audio_in, audio_trig) pairs"""
+    loop = []
+    for _ in range(frames):
+        eyesy.update_audio()
+        loop.append((eyesy.audio_in, eyesy.audio_trig))
+    return loop
+
+
+def soak_mode(mode_path, frames=20000, samples=50, seed=0, size=(1280, 720), trace=True):
+    """Run one mode for `frames` frames and return its memory and timing samples
+
+    The first tenth of the run is warm-up (caches filling, histories reaching
+    their length) and is not sampled. tracemalloc is only switched on for the
+    last TRACED_SHARE of the run: tracing every allocation slows allocation-heavy
+    modes by an order of magnitude, so draw times are taken before it starts and
+    traced memory after. Each sample is
+    (frame, traced bytes or None, RSS bytes, mean draw ms or None).
+    """
+    mode_path = Path(mode_path)
+    result = {"mode": mode_path.name, "path": str(mode_path), "frames": 0,
+              "samples": [], "growth": [], "flags": [], "error": None}
+    rng = random.Random(seed)
+    random.seed(seed)
+    np.random.seed(seed)
+    pygame.init()
+    pygame.display.set_mode(size, pygame.HIDDEN)
+    screen = pygame.Surface(size)
+    eyesy = EYESYSimulator(*size)
+    eyesy.fixed_timestep = True
+    audio = audio_loop(eyesy, AUDIO_LOOP_SECONDS * eyesy.fps)
+    warmup = frames // 10
+    traced_from = frames - int(frames * TRACED_SHARE) if trace else frames + 1
+    sample_every = max(1, (frames - warmup) // samples)
+    baseline = None
+    try:
+        module = load_mode(mode_path, eyesy)
+        eyesy.update_audio()
+        module.setup(screen, eyesy)
+        draw_time = 0.0
+        for frame in range(1, frames + 1):
+            eyesy.advance_frame()
+            # Fresh lists each frame, as update_audio() gives
+            audio_in, eyesy.audio_trig = audio[frame % len(audio)]
+            eyesy.audio_in = list(audio_in)
+            eyesy.audio_in_r = list(audio_in)
+            shake_controls(eyesy, rng)
+            if eyesy.auto_clear:
+                screen.fill(tuple(eyesy.bg_color))
+            start = time.perf_counter()
+            module.draw(screen, eyesy)
+            draw_time += time.perf_counter() - start
+            result["frames"] = frame
+            if frame == traced_from:
+                gc.collect()
+                tracemalloc.start()
+                baseline = tracemalloc.take_snapshot()
+                draw_time = 0.0
+            elif frame == warmup:
+                draw_time = 0.0
+            elif frame > warmup and (frame - warmup) % sample_every == 0:
+                gc.collect()
+                if baseline is None:
+                    traced, draw_ms = None, draw_time / sample_every * 1000.0
+                else:
+                    traced, draw_ms = tracemalloc.get_traced_memory()[0], None
+                result["samples"].append((frame, traced, current_rss(), draw_ms))
+                draw_time = 0.0
+        if baseline is not None:
+            # Where the memory went: the source lines holding the most new memory
+            stats = tracemalloc.take_snapshot().compare_to(baseline, 'lineno')
+            result["growth"] = [str(stat) for stat in stats[:5] if stat.size_diff > 0]
+    except Exception as e:
+        result["error"] = f"{e}\n{traceback.format_exc()}"
+    finally:
+        tracemalloc.stop()
+    result["flags"] = check(result["samples"])
+    return result
+
+
+def check(samples):
+    """Names of the measurements that grew for as long as they were taken"""
+    if not samples:
+        return []
+    _, traced, rss, frame_ms = zip(*samples)
+    flags = []
+    if rising(traced, TRACED_GROWTH):
+        flags.append("traced memory")
+    if rising(rss, RSS_GROWTH):
+        flags.append("RSS")
+    if rising(frame_ms, FRAME_TIME_GROWTH, FRAME_TIME_RATIO):
+        flags.append("frame time")
+    return flags
+
+
+def _soak_worker(job):
+    mode_path, kwargs = job
+    return soak_mode(mode_path, **kwargs)
+
+
+def megabytes(value):
+    return "-" if value is None else f"{value / (1024 * 1024):.1f}M"
+
+
+def print_result(result):
+    samples = result["samples"]
+    if result["error"]:
+        status = "ERROR"
+    else:
+        status = ("GROWS: " + ", ".join(result["flags"])) if result["flags"] else "steady"
+    line = f"{result['mode']:<36} {result['frames']:>7} frames  {status}"
+    if samples:
+        # First and last value of each measurement (traced memory and draw time cover part of the run)
+        _, traced, rss, frame_ms = ([v for v in column if v is not None] or [None] for column in zip(*samples))
+        line += (f"\n    traced {megabytes(traced[0])} -> {megabytes(traced[-1])}"
+                 f"  RSS {megabytes(rss[0])} -> {megabytes(rss[-1])}")
+        if frame_ms[0] is not None:
+            line += f"  draw {frame_ms[0]:.2f} -> {frame_ms[-1]:.2f} ms"
+    print(line)
+    if result["error"]:
+        print("    " + result["error"].split('\n')[0])
+    elif result["flags"]:
+        for stat in result["growth"][:3]:
+            print(f"    {stat}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak EYESY modes and report memory or frame-time growth")
+    parser.add_argument("modes", nargs="*", help="mode names (substring match) or mode directories; default all")
+    parser.add_argument("--frames", type=int, default=20000, help="frames per mode (default 20000)")
+    parser.add_argument("--samples", type=int, default=50, help="measurements per run (default 50)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for audio, knobs and triggers")
+    parser.add_argument("--jobs", type=int, default=1, help="modes soaked in parallel (default 1)")
+    parser.add_argument("--size", default="1280x720", help="screen size (default 1280x720)")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="skip tracemalloc (faster; RSS and frame time only)")
+    parser.add_argument("--json", metavar="PATH", help="also write every sample to a JSON file")
+    args = parser.parse_args()
+
+    modes = find_modes(args.modes)
+    if not modes:
+        print("No modes found")
+        sys.exit(1)
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    kwargs = {"frames": args.frames, "samples": args.samples, "seed": args.seed,
+              "size": (width, height), "trace": not args.no_tracemalloc}
+    print(f"Soaking {len(modes)} modes for {args.frames} frames each\n")
+
+    # Leave through the Pool's cleanup when killed (a CI timeout) so no workers are left soaking
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    results = []
+    # A fresh process per mode keeps RSS and leftover module state from bleeding between modes
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(args.jobs, maxtasksperchild=1) as pool:
+        for result in pool.imap(_soak_worker, [(str(m), kwargs) for m in modes]):
+            print_result(result)
+            results.append(result)
+
+    flagged = [r for r in results if r["flags"] or r["error"]]
+    print("\n" + "=" * 70)
+    print(f"Modes soaked: {len(results)}")
+    print(f"Steady: {len(results) - len(flagged)}")
+    print(f"Growing or failing: {len(flagged)}")
+    for result in flagged:
+        print(f"  {result['mode']}: {'error' if result['error'] else ', '.join(result['flags'])}")
+    print("=" * 70)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the draw() allocation profiler (tools/alloc_profiler.py), on
+stand-in draw functions with known allocation and garbage behaviour.
+
+Run with: python -m pytest tools/test_alloc_profiler.py
+"""
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.alloc_profiler import AllocationProfiler
+
+
+def quiet_draw(screen, eyesy):
+    return None
+
+
+def churning_draw(screen, eyesy):
+    points = [(i, i * 2) for i in range(2000)]  # Tuples alive when draw() returns
+    scratch = [bytes(1000) for _ in range(100)]  # Freed before it returns
+    del scratch
+    return len(points)
+
+
+def cyclic_draw(screen, eyesy):
+    # Reference cycles only the garbage collector can free
+    for _ in range(2000):
+        node = {}
+        node["self"] = node
+
+
+def run(profiler, draw, name, frames=20):
+    wrapped = profiler.wrap(draw, name)
+    return [wrapped(None, None) for _ in range(frames)]
+
+
+def test_allocations_and_lines_are_attributed():
+    profiler = AllocationProfiler(snapshot_every=5).start()
+    try:
+        assert run(profiler, churning_draw, "Churn")[0] == 2000
+        run(profiler, quiet_draw, "Quiet")
+    finally:
+        profiler.stop()
+    rows = {row["mode"]: row for row in profiler.report()}
+    assert rows["Churn"]["frames"] == 20
+    # The peak includes the scratch buffers freed inside the frame
+    assert rows["Churn"]["kb_per_frame"] > 100
+    assert rows["Churn"]["blocks_per_frame"] >= 2000
+    assert rows["Quiet"]["kb_per_frame"] < 1
+    filename, lineno, size, blocks = profiler.profiles["Churn"].top_lines(1)[0]
+    assert filename == __file__
+    assert lineno == churning_draw.__code__.co_firstlineno + 1
+    assert blocks >= 2000
+
+
+def test_gc_pauses_are_counted_and_ranked():
+    gc.collect()
+    profiler = AllocationProfiler().start()
+    try:
+        run(profiler, quiet_draw, "Quiet")
+        run(profiler, cyclic_draw, "Cycles")
+    finally:
+        profiler.stop()
+    rows = profiler.report()
+    assert rows[0]["mode"] == "Cycles"
+    assert sum(rows[0]["collections"]) > 0
+    assert rows[0]["gc_max_ms"] > 0
+    assert "Cycles" in profiler.format_report()
+
+
+def test_stop_leaves_no_hooks_behind():
+    was_tracing = tracemalloc.is_tracing()
+    profiler = AllocationProfiler(snapshot_every=1).start()
+    run(profiler, churning_draw, "Churn", frames=2)
+    profiler.stop()
+    assert profiler._gc_callback not in gc.callbacks
+    assert sys.getprofile() is None
+    assert tracemalloc.is_tracing() == was_tracing
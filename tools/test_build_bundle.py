@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the precompiled mode bundle written by tools/build_web_modes.py,
+read back the way web/js/mode-runner.js reads it: a mode's .pyc sliced out
+of the zip by its manifest offset, and the library modules imported from the
+zip on sys.path.
+
+Run with: python -m pytest tools/test_build_bundle.py
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools import build_web_modes
+from tools.build_web_modes import ModeBuilder
+from tools.eyesy_runner import EYESYSimulator
+
+MODES = [('scopes', 'S - Grid Circles - Column Color'), ('scopes', 'S - Classic Horizontal')]
+
+pytestmark = pytest.mark.skipif(sys.version_info[:2] != build_web_modes.TARGET_PYTHON,
+                                reason="bundles are only built on the web app's Python version")
+
+
+@pytest.fixture
+def build(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_web_modes, 'WEB_MODES_DIR', tmp_path)
+    monkeypatch.setattr(build_web_modes, 'WEB_MANIFEST', tmp_path / 'manifest.json')
+
+    def run():
+        builder = ModeBuilder()
+        built = []
+        for category, name in MODES:
+            folder = build_web_modes.EXAMPLES_DIR / category / name
+            built.append((builder.process_mode_folder(folder, category, 'examples'), folder / 'main.py'))
+        return builder.write_bundle(built), [mode for mode, _ in built]
+    return run
+
+
+def test_modes_run_from_their_slice_of_the_bundle(build, monkeypatch):
+    bundle, modes = build()
+    data = (build_web_modes.WEB_MODES_DIR / Path(bundle['path']).name).read_bytes()
+    assert bundle['sha256'] == hashlib.sha256(data).hexdigest() and bundle['size'] == len(data)
+    assert bundle['magic'] == importlib.util.MAGIC_NUMBER.hex()
+
+    # Library modules import from the zip itself
+    zip_path = str(build_web_modes.WEB_MODES_DIR / Path(bundle['path']).name)
+    monkeypatch.syspath_prepend(zip_path)
+    monkeypatch.delitem(sys.modules, 'eyesy_grid', raising=False)
+
+    with zipfile.ZipFile(zip_path) as archive:
+        assert 'eyesy_grid.pyc' in archive.namelist()
+        for mode in modes:
+            entry = mode['bundle']
+            pyc = data[entry['offset']:entry['offset'] + entry['length']]
+            assert pyc == archive.read(f"modes/{mode['id']}.pyc")
+            assert hashlib.sha256(pyc).hexdigest() == entry['sha256']
+
+            namespace = {'__name__': '__main__', '__file__': mode['path']}
+            exec(marshal.loads(pyc[bundle['header_size']:]), namespace)
+            eyesy = EYESYSimulator(320, 240)
+            screen = pygame.Surface((320, 240))
+            namespace['setup'](screen, eyesy)
+            namespace['draw'](screen, eyesy)
+    assert sys.modules['eyesy_grid'].__file__.startswith(zip_path)
+
+
+def test_bundle_name_follows_its_contents(build):
+    first, _ = build()
+    second, _ = build()
+    assert first == second
+    assert [path.name for path in build_web_modes.WEB_MODES_DIR.glob('modes-*.zip')] == [Path(first['path']).name]
+
+
+def test_no_bundle_for_another_python(build, monkeypatch):
+    monkeypatch.setattr(build_web_modes, 'TARGET_PYTHON', (3, 0))
+    bundle, modes = build()
+    assert bundle is None
+    assert not any('bundle' in mode for mode in modes)
+    assert not list(build_web_modes.WEB_MODES_DIR.glob('modes-*.zip'))
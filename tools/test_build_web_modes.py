@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental web mode builds (tools/build_web_modes.py): only modes
+whose source or assets changed since the last build are rebuilt.
+
+Run with: python -m pytest tools/test_build_web_modes.py
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools import build_web_modes
+from tools.build_web_modes import ModeBuilder
+
+MODES = [('scopes', 'S - Classic Horizontal'), ('triggers', 'T - Basic Image')]
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """A two-mode examples/ tree and an empty web/ to build it into"""
+    examples = tmp_path / 'examples'
+    for category, name in MODES:
+        shutil.copytree(project_root / 'examples' / category / name, examples / category / name)
+    web = tmp_path / 'web'
+    shutil.copytree(project_root / 'examples' / 'lib', examples / 'lib', ignore=shutil.ignore_patterns('__pycache__'))
+    monkeypatch.setattr(build_web_modes, 'EXAMPLES_DIR', examples)
+    monkeypatch.setattr(build_web_modes, 'LIB_DIR', examples / 'lib')
+    monkeypatch.setattr(build_web_modes, 'CUSTOM_DIR', tmp_path / 'custom')
+    monkeypatch.setattr(build_web_modes, 'WEB_MODES_DIR', web / 'modes')
+    monkeypatch.setattr(build_web_modes, 'WEB_ASSETS_DIR', web / 'assets')
+    monkeypatch.setattr(build_web_modes, 'WEB_MANIFEST', web / 'modes' / 'manifest.json')
+    return tmp_path
+
+
+def build(monkeypatch):
+    """Run a build; returns the ids of the modes it rebuilt, and the manifest"""
+    rebuilt = []
+    build_mode = ModeBuilder.build_mode
+
+    def recording(self, mode):
+        rebuilt.append(mode['id'])
+        return build_mode(self, mode)
+
+    monkeypatch.setattr(ModeBuilder, 'build_mode', recording)
+    assert ModeBuilder().build()
+    return sorted(rebuilt), json.loads(build_web_modes.WEB_MANIFEST.read_text(encoding='utf-8'))
+
+
+def test_unchanged_modes_are_skipped(tree, monkeypatch):
+    rebuilt, manifest = build(monkeypatch)
+    assert rebuilt == ['s---classic-horizontal', 't---basic-image']
+    assert all(len(mode['hash']) == 16 for mode in manifest['modes'])
+    assert (build_web_modes.WEB_ASSETS_DIR / 't---basic-image' / 'airport.png').exists()
+
+    manifest_text = build_web_modes.WEB_MANIFEST.read_text(encoding='utf-8')
+    rebuilt, _ = build(monkeypatch)
+    assert rebuilt == []
+    # Not even the build date moves when nothing changed
+    assert build_web_modes.WEB_MANIFEST.read_text(encoding='utf-8') == manifest_text
+
+
+def test_an_edit_rebuilds_only_that_mode(tree, monkeypatch):
+    _, before = build(monkeypatch)
+    image = tree / 'examples' / 'triggers' / 'T - Basic Image' / 'Images' / 'airport.png'
+    image.write_bytes(image.read_bytes() + b'\0')
+    rebuilt, after = build(monkeypatch)
+    assert rebuilt == ['t---basic-image']
+    hashes = [(old['hash'] == new['hash']) for old, new in zip(before['modes'], after['modes'])]
+    assert hashes == [True, False]
+    assert after['build_date'] >= before['build_date']
+
+    # Deleted output is rebuilt even though the source didn't change
+    (build_web_modes.WEB_MODES_DIR / 's---classic-horizontal.py').unlink()
+    rebuilt, _ = build(monkeypatch)
+    assert rebuilt == ['s---classic-horizontal']
+
+
+def test_removed_modes_lose_their_output(tree, monkeypatch):
+    build(monkeypatch)
+    shutil.rmtree(tree / 'examples' / 'triggers' / 'T - Basic Image')
+    _, manifest = build(monkeypatch)
+    assert [mode['id'] for mode in manifest['modes']] == ['s---classic-horizontal']
+    assert not (build_web_modes.WEB_MODES_DIR / 't---basic-image.py').exists()
+    assert not (build_web_modes.WEB_ASSETS_DIR / 't---basic-image').exists()
+
+
+def test_shared_modules_are_copied_for_loading_from_source(tree, monkeypatch):
+    _, manifest = build(monkeypatch)
+    lib = tree / 'examples' / 'lib'
+    names = sorted(path.name for path in lib.glob('*.py'))
+    assert [entry['path'] for entry in manifest['lib']] == [f'modes/lib/{name}' for name in names]
+    for name in names:
+        assert (build_web_modes.WEB_MODES_DIR / 'lib' / name).read_bytes() == (lib / name).read_bytes()
+    (lib / 'eyesy_images.py').unlink()
+    _, manifest = build(monkeypatch)
+    assert 'modes/lib/eyesy_images.py' not in [entry['path'] for entry in manifest['lib']]
+    assert not (build_web_modes.WEB_MODES_DIR / 'lib' / 'eyesy_images.py').exists()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the background camera capture used by the webcam modes
+(examples/lib/eyesy_capture.py), driven by synthetic frames so no camera is needed.
+
+Run with: python -m pytest tools/test_capture.py
+"""
+
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pygame
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'examples' / 'lib'))
+
+import eyesy_capture
+from eyesy_capture import (CaptureStream, FFmpegPipeSource, SyntheticSource,
+                           close_all_streams, convert_frame, frame_surface, open_stream,
+                           upload_frame)
+
+
+def wait_for_frames(stream, count, timeout=5.0):
+    """Poll latest() until the stream has published `count` frames"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        frame, frame_id = stream.latest()
+        if frame_id >= count:
+            return frame, frame_id
+        time.sleep(0.005)
+    raise AssertionError(f"stream only published {stream.frame_id} of {count} frames")
+
+
+@pytest.fixture(autouse=True)
+def stop_streams():
+    yield
+    close_all_streams()
+
+
+def test_convert_frame_swaps_bgr_and_resizes():
+    frame = np.zeros((48, 64, 3), np.uint8)
+    frame[:, :, 0] = 200  # Blue in BGR order
+    out = np.empty((24, 32, 3), np.uint8)
+    convert_frame(frame, out, bgr=True)
+    assert (out[:, :, 2] == 200).all()
+    assert (out[:, :, 0] == 0).all()
+
+
+def test_convert_frame_without_opencv(monkeypatch):
+    monkeypatch.setattr(eyesy_capture, 'cv2', None)
+    frame = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+    out = np.empty((2, 3, 3), np.uint8)
+    convert_frame(frame, out, bgr=True)
+    np.testing.assert_array_equal(out, frame[::2, ::2, ::-1])
+
+
+def test_upload_frame_reuses_surface():
+    surface = frame_surface((16, 12))
+    frame = np.random.randint(0, 256, (12, 16, 3), np.uint8)
+    assert upload_frame(surface, frame) is surface
+    np.testing.assert_array_equal(pygame.surfarray.array3d(surface).swapaxes(0, 1), frame)
+    # Views that frombuffer cannot wrap go through blit_array
+    flipped = frame[:, ::-1]
+    upload_frame(surface, flipped)
+    np.testing.assert_array_equal(pygame.surfarray.array3d(surface).swapaxes(0, 1), flipped)
+
+
+def test_stream_publishes_converted_frames():
+    source = SyntheticSource((64, 48), fps=200, bgr=True)
+    stream = CaptureStream(source, (32, 24)).start()
+    frame, frame_id = wait_for_frames(stream, 3)
+    assert frame.shape == (24, 32, 3)
+    assert frame.dtype == np.uint8
+    # Blue was generated as 255 - red, which survives the BGR -> RGB swap
+    np.testing.assert_array_equal(frame[12, 8:, 2].astype(int), 255 - frame[12, 8:, 0].astype(int))
+    stream.stop()
+    assert not stream.running
+
+
+def test_latest_never_waits_for_the_camera():
+    source = SyntheticSource((32, 24), fps=2)  # A very slow camera
+    stream = CaptureStream(source, (32, 24)).start()
+    wait_for_frames(stream, 1)
+    start = time.perf_counter()
+    for _ in range(1000):
+        stream.latest()
+    assert time.perf_counter() - start < 0.25
+
+
+def test_frame_in_use_is_not_overwritten():
+    source = SyntheticSource((32, 24), fps=500)
+    stream = CaptureStream(source, (32, 24)).start()
+    frame, frame_id = wait_for_frames(stream, 2)
+    held = frame.copy()
+    # Let the thread publish several newer frames without calling latest() again
+    deadline = time.monotonic() + 5.0
+    while stream.frame_id < frame_id + 10 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert stream.frame_id >= frame_id + 10
+    np.testing.assert_array_equal(frame, held)
+    newest, newest_id = stream.latest()
+    assert newest_id > frame_id
+    assert newest[0, 0, 0] == (newest_id - 1) % 256
+
+
+def test_stream_ends_with_its_source():
+    source = SyntheticSource((16, 12), fps=0, frame_count=5)
+    stream = CaptureStream(source, (16, 12)).start()
+    stream._thread.join(2.0)
+    assert not stream.running
+    frame, frame_id = stream.latest()
+    assert frame_id == 5
+    assert frame[0, 0, 0] == 4
+
+
+def test_open_stream_replaces_previous_stream_for_device():
+    first = open_stream('/dev/video0', SyntheticSource((16, 12), fps=100), (16, 12))
+    second = open_stream('/dev/video0', SyntheticSource((16, 12), fps=100), (16, 12))
+    assert not first.running
+    assert first.source.closed
+    assert second.running
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg not installed")
+def test_ffmpeg_pipe_streams_into_buffer():
+    source = FFmpegPipeSource('testsrc=size=64x48:rate=30', (32, 24), input_format='lavfi')
+    stream = CaptureStream(source, (32, 24)).start()
+    frame, _ = wait_for_frames(stream, 5)
+    assert frame.shape == (24, 32, 3)
+    assert frame.any()
+    stream.stop()
+    assert source.process.poll() is not None
+
+
+def test_ffmpeg_pipe_reads_whole_frames(tmp_path):
+    # Stand-in ffmpeg that writes three raw 16x12 frames in uneven chunks, then exits
+    fake = tmp_path / 'ffmpeg'
+    fake.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "for n in range(3):\n"
+        "    frame = bytes([n + 1]) * (16 * 12 * 3)\n"
+        "    for i in range(0, len(frame), 100):\n"
+        "        sys.stdout.buffer.write(frame[i:i + 100])\n"
+        "        sys.stdout.buffer.flush()\n"
+    )
+    fake.chmod(0o755)
+    source = FFmpegPipeSource('/dev/video0', (16, 12), ffmpeg=str(fake))
+    stream = CaptureStream(source, (16, 12)).start()
+    stream._thread.join(5.0)
+    assert not stream.running
+    frame, frame_id = stream.latest()
+    assert frame_id == 3
+    assert (frame == 3).all()
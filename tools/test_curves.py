@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched Bezier engine used by the curve scope modes
+(examples/lib/eyesy_curves.py).
+
+Run with: python -m pytest tools/test_curves.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import pygame.gfxdraw
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'examples' / 'lib'))
+
+from eyesy_curves import bezier_basis, draw_polylines, gfx_segments, rotate, tessellate
+
+
+def de_casteljau(points, t):
+    points = [np.asarray(p, dtype=np.float64) for p in points]
+    while len(points) > 1:
+        points = [a + (b - a) * t for a, b in zip(points, points[1:])]
+    return points[0]
+
+
+def test_basis_rows_sum_to_one():
+    np.testing.assert_allclose(bezier_basis(24, 48).sum(axis=1), 1.0)
+
+
+def test_tessellate_matches_de_casteljau_for_a_batch():
+    rng = np.random.default_rng(3)
+    control = rng.uniform(-100, 100, (5, 2, 4, 2))  # 5 cells x 2 cubic curves
+    curves = tessellate(control, 10)
+    assert curves.shape == (5, 2, 11, 2)
+    for cell in range(5):
+        for curve in range(2):
+            for i, t in enumerate(np.linspace(0, 1, 11)):
+                np.testing.assert_allclose(curves[cell, curve, i], de_casteljau(control[cell, curve], t))
+
+
+def test_rotate_turns_each_cell_about_its_own_center():
+    points = np.array([[[2.0, 1.0]], [[10.0, 0.0]]])
+    centers = np.array([[1.0, 1.0], [10.0, 10.0]])
+    turned = rotate(points, centers, np.array([90.0, 180.0]))
+    np.testing.assert_allclose(turned, [[[1.0, 2.0]], [[10.0, 20.0]]], atol=1e-9)
+
+
+def test_polylines_trace_the_same_curve_as_gfxdraw():
+    pygame.init()
+    control = [(380, 20), (200, 280), (20, 40)]
+    expected = pygame.Surface((400, 300))
+    pygame.gfxdraw.bezier(expected, control, 4, (255, 255, 255))
+    actual = pygame.Surface((400, 300))
+    draw_polylines(actual, (255, 255, 255), tessellate(np.array(control), gfx_segments(3, 4))[None])
+    expected_pixels = np.argwhere(pygame.surfarray.array2d(expected))
+    actual_pixels = np.argwhere(pygame.surfarray.array2d(actual))
+    # Every lit pixel is within a pixel diagonal of the other rasterization
+    distance = np.sqrt(((expected_pixels[:, None] - actual_pixels[None]) ** 2).sum(-1))
+    assert distance.min(axis=1).max() <= 1.5
+    assert distance.min(axis=0).max() <= 1.5
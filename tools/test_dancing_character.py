@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the Dancing Character pose tables (custom/dancing_character/main.py).
+
+Run with: python -m pytest tools/test_dancing_character.py
+"""
+
+import importlib.util
+import math
+import os
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+main_py = project_root / 'custom' / 'dancing_character' / 'main.py'
+spec = importlib.util.spec_from_file_location('dancing_character', str(main_py))
+mode = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mode)
+
+# Linear interpolation error of the fastest sinusoid between keyframes
+TOLERANCE = 2e-3
+
+
+def freeze_pose(t):
+    """Freeze's drivers as the per-character loop computed them before tabling"""
+    held = math.floor(t * 2.0) % 2 == 1
+    gate = 0.3 if held else 1.0
+    lean_gate = 0.2 if held else 1.0
+    return {
+        mode.BOUNCE: math.sin(t * 3.0) * 0.12 * gate,
+        mode.LEAN: math.sin(t * 1.5) * 0.4 * lean_gate,
+        mode.SWAY: math.sin(t * 1.0) * 0.2,
+        mode.LEFT: math.sin(t * 1.5) * gate,
+        mode.RIGHT: math.cos(t * 1.5) * gate,
+    }
+
+
+def test_freeze_matches_loop_past_pose_period():
+    # Stay clear of the hold steps, where interpolation can't match a hard edge
+    t = np.arange(3 * mode.POSE_PERIOD, 8 * mode.POSE_PERIOD, 0.37)
+    t = t[np.abs(t * 2.0 - np.round(t * 2.0)) > 0.05]
+    move_type = np.full(len(t), mode.FREEZE_MOVE)
+    pose = mode.sample_poses(move_type, t)
+    for row, local_time in zip(pose, t):
+        for channel, expected in freeze_pose(local_time).items():
+            assert abs(row[channel] - expected) < TOLERANCE, (local_time, channel)
+
+
+def test_hold_only_applies_to_freeze():
+    t = np.array([0.75, 0.75])  # Inside a held half beat
+    pose = mode.sample_poses(np.array([mode.FREEZE_MOVE, 0]), t)
+    standard = mode.sample_poses(np.array([0]), t[:1])
+    assert np.allclose(pose[1], standard[0])
+    assert abs(pose[0, mode.BOUNCE] - math.sin(0.75 * 3.0) * 0.12 * 0.3) < TOLERANCE
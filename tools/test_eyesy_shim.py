@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the Pyodide eyesy object (web/py/eyesy_shim.py), run under plain
+CPython with a stand-in host writing its buffers the way eyesy-api.js does.
+
+Run with: python -m pytest tools/test_eyesy_shim.py
+"""
+
+import importlib.util
+import sys
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+SHIM = project_root / 'web' / 'py' / 'eyesy_shim.py'
+
+
+class JsArray(list):
+    def toJs(self):
+        return list(self)
+
+
+class FakeEyesyJs:
+    """The JavaScript EYESYAPI object, as far as the shim calls it"""
+
+    def colorPicker(self, knob):
+        return JsArray([int(knob * 255), 0, 0])
+
+    def colorPickerLFO(self, knob, max_rate):
+        return JsArray([0, int(knob * 255), 0])
+
+    def colorPickerBG(self, knob):
+        return JsArray([0, 0, int(knob * 255)])
+
+    def setModeRoot(self, path):
+        self.mode_root = path
+
+
+class FakeHost:
+    """Writes state and audio into the eyesy buffers in place, then syncs (EYESYAPI.writeState())"""
+
+    def __init__(self, eyesy):
+        self.eyesy = eyesy
+
+    @staticmethod
+    def write(buffer, values):
+        with memoryview(buffer) as view:
+            count = min(len(view), len(values))
+            for i in range(count):
+                view[i] = values[i]
+            for i in range(count, len(view)):
+                view[i] = 0
+
+    def frame(self, knobs, trig, audio):
+        self.write(self.eyesy.state, list(knobs) + [float(trig), 0.0, 1.0])
+        self.write(self.eyesy.audio_left, audio)
+        self.write(self.eyesy.audio_right, [-sample for sample in audio])
+        self.eyesy.sync()
+
+
+@pytest.fixture
+def shim():
+    saved = {name: sys.modules.get(name) for name in ('js', 'eyesy_shim')}
+    js = ModuleType('js')
+    js.eyesy = FakeEyesyJs()
+    sys.modules['js'] = js
+    try:
+        spec = importlib.util.spec_from_file_location('eyesy_shim', SHIM)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def test_host_writes_reach_the_mode(shim):
+    eyesy = shim.EYESY(1280, 720)
+    host = FakeHost(eyesy)
+    audio = [i * 100 - 10000 for i in range(shim.AUDIO_SAMPLES)]
+    host.frame((0.1, 0.2, 0.3, 0.4, 0.5), True, audio)
+    assert (eyesy.knob1, eyesy.knob5) == (0.1, 0.5)
+    assert eyesy.trig is True and eyesy.audio_trig is False and eyesy.auto_clear is True
+    assert eyesy.audio_in[3] == audio[3]
+    assert eyesy.audio_in[-1] == audio[-1]
+    assert eyesy.audio_in_r[3] == -audio[3]
+    assert abs(eyesy.audio_in[0]) == 10000
+    assert list(eyesy.audio_in[:4]) == audio[:4]
+    assert len(eyesy.audio_in) == shim.AUDIO_SAMPLES
+    # A short buffer from the host leaves silence after it
+    host.frame((0.1, 0.2, 0.3, 0.4, 0.5), False, audio[:10])
+    assert eyesy.trig is False
+    assert eyesy.audio_in[10] == 0
+
+
+def test_audio_views_are_persistent_and_shared(shim):
+    eyesy = shim.EYESY(1280, 720)
+    host = FakeHost(eyesy)
+    left = eyesy.audio_in
+    samples = np.asarray(eyesy.audio_in)  # No copy: a NumPy view on the same memory
+    host.frame((0.5,) * 5, False, list(range(shim.AUDIO_SAMPLES)))
+    assert eyesy.audio_in is left
+    assert samples[7] == 7
+    with pytest.raises(TypeError):
+        eyesy.audio_in[0] = 1
+    with pytest.raises(BufferError):
+        eyesy.audio_left.append(1)
+
+
+def test_frames_leave_no_garbage(shim):
+    eyesy = shim.EYESY(1280, 720)
+    host = FakeHost(eyesy)
+    audio = list(range(shim.AUDIO_SAMPLES))
+    host.frame((0.5,) * 5, False, audio)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for frame in range(200):
+            host.frame((frame / 200,) * 5, frame % 2, audio)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    only_shim = [tracemalloc.Filter(True, str(SHIM))]
+    grown = sum(stat.size_diff for stat in after.filter_traces(only_shim).compare_to(
+        before.filter_traces(only_shim), 'filename'))
+    assert grown < 1024
+
+
+def test_color_pickers_go_through_the_host(shim):
+    eyesy = shim.EYESY(1280, 720)
+    assert eyesy.color_picker(1.0) == [255, 0, 0]
+    assert eyesy.color_picker_lfo(1.0) == [0, 255, 0]
+    assert eyesy.color_picker_bg(1.0) == [0, 0, 255]
+    assert eyesy.bg_color == [0, 0, 255]
+    eyesy.set_mode_root('/modes/x')
+    assert eyesy.mode_root == sys.modules['js'].eyesy.mode_root == '/modes/x'
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the simulator's frame clock (eyesy.time / eyesy.dt) and for routing a
+mode's time.time() onto it, which makes headless renders reproducible.
+
+Run with: python -m pytest tools/test_frame_clock.py
+"""
+
+import os
+import random
+import sys
+import time
+import importlib.util
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.eyesy_runner import EYESYSimulator, FrameClock, use_frame_clock
+
+
+def load_mode(name, eyesy):
+    main_py = project_root / 'examples' / 'scopes' / name / 'main.py'
+    spec = importlib.util.spec_from_file_location('main', str(main_py))
+    module = importlib.util.module_from_spec(spec)
+    eyesy.set_mode_root(str(main_py.parent))
+    spec.loader.exec_module(module)
+    return module
+
+
+def render(name, frames):
+    """Render a mode headless on a fixed-step clock, returning the last frame's pixels"""
+    random.seed(1)
+    np.random.seed(1)
+    eyesy = EYESYSimulator(320, 240)
+    eyesy.fixed_timestep = True
+    module = load_mode(name, eyesy)
+    assert use_frame_clock(module, eyesy)
+    screen = pygame.Surface((320, 240))
+    module.setup(screen, eyesy)
+    for _ in range(frames):
+        eyesy.advance_frame()
+        eyesy.update_audio()
+        screen.fill(tuple(eyesy.bg_color))
+        module.draw(screen, eyesy)
+    return pygame.surfarray.array3d(screen)
+
+
+@pytest.fixture(autouse=True, scope='module')
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_fixed_timestep_advances_one_frame_at_a_time():
+    eyesy = EYESYSimulator(320, 240)
+    eyesy.fixed_timestep = True
+    eyesy.fps = 50
+    for _ in range(10):
+        eyesy.advance_frame()
+    assert eyesy.frame_count == 10
+    assert eyesy.dt == pytest.approx(0.02)
+    assert eyesy.time == pytest.approx(0.2)
+    eyesy.advance_frame(0.5)
+    assert eyesy.time == pytest.approx(0.7)
+
+
+def test_frame_clock_replaces_only_the_modes_time():
+    eyesy = EYESYSimulator(320, 240)
+    module = load_mode('S - Gradient Cloud', eyesy)
+    assert use_frame_clock(module, eyesy)
+    assert isinstance(module.time, FrameClock)
+    assert sys.modules['time'] is time
+    eyesy.advance_frame(1.25)
+    assert module.time.time() == 1.25
+    start = time.perf_counter()
+    module.time.sleep(30)
+    assert time.perf_counter() - start < 1.0
+    assert module.time.time() == pytest.approx(31.25)
+    assert module.time.perf_counter() >= start
+    # With a fixed timestep even perf_counter() is the frame clock
+    eyesy.fixed_timestep = True
+    assert module.time.perf_counter() == pytest.approx(31.25)
+    assert module.time.perf_counter_ns() == 31_250_000_000
+
+
+def test_headless_renders_are_reproducible():
+    first = render('S - Gradient Cloud', 20)
+    second = render('S - Gradient Cloud', 20)
+    np.testing.assert_array_equal(first, second)
+    assert not np.array_equal(first, render('S - Gradient Cloud', 21))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for golden-frame regression (tools/golden_frames.py): the perceptual
+diff, the content-addressed store, an update/check round trip on a
+stand-in mode, and the timing check.
+
+Run with: python -m pytest tools/test_golden.py
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.golden_frames import (DEFAULT_TOLERANCE, check, compare, frame_hash, load_object,
+                                 perceptual_diff, save_object, shrink, timing, update)
+
+BAR_MODE = """
+import pygame
+def setup(screen, eyesy):
+    pass
+def draw(screen, eyesy):
+    eyesy.color_picker_bg(0.0)
+    pygame.draw.rect(screen, (255, 255, 255), (BAR_X, 200, 40, 300))
+"""
+
+# Sizes its bar by how long a bit of work took, as an adaptive-quality mode would
+BUDGET_MODE = """
+import pygame
+from time import perf_counter
+def setup(screen, eyesy):
+    pass
+def draw(screen, eyesy):
+    eyesy.color_picker_bg(0.0)
+    start = perf_counter()
+    sum(range(200000))
+    slow = perf_counter() - start > 0.01
+    pygame.draw.rect(screen, (255, 255, 255), (400, 200, 400 if slow else 40, 300))
+"""
+
+
+def bar_frame(x, width=8):
+    frame = np.zeros((90, 160, 3), np.uint8)
+    frame[20:70, x:x + width] = 255
+    return frame
+
+
+def write_mode(path, bar_x):
+    path.mkdir(exist_ok=True)
+    (path / 'main.py').write_text(BAR_MODE.replace('BAR_X', str(bar_x)))
+    return path
+
+
+@pytest.fixture(autouse=True, scope='module')
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_shrink_averages_blocks():
+    pixels = np.zeros((8, 8, 3), np.uint8)
+    pixels[0, 0] = 200
+    small = shrink(pixels, 4)
+    assert small.shape == (2, 2, 3)
+    assert small[0, 0, 0] == round(200 / 16)
+    assert small[1, 1, 0] == 0
+
+
+def test_perceptual_diff_forgives_drift_not_moves():
+    golden = bar_frame(40)
+    assert compare(golden, golden)[0]
+    # One pixel of drift passes, a bar moved well across the frame does not
+    assert compare(golden, bar_frame(41))[0]
+    passed, stats, _ = compare(golden, bar_frame(100))
+    assert not passed
+    assert stats["changed"] > 0.01
+    # With no shift allowed even the drift shows up
+    assert perceptual_diff(golden, bar_frame(41), shift=0).max() > DEFAULT_TOLERANCE["pixel_threshold"]
+
+
+def test_perceptual_diff_sees_missing_content():
+    golden = bar_frame(40)
+    blank = np.zeros_like(golden)
+    assert not compare(golden, blank)[0]
+    assert not compare(blank, golden)[0]
+
+
+def test_store_is_content_addressed(tmp_path):
+    frame = bar_frame(40)
+    first = save_object(frame, tmp_path)
+    assert save_object(frame.copy(), tmp_path) == first
+    assert first == frame_hash(frame)
+    assert len(list((tmp_path / 'objects').glob('*/*.png'))) == 1
+    np.testing.assert_array_equal(load_object(first, tmp_path), frame)
+    assert save_object(bar_frame(41), tmp_path) != first
+
+
+def test_update_then_check(tmp_path):
+    golden_dir = tmp_path / 'golden'
+    mode = write_mode(tmp_path / 'Bar', 400)
+    assert update([mode], golden_dir) == []
+    index = json.loads((golden_dir / 'index.json').read_text())
+    frames = index['modes']['Bar']
+    # Every captured frame shows the same bar, so the store holds one object
+    assert len(set(frames.values())) == 1
+    assert len(list((golden_dir / 'objects').glob('*/*.png'))) == 1
+    assert check([mode], golden_dir) == []
+    # Move the bar: the check fails and writes diff images
+    write_mode(mode, 800)
+    failures = check([mode], golden_dir, diff_dir=str(tmp_path / 'diffs'))
+    assert [f['mode'] for f in failures] == ['Bar']
+    assert list((tmp_path / 'diffs').glob('Bar - frame *.png'))
+    # Tolerances can let a mode off
+    (golden_dir / 'tolerances.json').write_text(json.dumps({'Bar': {'skip': 'moves on purpose'}}))
+    assert check([mode], golden_dir) == []
+
+
+def test_modes_whose_frames_depend_on_timing_are_refused(tmp_path):
+    golden_dir = tmp_path / 'golden'
+    steady = write_mode(tmp_path / 'Bar', 400)
+    budget = tmp_path / 'Budget'
+    budget.mkdir()
+    (budget / 'main.py').write_text(BUDGET_MODE)
+    assert timing([steady], golden_dir) == []
+    assert [f['mode'] for f in timing([budget], golden_dir)] == ['Budget']
+    failures = update([steady, budget], golden_dir)
+    assert [f['mode'] for f in failures] == ['Budget'] and 'depends on timing' in failures[0]['error']
+    assert list(json.loads((golden_dir / 'index.json').read_text())['modes']) == ['Bar']
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the grid engine used by the S - Grid scope modes
+(examples/lib/eyesy_grid.py), against the per-cell loops the modes used to run.
+
+Run with: python -m pytest tools/test_grid.py
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'examples' / 'lib'))
+
+from eyesy_grid import (CELLS, LFO, PATCHWORK, Circles, ColumnColor, Grid, KnobShift, PatchworkColor,
+                        Polygons, SlideShift, Triangles)
+from tools.eyesy_runner import EYESYSimulator
+
+SIZE = (320, 240)
+
+
+def simulator(frame):
+    eyesy = EYESYSimulator(*SIZE)
+    eyesy.knob1, eyesy.knob2, eyesy.knob3, eyesy.knob4 = 0.3, 0.7, 0.4, 0.65
+    eyesy.audio_in = [int(20000 * np.sin(i * 0.7 + frame)) for i in range(200)]
+    return eyesy
+
+
+def reference_circles(screen, eyesy, state):
+    """S - Grid Circles - Column Color as it was drawn cell by cell"""
+    xr, yr = eyesy.xres, eyesy.yres
+    x8, y5 = xr / 8, yr / 5
+    for i in range(0, 7):
+        xoffset = int(eyesy.knob1 * (x8))
+        yoffset = int(eyesy.knob2 * (y5))
+        for j in range(0, 10):
+            x = (j * (x8)) - (x8)
+            y = (i * (y5)) - (y5)
+            rad = abs((eyesy.audio_in[j + i] / 32768) * xr * .2)
+            restRad = int(eyesy.knob3 * (xr * 0.023)) + 1
+            if (i % 2) == 1:
+                x = j * (x8) - (x8) + xoffset
+            if (j % 2) == 1:
+                y = i * (y5) - (y5) + yoffset
+            color = eyesy.color_picker(((j * .1) + eyesy.knob4) % 1.0)
+            pygame.draw.circle(screen, color, [x, y], rad + restRad)
+
+
+def reference_triangles(screen, eyesy, state):
+    """S - Grid Triangles - Unfilled Patchwork Color as it was drawn cell by cell"""
+    xr, yr = eyesy.xres, eyesy.yres
+    for i in range(0, 7):
+        xoffset = int(eyesy.knob1 * (xr / 8))
+        yoffset = int(eyesy.knob2 * (yr / 5))
+        for j in range(0, 10):
+            x = (j * (xr / 8)) - (xr / 8)
+            y = (i * (yr / 5)) - (yr / 5)
+            rad = abs((eyesy.audio_in[j - i] * 0.00003058) * (xr * 0.25))
+            width = int(eyesy.knob3 * (xr * 0.063)) + 1
+            if (i % 2) == 1:
+                x = j * (xr / 8) - (xr / 8) + xoffset
+                state['color'] = eyesy.color_picker(eyesy.knob4)
+            if (j % 2) == 1:
+                y = i * (yr / 5) - (yr / 5) + yoffset
+                state['color'] = eyesy.color_picker((0.4 + eyesy.knob4) % 1.00)
+            if ((j + i) % 3) == 1:
+                state['color'] = eyesy.color_picker((0.8 + eyesy.knob4) % 1.00)
+            points = [((x - width) - rad, (y + width) + rad), (x, (y - width) - rad),
+                      ((x + width) + rad, (y + width) + rad)]
+            pygame.draw.polygon(screen, state['color'], points, int(xr * 0.0026))
+
+
+def assert_same_frames(grid, reference, frames=3):
+    screen = pygame.Surface(SIZE)
+    expected = pygame.Surface(SIZE)
+    grid.setup(screen, simulator(0))
+    state = {'color': simulator(0).color_picker(0.65)}
+    for frame in range(frames):
+        screen.fill((0, 0, 0))
+        expected.fill((0, 0, 0))
+        grid.draw(screen, simulator(frame))
+        reference(expected, simulator(frame), state)
+        np.testing.assert_array_equal(pygame.surfarray.array3d(screen), pygame.surfarray.array3d(expected))
+
+
+def test_circles_match_the_cell_loop():
+    assert_same_frames(Grid(Circles(.2), ColumnColor(), KnobShift()), reference_circles)
+
+
+def test_patchwork_carries_the_last_color_across_frames():
+    # Only the first cell has no rule of its own
+    assert PATCHWORK[0] == -1 and -1 not in PATCHWORK[1:]
+    assert len(PATCHWORK) == CELLS
+    assert_same_frames(Grid(Triangles(0.25, filled=False), PatchworkColor(), KnobShift()), reference_triangles)
+
+
+def test_slide_shift_steps_the_lfo_twice_per_row():
+    eyesy = simulator(0)
+    shift = SlideShift()
+    shift.setup(eyesy)
+    lfo = LFO(-SIZE[0] * 0.09375, SIZE[0] * 0.09375, 10)
+    for _ in range(5):
+        x, y = shift.offsets(eyesy)
+        lfo.step = eyesy.knob1 * max(1, int(SIZE[0] * 0.00234))
+        lfo.max = int(eyesy.knob2 * SIZE[0] * 0.09375)
+        lfo.start = -lfo.max
+        for row in range(7):
+            assert x[row, 0] == -lfo.update()
+            assert y[row, 0] == lfo.update() * 0.8
+
+
+def test_polygons_deal_new_corners_on_trigger():
+    random.seed(0)
+    eyesy = simulator(0)
+    polygons = Polygons()
+    grid = Grid(polygons, ColumnColor(), KnobShift())
+    screen = pygame.Surface(SIZE)
+    grid.setup(screen, eyesy)
+    corners = polygons.offsets.copy()
+    assert corners.shape == (CELLS, 6, 2)
+    grid.draw(screen, eyesy)
+    np.testing.assert_array_equal(polygons.offsets, corners)
+    eyesy.trig = True
+    grid.draw(screen, eyesy)
+    assert not np.array_equal(polygons.offsets, corners)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for lazily decoded image sequences (examples/lib/eyesy_images.py).
+
+Run with: python -m pytest tools/test_images.py
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'examples' / 'lib'))
+
+import eyesy_images
+from eyesy_images import ImageSequence
+
+SIZE = (100, 50)
+
+
+@pytest.fixture
+def slides(tmp_path):
+    """Six solid-color 100x50 PNGs"""
+    for i in range(6):
+        surface = pygame.Surface(SIZE)
+        surface.fill((i * 40, 255 - i * 40, 7))
+        pygame.image.save(surface, str(tmp_path / f'slide{i}.png'))
+    return tmp_path
+
+
+def color(surface):
+    return tuple(surface.get_at((0, 0)))[:3]
+
+
+def test_indexes_like_the_list_of_loaded_images(slides):
+    images = ImageSequence(str(slides / '*.png'))
+    loaded = [pygame.image.load(str(path)) for path in sorted(slides.glob('*.png'))]
+    assert len(images) == len(loaded)
+    assert [color(image) for image in images] == [color(image) for image in loaded]
+    assert color(images[-1]) == color(loaded[-1])
+    assert [color(image) for image in images[1:3]] == [color(image) for image in loaded[1:3]]
+    assert images[2] is images[2]
+    with pytest.raises(IndexError):
+        images[6]
+
+
+def test_decodes_ahead_of_use_and_only_then(slides):
+    images = ImageSequence(str(slides / '*.png'), prefetch=2)
+    assert set(images._pending) == {0, 1} and not images._cache
+    images[4]
+    # Wraps around, as slideshows do
+    assert set(images._cache) == {4} and {5, 0} <= set(images._pending)
+    assert 2 not in images._pending and 3 not in images._pending
+
+
+def test_least_recently_used_images_are_dropped_over_the_cap(slides):
+    one = SIZE[0] * SIZE[1] * pygame.image.load(str(slides / 'slide0.png')).get_bytesize()
+    images = ImageSequence(str(slides / '*.png'), prefetch=1, max_bytes=2 * one)
+    images[0]
+    images[1]
+    images[0]
+    images[2]
+    assert list(images._cache) == [0, 2] and images.nbytes == 2 * one
+    # A dropped image is decoded again
+    assert color(images[1]) == (40, 215, 7)
+
+
+def test_decodes_on_access_without_threads(slides, monkeypatch):
+    def no_threads(*args, **kwargs):
+        raise RuntimeError("can't start new thread")
+
+    monkeypatch.setattr(eyesy_images, 'ThreadPoolExecutor', no_threads)
+    monkeypatch.setattr(eyesy_images, '_executor', None)
+    images = ImageSequence(str(slides / '*.png'))
+    assert not images._pending
+    assert color(images[3]) == (120, 135, 7)
+    assert not images._pending
+
+
+def test_replaced_sequences_share_one_thread_and_close(slides):
+    # A mode's setup() run again and again, as on reloads
+    images = ImageSequence([])
+    for _ in range(5):
+        images.close()
+        images = ImageSequence(str(slides / '*.png'))
+        images[0]
+    decoders = [thread for thread in threading.enumerate() if thread.name.startswith('eyesy-images')]
+    assert len(decoders) == 1
+    images.close()
+    assert not images._pending and not images._cache and images.nbytes == 0
+    assert color(images[2]) == (80, 175, 7)
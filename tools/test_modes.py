@@ -20,7 +20,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 # Import the EYESY simulator
-from tools.eyesy_runner import EYESYSimulator
+from tools.eyesy_runner import EYESYSimulator, use_frame_clock
+from tools.alloc_profiler import AllocationProfiler
 
 # Try to import pygame
 try:
@@ -34,10 +35,12 @@ except ImportError:
 class ModeTester:
     """Test framework for EYESY modes"""
     
-    def __init__(self):
+    def __init__(self, profiler=None):
         self.results = []
         self.simulator = None
         self.screen = None
+        # Optional AllocationProfiler wrapped around every draw()
+        self.profiler = profiler
         
     def setup_test_environment(self):
         """Initialize pygame and create test screen"""
@@ -57,6 +60,8 @@ class ModeTester:
                 pygame.display.set_mode((1280, 720))
             self.screen = pygame.Surface((1280, 720))
             self.simulator = EYESYSimulator(1280, 720)
+            # Headless: modes run on a fixed-step frame clock, not the wall clock
+            self.simulator.fixed_timestep = True
             return True
         except Exception as e:
             print(f"Failed to setup test environment: {e}")
@@ -97,6 +102,8 @@ class ModeTester:
                 self.simulator.mode = mode_path.name
             
             spec.loader.exec_module(module)
+            if self.simulator:
+                use_frame_clock(module, self.simulator)
             return module, None
         except Exception as e:
             return None, f"Failed to load module: {str(e)}\n{traceback.format_exc()}"
@@ -130,6 +137,9 @@ class ModeTester:
             return False, "Test environment not initialized"
         
         errors = []
+        draw = module.draw
+        if self.profiler:
+            draw = self.profiler.wrap(module.draw, self.simulator.mode)
         
         # Test with different knob values
         test_cases = [
@@ -151,11 +161,12 @@ class ModeTester:
                     self.simulator.trig = False
                     self.simulator.midi_note_new = False
                     
-                    # Update audio
+                    # Advance the frame clock and update audio
+                    self.simulator.advance_frame()
                     self.simulator.update_audio()
                     
                     # Call draw
-                    module.draw(self.screen, self.simulator)
+                    draw(self.screen, self.simulator)
                 except Exception as e:
                     error_msg = f"draw() failed (test_case={test_case['name']}, iteration={i}): {str(e)}"
                     errors.append(error_msg)
@@ -272,9 +283,14 @@ def main():
     print("EYESY Mode Test Suite")
     print("="*70)
     
-    tester = ModeTester()
+    # --profile-alloc: also profile allocations and GC pauses of every draw()
+    profiler = AllocationProfiler().start() if "--profile-alloc" in sys.argv[1:] else None
+    tester = ModeTester(profiler)
     results = tester.run_all_tests()
     tester.print_summary(results)
+    if profiler:
+        profiler.stop()
+        print(profiler.format_report())
     
     # Exit with error code if any tests failed
     passed = sum(1 for r in results if r["loaded"] and r["has_functions"] and r["setup_works"] and r["draw_works"])
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the web build's image optimization (tools/optimize_assets.py): the
+browser must see the same pixels, in fewer bytes.
+
+Run with: python -m pytest tools/test_optimize_assets.py
+"""
+
+import io
+import os
+import shutil
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.optimize_assets import WEB_CANVAS, is_indexed, mode_usage, optimize_images, optimize_png
+
+EXAMPLES = project_root / 'examples'
+
+
+def pixels(data):
+    surface = pygame.image.load(io.BytesIO(data), 'image.png')
+    return surface.get_size(), pygame.image.tostring(surface, 'RGBA')
+
+
+def png(surface):
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, 'image.png')
+    return buffer.getvalue()
+
+
+def mode_source(path):
+    return (EXAMPLES / path / 'main.py').read_text(encoding='utf-8')
+
+
+def test_images_look_the_same_in_fewer_bytes(tmp_path):
+    # Two of S - Spinning Discs' indexed images are enough
+    discs = tmp_path / 'discs'
+    discs.mkdir()
+    for name in ('ziggy-640-2col.png', 'strobe-sun-640-index32.png'):
+        shutil.copy2(EXAMPLES / 'scopes/S - Spinning Discs/Images' / name, discs / name)
+    for mode, images in (('scopes/S - Circle Scope - Image', EXAMPLES / 'scopes/S - Circle Scope - Image' / 'Images'),
+                         ('scopes/S - Spinning Discs', discs)):
+        report = optimize_images(images, tmp_path / mode, mode_source(mode))
+        assert report['bytes_out'] <= report['bytes_in']
+        for original in images.glob('*.png'):
+            optimized = (tmp_path / mode / original.name).read_bytes()
+            assert len(optimized) <= original.stat().st_size
+            assert pixels(optimized) == pixels(original.read_bytes())
+    # Palettes the mode recolors are kept as they are
+    original = pygame.image.load(str(EXAMPLES / 'scopes/S - Spinning Discs/Images/ziggy-640-2col.png'))
+    optimized = pygame.image.load(str(tmp_path / 'scopes/S - Spinning Discs/ziggy-640-2col.png'))
+    assert optimized.get_palette() == original.get_palette()
+
+
+def test_few_colors_become_an_indexed_png():
+    surface = pygame.Surface((200, 100), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+    pygame.draw.circle(surface, (250, 20, 90, 255), (50, 50), 40)
+    pygame.draw.rect(surface, (10, 200, 30, 128), (120, 20, 60, 60))
+    original = png(surface)
+    optimized = optimize_png(original)
+    assert is_indexed(optimized) and not is_indexed(original)
+    assert len(optimized) < len(original)
+    assert pixels(optimized) == pixels(original)
+
+
+def test_only_screen_filling_modes_are_downsampled():
+    assert mode_usage(mode_source('triggers/T - Slideshow Grid-AG-Alpha')) == {'recolors': False, 'fits_screen': True}
+    assert mode_usage(mode_source('triggers/T - Basic Image'))['fits_screen'] is False
+    assert mode_usage(mode_source('scopes/S - Spinning Discs'))['recolors'] is True
+
+    gradient = np.linspace(0, 255, 1600 * 900 * 3).astype(np.uint8).reshape(1600, 900, 3)
+    original = png(pygame.surfarray.make_surface(gradient))
+    assert pixels(optimize_png(original, fits_screen=True))[0] == WEB_CANVAS
+    assert pixels(optimize_png(original))[0] == (1600, 900)
+
+
+def test_sprites_are_cut_from_the_atlas(tmp_path):
+    mode = 'triggers/T - Isometric Wave'
+    report = optimize_images(EXAMPLES / mode / 'Images', tmp_path, mode_source(mode))
+    atlas = pygame.image.load(str(tmp_path / report['atlas']['file']))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['atlas.png']
+    for name, (x, y, w, h) in report['atlas']['sprites'].items():
+        sprite = pygame.image.load(str(EXAMPLES / mode / 'Images' / name))
+        assert pygame.image.tostring(atlas.subsurface((x, y, w, h)), 'RGBA') == \
+            pygame.image.tostring(sprite, 'RGBA')
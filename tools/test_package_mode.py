@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for packaging modes for the hardware (tools/package_mode.py): shared
+modules are vendored next to main.py and the packaged mode imports on its own.
+
+Run with: python -m pytest tools/test_package_mode.py
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.package_mode import LIB_DIR, needed_libs, package_mode
+
+EXAMPLES = project_root / 'examples'
+# Load main.py the way the EYESY does: by path, with nothing from this repo on sys.path
+LOAD = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location('main', sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(sorted(name for name in sys.modules if name.startswith('eyesy_')))
+"""
+
+
+def load_alone(main_py, cwd):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    env.pop('PYTHONPATH', None)
+    return subprocess.run([sys.executable, '-c', LOAD, str(main_py)], cwd=cwd, env=env,
+                          capture_output=True, text=True, timeout=60)
+
+
+def test_packaged_mode_imports_without_the_repo(tmp_path):
+    mode = EXAMPLES / 'scopes' / 'S - Grid Circles - Column Color'
+    libs = package_mode(mode, tmp_path)
+    assert [lib.name for lib in libs] == ['eyesy_grid.py']
+    packaged = tmp_path / mode.name
+    assert (packaged / 'eyesy_grid.py').read_bytes() == (LIB_DIR / 'eyesy_grid.py').read_bytes()
+    # Unpackaged, the mode can't find its engine; packaged, it uses the copy
+    assert load_alone(mode / 'main.py', tmp_path).returncode != 0
+    result = load_alone(packaged / 'main.py', tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "['eyesy_grid']"
+
+
+def test_repackaging_replaces_the_old_package(tmp_path):
+    mode = EXAMPLES / 'triggers' / 'T - Slideshow Grid-AG-Alpha'
+    package_mode(mode, tmp_path)
+    (tmp_path / mode.name / 'stale.py').write_text('')
+    package_mode(mode, tmp_path)
+    assert not (tmp_path / mode.name / 'stale.py').exists()
+    assert (tmp_path / mode.name / 'eyesy_images.py').exists()
+    assert (tmp_path / mode.name / 'Images').is_dir()
+
+
+def test_every_library_mode_gets_its_modules():
+    libs = {lib.stem for lib in LIB_DIR.glob('*.py')}
+    for main_py in EXAMPLES.glob('*/*/main.py'):
+        source = main_py.read_text(encoding='utf-8')
+        imported = {name for name in libs if f'from {name} import' in source}
+        assert {lib.stem for lib in needed_libs(main_py.parent)} == imported, main_py.parent.name
+
+
+def test_mode_without_libraries_is_copied_as_is(tmp_path):
+    mode = EXAMPLES / 'scopes' / 'S - Classic Horizontal'
+    assert package_mode(mode, tmp_path) == []
+    assert sorted(p.name for p in (tmp_path / mode.name).iterdir()) == sorted(
+        p.name for p in mode.iterdir() if p.name != '__pycache__')
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the static performance inspector (tools/perf_inspector.py), on small
+mode sources and on modes from examples/.
+
+Run with: python -m pytest tools/test_perf_inspector.py
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.perf_inspector import LOOP_FACTOR, RULES, format_findings, inspect_mode, inspect_source
+
+EXAMPLES = project_root / 'examples'
+
+MODE = '''
+import pygame
+import time
+
+def setup(screen, eyesy):
+    global font
+    font = pygame.font.Font(None, 30)
+
+def label(screen, text):
+    f = pygame.font.Font(None, 30)
+    screen.blit(f.render(text, True, (255, 255, 255)), (0, 0))
+
+def draw(screen, eyesy):
+    image = pygame.image.load('a.png')
+    for i in range(10):
+        x = time.time() + i
+    trail = screen.copy()
+    label(screen, 'hi')
+'''
+
+
+def rules(findings):
+    return [finding.rule for finding in findings]
+
+
+def test_hot_path_findings_are_ranked_with_their_lines():
+    findings = inspect_source(MODE)
+    assert rules(findings) == ['time_in_loop', 'image_load_per_frame', 'font_per_frame',
+                               'screen_copy_per_frame', 'load_without_convert']
+    time_in_loop = findings[0]
+    assert time_in_loop.lines == [16] and time_in_loop.score == RULES['time_in_loop'][0] * LOOP_FACTOR
+    # Found through the call from draw(); the font made in setup() is fine
+    font = findings[2]
+    assert (font.function, font.lines) == ('label', [10])
+    text = format_findings(findings, limit=2)
+    assert 'line 16 in draw()' in text and '... and 3 more' in text
+
+
+def test_setup_and_cached_results_are_not_per_frame():
+    source = '''
+import pygame
+
+def make_stamps(size):
+    return [pygame.Surface((size, size)) for _ in range(4)]
+
+def setup(screen, eyesy):
+    global image, stamps, stamp_size
+    image = pygame.image.load('a.png').convert_alpha()
+    stamps, stamp_size = None, None
+
+def draw(screen, eyesy):
+    global stamps, stamp_size
+    size = int(eyesy.knob1 * 24) + 1
+    if size != stamp_size:
+        stamps = make_stamps(size)
+        stamp_size = size
+    screen.blit(image, (0, 0))
+'''
+    assert inspect_source(source) == []
+
+
+def test_modes_with_known_hot_spots():
+    assert [(finding.rule, finding.lines) for finding in inspect_mode(EXAMPLES / 'triggers/T - Font Patterns')] == \
+        [('font_per_frame', [32])]
+    assert rules(inspect_mode(EXAMPLES / 'scopes/S - AA Selector'))[0] == 'time_in_loop'
+    assert inspect_mode(EXAMPLES / 'scopes/S - Boids') == []
+    assert inspect_source('def draw(:') == []
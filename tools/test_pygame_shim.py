@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the Pyodide pygame shim's display list (web/py/pygame_shim.py),
+run under plain CPython with a stand-in `js` module in place of the browser.
+
+Run with: python -m pytest tools/test_pygame_shim.py
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+SHIM = project_root / 'web' / 'py' / 'pygame_shim.py'
+
+# Operands after each opcode (POLYGON also carries its points)
+OPERANDS = {1: 3, 2: 4, 3: 2, 4: 9, 5: 2, 6: 8, 7: 9, 8: 9, 9: 6, 10: 11, 11: 9, 12: 4}
+
+
+class FakeBridge:
+    """Records what reaches JavaScript"""
+
+    def __init__(self):
+        self.calls = []
+
+    def registerSurface(self, surface_id, width, height):
+        self.calls.append(('registerSurface', surface_id, width, height))
+
+    def replay(self, commands, names):
+        self.calls.append(('replay', list(commands), names))
+
+    def crossings(self, name):
+        return [call for call in self.calls if call[0] == name]
+
+
+def decode(commands, names):
+    """[(opcode, surface id or None, operands)] - the walk replayCommands() makes"""
+    out = []
+    i = 0
+    while i < len(commands):
+        op = int(commands[i])
+        count = OPERANDS[op]
+        operands = commands[i + 1:i + 1 + count]
+        if op == 9:
+            count += 2 * int(operands[5])
+            operands = commands[i + 1:i + 1 + count]
+        surface = None if op == 1 else names[int(operands[0])]
+        out.append((op, surface, operands))
+        i += 1 + count
+    assert i == len(commands)
+    return out
+
+
+@pytest.fixture
+def shim():
+    saved = {name: sys.modules.get(name) for name in ('js', 'pygame', 'pygame.locals', 'pygame_shim')}
+    js = ModuleType('js')
+    js.bridge = FakeBridge()
+    sys.modules['js'] = js
+    try:
+        spec = importlib.util.spec_from_file_location('pygame_shim', SHIM)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module, js.bridge
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def test_a_frame_crosses_into_javascript_once(shim):
+    module, bridge = shim
+    screen = module.set_mode((400, 300))
+    screen.fill((0, 0, 0))
+    for i in range(2000):
+        module.pygame.draw.line(screen, (0, 255, 0), (i % 400, 0), (i % 400, 300), 1)
+        module.pygame.draw.circle(screen, (255, 0, 0), (i % 400, 150), 3)
+    assert bridge.crossings('replay') == []
+    module.end_frame()
+    (_, commands, names), = bridge.crossings('replay')
+    frame = decode(commands, names)
+    assert len(frame) == 4001
+    assert frame[0] == (1, None, [0, 0, 0])
+    slot = names.index('main_screen')
+    assert frame[1] == (7, 'main_screen', [slot, 0, 255, 0, 0, 0, 0, 300, 1])
+    assert frame[2] == (6, 'main_screen', [slot, 255, 0, 0, 0, 150, 3, 0])
+    # Nothing drawn, nothing sent
+    module.end_frame()
+    assert len(bridge.crossings('replay')) == 1
+
+
+def test_every_command_decodes(shim):
+    module, bridge = shim
+    pygame = module.pygame
+    screen = module.set_mode((400, 300))
+    layer = module.Surface(100, 50)
+    layer.fill(128)
+    layer.set_alpha(None)
+    pygame.draw.polygon(layer, (1, 2, 3, 4), [(0, 0), (10, 0), (10, 10)], 2)
+    pygame.draw.rect(layer, [9, 8, 7], (1, 2, 3, 4))
+    pygame.draw.arc(screen, (5, 5, 5), (0, 0, 20, 20), 0.0, 3.14, 2)
+    pygame.draw.ellipse(screen, (6, 6, 6), (0, 0, 20, 10))
+    scaled = pygame.transform.scale(layer, (200, 100))
+    copy = scaled.copy()
+    screen.blit(copy, (5, 6), (0, 0, 50, 25))
+    screen.blit(layer, (7, 8))
+    pygame.display.flip()
+    (_, commands, names), = bridge.crossings('replay')
+    ops = [(op, surface) for op, surface, _ in decode(commands, names)]
+    assert ops == [(2, layer._id), (5, layer._id), (9, layer._id), (8, layer._id), (10, 'main_screen'),
+                   (11, 'main_screen'), (12, layer._id), (3, scaled._id), (4, 'main_screen'), (4, 'main_screen')]
+    frame = decode(commands, names)
+    assert frame[0][2] == [names.index(layer._id), 128, 128, 128]  # Gray level fill
+    assert frame[1][2][1] == -1  # set_alpha(None)
+    assert frame[2][2] == [names.index(layer._id), 1, 2, 3, 2, 3, 0, 0, 10, 0, 10, 10]  # Alpha dropped
+    assert frame[8][2][4:] == [1, 0, 0, 50, 25]
+    assert frame[9][2][4] == 0  # No area
+
+
+def test_surface_table_is_sent_only_when_it_grows(shim):
+    module, bridge = shim
+    screen = module.set_mode((400, 300))
+    layer = module.Surface(10, 10)
+    for _ in range(2):
+        layer.fill((0, 0, 0))
+        screen.blit(layer, (0, 0))
+        module.end_frame()
+    first, second = bridge.crossings('replay')
+    assert first[2] == [layer._id, 'main_screen']
+    assert second[2] is None
+    module.Draw.rect(module.Surface(5, 5), (0, 0, 0), (0, 0, 5, 5))
+    module.end_frame()
+    assert len(bridge.crossings('replay')[-1][2]) == 3
+    # Surfaces still register with the bridge as they are made
+    assert len(bridge.crossings('registerSurface')) == 3
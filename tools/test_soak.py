@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the soak harness (tools/soak_modes.py): the growth check on its own,
+and short soaks of a leaking and a steady stand-in mode.
+
+Run with: python -m pytest tools/test_soak.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.soak_modes import check, find_modes, rising, soak_mode
+
+LEAKY_MODE = """
+import pygame
+history = []
+def setup(screen, eyesy):
+    pass
+def draw(screen, eyesy):
+    history.append(bytes(512))
+    pygame.draw.circle(screen, (255, 255, 255), (160, 120), int(10 + 50 * eyesy.knob1))
+"""
+
+STEADY_MODE = """
+import pygame
+history = []
+def setup(screen, eyesy):
+    pass
+def draw(screen, eyesy):
+    history.append(bytes(512))
+    del history[:-50]
+    pygame.draw.circle(screen, (255, 255, 255), (160, 120), int(10 + 50 * eyesy.knob1))
+"""
+
+
+def write_mode(tmp_path, name, source):
+    mode_dir = tmp_path / name
+    mode_dir.mkdir()
+    (mode_dir / 'main.py').write_text(source)
+    return mode_dir
+
+
+@pytest.fixture(autouse=True, scope='module')
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_rising_needs_every_quarter_to_climb():
+    assert rising(list(range(40)), min_increase=10)
+    assert not rising(list(range(40)), min_increase=100)
+    # Fills up, then levels off
+    assert not rising([min(i, 15) for i in range(40)])
+    # Noisy but climbing
+    assert rising([i + (5 if i % 2 else -5) for i in range(0, 400, 10)])
+    assert not rising([1, 2, 3])
+
+
+def test_check_names_what_grew():
+    samples = [(i, 1000 + i * 10000, 50_000_000, 2.0) for i in range(40)]
+    assert check(samples) == ["traced memory"]
+    samples = [(i, 1000, 50_000_000, 1.0 + i * 0.1) for i in range(40)]
+    assert check(samples) == ["frame time"]
+    assert check([]) == []
+
+
+def test_leaking_mode_is_flagged(tmp_path):
+    result = soak_mode(write_mode(tmp_path, 'Leaky', LEAKY_MODE), frames=2000, samples=40, size=(320, 240))
+    assert result["error"] is None
+    assert result["frames"] == 2000
+    assert "traced memory" in result["flags"]
+    # Draw times come from before tracemalloc starts, traced memory from after
+    first, last = result["samples"][0], result["samples"][-1]
+    assert first[1] is None and first[3] is not None
+    assert last[1] is not None and last[3] is None
+    # The growth report points at the line doing the appending
+    assert any("main.py" in stat for stat in result["growth"])
+
+
+def test_steady_mode_is_not_flagged(tmp_path):
+    result = soak_mode(write_mode(tmp_path, 'Steady', STEADY_MODE), frames=2000, samples=40, size=(320, 240))
+    assert result["error"] is None
+    assert "traced memory" not in result["flags"]
+
+
+def test_draw_errors_are_reported(tmp_path):
+    broken = write_mode(tmp_path, 'Broken', "def setup(screen, eyesy):\n    pass\n"
+                                            "def draw(screen, eyesy):\n    raise ValueError('boom')\n")
+    result = soak_mode(broken, frames=100, size=(320, 240))
+    assert "boom" in result["error"]
+    assert result["frames"] == 0
+
+
+def test_find_modes_by_name():
+    modes = find_modes(["gradient cloud"])
+    assert [m.name for m in modes] == ["S - Gradient Cloud"]
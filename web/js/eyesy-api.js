@@ -3,6 +3,9 @@
  * Provides EYESY hardware API for Python modes running in Pyodide
  */
 
+// Python side of the eyesy object, in web/py beside this script's folder
+const EYESY_SHIM_URL = new URL('../py/eyesy_shim.py', document.currentScript.src).href;
+
 class EYESYAPI {
     constructor(canvas) {
         this.canvas = canvas;
@@ -236,118 +239,79 @@ class EYESYAPI {
 
     /**
      * Inject EYESY API into Pyodide Python namespace
+     * Loads the Python side (py/eyesy_shim.py) and keeps handles on its buffers
      */
-    injectIntoPyodide(loader) {
-        const eyesy = this;
-
-        // Create Python EYESY object
-        const eyesyCode = `
-class EYESY:
-    def __init__(self):
-        self.xres = ${this.xres}
-        self.yres = ${this.yres}
-        self.knob1 = ${this.knob1}
-        self.knob2 = ${this.knob2}
-        self.knob3 = ${this.knob3}
-        self.knob4 = ${this.knob4}
-        self.knob5 = ${this.knob5}
-        self.button1 = ${this.toPythonValue(this.button1)}
-        self.button2 = ${this.toPythonValue(this.button2)}
-        self.button3 = ${this.toPythonValue(this.button3)}
-        self.button4 = ${this.toPythonValue(this.button4)}
-        self.shift = ${this.toPythonValue(this.shift)}
-        self.audio_gain = ${this.audio_gain}
-        self.trig = ${this.toPythonValue(this.trig)}
-        self.audio_in = []
-        self.audio_in_r = []
-        self.auto_clear = ${this.toPythonValue(this.auto_clear)}
-        self.mode_root = "${this.mode_root}"
-        self.mode = "${this.mode}"
-        self.bg_color = [${this.bg_color.join(',')}]
-        self.midi_notes = [False] * 128
-        self.midi_note_new = False
-        self.audio_trig = False
-    
-    def color_picker(self, knob):
-        return js.eyesy.colorPicker(knob).toJs()
-    
-    def color_picker_lfo(self, knob, max_rate=0.1):
-        return js.eyesy.colorPickerLFO(knob, max_rate).toJs()
-    
-    def color_picker_bg(self, knob):
-        return js.eyesy.colorPickerBG(knob).toJs()
-    
-    def set_mode_root(self, path):
-        js.eyesy.setModeRoot(path)
-        self.mode_root = path
-
-eyesy = EYESY()
-        `;
-
-        // Set up eyesy so Python can access it via js.eyesy
-        // In Pyodide, js is a built-in module for accessing JavaScript
-        // We'll set it as a Python object and make it accessible via js module
+    async injectIntoPyodide(loader) {
+        // Set up eyesy so Python can access it via js.eyesy (color pickers, mode root)
         const eyesyJsProxy = loader.pyodide.toPy(this);
         loader.setPythonObject('__eyesy_js__', eyesyJsProxy);
-        
-        // Set up js.eyesy using setattr which works for both dicts and objects
         loader.runPython(`
 import js
 # Use setattr to set eyesy, which works even if js is dict-like
 setattr(js, 'eyesy', __eyesy_js__)
         `);
 
-        // Run Python code to create EYESY object
-        loader.runPython(eyesyCode);
+        // Load the shim as its own module and create the EYESY object from it
+        const response = await fetch(EYESY_SHIM_URL);
+        if (!response.ok) {
+            throw new Error(`Failed to load eyesy shim: ${response.statusText}`);
+        }
+        loader.setPythonObject('_eyesy_shim_source', await response.text());
+        loader.runPython(`
+import sys
+from types import ModuleType
+_shim = ModuleType('eyesy_shim')
+_shim.__file__ = 'eyesy_shim.py'
+sys.modules['eyesy_shim'] = _shim
+exec(compile(_eyesy_shim_source, 'eyesy_shim.py', 'exec'), _shim.__dict__)
+del _shim, _eyesy_shim_source
+from eyesy_shim import EYESY
+eyesy = EYESY(${this.xres}, ${this.yres}, ${this.toPythonValue(this.mode_root)}, ${this.toPythonValue(this.mode)})
+eyesy.bg_color = [${this.bg_color.join(',')}]
+        `);
 
-        // Set up property accessors so Python can read/write JavaScript properties
-        // This allows Python code to access eyesy.knob1, etc.
-        this.setupPropertyAccessors(loader);
+        // Persistent handles: each frame writes into these buffers and calls sync()
+        const eyesyPy = loader.getPythonObject('eyesy');
+        this.pyState = eyesyPy.state;
+        this.pyAudioLeft = eyesyPy.audio_left;
+        this.pyAudioRight = eyesyPy.audio_right;
+        this.pySync = eyesyPy.sync;
+        eyesyPy.destroy();
+        this.writeState();
     }
 
     /**
-     * Set up property accessors so Python can read/write EYESY properties
+     * Copy values into a Python buffer's memory in place
+     * @param {PyProxy} buffer - Python array exposing the buffer protocol
+     * @param {string} type - getBuffer() element type ('f64', 'i32')
+     * @param {ArrayLike<number>} values - Values to write (extra ones are dropped)
      */
-    setupPropertyAccessors(loader) {
-        const eyesy = this;
-        const props = ['knob1', 'knob2', 'knob3', 'knob4', 'knob5', 'trig', 'audio_in', 'audio_in_r', 'auto_clear'];
-
-        props.forEach(prop => {
-            loader.runPython(`
-def get_${prop}(self):
-    val = js.eyesy.${prop}
-    if hasattr(val, 'toJs'):
-        return val.toJs()
-    else:
-        return val
-
-def set_${prop}(self, value):
-    setattr(js.eyesy, '${prop}', value)
-
-eyesy.${prop} = property(get_${prop}, set_${prop})
-            `);
-        });
-
-        // For audio_in, we need special handling
-        loader.runPython(`
-def update_eyesy_properties():
-    # Helper function to safely convert JS values to Python
-    def to_py(value):
-        if hasattr(value, 'toJs'):
-            return value.toJs()
-        else:
-            return value
-    
-    eyesy.knob1 = to_py(js.eyesy.knob1)
-    eyesy.knob2 = to_py(js.eyesy.knob2)
-    eyesy.knob3 = to_py(js.eyesy.knob3)
-    eyesy.knob4 = to_py(js.eyesy.knob4)
-    eyesy.knob5 = to_py(js.eyesy.knob5)
-    eyesy.trig = to_py(js.eyesy.trig)
-    eyesy.audio_in = to_py(js.eyesy.audio_in)
-    eyesy.audio_in_r = to_py(js.eyesy.audio_in_r)
-    eyesy.auto_clear = to_py(js.eyesy.auto_clear)
-        `);
+    writeBuffer(buffer, type, values) {
+        const view = buffer.getBuffer(type);
+        try {
+            const data = view.data;
+            const count = Math.min(data.length, values.length);
+            for (let i = 0; i < count; i++) {
+                data[i] = values[i];
+            }
+            data.fill(0, count);
+        } finally {
+            view.release();
+        }
+    }
+
+    /**
+     * Write knobs, triggers and audio into the Python eyesy object and sync it
+     * State order matches STATE_FIELDS in eyesy_shim.py
+     */
+    writeState() {
+        this.writeBuffer(this.pyState, 'f64', [
+            this.knob1, this.knob2, this.knob3, this.knob4, this.knob5,
+            this.trig ? 1 : 0, this.audio_trig ? 1 : 0, this.auto_clear ? 1 : 0,
+        ]);
+        this.writeBuffer(this.pyAudioLeft, 'i32', this.audio_in);
+        this.writeBuffer(this.pyAudioRight, 'i32', this.audio_in_r);
+        this.pySync();
     }
 
     /**
@@ -356,11 +320,7 @@ def update_eyesy_properties():
     updateProperties(loader) {
         // Update audio first
         this.updateAudio();
-
-        // Update Python EYESY object properties
-        loader.runPython(`
-update_eyesy_properties()
-        `);
+        this.writeState();
     }
 }
 
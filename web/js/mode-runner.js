@@ -18,15 +18,144 @@ class ModeRunner {
         this.lastFrameTime = 0;
         this.consecutiveErrors = 0;
         this.maxConsecutiveErrors = 10;
+        this.bundle = null;
+        this.bundleEntries = {};
+        this.pycHeaderSize = 16;
+        this.modeHashes = {};
+        this.libs = [];
+        this.libsInstalled = false;
+    }
+
+    /**
+     * Take up a freshly fetched manifest: each mode's content hash, sprite atlas, and the bundle
+     * Mode files are fetched as path?v=hash, so a browser re-downloads a mode
+     * only when its build output changed.
+     * @param {Object} manifest - Parsed modes/manifest.json
+     */
+    async useManifest(manifest) {
+        this.modeHashes = {};
+        this.libs = manifest.lib || [];
+        this.libsInstalled = false;
+        manifest.modes.forEach(mode => {
+            if (mode.hash) {
+                this.modeHashes[mode.path] = mode.hash;
+            }
+            if (mode.atlas) {
+                this.bridge.addAtlas(mode.assets_path, mode.atlas);
+            }
+        });
+        return await this.loadBundle(manifest);
+    }
+
+    /**
+     * Fetch the precompiled mode bundle named in the manifest, if any
+     * One request covers every mode, and modes run from their compiled code
+     * without compiling source in the browser. The shared modules in the
+     * bundle (eyesy_grid, ...) import from it directly (zipimport).
+     * Without a bundle, or with one built for another Python, modes load
+     * from their .py files, and the shared modules from modes/lib/ (installLibs).
+     * @param {Object} manifest - Parsed modes/manifest.json
+     * @returns {boolean} Whether the bundle is in use
+     */
+    async loadBundle(manifest) {
+        this.bundle = null;
+        this.bundleEntries = {};
+        const info = manifest.bundle;
+        if (!info) {
+            return false;
+        }
+        try {
+            const magic = this.loader.runPython('import importlib.util\nimportlib.util.MAGIC_NUMBER.hex()');
+            if (magic !== info.magic) {
+                console.warn(`Mode bundle is for Python ${info.python}, loading modes from source`);
+                return false;
+            }
+            const response = await fetch(info.path);
+            if (!response.ok) {
+                throw new Error(`Failed to load mode bundle: ${response.statusText}`);
+            }
+            const data = new Uint8Array(await response.arrayBuffer());
+
+            // Put the zip on sys.path for the library modules
+            const zipPath = `/${info.path}`;
+            const pyodide = this.loader.getPyodide();
+            pyodide.FS.mkdirTree(zipPath.substring(0, zipPath.lastIndexOf('/')));
+            pyodide.FS.writeFile(zipPath, data);
+            this.loader.setPythonObject('_bundle_path', zipPath);
+            this.loader.runPython(`
+import sys
+if _bundle_path not in sys.path:
+    sys.path.append(_bundle_path)
+del _bundle_path
+            `);
+
+            this.bundle = data;
+            this.pycHeaderSize = info.header_size || 16;
+            manifest.modes.forEach(mode => {
+                if (mode.bundle) {
+                    this.bundleEntries[mode.path] = mode.bundle;
+                }
+            });
+            console.log(`Loaded mode bundle ${info.path} (${Object.keys(this.bundleEntries).length} modes)`);
+            return true;
+        } catch (error) {
+            console.warn(`Mode bundle unavailable, loading modes from source: ${error.message}`);
+            this.bundle = null;
+            this.bundleEntries = {};
+            return false;
+        }
+    }
+
+    /**
+     * Install the shared modules (eyesy_grid, ...) from their .py copies in modes/lib/
+     * Only needed for modes loaded from source: the bundle carries them compiled.
+     * They go into Pyodide's filesystem under /modes/lib, which is put on sys.path.
+     */
+    async installLibs() {
+        if (this.libsInstalled) {
+            return;
+        }
+        const pyodide = this.loader.getPyodide();
+        pyodide.FS.mkdirTree('/modes/lib');
+        await Promise.all(this.libs.map(async lib => {
+            const response = await fetch(`${lib.path}?v=${lib.hash}`);
+            if (!response.ok) {
+                throw new Error(`Failed to load library module ${lib.path}: ${response.statusText}`);
+            }
+            pyodide.FS.writeFile(`/${lib.path}`, await response.text());
+        }));
+        this.loader.runPython(`
+import importlib, sys
+if '/modes/lib' not in sys.path:
+    sys.path.append('/modes/lib')
+importlib.invalidate_caches()
+        `);
+        this.libsInstalled = true;
+    }
+
+    /**
+     * Run a mode's compiled code (.pyc bytes from the bundle) in the global namespace
+     * @param {Uint8Array} pyc - The mode's .pyc bytes
+     * @param {string} filename - Mode file, for __file__ and tracebacks
+     */
+    runCompiled(pyc, filename) {
+        this.loader.setPythonObject('_mode_pyc', pyc);
+        this.loader.setPythonObject('__file__', filename);
+        this.loader.runPython(`
+import marshal
+exec(marshal.loads(memoryview(_mode_pyc.to_bytes())[${this.pycHeaderSize}:]), globals())
+del _mode_pyc
+        `);
     }
 
     /**
      * Load a mode from Python code
-     * @param {string} modeCode - Python code for the mode
+     * @param {string|Uint8Array} modeCode - Python code for the mode, or its .pyc bytes from the bundle
      * @param {string} modeName - Name of the mode
      * @param {string} modePath - Path to mode folder (for assets)
+     * @param {string} modeFile - Path to the mode file (for __file__)
      */
-    async loadMode(modeCode, modeName, modePath) {
+    async loadMode(modeCode, modeName, modePath, modeFile = null) {
         try {
             // Set mode root
             this.eyesy.setModeRoot(modePath);
@@ -51,18 +180,20 @@ sys.modules['__main__'].screen = screen
             console.log('Screen created successfully:', screen);
 
             // Inject EYESY API (only if not already injected)
-            try {
-                this.loader.getPythonObject('eyesy');
-            } catch (e) {
-                // EYESY not injected yet, inject it
-                this.eyesy.injectIntoPyodide(this.loader);
+            if (!this.eyesy.pySync) {
+                await this.eyesy.injectIntoPyodide(this.loader);
             }
 
             // Update EYESY properties in Python
             this.eyesy.updateProperties(this.loader);
 
-            // Load mode code
-            this.loader.runPython(modeCode);
+            // Load mode code (modes find their files, and examples/lib, from __file__)
+            if (typeof modeCode === 'string') {
+                this.loader.setPythonObject('__file__', modeFile || `${modePath}/main.py`);
+                this.loader.runPython(modeCode);
+            } else {
+                this.runCompiled(modeCode, modeFile);
+            }
 
             // Get setup and draw functions
             try {
@@ -74,7 +205,12 @@ sys.modules['__main__'].screen = screen
 
             // Call setup (reuse screen variable)
             screen = this.loader.getPythonObject('screen');
-            this.setupFunc(screen, this.loader.getPythonObject('eyesy'));
+            try {
+                this.setupFunc(screen, this.loader.getPythonObject('eyesy'));
+            } finally {
+                // Draw whatever setup() drew
+                this.bridge.endFrame();
+            }
 
             console.log(`Mode loaded: ${modeName}`);
             return true;
@@ -85,19 +221,27 @@ sys.modules['__main__'].screen = screen
     }
 
     /**
-     * Load a mode from a file
+     * Load a mode from a file (from the bundle when it has the mode)
      * @param {string} filePath - Path to Python file
      * @param {string} modeName - Name of the mode
      */
     async loadModeFromFile(filePath, modeName) {
         try {
-            const response = await fetch(filePath);
+            const modePath = filePath.substring(0, filePath.lastIndexOf('/'));
+            const entry = this.bundle && this.bundleEntries[filePath];
+            if (entry) {
+                const pyc = this.bundle.subarray(entry.offset, entry.offset + entry.length);
+                return await this.loadMode(pyc, modeName, modePath, filePath);
+            }
+            // From source: the shared modules have to come from their .py copies too
+            await this.installLibs();
+            const hash = this.modeHashes[filePath];
+            const response = await fetch(hash ? `${filePath}?v=${hash}` : filePath);
             if (!response.ok) {
                 throw new Error(`Failed to load mode file: ${response.statusText}`);
             }
             const modeCode = await response.text();
-            const modePath = filePath.substring(0, filePath.lastIndexOf('/'));
-            return await this.loadMode(modeCode, modeName, modePath);
+            return await this.loadMode(modeCode, modeName, modePath, filePath);
         } catch (error) {
             console.error(`Failed to load mode from file: ${error.message}`, error);
             throw error;
@@ -190,14 +334,18 @@ screen = set_mode((${this.canvas.width}, ${this.canvas.height}))
                 throw new Error('EYESY object is None');
             }
 
-            // Call draw function
-            this.drawFunc(screen, eyesy);
+            // Call draw function, then draw its display list in one go
+            try {
+                this.drawFunc(screen, eyesy);
+            } finally {
+                this.bridge.endFrame();
+            }
 
             // Reset error counter on successful draw
             this.consecutiveErrors = 0;
 
-            // Note: Drawing is done directly to canvas via the pygame bridge
-            // The bridge methods draw directly to the canvas context
+            // Note: the pygame shim records draw calls; endFrame() replays them
+            // onto the canvas with a single call into the bridge
         } catch (error) {
             this.consecutiveErrors++;
             
@@ -4,12 +4,57 @@
  * This allows Python code using pygame to work in the browser
  */
 
+// Python side of the shim, in web/py beside this script's folder
+const PYGAME_SHIM_URL = new URL('../py/pygame_shim.py', document.currentScript.src).href;
+
+// Display list opcodes, as written by pygame_shim.py
+const DISPLAY_OPS = {
+    FILL_CANVAS: 1,
+    FILL_SURFACE: 2,
+    COPY_SURFACE: 3,
+    BLIT: 4,
+    SET_ALPHA: 5,
+    CIRCLE: 6,
+    LINE: 7,
+    RECT: 8,
+    POLYGON: 9,
+    ARC: 10,
+    ELLIPSE: 11,
+    SCALE: 12,
+};
+
 class PygameBridge {
     constructor(canvas) {
         this.canvas = canvas;
         this.ctx = canvas.getContext('2d');
         this.screen = null; // Will be a Surface-like object
         this.images = new Map(); // Cache loaded images
+        this.atlasSprites = new Map(); // Image path -> { atlas path, rect }
+        this.atlasImages = new Map(); // Atlas path -> Promise of its decoded image
+    }
+
+    /**
+     * Register a mode's sprite atlas (its manifest "atlas" entry)
+     * The build packs a mode's small images into one atlas.png. Loading
+     * any of them then downloads and decodes the atlas once, and cuts the
+     * sprite out of it.
+     * @param {string} assetsPath - The mode's assets folder
+     * @param {Object} atlas - { path, sprites: { name: [x, y, w, h] } }
+     */
+    addAtlas(assetsPath, atlas) {
+        Object.entries(atlas.sprites).forEach(([name, rect]) => {
+            this.atlasSprites.set(`${assetsPath}/${name}`, { path: atlas.path, rect });
+        });
+    }
+
+    fetchImage(src) {
+        const img = new Image();
+        img.crossOrigin = 'anonymous'; // Allow CORS if needed
+        img.src = src;
+        return new Promise((resolve, reject) => {
+            img.onload = () => resolve(img);
+            img.onerror = () => reject(new Error(`Failed to load image: ${src}`));
+        });
     }
 
     /**
@@ -19,195 +64,14 @@ class PygameBridge {
     async initialize(loader) {
         const bridge = this;
 
-        // Create a Surface class that mimics pygame.Surface
-        const surfaceCode = `
-class Surface:
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self._id = f"surface_{id(self)}"
-        # Register this surface with the bridge
-        js.bridge.registerSurface(self._id, self.width, self.height)
-    
-    def get_width(self):
-        return self.width
-    
-    def get_height(self):
-        return self.height
-    
-    def get_size(self):
-        return (self.width, self.height)
-    
-    def copy(self):
-        new_surface = Surface(self.width, self.height)
-        js.bridge.copySurface(self._id, new_surface._id)
-        return new_surface
-    
-    def fill(self, color):
-        js.bridge.fillSurface(self._id, color)
-    
-    def blit(self, source, dest, area=None):
-        if hasattr(source, '_id'):
-            js.bridge.blitSurface(self._id, source._id, dest, area)
-    
-    def set_alpha(self, alpha):
-        js.bridge.setSurfaceAlpha(self._id, alpha)
-
-class Screen:
-    def __init__(self, width, height):
-        # Main screen draws directly to canvas
-        self._id = "main_screen"
-        self.width = width
-        self.height = height
-        # Create a dummy surface for compatibility
-        self.surface = Surface(width, height)
-        self.surface._id = "main_screen"
-    
-    def get_width(self):
-        return self.width
-    
-    def get_height(self):
-        return self.height
-    
-    def get_size(self):
-        return (self.width, self.height)
-    
-    def fill(self, color):
-        # Fill canvas directly for main screen
-        js.bridge.fillCanvas(color)
-    
-    def blit(self, source, dest, area=None):
-        self.surface.blit(source, dest, area)
-    
-    def copy(self):
-        return self.surface.copy()
-    
-    def set_alpha(self, alpha):
-        self.surface.set_alpha(alpha)
-
-# Drawing functions
-class Draw:
-    @staticmethod
-    def circle(surface, color, center, radius, width=0):
-        x, y = center
-        surface_id = getattr(surface, '_id', 'main_screen')
-        js.bridge.drawCircle(surface_id, color, x, y, radius, width)
-    
-    @staticmethod
-    def line(surface, color, start_pos, end_pos, width=1):
-        x1, y1 = start_pos
-        x2, y2 = end_pos
-        surface_id = getattr(surface, '_id', 'main_screen')
-        js.bridge.drawLine(surface_id, color, x1, y1, x2, y2, width)
-    
-    @staticmethod
-    def rect(surface, color, rect, width=0):
-        x, y, w, h = rect
-        js.bridge.drawRect(surface._id, color, x, y, w, h, width)
-    
-    @staticmethod
-    def polygon(surface, color, points, width=0):
-        js.bridge.drawPolygon(surface._id, color, points, width)
-    
-    @staticmethod
-    def arc(surface, color, rect, start_angle, stop_angle, width=1):
-        x, y, w, h = rect
-        js.bridge.drawArc(surface._id, color, x, y, w, h, start_angle, stop_angle, width)
-    
-    @staticmethod
-    def ellipse(surface, color, rect, width=0):
-        x, y, w, h = rect
-        js.bridge.drawEllipse(surface._id, color, x, y, w, h, width)
-
-# Image loading (handles async promise from JavaScript)
-async def image_load_async(filepath):
-    # Load image via JavaScript (returns a promise)
-    try:
-        img_id = await js.bridge.loadImage(filepath)
-        if img_id:
-            img = Surface(1, 1)  # Placeholder, will be set by bridge
-            img._id = img_id
-            img.width = js.bridge.getImageWidth(img_id)
-            img.height = js.bridge.getImageHeight(img_id)
-            return img
-    except Exception as e:
-        print(f"Error loading image {filepath}: {e}")
-    return None
-
-# Synchronous wrapper (for now, returns None - images will need to be pre-loaded)
-def image_load(filepath):
-    # For now, return None - proper async image loading will be implemented
-    # This allows the module to import without errors
-    print(f"Warning: Image loading for {filepath} not yet fully implemented")
-    return None
-
-# Transform functions
-class Transform:
-    @staticmethod
-    def scale(surface, size):
-        width, height = size
-        new_surface = Surface(width, height)
-        js.bridge.scaleSurface(surface._id, new_surface._id, width, height)
-        return new_surface
-
-# Initialize pygame module
-class PygameModule:
-    def __init__(self):
-        self.draw = Draw()
-        self.transform = Transform()
-        # Add image module
-        self.image = type('ImageModule', (), {
-            'load': image_load
-        })()
-        # Add Color class
-        self.Color = lambda r, g, b, a=255: [r, g, b, a] if a != 255 else [r, g, b]
-    
-    def image_load(self, filepath):
-        return image_load(filepath)
-
-# Create pygame instance
-_pygame_instance = PygameModule()
-
-# Make pygame available as an importable module
-import sys
-from types import ModuleType
-
-pygame_module = ModuleType('pygame')
-pygame_module.draw = _pygame_instance.draw
-pygame_module.transform = _pygame_instance.transform
-pygame_module.image = _pygame_instance.image
-pygame_module.Color = _pygame_instance.Color
-pygame_module.image.load = image_load
-
-# Add to sys.modules so 'import pygame' works
-sys.modules['pygame'] = pygame_module
-
-# Also create pygame.locals for 'from pygame.locals import *'
-pygame_locals = ModuleType('pygame.locals')
-sys.modules['pygame.locals'] = pygame_locals
-
-# Make pygame available as a global variable too
-pygame = pygame_module
-        `;
-
         // Inject bridge methods into JavaScript namespace
+        // Drawing reaches the bridge through replay(), once per frame
         const bridgeObj = {
             registerSurface: (id, width, height) => bridge.registerSurface(id, width, height),
-            fillSurface: (id, color) => bridge.fillSurface(id, color),
-            copySurface: (srcId, dstId) => bridge.copySurface(srcId, dstId),
-            blitSurface: (dstId, srcId, dest, area) => bridge.blitSurface(dstId, srcId, dest, area),
-            setSurfaceAlpha: (id, alpha) => bridge.setSurfaceAlpha(id, alpha),
-            drawCircle: (id, color, x, y, radius, width) => bridge.drawCircle(id, color, x, y, radius, width),
-            drawLine: (id, color, x1, y1, x2, y2, width) => bridge.drawLine(id, color, x1, y1, x2, y2, width),
-            drawRect: (id, color, x, y, w, h, width) => bridge.drawRect(id, color, x, y, w, h, width),
-            drawPolygon: (id, color, points, width) => bridge.drawPolygon(id, color, points, width),
-            drawArc: (id, color, x, y, w, h, startAngle, stopAngle, width) => bridge.drawArc(id, color, x, y, w, h, startAngle, stopAngle, width),
-            drawEllipse: (id, color, x, y, w, h, width) => bridge.drawEllipse(id, color, x, y, w, h, width),
+            replay: (commands, names) => bridge.replay(commands, names),
             loadImage: (filepath) => bridge.loadImage(filepath),
             getImageWidth: (id) => bridge.getImageWidth(id),
             getImageHeight: (id) => bridge.getImageHeight(id),
-            scaleSurface: (srcId, dstId, width, height) => bridge.scaleSurface(srcId, dstId, width, height),
-            fillCanvas: (color) => bridge.fillCanvas(color),
         };
         const bridgePy = loader.pyodide.toPy(bridgeObj);
         loader.setPythonObject('bridge', bridgePy);
@@ -219,20 +83,135 @@ import js
 setattr(js, 'bridge', bridge)
         `);
 
-        // Run Python code to create pygame module
-        loader.runPython(surfaceCode);
-
-        // Create Screen class and set_mode function
+        // Load the Python side of the shim (py/pygame_shim.py) as its own module,
+        // so a mode's globals can't shadow its internals
+        const response = await fetch(PYGAME_SHIM_URL);
+        if (!response.ok) {
+            throw new Error(`Failed to load pygame shim: ${response.statusText}`);
+        }
+        loader.setPythonObject('_pygame_shim_source', await response.text());
         loader.runPython(`
-def set_mode(size):
-    width, height = size
-    screen = Screen(width, height)
-    return screen
+import sys
+from types import ModuleType
+_shim = ModuleType('pygame_shim')
+_shim.__file__ = 'pygame_shim.py'
+sys.modules['pygame_shim'] = _shim
+exec(compile(_pygame_shim_source, 'pygame_shim.py', 'exec'), _shim.__dict__)
+del _shim, _pygame_shim_source
+from pygame_shim import Surface, Screen, set_mode, pygame, end_frame
         `);
+        this.endFramePy = loader.getPythonObject('end_frame');
+    }
+
+    /**
+     * Draw everything the Python shim has recorded since the last frame
+     */
+    endFrame() {
+        if (this.endFramePy) {
+            this.endFramePy();
+        }
+    }
+
+    /**
+     * Replay a display list recorded by the Python shim
+     * @param {PyProxy|Float64Array|Array} commands - Flat command buffer (an array('d') from Python)
+     * @param {PyProxy|Array|null} names - Surface id for each slot, sent when surfaces were added
+     */
+    replay(commands, names) {
+        if (names) {
+            this.slotIds = typeof names.toJs === 'function' ? names.toJs() : Array.from(names);
+        }
+        if (typeof commands.getBuffer === 'function') {
+            // Read the Python array in place rather than copying it
+            const view = commands.getBuffer('f64');
+            try {
+                this.replayCommands(view.data);
+            } finally {
+                view.release();
+            }
+        } else {
+            this.replayCommands(commands);
+        }
+    }
+
+    /**
+     * Run the commands in a display list buffer (opcodes as in pygame_shim.py)
+     * @param {Float64Array|Array} data - Flat command buffer
+     */
+    replayCommands(data) {
+        const ids = this.slotIds;
+        const rgb = (i) => [data[i], data[i + 1], data[i + 2]];
+        let i = 0;
+        while (i < data.length) {
+            const op = data[i];
+            switch (op) {
+                case DISPLAY_OPS.FILL_CANVAS:
+                    this.fillCanvas(rgb(i + 1));
+                    i += 4;
+                    break;
+                case DISPLAY_OPS.FILL_SURFACE:
+                    this.fillSurface(ids[data[i + 1]], rgb(i + 2));
+                    i += 5;
+                    break;
+                case DISPLAY_OPS.COPY_SURFACE:
+                    this.copySurface(ids[data[i + 1]], ids[data[i + 2]]);
+                    i += 3;
+                    break;
+                case DISPLAY_OPS.BLIT: {
+                    const area = data[i + 5] ? [data[i + 6], data[i + 7], data[i + 8], data[i + 9]] : null;
+                    this.blitSurface(ids[data[i + 1]], ids[data[i + 2]], [data[i + 3], data[i + 4]], area);
+                    i += 10;
+                    break;
+                }
+                case DISPLAY_OPS.SET_ALPHA:
+                    this.setSurfaceAlpha(ids[data[i + 1]], data[i + 2] < 0 ? null : data[i + 2]);
+                    i += 3;
+                    break;
+                case DISPLAY_OPS.CIRCLE:
+                    this.drawCircle(ids[data[i + 1]], rgb(i + 2), data[i + 5], data[i + 6], data[i + 7], data[i + 8]);
+                    i += 9;
+                    break;
+                case DISPLAY_OPS.LINE:
+                    this.drawLine(ids[data[i + 1]], rgb(i + 2), data[i + 5], data[i + 6], data[i + 7], data[i + 8], data[i + 9]);
+                    i += 10;
+                    break;
+                case DISPLAY_OPS.RECT:
+                    this.drawRect(ids[data[i + 1]], rgb(i + 2), data[i + 5], data[i + 6], data[i + 7], data[i + 8], data[i + 9]);
+                    i += 10;
+                    break;
+                case DISPLAY_OPS.POLYGON: {
+                    const count = data[i + 6];
+                    const points = [];
+                    for (let k = 0; k < count; k++) {
+                        points.push([data[i + 7 + 2 * k], data[i + 8 + 2 * k]]);
+                    }
+                    this.drawPolygon(ids[data[i + 1]], rgb(i + 2), points, data[i + 5]);
+                    i += 7 + 2 * count;
+                    break;
+                }
+                case DISPLAY_OPS.ARC:
+                    this.drawArc(ids[data[i + 1]], rgb(i + 2), data[i + 5], data[i + 6], data[i + 7], data[i + 8],
+                                 data[i + 9], data[i + 10], data[i + 11]);
+                    i += 12;
+                    break;
+                case DISPLAY_OPS.ELLIPSE:
+                    this.drawEllipse(ids[data[i + 1]], rgb(i + 2), data[i + 5], data[i + 6], data[i + 7], data[i + 8], data[i + 9]);
+                    i += 10;
+                    break;
+                case DISPLAY_OPS.SCALE:
+                    this.scaleSurface(ids[data[i + 1]], ids[data[i + 2]], data[i + 3], data[i + 4]);
+                    i += 5;
+                    break;
+                default:
+                    console.error(`Unknown display list opcode ${op} at ${i}, dropping the rest of the frame`);
+                    return;
+            }
+        }
     }
 
     // Surface management
     surfaces = new Map();
+    slotIds = []; // Display list slot -> surface id
 
     registerSurface(id, width, height) {
         this.surfaces.set(id, {
@@ -417,14 +396,17 @@ def set_mode(size):
         }
 
         try {
-            const img = new Image();
-            img.crossOrigin = 'anonymous'; // Allow CORS if needed
-            img.src = filepath;
-            
-            await new Promise((resolve, reject) => {
-                img.onload = resolve;
-                img.onerror = () => reject(new Error(`Failed to load image: ${filepath}`));
-            });
+            let img;
+            const sprite = this.atlasSprites.get(filepath);
+            if (sprite) {
+                if (!this.atlasImages.has(sprite.path)) {
+                    this.atlasImages.set(sprite.path, this.fetchImage(sprite.path));
+                }
+                const [x, y, w, h] = sprite.rect;
+                img = await createImageBitmap(await this.atlasImages.get(sprite.path), x, y, w, h);
+            } else {
+                img = await this.fetchImage(filepath);
+            }
 
             const id = `img_${Date.now()}_${Math.random()}`;
             this.images.set(filepath, { id, img, width: img.width, height: img.height });
@@ -0,0 +1,85 @@
+"""
+eyesy object for modes running in Pyodide (loaded by web/js/eyesy-api.js)
+
+The host (EYESYAPI in eyesy-api.js) owns the knobs, trigger and simulated
+audio. Nothing is converted into new Python objects each frame: the eyesy
+object keeps persistent buffers, and the host writes straight into their
+memory (PyProxy.getBuffer()) before calling sync() once per frame.
+
+- `state` is one packed float64 record, fields in STATE_FIELDS order;
+  sync() unpacks it into eyesy.knob1 ... eyesy.auto_clear
+- audio arrives in two int32 arrays of AUDIO_SAMPLES samples, and
+  eyesy.audio_in / audio_in_r are read-only memoryviews over them: the
+  same objects every frame, indexable and iterable like the lists modes
+  expect, and usable by NumPy without a copy (np.asarray(eyesy.audio_in))
+
+Nothing here needs a browser: with a stand-in host it runs (and is tested)
+under plain CPython, see tools/test_eyesy_shim.py.
+"""
+
+from array import array
+
+import js
+
+AUDIO_SAMPLES = 200
+# Packed host state, one float64 each. Keep in step with EYESYAPI.writeState()
+STATE_FIELDS = ('knob1', 'knob2', 'knob3', 'knob4', 'knob5', 'trig', 'audio_trig', 'auto_clear')
+
+
+class EYESY:
+    def __init__(self, xres, yres, mode_root="", mode=""):
+        self.xres = xres
+        self.yres = yres
+        self.knob1 = 0.5
+        self.knob2 = 0.5
+        self.knob3 = 0.5
+        self.knob4 = 0.5
+        self.knob5 = 0.5
+        self.button1 = False
+        self.button2 = False
+        self.button3 = False
+        self.button4 = False
+        self.shift = False
+        self.audio_gain = 1.0
+        self.trig = False
+        self.audio_trig = False
+        self.auto_clear = True
+        self.mode_root = mode_root
+        self.mode = mode
+        self.bg_color = [0, 0, 0]
+        self.midi_notes = [False] * 128
+        self.midi_note_new = False
+        # Written in place by the host
+        self.state = array('d', bytes(8 * len(STATE_FIELDS)))
+        self.audio_left = array('i', bytes(4 * AUDIO_SAMPLES))
+        self.audio_right = array('i', bytes(4 * AUDIO_SAMPLES))
+        # Views stay exported for the object's life, which also keeps the arrays from being resized
+        self.audio_in = memoryview(self.audio_left).toreadonly()
+        self.audio_in_r = memoryview(self.audio_right).toreadonly()
+
+    def sync(self):
+        """Take up the state the host has just written (the host calls this once per frame)"""
+        knob1, knob2, knob3, knob4, knob5, trig, audio_trig, auto_clear = self.state
+        self.knob1 = knob1
+        self.knob2 = knob2
+        self.knob3 = knob3
+        self.knob4 = knob4
+        self.knob5 = knob5
+        self.trig = trig != 0
+        self.audio_trig = audio_trig != 0
+        self.auto_clear = auto_clear != 0
+
+    def color_picker(self, knob):
+        return js.eyesy.colorPicker(knob).toJs()
+
+    def color_picker_lfo(self, knob, max_rate=0.1):
+        return js.eyesy.colorPickerLFO(knob, max_rate).toJs()
+
+    def color_picker_bg(self, knob):
+        color = js.eyesy.colorPickerBG(knob).toJs()
+        self.bg_color = [color[0], color[1], color[2]]
+        return color
+
+    def set_mode_root(self, path):
+        js.eyesy.setModeRoot(path)
+        self.mode_root = path
@@ -0,0 +1,285 @@
+"""
+pygame shim for modes running in Pyodide (loaded by web/js/pygame-bridge.js)
+
+Provides the parts of the pygame API the modes use (Surface, draw, image,
+transform) on top of the JavaScript canvas bridge. Drawing is not sent to
+JavaScript call by call: every fill, blit and draw is appended to a display
+list, a flat array('d') of opcodes and numbers, and the whole frame crosses
+into JavaScript once, in end_frame(), where js.bridge.replay() draws it.
+A mode making thousands of draw calls costs one Python -> JS crossing per
+frame instead of thousands.
+
+Surfaces are referred to in the display list by slot number; replay() gets
+the slot -> surface id table whenever it has grown.
+
+Nothing here needs a browser: with a stand-in `js` module it runs (and is
+tested) under plain CPython, see tools/test_pygame_shim.py.
+"""
+
+import sys
+from array import array
+from types import ModuleType
+
+import js
+
+# Display list opcodes, each followed by its operands (colors as r, g, b).
+# Keep in step with PygameBridge.replayCommands() in pygame-bridge.js
+FILL_CANVAS = 1  # r, g, b
+FILL_SURFACE = 2  # slot, r, g, b
+COPY_SURFACE = 3  # source slot, destination slot
+BLIT = 4  # destination slot, source slot, x, y, has area, area x, y, w, h
+SET_ALPHA = 5  # slot, alpha (-1 for None)
+CIRCLE = 6  # slot, r, g, b, x, y, radius, width
+LINE = 7  # slot, r, g, b, x1, y1, x2, y2, width
+RECT = 8  # slot, r, g, b, x, y, w, h, width
+POLYGON = 9  # slot, r, g, b, width, point count, x0, y0, x1, y1, ...
+ARC = 10  # slot, r, g, b, x, y, w, h, start angle, stop angle, width
+ELLIPSE = 11  # slot, r, g, b, x, y, w, h, width
+SCALE = 12  # source slot, destination slot, width, height
+
+
+def _rgb(color):
+    """(r, g, b) of a color tuple or list (alpha is dropped) or a gray level"""
+    if isinstance(color, (int, float)):
+        return color, color, color
+    return color[0], color[1], color[2]
+
+
+class DisplayList:
+    """One frame's drawing, recorded for a single hand-over to JavaScript"""
+
+    def __init__(self):
+        self.commands = array('d')
+        self.slots = {}  # Surface id -> slot
+        self.names = []  # Slot -> surface id
+        self._names_sent = 0
+
+    def slot(self, surface):
+        surface_id = getattr(surface, '_id', 'main_screen')
+        slot = self.slots.get(surface_id)
+        if slot is None:
+            slot = self.slots[surface_id] = len(self.names)
+            self.names.append(surface_id)
+        return slot
+
+    def add(self, *values):
+        self.commands.extend(values)
+
+    def add_colored(self, opcode, surface, color, *values):
+        self.commands.extend((opcode, self.slot(surface)) + _rgb(color) + values)
+
+    def flush(self):
+        """Hand the recorded frame to js.bridge.replay() and start a new one
+
+        The slot table goes along only when surfaces have been added since
+        the last flush.
+        """
+        if not self.commands:
+            return
+        names = None
+        if len(self.names) != self._names_sent:
+            names = list(self.names)
+            self._names_sent = len(self.names)
+        js.bridge.replay(self.commands, names)
+        self.commands = array('d')
+
+
+display_list = DisplayList()
+
+
+class Surface:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._id = f"surface_{id(self)}"
+        # Register this surface with the bridge
+        js.bridge.registerSurface(self._id, self.width, self.height)
+
+    def get_width(self):
+        return self.width
+
+    def get_height(self):
+        return self.height
+
+    def get_size(self):
+        return (self.width, self.height)
+
+    def copy(self):
+        new_surface = Surface(self.width, self.height)
+        display_list.add(COPY_SURFACE, display_list.slot(self), display_list.slot(new_surface))
+        return new_surface
+
+    def fill(self, color):
+        display_list.add(FILL_SURFACE, display_list.slot(self), *_rgb(color))
+
+    def blit(self, source, dest, area=None):
+        if hasattr(source, '_id'):
+            x, y = dest[0], dest[1]
+            if area is None:
+                area = (0, 0, 0, 0)
+                has_area = 0
+            else:
+                has_area = 1
+            display_list.add(BLIT, display_list.slot(self), display_list.slot(source), x, y, has_area, *area[:4])
+
+    def set_alpha(self, alpha):
+        display_list.add(SET_ALPHA, display_list.slot(self), -1 if alpha is None else alpha)
+
+
+class Screen:
+    def __init__(self, width, height):
+        # Main screen draws directly to canvas
+        self._id = "main_screen"
+        self.width = width
+        self.height = height
+        # Create a dummy surface for compatibility
+        self.surface = Surface(width, height)
+        self.surface._id = "main_screen"
+
+    def get_width(self):
+        return self.width
+
+    def get_height(self):
+        return self.height
+
+    def get_size(self):
+        return (self.width, self.height)
+
+    def fill(self, color):
+        # Fill canvas directly for main screen
+        display_list.add(FILL_CANVAS, *_rgb(color))
+
+    def blit(self, source, dest, area=None):
+        self.surface.blit(source, dest, area)
+
+    def copy(self):
+        return self.surface.copy()
+
+    def set_alpha(self, alpha):
+        self.surface.set_alpha(alpha)
+
+
+# Drawing functions
+class Draw:
+    @staticmethod
+    def circle(surface, color, center, radius, width=0):
+        x, y = center
+        display_list.add_colored(CIRCLE, surface, color, x, y, radius, width)
+
+    @staticmethod
+    def line(surface, color, start_pos, end_pos, width=1):
+        x1, y1 = start_pos
+        x2, y2 = end_pos
+        display_list.add_colored(LINE, surface, color, x1, y1, x2, y2, width)
+
+    @staticmethod
+    def rect(surface, color, rect, width=0):
+        x, y, w, h = rect
+        display_list.add_colored(RECT, surface, color, x, y, w, h, width)
+
+    @staticmethod
+    def polygon(surface, color, points, width=0):
+        display_list.add_colored(POLYGON, surface, color, width, len(points))
+        commands = display_list.commands
+        for x, y in points:
+            commands.append(x)
+            commands.append(y)
+
+    @staticmethod
+    def arc(surface, color, rect, start_angle, stop_angle, width=1):
+        x, y, w, h = rect
+        display_list.add_colored(ARC, surface, color, x, y, w, h, start_angle, stop_angle, width)
+
+    @staticmethod
+    def ellipse(surface, color, rect, width=0):
+        x, y, w, h = rect
+        display_list.add_colored(ELLIPSE, surface, color, x, y, w, h, width)
+
+
+# Image loading (handles async promise from JavaScript)
+async def image_load_async(filepath):
+    # Load image via JavaScript (returns a promise)
+    try:
+        img_id = await js.bridge.loadImage(filepath)
+        if img_id:
+            img = Surface(1, 1)  # Placeholder, will be set by bridge
+            img._id = img_id
+            img.width = js.bridge.getImageWidth(img_id)
+            img.height = js.bridge.getImageHeight(img_id)
+            return img
+    except Exception as e:
+        print(f"Error loading image {filepath}: {e}")
+    return None
+
+
+# Synchronous wrapper (for now, returns None - images will need to be pre-loaded)
+def image_load(filepath):
+    # For now, return None - proper async image loading will be implemented
+    # This allows the module to import without errors
+    print(f"Warning: Image loading for {filepath} not yet fully implemented")
+    return None
+
+
+# Transform functions
+class Transform:
+    @staticmethod
+    def scale(surface, size):
+        width, height = size
+        new_surface = Surface(width, height)
+        display_list.add(SCALE, display_list.slot(surface), display_list.slot(new_surface), width, height)
+        return new_surface
+
+
+def end_frame():
+    """Draw everything recorded since the last call (the mode runner calls it after setup() and draw())"""
+    display_list.flush()
+
+
+# Initialize pygame module
+class PygameModule:
+    def __init__(self):
+        self.draw = Draw()
+        self.transform = Transform()
+        # Add image module
+        self.image = type('ImageModule', (), {
+            'load': image_load
+        })()
+        # display.flip() / update() draw the frame so far, as in pygame
+        self.display = type('DisplayModule', (), {
+            'flip': staticmethod(end_frame),
+            'update': staticmethod(lambda *rects: end_frame()),
+        })()
+        # Add Color class
+        self.Color = lambda r, g, b, a=255: [r, g, b, a] if a != 255 else [r, g, b]
+
+    def image_load(self, filepath):
+        return image_load(filepath)
+
+
+# Create pygame instance
+_pygame_instance = PygameModule()
+
+# Make pygame available as an importable module
+pygame_module = ModuleType('pygame')
+pygame_module.draw = _pygame_instance.draw
+pygame_module.transform = _pygame_instance.transform
+pygame_module.image = _pygame_instance.image
+pygame_module.display = _pygame_instance.display
+pygame_module.Color = _pygame_instance.Color
+pygame_module.image.load = image_load
+
+# Add to sys.modules so 'import pygame' works
+sys.modules['pygame'] = pygame_module
+
+# Also create pygame.locals for 'from pygame.locals import *'
+pygame_locals = ModuleType('pygame.locals')
+sys.modules['pygame.locals'] = pygame_locals
+
+# Make pygame available as a global variable too
+pygame = pygame_module
+
+
+def set_mode(size):
+    width, height = size
+    screen = Screen(width, height)
+    return screen
@@ -18,7 +18,7 @@ async function setupIntegrationTests() {
         await integrationBridge.initialize(integrationLoader);
         
         integrationEYESY = new EYESYAPI(integrationCanvas);
-        integrationEYESY.injectIntoPyodide(integrationLoader);
+        await integrationEYESY.injectIntoPyodide(integrationLoader);
         
         integrationRunner = new ModeRunner(integrationLoader, integrationBridge, integrationEYESY, integrationCanvas);
     }
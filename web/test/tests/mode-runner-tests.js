@@ -17,7 +17,7 @@ async function setupRunnerTests() {
         await testBridge.initialize(testLoader);
         
         testEYESY = new EYESYAPI(testCanvas);
-        testEYESY.injectIntoPyodide(testLoader);
+        await testEYESY.injectIntoPyodide(testLoader);
         
         testRunner = new ModeRunner(testLoader, testBridge, testEYESY, testCanvas);
     }
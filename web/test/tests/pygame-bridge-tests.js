@@ -120,6 +120,7 @@ testCategory('pygame', 'Python draw.circle call', async () => {
     testLoader.runPython(`
 screen = set_mode((400, 300))
 pygame.draw.circle(screen, [255, 0, 0], (200, 150), 50)
+pygame.display.flip()
     `);
     
     // Check that circle was drawn on canvas
@@ -127,3 +128,44 @@ pygame.draw.circle(screen, [255, 0, 0], (200, 150), 50)
     assertEquals(imageData.data[0], 255, 'Circle should be drawn via Python');
 });
 
+testCategory('pygame', 'Display list replay', async () => {
+    await setupPygameTests();
+
+    testBridge.clear();
+    testBridge.slotIds = ['main_screen'];
+    // FILL_CANVAS black, then RECT in slot 0: magenta 20x20 at (10, 10), filled
+    testBridge.replay(new Float64Array([1, 0, 0, 0, 8, 0, 255, 0, 255, 10, 10, 20, 20, 0]), null);
+
+    const inside = testBridge.ctx.getImageData(20, 20, 1, 1);
+    assertEquals(inside.data[0], 255, 'Rectangle should be replayed');
+    assertEquals(inside.data[2], 255, 'Rectangle should be magenta');
+    const outside = testBridge.ctx.getImageData(50, 50, 1, 1);
+    assertEquals(outside.data[0], 0, 'Canvas fill should be replayed first');
+});
+
+testCategory('pygame', 'Python draw calls cross into JavaScript once per frame', async () => {
+    await setupPygameTests();
+
+    const replay = testBridge.replay;
+    let crossings = 0;
+    testBridge.replay = function (commands, names) {
+        crossings++;
+        return replay.call(this, commands, names);
+    };
+    try {
+        testLoader.runPython(`
+screen = set_mode((400, 300))
+screen.fill((0, 0, 0))
+for i in range(1000):
+    pygame.draw.line(screen, (0, 255, 0), (i % 400, 0), (i % 400, 300), 1)
+        `);
+        assertEquals(crossings, 0, 'Draw calls should only be recorded');
+        testBridge.endFrame();
+        assertEquals(crossings, 1, 'The frame should be replayed in one call');
+    } finally {
+        testBridge.replay = replay;
+    }
+
+    const imageData = testBridge.ctx.getImageData(100, 150, 1, 1);
+    assertEquals(imageData.data[1], 255, 'Lines should be drawn after endFrame()');
+});